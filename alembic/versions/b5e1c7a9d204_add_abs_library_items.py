@@ -0,0 +1,46 @@
+"""add_abs_library_items
+
+Revision ID: b5e1c7a9d204
+Revises: 06a50e7f27f0
+Create Date: 2026-01-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = 'b5e1c7a9d204'
+down_revision = '06a50e7f27f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Local mirror of Audiobookshelf library items
+    op.create_table(
+        'abs_library_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('abs_id', sa.String(length=64), nullable=False),
+        sa.Column('library_id', sa.String(length=64), nullable=False),
+        sa.Column('title', sa.String(length=500), nullable=True),
+        sa.Column('author', sa.String(length=500), nullable=True),
+        sa.Column('series', sa.String(length=500), nullable=True),
+        sa.Column('added_at_ms', sa.BigInteger(), nullable=True),
+        sa.Column('updated_at_ms', sa.BigInteger(), nullable=True),
+        sa.Column('item', sa.JSON(), nullable=False),
+        sa.Column('synced_at', sa.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_abs_library_items_id'), 'abs_library_items', ['id'], unique=False)
+    op.create_index(op.f('ix_abs_library_items_abs_id'), 'abs_library_items', ['abs_id'], unique=True)
+    op.create_index('idx_abs_library_items_updated', 'abs_library_items', ['library_id', 'updated_at_ms'], unique=False)
+    op.create_index('idx_abs_library_items_added', 'abs_library_items', ['library_id', 'added_at_ms'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_abs_library_items_added', table_name='abs_library_items')
+    op.drop_index('idx_abs_library_items_updated', table_name='abs_library_items')
+    op.drop_index(op.f('ix_abs_library_items_abs_id'), table_name='abs_library_items')
+    op.drop_index(op.f('ix_abs_library_items_id'), table_name='abs_library_items')
+    op.drop_table('abs_library_items')
@@ -0,0 +1,26 @@
+"""add_listing_keyset_indexes
+
+Revision ID: c3d8f2a61e57
+Revises: b5e1c7a9d204
+Create Date: 2026-01-19 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = 'c3d8f2a61e57'
+down_revision = 'b5e1c7a9d204'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination of /books and /downloads filtered by status
+    op.create_index('idx_books_status_date_added', 'books', ['status', 'date_added', 'id'], unique=False)
+    op.create_index('idx_downloads_status_date_queued', 'downloads', ['status', 'date_queued', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_downloads_status_date_queued', table_name='downloads')
+    op.drop_index('idx_books_status_date_added', table_name='books')
@@ -0,0 +1,70 @@
+"""add_book_search_index
+
+Revision ID: d7a4e9b13c68
+Revises: c3d8f2a61e57
+Create Date: 2026-01-26 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = 'd7a4e9b13c68'
+down_revision = 'c3d8f2a61e57'
+branch_labels = None
+depends_on = None
+
+# Columns covered by book search (BookSearchService.SEARCH_FIELDS)
+SEARCH_COLUMNS = ['title', 'author', 'series', 'narrator']
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # Trigram GIN indexes serve word_similarity (<%) and ILIKE '%q%'
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'idx_books_{column}_trgm', 'books', [column], unique=False,
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+            )
+
+    elif dialect == 'sqlite':
+        # External-content FTS5 table over books, kept in sync by triggers
+        columns = ', '.join(SEARCH_COLUMNS)
+        new_values = ', '.join(f'new.{column}' for column in SEARCH_COLUMNS)
+        old_values = ', '.join(f'old.{column}' for column in SEARCH_COLUMNS)
+
+        op.execute(
+            f"CREATE VIRTUAL TABLE books_fts USING fts5("
+            f"{columns}, content='books', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            f"CREATE TRIGGER books_fts_ai AFTER INSERT ON books BEGIN "
+            f"INSERT INTO books_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER books_fts_ad AFTER DELETE ON books BEGIN "
+            f"INSERT INTO books_fts(books_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER books_fts_au AFTER UPDATE OF {columns} ON books BEGIN "
+            f"INSERT INTO books_fts(books_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO books_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        for column in reversed(SEARCH_COLUMNS):
+            op.drop_index(f'idx_books_{column}_trgm', table_name='books')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS books_fts_au')
+        op.execute('DROP TRIGGER IF EXISTS books_fts_ad')
+        op.execute('DROP TRIGGER IF EXISTS books_fts_ai')
+        op.execute('DROP TABLE IF EXISTS books_fts')
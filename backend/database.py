@@ -1,12 +1,21 @@
 """
 Database connection and session management
 Handles SQLAlchemy ORM setup and database session lifecycle
+
+Two engines share the same database:
+- engine / SessionLocal: pooled synchronous engine (QueuePool) used by
+  get_db(), get_db_context() and the scheduler tasks
+- async engine / AsyncSessionLocal: created on first use for async routes
+  (asyncpg on PostgreSQL, aiosqlite on SQLite) via get_async_db()
 """
 
+from typing import Any, AsyncGenerator, Dict, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import NullPool
-from contextlib import contextmanager
+from sqlalchemy.pool import QueuePool
+from contextlib import contextmanager, asynccontextmanager
 import logging
 
 from backend.config import get_settings
@@ -20,19 +29,64 @@ settings = get_settings()
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Prepare connection arguments based on database type
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite://"):
-    connect_args = {"timeout": 10}
-
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,  # Verify connections before using them
-    connect_args=connect_args,
-    poolclass=NullPool  # Don't use connection pooling
-)
+
+def _is_sqlite(url: str) -> bool:
+    """Check whether a database URL points at SQLite."""
+    return url.startswith("sqlite")
+
+
+def build_engine_kwargs(url: str) -> Dict[str, Any]:
+    """
+    Build create_engine() keyword arguments for a database URL
+
+    Server databases get a sized QueuePool with pre-ping and recycle.
+    SQLite keeps SQLAlchemy's default pool for its URL type (QueuePool for
+    files, SingletonThreadPool for :memory:) but allows cross-thread use so
+    sessions can be handed to worker threads.
+    """
+    kwargs: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+    if _is_sqlite(url):
+        kwargs["connect_args"] = {"timeout": 10, "check_same_thread": False}
+        return kwargs
+
+    kwargs.update(
+        poolclass=QueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    )
+    return kwargs
+
+
+def get_async_database_url(url: Optional[str] = None) -> str:
+    """
+    Derive the async driver URL for a database URL
+
+    postgresql:// and postgresql+psycopg2:// map to postgresql+asyncpg://,
+    sqlite:// maps to sqlite+aiosqlite://. DATABASE_ASYNC_URL wins if set.
+    """
+    if url is None:
+        if settings.DATABASE_ASYNC_URL:
+            return settings.DATABASE_ASYNC_URL
+        url = settings.DATABASE_URL
+
+    parsed = make_url(url)
+    backend_name = parsed.get_backend_name()
+
+    if backend_name == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if backend_name == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return url
+
+
+# Create pooled database engine
+engine = create_engine(settings.DATABASE_URL, **build_engine_kwargs(settings.DATABASE_URL))
 
 # Create session factory
 SessionLocal = sessionmaker(
@@ -41,6 +95,53 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine and session factory are created lazily so the async driver
+# is only required by deployments that actually use async routes
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """
+    Get (creating on first use) the pooled async engine
+
+    Returns:
+        AsyncEngine bound to get_async_database_url()
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        async_url = get_async_database_url()
+        kwargs = build_engine_kwargs(async_url)
+        kwargs.pop("poolclass", None)  # Async engines use AsyncAdaptedQueuePool
+        if _is_sqlite(async_url):
+            kwargs["connect_args"] = {"timeout": 10}
+
+        _async_engine = create_async_engine(async_url, **kwargs)
+        logger.info(f"Async database engine created ({make_url(async_url).drivername})")
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    """
+    Create a new AsyncSession from the shared async session factory
+    Usage:
+        async with AsyncSessionLocal() as session:
+            ...
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_session_factory()
+
 
 def get_db() -> Session:
     """
@@ -71,6 +172,57 @@ def get_db_context():
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator:
+    """
+    FastAPI dependency for getting an async database session
+    Usage:
+        async def my_endpoint(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@asynccontextmanager
+async def get_async_db_context():
+    """
+    Async context manager for database sessions
+    Usage:
+        async with get_async_db_context() as db:
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _describe_pool(pool) -> Dict[str, Any]:
+    """Collect size/usage counters from a SQLAlchemy pool."""
+    metrics: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            try:
+                metrics[name] = counter()
+            except Exception:
+                continue
+    if "size" in metrics and "overflow" in metrics:
+        metrics["max_overflow"] = getattr(pool, "_max_overflow", None)
+    return metrics
+
+
+def get_pool_status() -> Dict[str, Any]:
+    """
+    Get connection pool metrics for the health endpoints
+
+    Returns:
+        Dictionary with sync pool counters and, once created, async pool counters
+    """
+    status = {"sync": _describe_pool(engine.pool)}
+    if _async_engine is not None:
+        status["async"] = _describe_pool(_async_engine.sync_engine.pool)
+    return status
+
+
 def init_db():
     """
     Initialize database (create all tables)
@@ -91,3 +243,16 @@ def close_db():
     """
     engine.dispose()
     logger.info("Database connection closed")
+
+
+async def close_async_db():
+    """
+    Dispose the async engine if it was created
+    Should be called on application shutdown
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+        logger.info("Async database connection closed")
@@ -19,6 +19,7 @@ from enum import Enum
 import logging
 
 from fastapi import APIRouter, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
@@ -52,16 +53,20 @@ async def check_database_health(connection=None) -> Dict[str, Any]:
         Dictionary with database health status
     """
     try:
-        from backend.database import engine
+        from backend.database import engine, get_pool_status
 
-        async with engine.connect() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            result.fetchone()
+        def ping():
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1")).fetchone()
+
+        # The sync engine blocks, so ping it from the threadpool
+        await run_in_threadpool(ping)
 
         return {
             "status": ComponentStatus.OK.value,
             "database": "connected",
-            "type": "postgresql"
+            "type": engine.dialect.name,
+            "pool": get_pool_status()
         }
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
@@ -6,7 +6,7 @@ Supports book import, metadata updates, library scanning, and search.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
 import asyncio
 
@@ -32,6 +32,9 @@ from backend.integrations.abs_managers.email_manager import EmailManager
 
 logger = logging.getLogger(__name__)
 
+# Safety limit for library pagination
+MAX_LIBRARY_OFFSET = 100000
+
 
 class AudiobookshelfError(Exception):
     """Base exception for Audiobookshelf client errors."""
@@ -49,6 +52,7 @@ class AudiobookshelfClient:
         base_url: Audiobookshelf server URL (e.g., "http://localhost:13378")
         api_token: Bearer token for authentication
         timeout: Request timeout in seconds (default: 30)
+        page_concurrency: Library pages fetched in parallel (default: 4)
 
     Example:
         >>> async with AudiobookshelfClient(base_url, token) as client:
@@ -61,10 +65,12 @@ class AudiobookshelfClient:
         base_url: str,
         api_token: str,
         timeout: int = 30,
+        page_concurrency: int = 4,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
         self.timeout = ClientTimeout(total=timeout)
+        self.page_concurrency = max(1, page_concurrency)
         self.session: Optional[aiohttp.ClientSession] = None
 
         # Headers for all requests
@@ -87,12 +93,28 @@ class AudiobookshelfClient:
 
         logger.info(f"Initialized AudiobookshelfClient for {self.base_url}")
 
-    async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the shared HTTP session.
+
+        The connector keeps enough keep-alive connections open for the
+        parallel page fetcher plus a couple of ordinary requests, all to the
+        single ABS host.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.page_concurrency + 2,
+            limit_per_host=self.page_concurrency + 2,
+            keepalive_timeout=60,
+        )
+        return aiohttp.ClientSession(
             timeout=self.timeout,
             headers=self.headers,
+            connector=connector,
         )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.session = self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -103,10 +125,7 @@ class AudiobookshelfClient:
     async def _ensure_session(self):
         """Ensure session is initialized."""
         if not self.session:
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout,
-                headers=self.headers,
-            )
+            self.session = self._create_session()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -167,22 +186,119 @@ class AudiobookshelfClient:
             logger.error(f"Request timeout for {url}")
             raise AudiobookshelfError(f"Request timeout")
 
+    async def _resolve_library_id(self, library_id: Optional[str]) -> Optional[str]:
+        """Return library_id, or the first library's ID if none is given."""
+        if library_id:
+            return library_id
+        libraries = await self._request("GET", "/api/libraries")
+        if not libraries or not libraries.get("libraries"):
+            logger.warning("No libraries found")
+            return None
+        library_id = libraries["libraries"][0]["id"]
+        logger.info(f"Using library: {library_id}")
+        return library_id
+
+    async def _fetch_items_page(
+        self,
+        library_id: str,
+        limit: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        """
+        Fetch up to limit library items starting at offset.
+
+        ABS pages by page number, so an offset that is not a multiple of
+        limit is served from the two pages covering it.
+        """
+        page, skip = divmod(offset, limit)
+
+        async def fetch_page(number: int) -> Dict[str, Any]:
+            params = {
+                "limit": limit,
+                "page": number,
+                "offset": number * limit,
+            }
+            logger.debug(f"Fetching items: page={number}, limit={limit}")
+            return await self._request("GET", f"/api/libraries/{library_id}/items", params=params)
+
+        response = await fetch_page(page)
+        if not skip or not response:
+            return response
+
+        results = response.get("results", [])
+        if len(results) == limit and (page + 1) * limit < response.get("total", 0):
+            following = await fetch_page(page + 1)
+            results = results + (following or {}).get("results", [])
+        return {**response, "results": results[skip:skip + limit]}
+
+    async def _iter_item_pages(
+        self,
+        library_id: str,
+        limit: int,
+        offset: int,
+        concurrency: int,
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Yield (page_index, items) as pages arrive.
+
+        The first page is fetched alone to learn the library total and the
+        server's effective page size; the remaining pages are then fetched
+        with at most `concurrency` requests in flight over the shared session.
+        """
+        first = await self._fetch_items_page(library_id, limit, offset)
+        items = first.get("results", [])
+        total = first.get("total", 0)
+        logger.info(f"Got {len(items)} items, total in library: {total}")
+        yield 0, items
+
+        # Servers may cap the page size below what we asked for
+        step = len(items) if 0 < len(items) < limit else limit
+        offsets = [
+            page_offset
+            for page_offset in range(offset + len(items), total, step)
+            if page_offset <= MAX_LIBRARY_OFFSET
+        ]
+        if not items or not offsets:
+            return
+        if offsets[-1] + step < total:
+            logger.warning(f"Offset exceeded {MAX_LIBRARY_OFFSET}, stopping pagination")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(index: int, page_offset: int) -> Tuple[int, List[Dict[str, Any]]]:
+            async with semaphore:
+                response = await self._fetch_items_page(library_id, step, page_offset)
+                return index, response.get("results", [])
+
+        tasks = [
+            asyncio.ensure_future(fetch(index, page_offset))
+            for index, page_offset in enumerate(offsets, start=1)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield await next_page
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def get_library_items(
         self,
         library_id: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get library items with automatic pagination.
 
-        Fetches all items by respecting the API's total field and paginating
-        through results.
+        Fetches the first page to learn the API's total, then fetches the
+        remaining pages concurrently and reassembles them in library order.
 
         Args:
             library_id: Specific library ID (if None, uses first library)
             limit: Items per page (max 1000)
             offset: Starting offset
+            concurrency: Pages in flight (default: page_concurrency)
 
         Returns:
             List of book metadata dictionaries
@@ -191,48 +307,169 @@ class AudiobookshelfClient:
             >>> books = await client.get_library_items(limit=50)
             >>> print(f"Found {len(books)} books")
         """
-        # Get libraries if no library_id specified
+        library_id = await self._resolve_library_id(library_id)
         if not library_id:
-            libraries = await self._request("GET", "/api/libraries")
-            if not libraries or not libraries.get("libraries"):
-                logger.warning("No libraries found")
-                return []
-            library_id = libraries["libraries"][0]["id"]
-            logger.info(f"Using library: {library_id}")
+            return []
+
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        async for index, items in self._iter_item_pages(
+            library_id,
+            min(limit, 1000),  # API max is 1000
+            offset,
+            concurrency or self.page_concurrency,
+        ):
+            pages[index] = items
+
+        all_items = [item for index in sorted(pages) for item in pages[index]]
+        logger.info(f"Retrieved {len(all_items)} total items")
+        return all_items
 
-        all_items = []
-        current_offset = offset
+    async def stream_library_items(
+        self,
+        library_id: Optional[str] = None,
+        limit: int = 500,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield library items as their pages arrive.
+
+        Same fetch pattern as get_library_items(), but items are handed to
+        the caller page by page instead of after the last page lands. Pages
+        after the first arrive in completion order, not library order.
+
+        Args:
+            library_id: Specific library ID (if None, uses first library)
+            limit: Items per page (max 1000)
+            concurrency: Pages in flight (default: page_concurrency)
+
+        Example:
+            >>> async for item in client.stream_library_items():
+            ...     process(item)
+        """
+        library_id = await self._resolve_library_id(library_id)
+        if not library_id:
+            return
+
+        async for _, items in self._iter_item_pages(
+            library_id,
+            min(limit, 1000),
+            0,
+            concurrency or self.page_concurrency,
+        ):
+            for item in items:
+                yield item
+
+    async def iter_library_items(
+        self,
+        library_id: Optional[str] = None,
+        record: Optional[type] = None,
+        limit: int = 500,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream library items projected into compact records.
+
+        Each page is projected with record.from_item() as it arrives and
+        then dropped, so memory stays bounded by the pages in flight rather
+        than the library size.
+
+        Args:
+            library_id: Specific library ID (if None, uses first library)
+            record: Record class with a from_item() classmethod, e.g.
+                BookRecord or NarratorRecord (None yields raw item dicts)
+            limit: Items per page (max 1000)
+            concurrency: Pages in flight (default: page_concurrency)
+
+        Example:
+            >>> async for book in client.iter_library_items(record=BookRecord):
+            ...     print(book.title)
+        """
+        async for item in self.stream_library_items(library_id, limit=limit, concurrency=concurrency):
+            yield record.from_item(item) if record else item
+
+    async def get_recent_library_items(
+        self,
+        library_id: str,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most recently added library items in a single request.
+
+        Args:
+            library_id: Library ID
+            limit: Number of items (max 1000)
+
+        Returns:
+            Library items, newest addedAt first
+        """
+        params = {"limit": min(limit, 1000), "page": 0, "sort": "addedAt", "desc": 1}
+        response = await self._request("GET", f"/api/libraries/{library_id}/items", params=params)
+        items = response.get("results", [])
+        # Keep the order guaranteed even if the server ignores the sort
+        items.sort(key=lambda item: item.get("addedAt") or 0, reverse=True)
+        return items
+
+    async def get_library_items_since(
+        self,
+        library_id: str,
+        since_ms: int,
+        page_size: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Get library items updated at or after a watermark.
+
+        Pages through the library sorted by updatedAt (newest first) and stops
+        at the first item older than since_ms, so only changed items are
+        transferred. Items sharing the watermark timestamp are returned again;
+        callers upsert, so that is harmless.
+
+        Args:
+            library_id: Library ID
+            since_ms: updatedAt watermark in epoch milliseconds
+            page_size: Items per page (max 1000)
+
+        Returns:
+            Dict with:
+                - items: Changed library items (newest first)
+                - total: Total items in the library as reported by ABS
+                - ordered: False if the server ignored the sort order, in
+                  which case items is incomplete and a full fetch is needed
+        """
+        endpoint = f"/api/libraries/{library_id}/items"
+        changed: List[Dict[str, Any]] = []
+        total = 0
+        page = 0
+        previous_ms: Optional[int] = None
 
         while True:
-            endpoint = f"/api/libraries/{library_id}/items"
             params = {
-                "limit": min(limit, 1000),  # API max is 1000
-                "offset": current_offset,
+                "limit": min(page_size, 1000),
+                "page": page,
+                "sort": "updatedAt",
+                "desc": 1,
             }
-
-            logger.info(f"Fetching items: offset={current_offset}, limit={params['limit']}")
-
             response = await self._request("GET", endpoint, params=params)
-
             items = response.get("results", [])
-            all_items.extend(items)
-
-            total = response.get("total", 0)
-            logger.info(f"Got {len(items)} items, total in library: {total}")
+            total = response.get("total", total)
 
-            # Check if we have all items
-            if current_offset + len(items) >= total:
-                break
+            for item in items:
+                updated_ms = item.get("updatedAt") or item.get("addedAt") or 0
+                if previous_ms is not None and updated_ms > previous_ms:
+                    logger.warning("Library items are not sorted by updatedAt, incremental fetch unavailable")
+                    return {"items": changed, "total": total, "ordered": False}
+                previous_ms = updated_ms
 
-            current_offset += len(items)
+                if updated_ms < since_ms:
+                    logger.info(f"Fetched {len(changed)} items changed since {since_ms}")
+                    return {"items": changed, "total": total, "ordered": True}
+                changed.append(item)
 
-            # Safety check to avoid infinite loops
-            if current_offset > 100000:
-                logger.warning("Offset exceeded 100k, stopping pagination")
+            if not items or (page + 1) * params["limit"] >= total:
                 break
+            page += 1
 
-        logger.info(f"Retrieved {len(all_items)} total items")
-        return all_items
+        logger.info(f"Fetched {len(changed)} items changed since {since_ms}")
+        return {"items": changed, "total": total, "ordered": True}
 
     async def get_book_by_id(self, abs_id: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,65 @@
+"""
+Compact records for streaming Audiobookshelf library items
+
+A full ABS library item is a deeply nested dict (media, audio files,
+chapters, tags...). Consumers that walk the whole library only need a few
+metadata fields, so they project each item into one of these slotted
+records as it streams past and let the original dict be freed.
+
+Usage:
+    async for book in client.iter_library_items(record=BookRecord):
+        index[book.author].append(book.title)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return media.metadata of an ABS library item (empty dict if missing)."""
+    return (item.get("media") or {}).get("metadata") or {}
+
+
+def _text(value: Any) -> str:
+    """Normalize an optional metadata value to a stripped string."""
+    return value.strip() if isinstance(value, str) else ""
+
+
+@dataclass(slots=True, frozen=True)
+class BookRecord:
+    """Identity fields: used for library inventory and author/series analysis."""
+
+    id: str
+    title: str
+    author: str
+    series: str
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "BookRecord":
+        metadata = _metadata(item)
+        return cls(
+            id=item.get("id") or "",
+            title=_text(metadata.get("title")),
+            author=_text(metadata.get("authorName") or metadata.get("author")),
+            series=_text(metadata.get("seriesName")),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class NarratorRecord:
+    """Fields needed for metadata quality checks and narrator population."""
+
+    id: str
+    title: str
+    author: str
+    narrator: str
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "NarratorRecord":
+        metadata = _metadata(item)
+        return cls(
+            id=item.get("id") or "",
+            title=_text(metadata.get("title")),
+            author=_text(metadata.get("authorName")),
+            narrator=_text(metadata.get("narrator") or metadata.get("narratorName")),
+        )
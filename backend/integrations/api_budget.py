@@ -0,0 +1,307 @@
+"""
+External API Budget
+
+Request budgets for external APIs (Google Books, Hardcover) kept in one
+SQLite file, so every client instance, scheduler thread and process draws
+from the same daily quota and per-second rate instead of counting from
+zero each time a client is built.
+
+Each named bucket has a token bucket for the request rate and an optional
+daily quota (reset at midnight UTC). Batch jobs can reserve part of the
+daily quota up front and size their work to what was granted.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from mamcrawler.storage import open_state_db
+
+logger = logging.getLogger(__name__)
+
+API_BUDGET_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_budget (
+    name TEXT PRIMARY KEY, tokens REAL NOT NULL, refilled_at REAL NOT NULL,
+    day TEXT NOT NULL, used INTEGER NOT NULL, reserved INTEGER NOT NULL
+);
+"""
+
+
+class QuotaExceededError(Exception):
+    """A bucket's daily quota is used up."""
+
+    def __init__(self, name: str, resets_at: datetime):
+        self.name = name
+        self.resets_at = resets_at
+        super().__init__(f"Daily quota for {name} exceeded, resets at {resets_at.isoformat()}")
+
+
+@dataclass
+class BucketConfig:
+    """Limits of one API bucket."""
+    rate: float  # Requests per second
+    burst: int = 1  # Requests allowed back to back
+    daily_quota: Optional[int] = None  # Requests per UTC day (None = unlimited)
+
+
+class Reservation:
+    """
+    Share of a bucket's daily quota set aside for one batch.
+
+    Requests made with the reservation draw from it first. Use it as a
+    context manager (or call release()) to hand unused requests back.
+    """
+
+    def __init__(self, budget: "ApiBudget", name: str, day: str, granted: int):
+        self.budget = budget
+        self.name = name
+        self.day = day
+        self.granted = granted
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.granted - self.used
+
+    def release(self):
+        """Return the unused part of the reservation to the daily quota."""
+        self.budget.release(self)
+
+    def __enter__(self) -> "Reservation":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def _utc_day(now: float) -> str:
+    return datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _next_reset(day: str) -> datetime:
+    return datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
+
+
+class ApiBudget:
+    """
+    Cross-process token buckets with daily quotas, stored in SQLite.
+
+    State (tokens, requests used and reserved today) lives in the database
+    file and is updated in IMMEDIATE transactions, so concurrent processes
+    see each other's requests. Limits are configured per process with
+    configure().
+    """
+
+    def __init__(self, path: Optional[str] = None, buckets: Optional[Dict[str, BucketConfig]] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            path: SQLite file holding the budget state (None = memory only)
+            buckets: Initial bucket limits by name
+        """
+        self.path = path
+        self.buckets: Dict[str, BucketConfig] = dict(buckets or {})
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Budget connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.path, API_BUDGET_SCHEMA)
+        return self._conn
+
+    def configure(self, name: str, config: BucketConfig):
+        """Set the limits of a bucket for this process."""
+        self.buckets[name] = config
+
+    def _transaction(self, name: str, now: float, update):
+        """
+        Run update(state) on a bucket's current state in one transaction.
+
+        state is a dict of tokens (refilled to now), day, used and reserved;
+        update may change it and returns the transaction's result.
+        """
+        config = self.buckets[name]
+        day = _utc_day(now)
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tokens, refilled_at, day, used, reserved FROM api_budget WHERE name = ?", (name,)
+                ).fetchone()
+                if row is None:
+                    state = {"tokens": float(config.burst), "day": day, "used": 0, "reserved": 0}
+                else:
+                    tokens, refilled_at, row_day, used, reserved = row
+                    state = {
+                        "tokens": min(float(config.burst), tokens + max(0.0, now - refilled_at) * config.rate),
+                        "day": row_day, "used": used, "reserved": reserved,
+                    }
+                    if row_day != day:
+                        state.update(day=day, used=0, reserved=0)
+
+                result = update(state)
+                conn.execute(
+                    "INSERT OR REPLACE INTO api_budget (name, tokens, refilled_at, day, used, reserved) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (name, state["tokens"], now, state["day"], state["used"], state["reserved"])
+                )
+                conn.execute("COMMIT")
+                return result
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def try_acquire(self, name: str, reservation: Optional[Reservation] = None) -> float:
+        """
+        Take one request from a bucket if the rate allows it now.
+
+        Args:
+            name: Bucket name
+            reservation: Reservation to draw the daily quota from first
+
+        Returns:
+            0.0 if the request was taken, otherwise seconds to wait before
+            trying again
+
+        Raises:
+            QuotaExceededError: The daily quota (and reservation) is used up
+        """
+        config = self.buckets[name]
+        now = time.time()
+
+        def update(state):
+            from_reservation = (
+                reservation is not None and reservation.remaining > 0 and reservation.day == state["day"]
+            )
+            if (
+                not from_reservation and config.daily_quota is not None
+                and state["used"] + state["reserved"] >= config.daily_quota
+            ):
+                raise QuotaExceededError(name, _next_reset(state["day"]))
+            if state["tokens"] < 1.0:
+                return (1.0 - state["tokens"]) / config.rate
+
+            state["tokens"] -= 1.0
+            state["used"] += 1
+            if from_reservation:
+                state["reserved"] -= 1
+                reservation.used += 1
+            return 0.0
+
+        return self._transaction(name, now, update)
+
+    async def acquire(self, name: str, reservation: Optional[Reservation] = None):
+        """
+        Take one request from a bucket, waiting for the rate if needed.
+
+        The transaction runs in a worker thread, so waiting on another
+        process's write lock never blocks the event loop.
+
+        Raises:
+            QuotaExceededError: The daily quota (and reservation) is used up
+        """
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire, name, reservation)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self, name: str, reservation: Optional[Reservation] = None):
+        """acquire() for synchronous callers (e.g. scheduler threads)."""
+        while True:
+            wait = self.try_acquire(name, reservation)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def reserve(self, name: str, count: int) -> Reservation:
+        """
+        Set aside up to count requests of today's quota.
+
+        Args:
+            name: Bucket name
+            count: Requests wanted
+
+        Returns:
+            Reservation whose granted count is what was available (possibly 0)
+        """
+        config = self.buckets[name]
+
+        def update(state):
+            available = count
+            if config.daily_quota is not None:
+                available = max(0, min(count, config.daily_quota - state["used"] - state["reserved"]))
+            state["reserved"] += available
+            return Reservation(self, name, state["day"], available)
+
+        reservation = self._transaction(name, time.time(), update)
+        logger.info(f"Reserved {reservation.granted}/{count} {name} requests")
+        return reservation
+
+    def release(self, reservation: Reservation):
+        """Return a reservation's unused requests to the daily quota."""
+        unused = reservation.remaining
+        if unused <= 0:
+            return
+
+        def update(state):
+            # A reservation from an earlier day was already dropped by the reset
+            if state["day"] == reservation.day:
+                state["reserved"] = max(0, state["reserved"] - unused)
+
+        self._transaction(reservation.name, time.time(), update)
+        reservation.granted = reservation.used
+
+    def status(self, name: str) -> Dict[str, Any]:
+        """
+        Current use of a bucket.
+
+        Returns:
+            Dict with daily_quota, used, reserved, remaining (None if
+            unlimited), tokens and reset_time
+        """
+        config = self.buckets[name]
+        state = self._transaction(name, time.time(), lambda state: dict(state))
+        remaining = None
+        if config.daily_quota is not None:
+            remaining = max(0, config.daily_quota - state["used"] - state["reserved"])
+        return {
+            "daily_quota": config.daily_quota,
+            "used": state["used"],
+            "reserved": state["reserved"],
+            "remaining": remaining,
+            "tokens": state["tokens"],
+            "reset_time": _next_reset(state["day"]).isoformat(),
+        }
+
+    def close(self):
+        """Close the budget connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton
+_budget = None
+_budget_lock = threading.Lock()
+
+
+def get_api_budget() -> ApiBudget:
+    """Get the shared API budget (stored at Settings.API_BUDGET_FILE)."""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            from backend.config import get_settings
+
+            _budget = ApiBudget(str(get_settings().API_BUDGET_FILE))
+    return _budget
@@ -22,7 +22,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-from backend.integrations.hardcover_client import HardcoverClient, ResolutionResult
+from backend.integrations.hardcover_client import BookLookup, HardcoverClient, ResolutionResult
 
 logger = logging.getLogger(__name__)
 
@@ -231,7 +231,8 @@ class AudiobookShelfHardcoverSync:
         self,
         item_id: str,
         abs_metadata: AudiobookMetadata,
-        auto_update: bool = False
+        auto_update: bool = False,
+        resolution: Optional[ResolutionResult] = None
     ) -> SyncResult:
         """
         Sync a single audiobook
@@ -240,6 +241,8 @@ class AudiobookShelfHardcoverSync:
             item_id: AudiobookShelf item ID
             abs_metadata: Current ABS metadata
             auto_update: Auto-update if confidence > 0.95
+            resolution: Hardcover resolution already made (e.g. by a batch);
+                resolved here if None
 
         Returns:
             SyncResult with changes made
@@ -247,7 +250,7 @@ class AudiobookShelfHardcoverSync:
         logger.info(f"Syncing: {abs_metadata.title} by {abs_metadata.author}")
 
         # Resolve via Hardcover
-        result = await self.hardcover_client.resolve_book(
+        result = resolution or await self.hardcover_client.resolve_book(
             title=abs_metadata.title,
             author=abs_metadata.author,
             isbn=abs_metadata.isbn
@@ -269,7 +272,7 @@ class AudiobookShelfHardcoverSync:
             match.hardcover_series = result.book.get_primary_series()
 
         # Compare with existing ABS data
-        matches, differences = await self._compare_metadata(abs_metadata, result)
+        matches, differences = self._compare_metadata(abs_metadata, result)
 
         # Determine action
         sync_result = SyncResult(
@@ -415,10 +418,12 @@ class AudiobookShelfHardcoverSync:
                     items = batch.get("results", [])
                     if not items:
                         break
+                    if limit:
+                        items = items[:limit - processed]
 
-                    for item in items:
-                        # Extract metadata
-                        abs_data = AudiobookMetadata(
+                    # Extract metadata
+                    abs_items = [
+                        AudiobookMetadata(
                             id=item.get("id"),
                             title=item.get("media", {}).get("metadata", {}).get("title", "Unknown"),
                             author=item.get("media", {}).get("metadata", {}).get("authors", [{}])[0].get("name", "Unknown"),
@@ -426,12 +431,22 @@ class AudiobookShelfHardcoverSync:
                             series_sequence=item.get("media", {}).get("metadata", {}).get("series", {}).get("sequence"),
                             path=item.get("path", "")
                         )
+                        for item in items
+                    ]
+
+                    # Resolve the whole page in batched Hardcover requests
+                    resolutions = await hc_client.resolve_books([
+                        BookLookup(title=abs_data.title, author=abs_data.author, isbn=abs_data.isbn)
+                        for abs_data in abs_items
+                    ])
 
+                    for item, abs_data, resolution in zip(items, abs_items, resolutions):
                         # Sync item
                         sync_result = await self.sync_audiobook(
                             item.get("id"),
                             abs_data,
-                            auto_update=auto_update and abs_data.author != "Unknown"
+                            auto_update=auto_update and abs_data.author != "Unknown",
+                            resolution=resolution
                         )
                         results.append(sync_result)
                         processed += 1
@@ -11,13 +11,15 @@ import logging
 import os
 import random
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, quote
 
 import aiohttp
 from bs4 import BeautifulSoup
 
+from backend.integrations.metadata_cache import MISSING, MetadataCache, get_metadata_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +69,8 @@ class GoodreadsWebCrawler:
         self.password = password
         self.session = None
         self.authenticated = False
+        # Whether the last search/details request got a page (an empty result is then a real miss)
+        self.last_request_ok = False
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -158,6 +162,7 @@ class GoodreadsWebCrawler:
         Returns:
             List of book results
         """
+        self.last_request_ok = False
         if not self.session:
             logger.error("Not authenticated. Call authenticate() first.")
             return []
@@ -196,6 +201,7 @@ class GoodreadsWebCrawler:
                         logger.debug(f"Error parsing book result: {e}")
                         continue
 
+                self.last_request_ok = True
                 return results
 
         except Exception as e:
@@ -212,6 +218,7 @@ class GoodreadsWebCrawler:
         Returns:
             BookMetadata or None
         """
+        self.last_request_ok = False
         if not self.session:
             logger.error("Not authenticated")
             return None
@@ -227,6 +234,10 @@ class GoodreadsWebCrawler:
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=30)
             ) as resp:
+                if resp.status == 404:
+                    logger.debug(f"Book not found on Goodreads: {goodreads_id}")
+                    self.last_request_ok = True
+                    return None
                 if resp.status != 200:
                     logger.error(f"Failed to fetch book details: {resp.status}")
                     return None
@@ -236,6 +247,7 @@ class GoodreadsWebCrawler:
 
                 # Extract metadata from page
                 metadata = self._parse_book_page(soup, goodreads_id, url)
+                self.last_request_ok = True
                 return metadata
 
         except Exception as e:
@@ -334,16 +346,17 @@ class GoodreadsMetadataResolver:
     3. Fuzzy matching (for variations)
     """
 
-    def __init__(self, email: str, password: str):
+    def __init__(self, email: str, password: str, cache: Optional[MetadataCache] = None):
         """
         Initialize resolver
 
         Args:
             email: Goodreads login email
             password: Goodreads login password
+            cache: Page lookup cache (default: the shared persistent metadata cache)
         """
         self.crawler = GoodreadsWebCrawler(email, password)
-        self.cache = {}
+        self.cache = cache or get_metadata_cache()
 
     async def initialize(self) -> bool:
         """Initialize the resolver (authenticate)"""
@@ -382,15 +395,38 @@ class GoodreadsMetadataResolver:
         result = await self._resolve_by_fuzzy(title, author)
         return result
 
+    async def _search_books(self, title: str, author: str = "") -> List[Dict]:
+        """Crawler search through the cache"""
+        key = f"{title}|{author}"
+        cached = self.cache.get("goodreads:search", key)
+        if cached is not MISSING:
+            return cached
+
+        results = await self.crawler.search_books(title, author)
+        if self.crawler.last_request_ok:
+            self.cache.set("goodreads:search", key, results)
+        return results
+
+    async def _get_book_details(self, goodreads_id: str) -> Optional[BookMetadata]:
+        """Crawler book page through the cache"""
+        cached = self.cache.get("goodreads:book", goodreads_id)
+        if cached is not MISSING:
+            return BookMetadata(**cached) if cached else None
+
+        metadata = await self.crawler.get_book_details(goodreads_id)
+        if self.crawler.last_request_ok:
+            self.cache.set("goodreads:book", goodreads_id, asdict(metadata) if metadata else None)
+        return metadata
+
     async def _resolve_by_isbn(self, isbn: str) -> ResolutionResult:
         """Stage 1: Resolve by ISBN"""
         try:
-            results = await self.crawler.search_books(isbn)
+            results = await self._search_books(isbn)
 
             if results:
                 # Get detailed info for first result
                 first_result = results[0]
-                metadata = await self.crawler.get_book_details(first_result['goodreads_id'])
+                metadata = await self._get_book_details(first_result['goodreads_id'])
 
                 if metadata and metadata.isbn == isbn:
                     return ResolutionResult(
@@ -419,7 +455,7 @@ class GoodreadsMetadataResolver:
     async def _resolve_by_title_author(self, title: str, author: str) -> ResolutionResult:
         """Stage 2: Resolve by Title + Author"""
         try:
-            results = await self.crawler.search_books(title, author)
+            results = await self._search_books(title, author)
 
             if not results:
                 return ResolutionResult(
@@ -431,7 +467,7 @@ class GoodreadsMetadataResolver:
 
             # Get details for top result
             first_result = results[0]
-            metadata = await self.crawler.get_book_details(first_result['goodreads_id'])
+            metadata = await self._get_book_details(first_result['goodreads_id'])
 
             if metadata:
                 # Calculate confidence based on title and author match
@@ -483,10 +519,10 @@ class GoodreadsMetadataResolver:
             best_confidence = 0.0
 
             for title_var in title_variations:
-                results = await self.crawler.search_books(title_var, author)
+                results = await self._search_books(title_var, author)
 
                 for result in results[:5]:
-                    metadata = await self.crawler.get_book_details(result['goodreads_id'])
+                    metadata = await self._get_book_details(result['goodreads_id'])
 
                     if metadata:
                         title_sim = self._text_similarity(title, metadata.title)
@@ -6,8 +6,9 @@ Includes rate limiting and caching to stay within free tier limits.
 """
 
 import logging
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import asyncio
 
 import aiohttp
@@ -19,6 +20,15 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from backend.integrations.api_budget import (
+    ApiBudget,
+    BucketConfig,
+    QuotaExceededError,
+    Reservation,
+    get_api_budget,
+)
+from backend.integrations.metadata_cache import MISSING, MetadataCache, get_metadata_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +56,8 @@ class GoogleBooksClient:
         api_key: Google Books API key (optional, increases rate limits)
         timeout: Request timeout in seconds (default: 30)
         max_requests_per_day: Maximum daily requests (default: 900 to stay safe)
+        cache: Response cache (default: the shared persistent metadata cache)
+        budget: Request budget (default: the shared cross-process API budget)
 
     Example:
         >>> async with GoogleBooksClient(api_key) as client:
@@ -54,27 +66,30 @@ class GoogleBooksClient:
     """
 
     BASE_URL = "https://www.googleapis.com/books/v1"
+    BUDGET_NAME = "google_books"
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_requests_per_day: int = 900,
+        cache: Optional[MetadataCache] = None,
+        budget: Optional[ApiBudget] = None,
     ):
         self.api_key = api_key
         self.timeout = ClientTimeout(total=timeout)
         self.max_requests_per_day = max_requests_per_day
         self.session: Optional[aiohttp.ClientSession] = None
 
-        # Rate limiting tracking
-        self._request_count = 0
-        self._request_reset_time = datetime.now() + timedelta(days=1)
-        self._last_request_time = datetime.now()
-        self._min_request_interval = timedelta(seconds=1)  # 1 request per second
+        # Rate limiting shared with other clients and processes (1 request per second)
+        self.budget = budget or get_api_budget()
+        self.budget.configure(
+            self.BUDGET_NAME, BucketConfig(rate=1.0, burst=1, daily_quota=max_requests_per_day)
+        )
+        self.reservation: Optional[Reservation] = None
 
-        # Simple in-memory cache
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_ttl = timedelta(hours=24)
+        # Persistent cache shared with other clients and processes
+        self.cache = cache or get_metadata_cache()
 
         logger.info(
             f"Initialized GoogleBooksClient "
@@ -97,58 +112,60 @@ class GoogleBooksClient:
         if not self.session:
             self.session = aiohttp.ClientSession(timeout=self.timeout)
 
-    def _check_rate_limit(self):
+    def _check_rate_limit(self) -> float:
         """
-        Check if rate limit allows request.
+        Take one request from the shared budget if the rate allows it.
+
+        Returns:
+            0 if the request was taken, otherwise seconds to wait
 
         Raises:
-            GoogleBooksRateLimitError: If rate limit exceeded
+            GoogleBooksRateLimitError: If the daily quota is used up
         """
-        now = datetime.now()
-
-        # Reset daily counter if needed
-        if now >= self._request_reset_time:
-            logger.info("Resetting daily request counter")
-            self._request_count = 0
-            self._request_reset_time = now + timedelta(days=1)
-
-        # Check daily limit
-        if self._request_count >= self.max_requests_per_day:
-            reset_in = self._request_reset_time - now
+        try:
+            return self.budget.try_acquire(self.BUDGET_NAME, self.reservation)
+        except QuotaExceededError as e:
+            reset_in = e.resets_at - datetime.now(timezone.utc)
             logger.error(
                 f"Daily rate limit exceeded ({self.max_requests_per_day} requests). "
                 f"Resets in {reset_in}"
             )
             raise GoogleBooksRateLimitError(
                 f"Daily rate limit exceeded. Resets in {reset_in}"
-            )
-
-        # Check minimum interval between requests
-        time_since_last = now - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            sleep_time = (self._min_request_interval - time_since_last).total_seconds()
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            return sleep_time
-
-        return 0
+            ) from e
 
     async def _rate_limited_sleep(self):
-        """Sleep if needed to respect rate limits."""
-        sleep_time = self._check_rate_limit()
-        if sleep_time > 0:
+        """Wait until the budget allows a request, then take it."""
+        while True:
+            # Off the event loop: the budget may wait on another process's lock
+            sleep_time = await asyncio.to_thread(self._check_rate_limit)
+            if not sleep_time:
+                return
+            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
             await asyncio.sleep(sleep_time)
 
-    def _increment_request_count(self):
-        """Increment request counter and update last request time."""
-        self._request_count += 1
-        self._last_request_time = datetime.now()
+    @contextmanager
+    def reserved(self, count: int):
+        """
+        Reserve up to count requests of today's quota for a batch.
+
+        Requests made inside the block draw from the reservation; unused
+        requests are returned when it exits.
 
-        logger.debug(
-            f"Request count: {self._request_count}/{self.max_requests_per_day} "
-            f"(resets in {self._request_reset_time - datetime.now()})"
-        )
+        Example:
+            >>> with client.reserved(len(books)) as reservation:
+            ...     for book in books[:reservation.granted]:
+            ...         await client.search(book.title)
+        """
+        reservation = self.budget.reserve(self.BUDGET_NAME, count)
+        self.reservation = reservation
+        try:
+            yield reservation
+        finally:
+            self.reservation = None
+            reservation.release()
 
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+    def _get_from_cache(self, cache_key: str) -> Any:
         """
         Get data from cache if not expired.
 
@@ -156,30 +173,23 @@ class GoogleBooksClient:
             cache_key: Cache key
 
         Returns:
-            Cached data or None if not found/expired
+            Cached data (an empty result if the lookup found nothing) or
+            MISSING if not cached/expired
         """
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            age = datetime.now() - cached_time
+        cached = self.cache.get("google_books", cache_key)
+        if cached is not MISSING:
+            logger.debug(f"Cache hit: {cache_key}")
+        return cached
 
-            if age < self._cache_ttl:
-                logger.debug(f"Cache hit: {cache_key} (age: {age})")
-                return cached_data
-            else:
-                logger.debug(f"Cache expired: {cache_key} (age: {age})")
-                del self._cache[cache_key]
-
-        return None
-
-    def _add_to_cache(self, cache_key: str, data: Dict[str, Any]):
+    def _add_to_cache(self, cache_key: str, data: Any):
         """
         Add data to cache.
 
         Args:
             cache_key: Cache key
-            data: Data to cache
+            data: Data to cache (empty for not found)
         """
-        self._cache[cache_key] = (data, datetime.now())
+        self.cache.set("google_books", cache_key, data)
         logger.debug(f"Cached: {cache_key}")
 
     @retry(
@@ -198,7 +208,6 @@ class GoogleBooksClient:
         Includes infinite backoff for 429 Rate Limits.
         """
         await self._ensure_session()
-        await self._rate_limited_sleep()
 
         url = f"{self.BASE_URL}{endpoint}"
 
@@ -212,11 +221,10 @@ class GoogleBooksClient:
 
         # Infinite loop for Rate Limit handling (User Request)
         while True:
+            # Every attempt, including retries after a 429, counts against the quota
+            await self._rate_limited_sleep()
             try:
                 async with self.session.get(url, params=params) as response:
-                    # Increment counter before checking status
-                    self._increment_request_count()
-
                     # Check for rate limit errors
                     if response.status == 429:
                         logger.warning("API rate limit exceeded (429). Sleeping 60s...")
@@ -271,9 +279,9 @@ class GoogleBooksClient:
             ...     print(f"{book['volumeInfo']['title']} by {book['volumeInfo']['authors']}")
         """
         # Check cache first
-        cache_key = f"search:{title}:{author}:{isbn}"
+        cache_key = f"search:{title}:{author}:{isbn}:{min(max_results, 40)}"
         cached = self._get_from_cache(cache_key)
-        if cached:
+        if cached is not MISSING:
             return cached
 
         # Build query
@@ -335,7 +343,7 @@ class GoogleBooksClient:
         # Check cache first
         cache_key = f"details:{book_id}"
         cached = self._get_from_cache(cache_key)
-        if cached:
+        if cached is not MISSING:
             return cached
 
         logger.info(f"Getting details for book: {book_id}")
@@ -487,21 +495,22 @@ class GoogleBooksClient:
             >>> print(f"Requests used: {status['requests_used']}/{status['max_requests']}")
             >>> print(f"Resets in: {status['reset_in']}")
         """
-        now = datetime.now()
-        reset_in = self._request_reset_time - now
+        status = self.budget.status(self.BUDGET_NAME)
+        reset_in = datetime.fromisoformat(status["reset_time"]) - datetime.now(timezone.utc)
 
         return {
-            "requests_used": self._request_count,
+            "requests_used": status["used"],
+            "requests_reserved": status["reserved"],
             "max_requests": self.max_requests_per_day,
-            "requests_remaining": self.max_requests_per_day - self._request_count,
-            "reset_time": self._request_reset_time.isoformat(),
+            "requests_remaining": status["remaining"],
+            "reset_time": status["reset_time"],
             "reset_in": str(reset_in),
         }
 
     def clear_cache(self):
-        """Clear the in-memory cache."""
-        logger.info(f"Clearing cache ({len(self._cache)} entries)")
-        self._cache.clear()
+        """Clear cached Google Books responses."""
+        logger.info("Clearing Google Books cache")
+        self.cache.invalidate("google_books")
 
     async def close(self):
         """Close client session."""
@@ -6,6 +6,9 @@ from datetime import datetime
 from dataclasses import dataclass, field
 import asyncio
 
+from backend.integrations.api_budget import ApiBudget, BucketConfig, get_api_budget
+from backend.integrations.metadata_cache import MISSING, MetadataCache, get_metadata_cache
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -51,6 +54,13 @@ class HardcoverBook:
         first = self.series_entries[0]
         return (first.series.name, first.position)
 
+@dataclass
+class BookLookup:
+    """One book to resolve in HardcoverClient.resolve_books()"""
+    title: str
+    author: str = ""
+    isbn: Optional[str] = None
+
 @dataclass
 class ResolutionResult:
     success: bool
@@ -60,8 +70,60 @@ class ResolutionResult:
     note: Optional[str] = None
     raw_payload: Optional[Dict[str, Any]] = None
 
+# Book fields requested by batch lookups (same as the single-book queries)
+BOOK_FIELDS = """
+fragment BookFields on books {
+    id
+    title
+    slug
+    description
+    release_date
+    contributions {
+        author {
+            name
+        }
+    }
+    editions {
+        id
+        isbn_10
+        isbn_13
+    }
+    book_series {
+        position
+        series {
+            id
+            name
+        }
+    }
+}
+"""
+
+# Lookups per batched GraphQL document: initial size and bounds
+BATCH_SIZE = 25
+MIN_BATCH_SIZE = 1
+MAX_BATCH_SIZE = 100
+
+# Batched documents in flight at once
+MAX_CONCURRENT_BATCHES = 3
+
+# Confidence and resolution_method of each lookup stage
+STAGES = {
+    "isbn": (1.0, "isbn"),
+    "title_author": (0.9, "title_author"),
+    "search": (0.7, "fuzzy"),
+}
+
 class HardcoverClient:
-    def __init__(self, api_token: str):
+    # Hardcover allows 60 requests per minute per token
+    BUDGET_NAME = "hardcover"
+    BUDGET = BucketConfig(rate=1.0, burst=5)
+
+    def __init__(
+        self,
+        api_token: str,
+        cache: Optional[MetadataCache] = None,
+        budget: Optional[ApiBudget] = None
+    ):
         self.api_token = api_token
         self.base_url = "https://api.hardcover.app/v1/graphql"
         self.headers = {
@@ -69,7 +131,11 @@ class HardcoverClient:
             "Content-Type": "application/json"
         }
         self.session = None
-        self._cache = {}  # Simple in-memory cache
+        self.cache = cache or get_metadata_cache()  # Persistent cache shared across clients
+        self.budget = budget or get_api_budget()  # Request rate shared across clients and processes
+        self.budget.configure(self.BUDGET_NAME, self.BUDGET)
+        # Adapted by batch lookups: grows while documents succeed, halves when one fails
+        self.batch_size = BATCH_SIZE
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(headers=self.headers)
@@ -91,6 +157,7 @@ class HardcoverClient:
         base_delay = 5
         
         for attempt in range(max_retries):
+            await self.budget.acquire(self.BUDGET_NAME)
             try:
                 async with self.session.post(self.base_url, json=payload) as resp:
                     if resp.status == 429:
@@ -141,11 +208,25 @@ class HardcoverClient:
             parts.append(f"{k}:{v}")
         return "|".join(parts)
 
-    def _get_from_cache(self, key: str) -> Optional[HardcoverBook]:
-        return self._cache.get(key)
+    def _get_from_cache(self, key: str) -> Any:
+        """Cached book payload, None if cached as not found, or MISSING."""
+        return self.cache.get("hardcover", key)
 
-    def _save_to_cache(self, key: str, book: HardcoverBook):
-        self._cache[key] = book
+    def _save_to_cache(self, key: str, payload: Optional[Dict[str, Any]]):
+        """Cache a book payload as returned by the API (None = not found)."""
+        self.cache.set("hardcover", key, payload)
+
+    def _cached_result(self, key: str, confidence: float, method: str) -> Optional[ResolutionResult]:
+        """ResolutionResult for a cached lookup, or None if it is not cached."""
+        payload = self._get_from_cache(key)
+        if payload is MISSING:
+            return None
+        if payload is None:
+            return ResolutionResult(success=False, confidence=0.0, resolution_method=method, note="Cached: not found")
+        return ResolutionResult(
+            success=True, book=self._deserialize_book(payload), confidence=confidence,
+            resolution_method=method, raw_payload=payload
+        )
 
     def _deserialize_book(self, data: Dict[str, Any]) -> HardcoverBook:
         # Robust deserialization ignoring missing fields
@@ -240,13 +321,208 @@ class HardcoverClient:
             logger.warning(f"Google Books fallback failed: {e}")
         return None
 
+    # --- BATCHED RESOLUTION ---
+
+    async def resolve_books(
+        self,
+        lookups: List[BookLookup],
+        max_concurrent_batches: int = MAX_CONCURRENT_BATCHES
+    ) -> List[ResolutionResult]:
+        """
+        Resolve many books with the same stages as resolve_book()
+
+        Each stage sends the lookups still unresolved in batched GraphQL
+        documents (ISBNs through one _in filter, titles as aliased queries)
+        instead of one request per book, so a library of thousands of books
+        takes dozens of round-trips.
+
+        Args:
+            lookups: Books to resolve
+            max_concurrent_batches: Batched documents in flight at once
+
+        Returns:
+            One ResolutionResult per lookup, in the same order
+        """
+        results: List[Optional[ResolutionResult]] = [None] * len(lookups)
+
+        async def run_stage(stage: str, keys_by_index: Dict[int, tuple]):
+            resolved = await self._resolve_stage(stage, set(keys_by_index.values()), max_concurrent_batches)
+            for i, key in keys_by_index.items():
+                if resolved[key].success:
+                    results[i] = resolved[key]
+
+        def unresolved(key_of) -> Dict[int, tuple]:
+            keys = {}
+            for i, lookup in enumerate(lookups):
+                key = key_of(lookup) if results[i] is None else None
+                if key:
+                    keys[i] = key
+            return keys
+
+        # Stage 1: ISBN
+        await run_stage("isbn", unresolved(
+            lambda lookup: (self._clean_isbn(lookup.isbn),) if lookup.isbn else None
+        ))
+
+        # Stage 2: Title + Author
+        await run_stage("title_author", unresolved(
+            lambda lookup: (lookup.title, lookup.author) if lookup.title and lookup.author else None
+        ))
+
+        # Stage 3: Fuzzy search
+        await run_stage("search", unresolved(
+            lambda lookup: ((f"{lookup.title} {lookup.author}".strip() if lookup.title else lookup.author),)
+            if (lookup.title or lookup.author) else None
+        ))
+
+        # Stage 4: Google Books Fallback (Get ISBN -> Stage 1)
+        google_isbns = {}
+        for i, lookup in enumerate(lookups):
+            if results[i] is None:
+                logger.info(f"Falling back to Google Books for: {lookup.title} by {lookup.author}")
+                google_isbn = await self._resolve_via_google_books(lookup.title, lookup.author)
+                if google_isbn:
+                    google_isbns[i] = (self._clean_isbn(google_isbn),)
+        await run_stage("isbn", google_isbns)
+        for i in google_isbns:
+            if results[i] is not None:
+                results[i].resolution_method = "google_books_isbn"
+
+        resolved_count = sum(1 for result in results if result is not None)
+        logger.info(f"Resolved {resolved_count}/{len(lookups)} books on Hardcover")
+        return [
+            result or ResolutionResult(success=False, confidence=0.0, resolution_method="failed", note="All stages failed")
+            for result in results
+        ]
+
+    @staticmethod
+    def _clean_isbn(isbn: str) -> str:
+        return isbn.replace("-", "").replace(" ", "")
+
+    def _stage_cache_key(self, stage: str, key: tuple) -> str:
+        """Cache key of the matching single-book lookup, so both share results."""
+        if stage == "isbn":
+            return self._get_cache_key("isbn", isbn=key[0])
+        if stage == "title_author":
+            return self._get_cache_key("title_author", title=key[0], author=key[1])
+        return self._get_cache_key("search", query=key[0])
+
+    async def _resolve_stage(
+        self,
+        stage: str,
+        keys: set,
+        max_concurrent_batches: int
+    ) -> Dict[tuple, ResolutionResult]:
+        """
+        Resolve lookup keys of one stage, from the cache or in batches
+
+        Up to max_concurrent_batches batches are in flight at once. A batch
+        that fails is split in half and retried, and the batch size for
+        later batches halves with it; each successful batch grows it again.
+        """
+        confidence, method = STAGES[stage]
+        results = {}
+        pending = []
+        for key in keys:
+            cached = self._cached_result(self._stage_cache_key(stage, key), confidence, method)
+            if cached:
+                results[key] = cached
+            else:
+                pending.append(key)
+
+        async def worker():
+            while pending:
+                batch = pending[:self.batch_size]
+                del pending[:len(batch)]
+                try:
+                    payloads = await self._fetch_batch(stage, batch)
+                except Exception as e:
+                    if len(batch) == 1:
+                        logger.error(f"Hardcover {stage} lookup failed for {batch[0]}: {e}")
+                        results[batch[0]] = ResolutionResult(
+                            success=False, confidence=0.0, resolution_method=method, note=f"Error: {e}"
+                        )
+                        continue
+                    half = len(batch) // 2
+                    self.batch_size = max(MIN_BATCH_SIZE, min(self.batch_size, half))
+                    logger.warning(f"Hardcover batch of {len(batch)} failed ({e}), retrying as two")
+                    pending.extend(batch)
+                    continue
+
+                self.batch_size = min(MAX_BATCH_SIZE, max(self.batch_size, len(batch) + len(batch) // 2))
+                for key in batch:
+                    payload = payloads.get(key)
+                    self._save_to_cache(self._stage_cache_key(stage, key), payload)
+                    if payload:
+                        results[key] = ResolutionResult(
+                            success=True, book=self._deserialize_book(payload), confidence=confidence,
+                            resolution_method=method, raw_payload=payload
+                        )
+                    else:
+                        results[key] = ResolutionResult(success=False, confidence=0.0, resolution_method=method)
+
+        if pending:
+            batches = -(-len(pending) // self.batch_size)
+            await asyncio.gather(*(worker() for _ in range(min(batches, max_concurrent_batches))))
+        return results
+
+    async def _fetch_batch(self, stage: str, batch: List[tuple]) -> Dict[tuple, Optional[Dict[str, Any]]]:
+        """
+        Send one batched GraphQL document for a stage
+
+        Returns:
+            Book payload (None if not found) per lookup key
+        """
+        if stage == "isbn":
+            isbns = [key[0] for key in batch]
+            query = """
+            query GetBooksByISBNs($isbns: [String!]!, $limit: Int!) {
+                books(where: {editions: {isbn_13: {_in: $isbns}}}, limit: $limit) {
+                    ...BookFields
+                }
+            }
+            """ + BOOK_FIELDS
+            response = await self._graphql_query(query, {"isbns": isbns, "limit": len(isbns) * 2})
+
+            found = {}
+            for book in response.get("books", []):
+                for edition in book.get("editions", []):
+                    isbn = edition.get("isbn_13")
+                    if isbn in isbns and isbn not in found:
+                        found[isbn] = book
+            return {(isbn,): found.get(isbn) for isbn in isbns}
+
+        # One aliased books(...) field per lookup
+        variables = {}
+        parameters = []
+        fields = []
+        for n, key in enumerate(batch):
+            if stage == "title_author":
+                variables[f"title{n}"], variables[f"author{n}"] = key
+                parameters += [f"$title{n}: String!", f"$author{n}: String!"]
+                where = f"{{title: {{_eq: $title{n}}}, contributions: {{author: {{name: {{_eq: $author{n}}}}}}}}}"
+                fields.append(f"b{n}: books(where: {where}, limit: 1) {{ ...BookFields }}")
+            else:
+                variables[f"query{n}"] = key[0]
+                parameters.append(f"$query{n}: String!")
+                where = (
+                    f"{{_or: [{{title: {{_eq: $query{n}}}}}, "
+                    f"{{contributions: {{author: {{name: {{_eq: $query{n}}}}}}}}}]}}"
+                )
+                fields.append(f"b{n}: books(where: {where}, limit: 1, order_by: {{rating: desc}}) {{ ...BookFields }}")
+
+        query = f"query ResolveBatch({', '.join(parameters)}) {{\n" + "\n".join(fields) + "\n}\n" + BOOK_FIELDS
+        response = await self._graphql_query(query, variables)
+        return {key: (response.get(f"b{n}") or [None])[0] for n, key in enumerate(batch)}
+
     # --- SIMPLIFIED QUERIES ---
 
     async def resolve_by_isbn(self, isbn: str) -> ResolutionResult:
         isbn_clean = isbn.replace("-", "").replace(" ", "")
         cache_key = self._get_cache_key("isbn", isbn=isbn_clean)
-        if self._get_from_cache(cache_key):
-            return ResolutionResult(success=True, book=self._get_from_cache(cache_key), confidence=1.0, resolution_method="isbn")
+        cached = self._cached_result(cache_key, confidence=1.0, method="isbn")
+        if cached:
+            return cached
 
         query = """
         query GetBookByISBN($isbn: String!) {
@@ -311,9 +587,9 @@ class HardcoverClient:
         try:
             response = await self._graphql_query(query, {"isbn": isbn_clean})
             books = response.get("books", [])
+            self._save_to_cache(cache_key, books[0] if books else None)
             if books:
                 book = self._deserialize_book(books[0])
-                self._save_to_cache(cache_key, book)
                 return ResolutionResult(success=True, book=book, confidence=1.0, resolution_method="isbn", raw_payload=books[0])
         except Exception as e:
             logger.error(f"ISBN resolution failed: {e}")
@@ -322,8 +598,9 @@ class HardcoverClient:
 
     async def resolve_by_title_author(self, title: str, author: str) -> ResolutionResult:
         cache_key = self._get_cache_key("title_author", title=title, author=author)
-        if self._get_from_cache(cache_key):
-             return ResolutionResult(success=True, book=self._get_from_cache(cache_key), confidence=0.95, resolution_method="title_author")
+        cached = self._cached_result(cache_key, confidence=0.9, method="title_author")
+        if cached:
+            return cached
 
         query = """
         query ResolveByTitleAuthor($title: String!, $author: String!) {
@@ -362,11 +639,11 @@ class HardcoverClient:
         try:
             response = await self._graphql_query(query, {"title": title, "author": author})
             books = response.get("books", [])
-            
+            self._save_to_cache(cache_key, books[0] if books else None)
+
             if books:
                 # Naive best match
                 book = self._deserialize_book(books[0])
-                self._save_to_cache(cache_key, book)
                 return ResolutionResult(success=True, book=book, confidence=0.9, resolution_method="title_author", raw_payload=books[0])
         except Exception as e:
             logger.error(f"Title+Author resolution failed: {e}")
@@ -375,8 +652,9 @@ class HardcoverClient:
 
     async def resolve_by_search(self, query_text: str) -> ResolutionResult:
         cache_key = self._get_cache_key("search", query=query_text)
-        if self._get_from_cache(cache_key):
-             return ResolutionResult(success=True, book=self._get_from_cache(cache_key), confidence=0.7, resolution_method="fuzzy")
+        cached = self._cached_result(cache_key, confidence=0.7, method="fuzzy")
+        if cached:
+            return cached
 
         query = """
         query Search($query: String!) {
@@ -416,9 +694,9 @@ class HardcoverClient:
         try:
             response = await self._graphql_query(query, {"query": query_text})
             books = response.get("books", [])
+            self._save_to_cache(cache_key, books[0] if books else None)
             if books:
                 book = self._deserialize_book(books[0])
-                self._save_to_cache(cache_key, book)
                 return ResolutionResult(success=True, book=book, confidence=0.7, resolution_method="fuzzy", raw_payload=books[0])
         except Exception as e:
             logger.error(f"Fuzzy search failed: {e}")
@@ -0,0 +1,252 @@
+"""
+Metadata Response Cache
+
+Persistent cache of external metadata lookups (Google Books, Hardcover,
+Goodreads, MAM) shared by every client instance and process, so scheduled
+jobs that build fresh clients do not re-query titles they looked up before.
+
+Entries expire after a TTL; not-found results are cached too, with a
+shorter TTL. The file is bounded in size by evicting the least recently
+used entries.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from mamcrawler.storage import open_state_db
+
+logger = logging.getLogger(__name__)
+
+# Returned by MetadataCache.get() when nothing usable is cached
+MISSING = object()
+
+# Writes between checks of the size bound
+EVICT_CHECK_INTERVAL = 100
+
+# Eviction frees space down to this share of max_bytes, so it does not run on every write
+EVICT_TARGET = 0.9
+
+METADATA_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,
+    negative INTEGER NOT NULL, size INTEGER NOT NULL,
+    expires_at REAL NOT NULL, accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_metadata_cache_accessed ON metadata_cache (accessed_at);
+"""
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of JSON-serializable lookup results.
+
+    Keys live in namespaces (one per source and lookup kind, e.g.
+    "google_books:search"). Empty values (None, [] or {}) are not-found
+    results: get() returns them like any other value, so callers can skip
+    the lookup, but they expire after negative_ttl.
+
+    Any object with the same get/set/stats methods can be passed to the
+    clients instead, e.g. a cache on another store.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 7 * 24 * 3600,
+        negative_ttl: float = 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file holding the cache (None = memory only)
+            ttl: Seconds a found result stays valid
+            negative_ttl: Seconds a not-found result stays valid
+            max_bytes: Bound on the total size of cached values
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "negative_hits": 0, "misses": 0, "writes": 0}
+        )
+        self.evictions = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Cache connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.path, METADATA_CACHE_SCHEMA)
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Any:
+        """
+        Look up a cached result.
+
+        Args:
+            namespace: Source and lookup kind
+            key: Lookup key within the namespace
+
+        Returns:
+            The cached value (possibly an empty not-found result), or
+            MISSING if nothing unexpired is cached
+        """
+        now = time.time()
+        counters = self._counters[namespace]
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, negative FROM metadata_cache "
+                "WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, now)
+            ).fetchone()
+            if row is None:
+                counters["misses"] += 1
+                return MISSING
+
+            self.conn.execute(
+                "UPDATE metadata_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key)
+            )
+
+        value, negative = row
+        counters["negative_hits" if negative else "hits"] += 1
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Cache a lookup result.
+
+        Args:
+            namespace: Source and lookup kind
+            key: Lookup key within the namespace
+            value: JSON-serializable result; empty means not found
+            ttl: Seconds the entry stays valid (default: ttl or negative_ttl)
+        """
+        negative = value is None or value == [] or value == {}
+        if ttl is None:
+            ttl = self.negative_ttl if negative else self.ttl
+        data = json.dumps(value, default=str)
+        now = time.time()
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO metadata_cache "
+                "(namespace, key, value, negative, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, data, int(negative), len(data), now + ttl, now)
+            )
+            self._counters[namespace]["writes"] += 1
+            self._writes += 1
+            if self._writes % EVICT_CHECK_INTERVAL == 0:
+                self._evict(now)
+
+    def invalidate(self, namespace: str, key: Optional[str] = None):
+        """Forget one entry, or a whole namespace if key is None."""
+        with self._lock:
+            if key is None:
+                self.conn.execute("DELETE FROM metadata_cache WHERE namespace = ?", (namespace,))
+            else:
+                self.conn.execute(
+                    "DELETE FROM metadata_cache WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones beyond max_bytes."""
+        with self._lock:
+            self._evict(time.time())
+
+    def _evict(self, now: float):
+        conn = self.conn
+        removed = conn.execute("DELETE FROM metadata_cache WHERE expires_at <= ?", (now,)).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata_cache").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - int(self.max_bytes * EVICT_TARGET)
+            oldest = []
+            for namespace, key, size in conn.execute(
+                "SELECT namespace, key, size FROM metadata_cache ORDER BY accessed_at"
+            ):
+                oldest.append((namespace, key))
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.execute("BEGIN")
+            try:
+                conn.executemany("DELETE FROM metadata_cache WHERE namespace = ? AND key = ?", oldest)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            removed += len(oldest)
+
+        if removed:
+            self.evictions += removed
+            logger.debug(f"Evicted {removed} metadata cache entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of this process and the cache's current size.
+
+        Returns:
+            Dict with hits, negative_hits, misses, writes, evictions,
+            hit_rate, entries, bytes and per-namespace counters
+        """
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM metadata_cache"
+            ).fetchone()
+            namespaces = {namespace: dict(counters) for namespace, counters in self._counters.items()}
+
+        totals = {
+            name: sum(counters[name] for counters in namespaces.values())
+            for name in ("hits", "negative_hits", "misses", "writes")
+        }
+        lookups = totals["hits"] + totals["negative_hits"] + totals["misses"]
+        return {
+            **totals,
+            "evictions": self.evictions,
+            "hit_rate": (totals["hits"] + totals["negative_hits"]) / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "namespaces": namespaces,
+        }
+
+    def close(self):
+        """Close the cache connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the shared metadata cache (stored at Settings.METADATA_CACHE_FILE)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from backend.config import get_settings
+
+            settings = get_settings()
+            _cache = MetadataCache(
+                str(settings.METADATA_CACHE_FILE),
+                ttl=settings.METADATA_CACHE_TTL_HOURS * 3600,
+                negative_ttl=settings.METADATA_CACHE_NEGATIVE_TTL_HOURS * 3600,
+                max_bytes=settings.METADATA_CACHE_MAX_MB * 1024 * 1024,
+            )
+    return _cache
@@ -23,6 +23,7 @@ from tenacity import (
 
 from backend.integrations.qbittorrent_bandwidth_manager import QBittorrentBandwidthManager
 from backend.integrations.qbittorrent_rss_manager import QBittorrentRSSManager
+from backend.integrations.qbittorrent_state_mirror import QBittorrentStateMirror
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +75,7 @@ class QBittorrentClient:
         # Initialize managers for domain-specific operations
         self.bandwidth = QBittorrentBandwidthManager(self)
         self.rss = QBittorrentRSSManager(self)
+        self.mirror = QBittorrentStateMirror(self)
 
         logger.info(f"Initialized QBittorrentClient for {self.base_url}")
 
@@ -376,6 +378,42 @@ class QBittorrentClient:
             logger.error(f"Failed to get torrents: {str(e)}")
             raise
 
+    async def get_maindata(self, rid: int = 0) -> Dict[str, Any]:
+        """
+        Get incremental main data via /api/v2/sync/maindata.
+
+        With rid=0 qBittorrent returns a full snapshot; passing the rid from
+        the previous response returns only what changed since then.
+
+        Args:
+            rid: Response ID from the previous maindata call
+
+        Returns:
+            Maindata dictionary (rid, full_update, torrents, torrents_removed,
+            categories, server_state, ...)
+
+        Example:
+            >>> data = await client.get_maindata()
+            >>> delta = await client.get_maindata(rid=data["rid"])
+        """
+        logger.debug(f"Getting maindata (rid={rid})")
+
+        endpoint = "/api/v2/sync/maindata"
+        params = {"rid": rid}
+
+        try:
+            data = await self._request("GET", endpoint, params=params)
+            logger.debug(
+                f"Maindata rid={data.get('rid')}: "
+                f"{len(data.get('torrents') or {})} torrents changed, "
+                f"{len(data.get('torrents_removed') or [])} removed"
+            )
+            return data
+
+        except QBittorrentError as e:
+            logger.error(f"Failed to get maindata: {str(e)}")
+            raise
+
     async def pause_torrent(self, torrent_hash: str) -> bool:
         """
         Pause torrent download.
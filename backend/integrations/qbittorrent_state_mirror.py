@@ -0,0 +1,351 @@
+"""
+qBittorrent Torrent State Mirror
+
+Keeps an in-process, hash-indexed copy of every torrent in qBittorrent by
+following the rid-based delta protocol of /api/v2/sync/maindata. After the
+first full snapshot, each sync only transfers the fields that changed since
+the previous response, so the monitoring managers can all read the same
+mirror instead of each pulling /api/v2/torrents/info.
+
+Changes detected while applying a delta are published as TorrentChangeEvent
+objects to registered subscribers (state transitions, progress crossings,
+ratio thresholds, additions and removals).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+# qBittorrent states grouped the same way the monitoring managers classify them;
+# DOWNLOADING_STATES matches qBittorrent's own "downloading" filter
+DOWNLOADING_STATES = (
+    'downloading', 'allocating', 'metadl', 'forceddl', 'queueddl', 'checkingdl',
+    'stalleddl', 'pauseddl',
+)
+SEEDING_STATES = ('uploading', 'seeding', 'forcedup', 'queuedup', 'stalledup', 'checkingup')
+
+
+@dataclass
+class TorrentChangeEvent:
+    """A single change observed while applying a sync/maindata delta."""
+    kind: str  # added | removed | state_changed | progress_crossed | ratio_crossed
+    torrent_hash: str
+    torrent_name: str
+    previous: Any = None
+    current: Any = None
+    threshold: Optional[float] = None
+    detected_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def is_completion(self) -> bool:
+        """True when this event marks a torrent finishing its download."""
+        if self.kind == 'progress_crossed':
+            return self.threshold is not None and self.threshold >= 1.0
+        if self.kind == 'state_changed' and self.previous and self.current:
+            return is_downloading_state(self.previous) and is_seeding_state(self.current)
+        return False
+
+
+def is_downloading_state(state: str) -> bool:
+    """Check whether a qBittorrent state string is a downloading state."""
+    return (state or '').lower() in DOWNLOADING_STATES
+
+
+def is_seeding_state(state: str) -> bool:
+    """Check whether a qBittorrent state string is a seeding state."""
+    return (state or '').lower() in SEEDING_STATES
+
+
+class QBittorrentStateMirror:
+    """
+    Incremental mirror of qBittorrent torrent state.
+
+    Follows the sync/maindata protocol: the first request uses rid=0 and
+    receives a full update; subsequent requests send the last rid back and
+    receive only changed fields, new torrents and removed hashes.
+
+    Args:
+        client: QBittorrentClient used for the maindata requests
+        min_sync_interval: Seconds during which a repeated sync() is served
+            from the mirror without a request (default: 2.0)
+        progress_thresholds: Progress fractions that publish progress_crossed
+        ratio_thresholds: Share ratios that publish ratio_crossed
+
+    Example:
+        >>> mirror = QBittorrentStateMirror(qb_client)
+        >>> mirror.subscribe(lambda event: print(event.kind, event.torrent_name))
+        >>> await mirror.sync()
+        >>> seeding = mirror.get_torrents(filter_state="seeding")
+    """
+
+    def __init__(
+        self,
+        client,
+        min_sync_interval: float = 2.0,
+        progress_thresholds: Sequence[float] = (0.25, 0.5, 0.75, 1.0),
+        ratio_thresholds: Sequence[float] = (1.0, 2.0),
+    ):
+        self.client = client
+        self.min_sync_interval = min_sync_interval
+        self.progress_thresholds = tuple(sorted(progress_thresholds))
+        self.ratio_thresholds = tuple(sorted(ratio_thresholds))
+
+        self.rid = 0
+        self.torrents: Dict[str, Dict[str, Any]] = {}
+        self.categories: Dict[str, Dict[str, Any]] = {}
+        self.server_state: Dict[str, Any] = {}
+        self.last_sync: Optional[datetime] = None
+        self.sync_count = 0
+        self.full_update_count = 0
+
+        self._last_sync_monotonic: Optional[float] = None
+        self._subscribers: List[Callable[[TorrentChangeEvent], None]] = []
+
+    # ========================================
+    # SUBSCRIPTIONS
+    # ========================================
+
+    def subscribe(self, callback: Callable[[TorrentChangeEvent], None]) -> None:
+        """Register a callback invoked for every published change event."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[TorrentChangeEvent], None]) -> None:
+        """Remove a previously registered callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _publish(self, events: List[TorrentChangeEvent]) -> None:
+        """Deliver events to subscribers; a failing subscriber never breaks the sync."""
+        for event in events:
+            for callback in list(self._subscribers):
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Mirror subscriber failed for {event.kind}: {e}", exc_info=True)
+
+    # ========================================
+    # SYNCHRONISATION
+    # ========================================
+
+    def is_fresh(self) -> bool:
+        """True if the last sync is within min_sync_interval."""
+        if self._last_sync_monotonic is None:
+            return False
+        return (time.monotonic() - self._last_sync_monotonic) < self.min_sync_interval
+
+    async def sync(self, force: bool = False) -> List[TorrentChangeEvent]:
+        """
+        Pull the next maindata delta and apply it to the mirror.
+
+        Several managers call this within one monitoring cycle; only the first
+        call inside min_sync_interval hits qBittorrent unless force is set.
+
+        Args:
+            force: Always request a delta, even if the mirror is fresh
+
+        Returns:
+            Change events produced by this delta (empty if served from mirror)
+
+        Raises:
+            QBittorrentError: On API errors
+        """
+        if not force and self.is_fresh():
+            return []
+
+        data = await self.client.get_maindata(rid=self.rid)
+        events = self.apply_maindata(data or {})
+
+        self._last_sync_monotonic = time.monotonic()
+        self.last_sync = datetime.utcnow()
+        self.sync_count += 1
+
+        if events:
+            logger.debug(f"Mirror sync rid={self.rid}: {len(events)} change events")
+            self._publish(events)
+
+        return events
+
+    def apply_maindata(self, data: Dict[str, Any]) -> List[TorrentChangeEvent]:
+        """
+        Apply one sync/maindata response to the mirror.
+
+        Args:
+            data: Decoded maindata response
+
+        Returns:
+            Change events derived from the delta
+        """
+        events: List[TorrentChangeEvent] = []
+        full_update = bool(data.get('full_update'))
+        # The very first snapshot establishes the baseline and publishes nothing
+        baseline = full_update and not self.torrents and self.sync_count == 0
+
+        if full_update:
+            self.full_update_count += 1
+            incoming = data.get('torrents') or {}
+            # Torrents missing from a full update have been removed
+            for torrent_hash in list(self.torrents):
+                if torrent_hash not in incoming:
+                    removed = self.torrents.pop(torrent_hash)
+                    events.append(TorrentChangeEvent(
+                        kind='removed',
+                        torrent_hash=torrent_hash,
+                        torrent_name=removed.get('name', 'Unknown'),
+                    ))
+            self.categories = dict(data.get('categories') or {})
+            self.server_state = dict(data.get('server_state') or {})
+        else:
+            for torrent_hash in data.get('torrents_removed') or []:
+                removed = self.torrents.pop(torrent_hash, None)
+                if removed is not None:
+                    events.append(TorrentChangeEvent(
+                        kind='removed',
+                        torrent_hash=torrent_hash,
+                        torrent_name=removed.get('name', 'Unknown'),
+                    ))
+            self.categories.update(data.get('categories') or {})
+            for name in data.get('categories_removed') or []:
+                self.categories.pop(name, None)
+            self.server_state.update(data.get('server_state') or {})
+
+        for torrent_hash, changes in (data.get('torrents') or {}).items():
+            previous = self.torrents.get(torrent_hash)
+            if previous is None:
+                torrent = dict(changes)
+                torrent['hash'] = torrent_hash
+                self.torrents[torrent_hash] = torrent
+                if not baseline:
+                    events.append(TorrentChangeEvent(
+                        kind='added',
+                        torrent_hash=torrent_hash,
+                        torrent_name=torrent.get('name', 'Unknown'),
+                        current=torrent.get('state'),
+                    ))
+                continue
+
+            before = dict(previous)
+            previous.update(changes)
+            events.extend(self._diff(torrent_hash, before, previous))
+
+        if 'rid' in data:
+            self.rid = data['rid']
+
+        return events
+
+    def _diff(
+        self,
+        torrent_hash: str,
+        before: Dict[str, Any],
+        after: Dict[str, Any],
+    ) -> List[TorrentChangeEvent]:
+        """Derive change events for one torrent from its before/after fields."""
+        events = []
+        name = after.get('name', 'Unknown')
+
+        old_state, new_state = before.get('state'), after.get('state')
+        if old_state != new_state:
+            events.append(TorrentChangeEvent(
+                kind='state_changed',
+                torrent_hash=torrent_hash,
+                torrent_name=name,
+                previous=old_state,
+                current=new_state,
+            ))
+
+        old_progress, new_progress = before.get('progress', 0) or 0, after.get('progress', 0) or 0
+        for threshold in self.progress_thresholds:
+            if old_progress < threshold <= new_progress:
+                events.append(TorrentChangeEvent(
+                    kind='progress_crossed',
+                    torrent_hash=torrent_hash,
+                    torrent_name=name,
+                    previous=old_progress,
+                    current=new_progress,
+                    threshold=threshold,
+                ))
+
+        old_ratio, new_ratio = before.get('ratio', 0) or 0, after.get('ratio', 0) or 0
+        for threshold in self.ratio_thresholds:
+            if old_ratio < threshold <= new_ratio:
+                events.append(TorrentChangeEvent(
+                    kind='ratio_crossed',
+                    torrent_hash=torrent_hash,
+                    torrent_name=name,
+                    previous=old_ratio,
+                    current=new_ratio,
+                    threshold=threshold,
+                ))
+
+        return events
+
+    def reset(self) -> None:
+        """Drop all mirrored state; the next sync requests a full update."""
+        self.rid = 0
+        self.torrents = {}
+        self.categories = {}
+        self.server_state = {}
+        self.sync_count = 0
+        self._last_sync_monotonic = None
+
+    # ========================================
+    # READ API
+    # ========================================
+
+    def get_torrent(self, torrent_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a single mirrored torrent by hash (case-insensitive)."""
+        torrent = self.torrents.get(torrent_hash)
+        if torrent is None and torrent_hash:
+            torrent = self.torrents.get(torrent_hash.lower())
+        return torrent
+
+    def get_torrents(
+        self,
+        filter_state: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get mirrored torrents, mirroring get_all_torrents() filters.
+
+        Args:
+            filter_state: Optional filter (downloading, seeding, completed, paused)
+            category: Optional category filter
+
+        Returns:
+            List of torrent dictionaries (shared with the mirror, do not mutate)
+        """
+        torrents = list(self.torrents.values())
+
+        if category is not None:
+            torrents = [t for t in torrents if t.get('category') == category]
+
+        if filter_state:
+            wanted = filter_state.lower()
+            if wanted == 'downloading':
+                torrents = [t for t in torrents if is_downloading_state(t.get('state'))]
+            elif wanted in ('seeding', 'uploading'):
+                torrents = [t for t in torrents if is_seeding_state(t.get('state'))]
+            elif wanted == 'completed':
+                torrents = [t for t in torrents if (t.get('progress', 0) or 0) >= 1.0]
+            elif wanted == 'paused':
+                torrents = [t for t in torrents if 'paused' in (t.get('state') or '').lower()]
+            else:
+                torrents = [t for t in torrents if (t.get('state') or '').lower() == wanted]
+
+        return torrents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get mirror bookkeeping statistics."""
+        return {
+            'rid': self.rid,
+            'torrents': len(self.torrents),
+            'sync_count': self.sync_count,
+            'full_updates': self.full_update_count,
+            'subscribers': len(self._subscribers),
+            'last_sync': self.last_sync.isoformat() if self.last_sync else None,
+        }
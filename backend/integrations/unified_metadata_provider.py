@@ -23,6 +23,7 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 from backend.database import get_db_context
+from backend.integrations.metadata_cache import MISSING, MetadataCache, get_metadata_cache
 from backend.services.evidence_service import EvidenceService
 
 
@@ -57,19 +58,26 @@ class UnifiedMetadataProvider:
         self,
         mam_client: Optional[Any] = None,
         google_books_client: Optional[Any] = None,
-        hardcover_client: Optional[Any] = None
+        hardcover_client: Optional[Any] = None,
+        cache: Optional[MetadataCache] = None
     ):
         """
         Initialize with optional clients for each source.
 
         Args:
-            mam_client: MAMMetadataExtractor instance (optional)
+            mam_client: MAMMetadataExtractor instance (optional); its
+                lookups return a dict when found, an empty dict when MAM
+                has no match and None when the lookup failed
             google_books_client: GoogleBooksClient instance (optional)
             hardcover_client: HardcoverClient instance (optional)
+            cache: Cache for MAM lookups (default: the shared persistent
+                metadata cache, which the Google Books and Hardcover
+                clients use too)
         """
         self.mam_client = mam_client
         self.google_books_client = google_books_client
         self.hardcover_client = hardcover_client
+        self.cache = cache or get_metadata_cache()
 
         # Metadata completeness weights for each field
         self.field_weights = {
@@ -185,12 +193,19 @@ class UnifiedMetadataProvider:
                     error="MAM client not configured"
                 )
 
-            # If we have a direct URL, use it
-            if mam_torrent_url:
-                metadata = await self.mam_client.extract_from_torrent_url(mam_torrent_url)
-            else:
-                # Otherwise search MAM
-                metadata = await self.mam_client.search_and_extract(title, author)
+            cache_key = mam_torrent_url or f"{title}|{author}"
+            metadata = self.cache.get("mam", cache_key)
+            if metadata is MISSING:
+                # If we have a direct URL, use it
+                if mam_torrent_url:
+                    metadata = await self.mam_client.extract_from_torrent_url(mam_torrent_url)
+                else:
+                    # Otherwise search MAM
+                    metadata = await self.mam_client.search_and_extract(title, author)
+                # None means the lookup failed (timeout, login, parse error):
+                # retry next time instead of remembering the book as missing
+                if metadata is not None:
+                    self.cache.set("mam", cache_key, metadata or None)
 
             if metadata:
                 completeness = self._calculate_completeness(metadata)
@@ -334,6 +349,10 @@ class UnifiedMetadataProvider:
                 error=str(e)
             )
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the shared metadata cache."""
+        return self.cache.stats()
+
     def _merge_metadata(
         self,
         target: Dict[str, Any],
@@ -31,7 +31,7 @@ from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
 
 from backend.config import get_settings
-from backend.database import init_db, close_db
+from backend.database import init_db, close_db, close_async_db
 from backend.middleware import setup_security_middleware, verify_api_key
 from backend.auth import hash_password, verify_password, generate_token, verify_token, sanitize_input
 from backend.rate_limit import add_rate_limiting
@@ -167,6 +167,7 @@ async def lifespan(app: FastAPI):
         # Close database connections
         logger.info("Closing database connections...")
         close_db()
+        await close_async_db()
         logger.info("Database connections closed")
 
         logger.info("Application shutdown complete")
@@ -459,12 +460,14 @@ async def detailed_health_check():
 
     # Check database
     try:
-        from backend.database import engine
+        from sqlalchemy import text
+        from backend.database import engine, get_pool_status
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(text("SELECT 1"))
         health_data["components"]["database"] = {
             "status": "ok",
-            "url": settings.DATABASE_URL.split("@")[-1]  # Hide credentials
+            "url": settings.DATABASE_URL.split("@")[-1],  # Hide credentials
+            "pool": get_pool_status()
         }
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
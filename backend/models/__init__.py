@@ -22,6 +22,7 @@ from backend.models.evidence import EvidenceSource, EvidenceEvent, Assertion
 from backend.models.hardcover_sync_log import HardcoverSyncLog
 from backend.models.downloaded_book import DownloadedBook
 from backend.models.hardcover_user_mapping import HardcoverUserMapping
+from backend.models.abs_library_item import AbsLibraryItem
 
 __all__ = [
     "Book",
@@ -46,4 +47,5 @@ __all__ = [
     "HardcoverSyncLog",
     "DownloadedBook",
     "HardcoverUserMapping",
+    "AbsLibraryItem",
 ]
@@ -0,0 +1,67 @@
+"""
+SQLAlchemy ORM model for ABS Library Items table
+Local mirror of Audiobookshelf library items, synced incrementally
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, TIMESTAMP, JSON, Index, func
+
+from backend.database import Base
+
+
+class AbsLibraryItem(Base):
+    """
+    AbsLibraryItem model representing one cached Audiobookshelf library item
+
+    Purpose: Let workflow phases read the library from the database instead of
+    re-downloading every page from Audiobookshelf. Rows are refreshed by
+    AbsLibraryCacheService.sync_library() using the items' updatedAt watermark.
+
+    Attributes:
+        id: Primary key
+        abs_id: Audiobookshelf library item ID - UNIQUE
+        library_id: Audiobookshelf library ID
+        title: Book title (media.metadata.title)
+        author: Author name (media.metadata.authorName)
+        series: Series name (media.metadata.seriesName)
+        added_at_ms: ABS addedAt (epoch milliseconds)
+        updated_at_ms: ABS updatedAt (epoch milliseconds) - sync watermark
+        item: Full library item JSON as returned by ABS
+        synced_at: When this row was last written by a sync
+
+    Indexes:
+        - abs_id (UNIQUE) - Upserts by ABS ID
+        - (library_id, updated_at_ms) - Watermark lookup per library
+        - (library_id, added_at_ms) - Recently added items
+    """
+
+    __tablename__ = "abs_library_items"
+
+    # Primary key
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Audiobookshelf identity
+    abs_id = Column(String(64), nullable=False, unique=True, index=True)
+    library_id = Column(String(64), nullable=False)
+
+    # Projected metadata for filtering without decoding the JSON
+    title = Column(String(500), nullable=True)
+    author = Column(String(500), nullable=True)
+    series = Column(String(500), nullable=True)
+
+    # ABS timestamps (epoch milliseconds)
+    added_at_ms = Column(BigInteger, nullable=True)
+    updated_at_ms = Column(BigInteger, nullable=True)
+
+    # Full item payload
+    item = Column(JSON, nullable=False)
+
+    # Local bookkeeping
+    synced_at = Column(TIMESTAMP, nullable=False, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_abs_library_items_updated", "library_id", "updated_at_ms"),
+        Index("idx_abs_library_items_added", "library_id", "added_at_ms"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AbsLibraryItem(abs_id='{self.abs_id}', title='{self.title}')>"
@@ -88,5 +88,10 @@ class Book(Base):
     # missing_book_entries = relationship("MissingBook", back_populates="book")
     # metadata_corrections = relationship("MetadataCorrection", back_populates="book")
 
+    # Keyset pagination of the book listing by status
+    __table_args__ = (
+        Index("idx_books_status_date_added", "status", "date_added", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<Book(id={self.id}, title={self.title}, author={self.author})>"
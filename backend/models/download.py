@@ -97,5 +97,10 @@ class Download(Base):
     book = relationship("Book", foreign_keys=[book_id], back_populates="downloads")
     # missing_book = relationship("MissingBook", foreign_keys=[missing_book_id])
 
+    # Keyset pagination of the download listing by status
+    __table_args__ = (
+        Index("idx_downloads_status_date_queued", "status", "date_queued", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<Download(id={self.id}, title={self.title}, source={self.source}, status={self.status})>"
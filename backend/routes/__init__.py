@@ -1,6 +1,13 @@
 """
 Routes Package Initialization
 Centralizes all API route imports and provides registration function
+
+Execution model:
+    Handlers that only do synchronous ORM work (Session from get_db) are plain
+    ``def`` functions, so FastAPI runs them in its threadpool and a slow query
+    never blocks the event loop, other requests or the AsyncIO scheduler jobs.
+    Handlers that must ``await`` integrations stay ``async def`` and push any
+    ORM calls through ``fastapi.concurrency.run_in_threadpool``.
 """
 
 from fastapi import FastAPI, Depends
@@ -76,7 +76,7 @@ class StandardResponse(BaseModel):
     summary="List all authors",
     description="Get paginated list of authors with book counts"
 )
-async def list_authors(
+def list_authors(
     limit: int = Query(100, ge=1, le=500, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     db: Session = Depends(get_db)
@@ -143,7 +143,7 @@ async def list_authors(
     summary="Get single author",
     description="Get detailed information about a specific author including book list"
 )
-async def get_author(
+def get_author(
     author_id: int,
     db: Session = Depends(get_db)
 ):
@@ -223,7 +223,7 @@ async def get_author(
     summary="Create author",
     description="Create a new author record"
 )
-async def create_author(
+def create_author(
     author: AuthorCreate,
     db: Session = Depends(get_db)
 ):
@@ -279,7 +279,7 @@ async def create_author(
     summary="Update author",
     description="Update author fields"
 )
-async def update_author(
+def update_author(
     author_id: int,
     updates: AuthorUpdate,
     db: Session = Depends(get_db)
@@ -343,7 +343,7 @@ async def update_author(
     summary="Delete author",
     description="Delete author record (hard delete - use with caution)"
 )
-async def delete_author(
+def delete_author(
     author_id: int,
     db: Session = Depends(get_db)
 ):
@@ -394,7 +394,7 @@ async def delete_author(
     summary="Get author's books",
     description="Get all books by a specific author"
 )
-async def get_author_books(
+def get_author_books(
     author_id: int,
     db: Session = Depends(get_db)
 ):
@@ -461,7 +461,7 @@ async def get_author_books(
     summary="Get author completion",
     description="Get completion percentage and statistics for an author"
 )
-async def get_author_completion(
+def get_author_completion(
     author_id: int,
     db: Session = Depends(get_db)
 ):
@@ -518,7 +518,7 @@ async def get_author_completion(
     summary="Get favorite authors",
     description="Get authors with 2 or more books owned"
 )
-async def get_favorite_authors(
+def get_favorite_authors(
     min_books: int = Query(2, ge=1, description="Minimum books owned to be considered a favorite"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
     db: Session = Depends(get_db)
@@ -582,7 +582,7 @@ async def get_favorite_authors(
     summary="Get completion summary",
     description="Get summary statistics for all authors"
 )
-async def get_completion_summary(
+def get_completion_summary(
     db: Session = Depends(get_db)
 ):
     """
@@ -623,7 +623,7 @@ async def get_completion_summary(
     summary="Recalculate completion",
     description="Manually trigger recalculation of author completion statistics"
 )
-async def recalculate_completion(
+def recalculate_completion(
     author_id: int,
     db: Session = Depends(get_db)
 ):
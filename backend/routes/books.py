@@ -15,6 +15,7 @@ from backend.database import get_db
 from backend.services.book_service import BookService
 from backend.models.book import Book
 from backend.rate_limit import limiter, get_rate_limit
+from backend.utils.pagination import InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -117,12 +118,14 @@ class StandardResponse(BaseModel):
     description="Get paginated list of books with optional filtering by status and search query"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def list_books(
+def list_books(
     request: Request,
     limit: int = Query(100, ge=1, le=500, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="page_info.next_cursor of the previous page (empty for the first page)"),
+    count: Optional[str] = Query(None, pattern="^(exact|estimated|none)$", description="Total to report: exact, estimated or none"),
     status: Optional[str] = Query("active", description="Filter by status (active, duplicate, archived, or null for all)"),
-    search: Optional[str] = Query(None, description="Search query for title/author"),
+    search: Optional[str] = Query(None, description="Search query for title/author/series/narrator"),
     db: Session = Depends(get_db)
 ):
     """
@@ -130,8 +133,10 @@ async def list_books(
 
     - **limit**: Maximum number of results (1-500, default 100)
     - **offset**: Number of records to skip for pagination (default 0)
+    - **cursor**: Page by cursor instead of offset; flat cost on any page
+    - **count**: Total to report (default exact with offset, none with cursor)
     - **status**: Filter by status (active, duplicate, archived, or null for all)
-    - **search**: Optional search query to filter by title or author
+    - **search**: Optional search query matched against title, author, series or narrator
 
     Returns:
         Standard response with book list, total count, and pagination info
@@ -178,12 +183,17 @@ async def list_books(
             }
 
         # Normal pagination
-        result = BookService.get_all_books(
-            db,
-            status=status if status else None,
-            limit=limit,
-            offset=offset
-        )
+        try:
+            result = BookService.list_books(
+                db,
+                status=status if status else None,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count or ("none" if cursor is not None else "exact")
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         if not result["success"]:
             raise HTTPException(
@@ -235,7 +245,7 @@ async def list_books(
     description="Get detailed information about a specific book including all metadata"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def get_book(
+def get_book(
     request: Request,
     book_id: int,
     db: Session = Depends(get_db)
@@ -307,7 +317,7 @@ async def get_book(
     description="Create a new book record with metadata"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def create_book(
+def create_book(
     request: Request,
     book: BookCreate,
     db: Session = Depends(get_db)
@@ -380,7 +390,7 @@ async def create_book(
     description="Update book fields"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def update_book(
+def update_book(
     request: Request,
     book_id: int,
     updates: BookUpdate,
@@ -446,7 +456,7 @@ async def update_book(
     description="Soft delete book (marks as archived)"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def delete_book(
+def delete_book(
     request: Request,
     book_id: int,
     db: Session = Depends(get_db)
@@ -497,7 +507,7 @@ async def delete_book(
     description="Get all metadata corrections for a specific book"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def get_metadata_history(
+def get_metadata_history(
     request: Request,
     book_id: int,
     db: Session = Depends(get_db)
@@ -565,7 +575,7 @@ async def get_metadata_history(
     description="Get all books in a specific series, sorted by series number"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def get_books_by_series(
+def get_books_by_series(
     request: Request,
     series_name: str,
     db: Session = Depends(get_db)
@@ -626,19 +636,19 @@ async def get_books_by_series(
     "/search",
     response_model=StandardResponse,
     summary="Search books",
-    description="Full-text search for books by title or author"
+    description="Ranked, typo-tolerant search for books by title, author, series or narrator"
 )
 @limiter.limit(get_rate_limit("search"))
-async def search_books(
+def search_books(
     request: Request,
     query: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=100, description="Maximum results"),
     db: Session = Depends(get_db)
 ):
     """
-    Search for books by title or author
+    Search for books by title, author, series or narrator
 
-    - **query**: Search query string (searches in title and author fields)
+    - **query**: Search query string (partial words and typos match)
     - **limit**: Maximum number of results (1-100, default 10)
 
     Returns:
@@ -662,7 +672,8 @@ async def search_books(
                 "series": book.series,
                 "series_number": book.series_number,
                 "metadata_completeness_percent": book.metadata_completeness_percent,
-                "status": book.status
+                "status": book.status,
+                "score": result["scores"].get(book.id)
             }
             for book in result["data"]
         ]
@@ -695,7 +706,7 @@ async def search_books(
     description="Track which source provided a specific metadata field"
 )
 @limiter.limit(get_rate_limit("metadata"))
-async def update_metadata_source(
+def update_metadata_source(
     request: Request,
     book_id: int,
     metadata_update: MetadataSourceUpdate,
@@ -759,7 +770,7 @@ async def update_metadata_source(
     description="Get books below metadata completeness threshold"
 )
 @limiter.limit(get_rate_limit("authenticated"))
-async def get_incomplete_metadata_books(
+def get_incomplete_metadata_books(
     request: Request,
     threshold: int = Query(80, ge=0, le=100, description="Completeness threshold percentage"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
@@ -14,6 +14,7 @@ import logging
 from backend.database import get_db
 from backend.services.download_service import DownloadService
 from backend.rate_limit import limiter, get_rate_limit
+from backend.utils.pagination import InvalidCursorError
 
 logger = logging.getLogger(__name__)
 
@@ -123,13 +124,15 @@ class StandardResponse(BaseModel):
     summary="List downloads",
     description="Get downloads filtered by status with pagination"
 )
-async def list_downloads(
+def list_downloads(
     status_filter: Optional[str] = Query(
         None,
         description="Filter by status (queued, downloading, completed, failed, abandoned)"
     ),
     limit: int = Query(100, ge=1, le=500, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="page_info.next_cursor of the previous page (empty for the first page)"),
+    count: Optional[str] = Query(None, pattern="^(exact|estimated|none)$", description="Total to report: exact, estimated or none"),
     db: Session = Depends(get_db)
 ):
     """
@@ -138,26 +141,30 @@ async def list_downloads(
     - **status_filter**: Optional filter by status
     - **limit**: Maximum number of results (1-500, default 100)
     - **offset**: Number of records to skip for pagination (default 0)
+    - **cursor**: Page by cursor instead of offset; flat cost on any page
+    - **count**: Total to report (default exact with offset, none with cursor)
 
     Returns:
         Standard response with download list, total count, and pagination info
     """
     try:
-        from backend.models.download import Download
-
-        # Build query
-        query = db.query(Download)
-
-        if status_filter:
-            query = query.filter(Download.status == status_filter)
-
-        # Get total count
-        total = query.count()
+        try:
+            result = DownloadService.list_downloads(
+                db,
+                status=status_filter,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count or ("none" if cursor is not None else "exact")
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-        # Get paginated results
-        downloads = query.order_by(
-            Download.date_queued.desc()
-        ).limit(limit).offset(offset).all()
+        if not result["success"]:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result["error"]
+            )
 
         # Convert downloads to dict format
         downloads_data = [
@@ -178,24 +185,22 @@ async def list_downloads(
                 "last_attempt": download.last_attempt.isoformat() if download.last_attempt else None,
                 "next_retry": download.next_retry.isoformat() if download.next_retry else None
             }
-            for download in downloads
+            for download in result["data"]
         ]
 
         return {
             "success": True,
             "data": {
                 "downloads": downloads_data,
-                "total": total,
-                "page_info": {
-                    "limit": limit,
-                    "offset": offset,
-                    "has_more": (offset + limit) < total
-                }
+                "total": result["total"],
+                "page_info": result["page_info"]
             },
             "error": None,
             "timestamp": datetime.utcnow().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing downloads: {e}", exc_info=True)
         raise HTTPException(
@@ -210,7 +215,7 @@ async def list_downloads(
     summary="Get download",
     description="Get detailed information about a specific download"
 )
-async def get_download(
+def get_download(
     download_id: int,
     db: Session = Depends(get_db)
 ):
@@ -280,7 +285,7 @@ async def get_download(
     summary="Queue download",
     description="Add a new download to the queue"
 )
-async def queue_download(
+def queue_download(
     download: DownloadCreate,
     db: Session = Depends(get_db)
 ):
@@ -342,7 +347,7 @@ async def queue_download(
     summary="Update download status",
     description="Update download status and qBittorrent information"
 )
-async def update_download_status(
+def update_download_status(
     download_id: int,
     status_update: DownloadStatusUpdate,
     db: Session = Depends(get_db)
@@ -406,7 +411,7 @@ async def update_download_status(
     summary="Mark download complete",
     description="Mark download as completed with import status"
 )
-async def mark_download_complete(
+def mark_download_complete(
     download_id: int,
     complete_data: DownloadMarkComplete,
     db: Session = Depends(get_db)
@@ -469,7 +474,7 @@ async def mark_download_complete(
     summary="Mark download failed",
     description="Mark download as failed with error message"
 )
-async def mark_download_failed(
+def mark_download_failed(
     download_id: int,
     failed_data: DownloadMarkFailed,
     db: Session = Depends(get_db)
@@ -537,7 +542,7 @@ async def mark_download_failed(
     summary="Schedule download retry",
     description="Schedule download for retry after specified delay"
 )
-async def schedule_download_retry(
+def schedule_download_retry(
     download_id: int,
     retry_data: DownloadRetry,
     db: Session = Depends(get_db)
@@ -596,7 +601,7 @@ async def schedule_download_retry(
     summary="Get pending downloads",
     description="Get all downloads with 'queued' status"
 )
-async def get_pending_downloads(
+def get_pending_downloads(
     db: Session = Depends(get_db)
 ):
     """
@@ -655,7 +660,7 @@ async def get_pending_downloads(
     summary="Get failed downloads",
     description="Get all downloads with 'failed' or 'abandoned' status"
 )
-async def get_failed_downloads(
+def get_failed_downloads(
     db: Session = Depends(get_db)
 ):
     """
@@ -715,7 +720,7 @@ async def get_failed_downloads(
     summary="Get downloads ready to retry",
     description="Get downloads with next_retry <= current time"
 )
-async def get_retry_due_downloads(
+def get_retry_due_downloads(
     db: Session = Depends(get_db)
 ):
     """
@@ -773,7 +778,7 @@ async def get_retry_due_downloads(
     summary="Remove download",
     description="Remove download from queue (hard delete)"
 )
-async def remove_download(
+def remove_download(
     download_id: int,
     db: Session = Depends(get_db)
 ):
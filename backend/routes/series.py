@@ -77,7 +77,7 @@ class StandardResponse(BaseModel):
     summary="List all series",
     description="Get paginated list of series with optional completion status filter"
 )
-async def list_series(
+def list_series(
     limit: int = Query(100, ge=1, le=500, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     completion_status: Optional[str] = Query(
@@ -155,7 +155,7 @@ async def list_series(
     summary="Get single series",
     description="Get detailed information about a specific series including book list"
 )
-async def get_series(
+def get_series(
     series_id: int,
     db: Session = Depends(get_db)
 ):
@@ -234,7 +234,7 @@ async def get_series(
     summary="Create series",
     description="Create a new series record"
 )
-async def create_series(
+def create_series(
     series: SeriesCreate,
     db: Session = Depends(get_db)
 ):
@@ -291,7 +291,7 @@ async def create_series(
     summary="Update series",
     description="Update series fields"
 )
-async def update_series(
+def update_series(
     series_id: int,
     updates: SeriesUpdate,
     db: Session = Depends(get_db)
@@ -355,7 +355,7 @@ async def update_series(
     summary="Delete series",
     description="Delete series record (hard delete - use with caution)"
 )
-async def delete_series(
+def delete_series(
     series_id: int,
     db: Session = Depends(get_db)
 ):
@@ -406,7 +406,7 @@ async def delete_series(
     summary="Get series completion",
     description="Get completion percentage and statistics for a series"
 )
-async def get_series_completion(
+def get_series_completion(
     series_id: int,
     db: Session = Depends(get_db)
 ):
@@ -463,7 +463,7 @@ async def get_series_completion(
     summary="Get completion summary",
     description="Get summary statistics for all series completion"
 )
-async def get_completion_summary(
+def get_completion_summary(
     db: Session = Depends(get_db)
 ):
     """
@@ -504,7 +504,7 @@ async def get_completion_summary(
     summary="Recalculate completion",
     description="Manually trigger recalculation of series completion statistics"
 )
-async def recalculate_completion(
+def recalculate_completion(
     series_id: int,
     db: Session = Depends(get_db)
 ):
@@ -559,7 +559,7 @@ async def recalculate_completion(
     summary="Get incomplete series",
     description="Get all series with completion percentage < 100%"
 )
-async def get_incomplete_series(
+def get_incomplete_series(
     min_completion: int = Query(0, ge=0, le=100, description="Minimum completion percentage"),
     max_completion: int = Query(99, ge=0, le=100, description="Maximum completion percentage"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
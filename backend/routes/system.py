@@ -7,6 +7,7 @@ from typing import Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from pydantic import BaseModel, Field
@@ -17,10 +18,10 @@ from backend.database import get_db
 from backend.services.book_service import BookService
 from backend.services.series_service import SeriesService
 from backend.services.author_service import AuthorService
-from backend.services.download_service import DownloadService
 from backend.rate_limit import limiter, get_rate_limit
 from backend.services.metadata_service import MetadataService
 from backend.services.task_service import TaskService
+from backend.services.stats_service import StatsService
 
 logger = logging.getLogger(__name__)
 
@@ -53,63 +54,47 @@ class StandardResponse(BaseModel):
     summary="Get system statistics",
     description="Get overall system statistics (books, series, authors, downloads)"
 )
-async def get_system_stats(
+def get_system_stats(
     db: Session = Depends(get_db)
 ):
     """
     Get overall system statistics
 
+    Served from the StatsService snapshot (refreshed by the scheduler).
+
     Returns:
         Standard response with comprehensive system statistics
     """
     try:
-        from backend.models.book import Book
-        from backend.models.series import Series
-        from backend.models.author import Author
-        from backend.models.download import Download
-        from backend.models.failed_attempt import FailedAttempt
-
-        # Book statistics
-        total_books = db.query(Book).filter(Book.status == "active").count()
-        archived_books = db.query(Book).filter(Book.status == "archived").count()
-        duplicate_books = db.query(Book).filter(Book.status == "duplicate").count()
-
-        # Series statistics
-        total_series = db.query(Series).count()
-
-        # Author statistics
-        total_authors = db.query(Author).count()
+        result = StatsService.get_snapshot(db)
+        if not result["success"]:
+            raise Exception(result["error"])
 
-        # Download statistics
-        total_downloads = db.query(Download).count()
-        queued_downloads = db.query(Download).filter(Download.status == "queued").count()
-        completed_downloads = db.query(Download).filter(Download.status == "completed").count()
-        failed_downloads = db.query(Download).filter(Download.status.in_(["failed", "abandoned"])).count()
-
-        # Failed attempt statistics
-        total_failed_attempts = db.query(FailedAttempt).count()
+        snapshot = result["data"]
+        books = snapshot["books"]
+        downloads = snapshot["downloads"]["by_status"]
 
         stats = {
             "books": {
-                "total_active": total_books,
-                "archived": archived_books,
-                "duplicates": duplicate_books,
-                "grand_total": total_books + archived_books + duplicate_books
+                "total_active": books["active"],
+                "archived": books["archived"],
+                "duplicates": books["duplicate"],
+                "grand_total": books["active"] + books["archived"] + books["duplicate"]
             },
             "series": {
-                "total": total_series
+                "total": snapshot["series"]
             },
             "authors": {
-                "total": total_authors
+                "total": snapshot["authors"]
             },
             "downloads": {
-                "total": total_downloads,
-                "queued": queued_downloads,
-                "completed": completed_downloads,
-                "failed": failed_downloads
+                "total": snapshot["downloads"]["total"],
+                "queued": downloads["queued"],
+                "completed": downloads["completed"],
+                "failed": downloads["failed"] + downloads["abandoned"]
             },
             "failed_attempts": {
-                "total": total_failed_attempts
+                "total": snapshot["failed_attempts"]
             }
         }
 
@@ -134,7 +119,7 @@ async def get_system_stats(
     summary="Get library health status",
     description="Get library health metrics (metadata completeness, series/author completion)"
 )
-async def get_library_status(
+def get_library_status(
     db: Session = Depends(get_db)
 ):
     """
@@ -200,48 +185,33 @@ async def get_library_status(
     summary="Get download queue statistics",
     description="Get download queue status and statistics"
 )
-async def get_download_stats(
+def get_download_stats(
     db: Session = Depends(get_db)
 ):
     """
     Get download queue statistics
 
+    Served from the StatsService snapshot (refreshed by the scheduler).
+
     Returns:
         Standard response with download queue metrics
     """
     try:
-        from backend.models.download import Download
-
-        # Count by status
-        queued = db.query(Download).filter(Download.status == "queued").count()
-        downloading = db.query(Download).filter(Download.status == "downloading").count()
-        completed = db.query(Download).filter(Download.status == "completed").count()
-        failed = db.query(Download).filter(Download.status == "failed").count()
-        abandoned = db.query(Download).filter(Download.status == "abandoned").count()
-
-        # Count by source
-        source_counts = db.query(
-            Download.source,
-            func.count(Download.id)
-        ).group_by(Download.source).all()
-
-        source_breakdown = {source: count for source, count in source_counts}
-
-        # Pending retries
-        retry_due_result = DownloadService.get_retry_due(db)
-        retry_due_count = retry_due_result["count"] if retry_due_result["success"] else 0
+        result = StatsService.get_snapshot(db)
+        if not result["success"]:
+            raise Exception(result["error"])
+
+        downloads = result["data"]["downloads"]
+        status_breakdown = {
+            status_name: downloads["by_status"][status_name]
+            for status_name in ("queued", "downloading", "completed", "failed", "abandoned")
+        }
 
         stats = {
-            "status_breakdown": {
-                "queued": queued,
-                "downloading": downloading,
-                "completed": completed,
-                "failed": failed,
-                "abandoned": abandoned
-            },
-            "source_breakdown": source_breakdown,
-            "retry_due_count": retry_due_count,
-            "total_downloads": queued + downloading + completed + failed + abandoned
+            "status_breakdown": status_breakdown,
+            "source_breakdown": downloads["by_source"],
+            "retry_due_count": downloads["retry_due"],
+            "total_downloads": sum(status_breakdown.values())
         }
 
         return {
@@ -265,7 +235,7 @@ async def get_download_stats(
     summary="Get storage usage",
     description="Get estimated storage usage statistics"
 )
-async def get_storage_usage(
+def get_storage_usage(
     db: Session = Depends(get_db)
 ):
     """
@@ -326,7 +296,7 @@ async def get_storage_usage(
     summary="Get API usage statistics",
     description="Get API call statistics by integration"
 )
-async def get_api_usage(
+def get_api_usage(
     db: Session = Depends(get_db)
 ):
     """
@@ -631,8 +601,10 @@ async def get_compliance_ratio(
         current_ratio = await service.get_current_ratio()
         is_emergency = await service.is_emergency_active()
 
-        # Get latest ratio log for seeding allocation
-        latest_log = db.query(RatioLog).order_by(RatioLog.timestamp.desc()).first()
+        # Get latest ratio log for seeding allocation (sync ORM, off the event loop)
+        latest_log = await run_in_threadpool(
+            lambda: db.query(RatioLog).order_by(RatioLog.timestamp.desc()).first()
+        )
         seeding_allocation = latest_log.seeding_allocation if latest_log else 0
 
         # Determine status
@@ -729,7 +701,7 @@ async def get_mam_rules(
     summary="Get current events",
     description="Get current MAM events (freeleech, bonus, multiplier)"
 )
-async def get_events(
+def get_events(
     db: Session = Depends(get_db)
 ):
     """
@@ -793,7 +765,7 @@ async def get_events(
     summary="Health check",
     description="Comprehensive health check (database, scheduler, external APIs)"
 )
-async def health_check(
+def health_check(
     db: Session = Depends(get_db)
 ):
     """
@@ -883,7 +855,7 @@ async def health_check(
     summary="Get quality enforcement status",
     description="Get current quality rules status and metrics"
 )
-async def get_quality_status(
+def get_quality_status(
     db: Session = Depends(get_db)
 ):
     """
@@ -1233,10 +1205,10 @@ async def get_event_monitor_status(
         service = EventMonitorService()
         strategy = await service.adjust_download_strategy()
 
-        # Get active events
-        active_events = db.query(EventStatus).filter(
-            EventStatus.active == True
-        ).all()
+        # Get active events (sync ORM, off the event loop)
+        active_events = await run_in_threadpool(
+            lambda: db.query(EventStatus).filter(EventStatus.active == True).all()
+        )
 
         events_list = [
             {
@@ -7,6 +7,8 @@ Call this during application startup to configure the scheduler.
 """
 
 import logging
+from datetime import datetime
+
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from backend.config import get_settings
@@ -30,7 +32,8 @@ from backend.schedulers.tasks import (
     daily_metadata_update_task,
     repair_batch_task,
     process_download_queue_task,
-    execute_full_workflow_task
+    execute_full_workflow_task,
+    refresh_dashboard_stats_task
 )
 from backend.services.vip_management_service import daily_vip_management_task
 
@@ -204,6 +207,25 @@ def register_all_tasks(scheduler: BackgroundScheduler) -> None:
     )
     logger.info("✓ Registered: Download Queue Processing (Every 30 Minutes)")
 
+    # ========================================================================
+    # Task 7.6: Dashboard Stats Snapshot (Every 30 Seconds)
+    # ========================================================================
+    scheduler.add_job(
+        refresh_dashboard_stats_task,
+        trigger='interval',
+        seconds=settings.DASHBOARD_STATS_REFRESH_SECONDS,
+        id='refresh_dashboard_stats',
+        name='Dashboard Stats Snapshot Refresh',
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        next_run_time=datetime.now()
+    )
+    logger.info(
+        f"✓ Registered: Dashboard Stats Snapshot Refresh "
+        f"(Every {settings.DASHBOARD_STATS_REFRESH_SECONDS} seconds)"
+    )
+
     # ========================================================================
     # Phase 1 Tasks
     # ========================================================================
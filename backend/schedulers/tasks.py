@@ -726,6 +726,26 @@ async def cleanup_old_tasks() -> None:
             raise
 
 
+def refresh_dashboard_stats_task() -> None:
+    """
+    Refresh the dashboard statistics snapshot
+
+    A plain (non-async) job so the scheduler runs its synchronous ORM
+    queries in the executor thread pool instead of on the event loop.
+
+    Schedule: Every DASHBOARD_STATS_REFRESH_SECONDS (default 30 seconds)
+    Purpose: Keep /system/stats and /system/download-stats constant-time
+    Output: Updated StatsService snapshot (in memory, no task record)
+    """
+    from backend.services.stats_service import StatsService
+
+    with get_db_context() as db:
+        result = StatsService.refresh_snapshot(db)
+
+    if not result["success"]:
+        logger.warning(f"Dashboard stats refresh failed: {result['error']}")
+
+
 # ============================================================================
 # Phase 1: MAM Rules Scraping (Daily 12:00 PM)
 # ============================================================================
@@ -0,0 +1,168 @@
+"""
+Dashboard polling load test
+
+Simulates several dashboards polling the system statistics endpoints at the
+same time and reports p50/p95/p99 latency per endpoint. A lightweight probe
+(/health/live) is polled alongside; its latency shows how long requests wait
+behind blocking work on the event loop.
+
+Run it against a build before and after a change and compare:
+
+    python -m backend.scripts.load_test_dashboard --api-key KEY --save before.json
+    # deploy the new build
+    python -m backend.scripts.load_test_dashboard --api-key KEY --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+DASHBOARD_ENDPOINTS = [
+    "/api/system/stats",
+    "/api/system/download-stats",
+    "/api/system/library-status",
+    "/api/system/quality/status",
+    "/api/books/?limit=50",
+    "/api/downloads/?limit=50",
+]
+PROBE_ENDPOINT = "/health/live"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: Dict[str, List[float]], errors: Dict[str, int]) -> Dict[str, Dict[str, float]]:
+    """Reduce per-endpoint latency samples (seconds) to millisecond percentiles."""
+    summary = {}
+    for endpoint, values in samples.items():
+        summary[endpoint] = {
+            "requests": len(values),
+            "errors": errors.get(endpoint, 0),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+            "max_ms": round(max(values) * 1000, 1) if values else 0.0,
+            "mean_ms": round(statistics.fmean(values) * 1000, 1) if values else 0.0,
+        }
+    return summary
+
+
+async def poll(
+    client: httpx.AsyncClient,
+    endpoints: List[str],
+    deadline: float,
+    interval: float,
+    samples: Dict[str, List[float]],
+    errors: Dict[str, int],
+) -> None:
+    """One simulated dashboard: request every endpoint, sleep, repeat."""
+    while time.perf_counter() < deadline:
+        for endpoint in endpoints:
+            started = time.perf_counter()
+            try:
+                response = await client.get(endpoint)
+                if response.status_code >= 400:
+                    errors[endpoint] = errors.get(endpoint, 0) + 1
+            except httpx.HTTPError:
+                errors[endpoint] = errors.get(endpoint, 0) + 1
+            samples.setdefault(endpoint, []).append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+
+
+async def run_load_test(
+    base_url: str,
+    api_key: Optional[str],
+    concurrency: int,
+    duration: float,
+    interval: float,
+    endpoints: List[str],
+) -> Dict[str, Dict[str, float]]:
+    """Run concurrent dashboard pollers plus the liveness probe for duration seconds."""
+    headers = {"X-API-Key": api_key} if api_key else {}
+    limits = httpx.Limits(max_connections=concurrency + 1, max_keepalive_connections=concurrency + 1)
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        pollers = [
+            poll(client, endpoints, deadline, interval, samples, errors)
+            for _ in range(concurrency)
+        ]
+        probe = poll(client, [PROBE_ENDPOINT], deadline, 0.1, samples, errors)
+        await asyncio.gather(*pollers, probe)
+
+    return summarize(samples, errors)
+
+
+def print_report(summary: Dict[str, Dict[str, float]], baseline: Optional[Dict] = None) -> None:
+    """Print a latency table, with before/after p99 when a baseline is given."""
+    header = f"{'endpoint':40} {'reqs':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8}"
+    if baseline:
+        header += f" {'p99 before':>11} {'change':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for endpoint, row in summary.items():
+        line = (
+            f"{endpoint:40} {row['requests']:>6} {row['errors']:>4} "
+            f"{row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms {row['p99_ms']:>7.1f}ms"
+        )
+        if baseline and endpoint in baseline:
+            before = baseline[endpoint]["p99_ms"]
+            change = ((row["p99_ms"] - before) / before * 100) if before else 0.0
+            line += f" {before:>9.1f}ms {change:>+7.0f}%"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent dashboard polling load test")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8081", help="API base URL")
+    parser.add_argument("--api-key", default=None, help="Value for the X-API-Key header")
+    parser.add_argument("--concurrency", type=int, default=20, help="Simulated dashboards")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test length in seconds")
+    parser.add_argument("--interval", type=float, default=1.0, help="Pause between polling rounds")
+    parser.add_argument("--endpoint", action="append", dest="endpoints", help="Override endpoints (repeatable)")
+    parser.add_argument("--save", help="Write the summary JSON to this file")
+    parser.add_argument("--compare", help="Summary JSON from a previous run to compare p99 against")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_load_test(
+        base_url=args.base_url,
+        api_key=args.api_key,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        interval=args.interval,
+        endpoints=args.endpoints or DASHBOARD_ENDPOINTS,
+    ))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(summary, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nSaved summary to {args.save}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
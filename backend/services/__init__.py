@@ -43,6 +43,10 @@ Usage:
         db, task_name="MAM", item_id=1, item_name="Book Name", reason="Connection timeout"
     )
 
+    # Dashboard statistics (cached snapshot)
+    result = StatsService.get_snapshot(db)
+    stats = result["data"]
+
 All service methods return Dict with:
     - success: bool - Whether operation succeeded
     - data: Any - Result data (model instance, list, etc.)
@@ -57,6 +61,7 @@ from backend.services.download_service import DownloadService
 from backend.services.metadata_service import MetadataService
 from backend.services.task_service import TaskService
 from backend.services.failed_attempt_service import FailedAttemptService
+from backend.services.stats_service import StatsService
 
 __all__ = [
     "BookService",
@@ -66,4 +71,5 @@ __all__ = [
     "MetadataService",
     "TaskService",
     "FailedAttemptService",
+    "StatsService",
 ]
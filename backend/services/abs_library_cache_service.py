@@ -0,0 +1,276 @@
+"""
+ABS Library Cache Service - Local mirror of the Audiobookshelf library
+Syncs library items incrementally by updatedAt watermark and serves them
+from the database so workflow phases do not re-download the whole library
+"""
+
+from typing import Optional, Dict, Any, List, Iterable, Iterator
+from datetime import datetime
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models.abs_library_item import AbsLibraryItem
+
+logger = logging.getLogger(__name__)
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return media.metadata of an ABS library item (empty dict if missing)."""
+    return (item.get("media") or {}).get("metadata") or {}
+
+
+class AbsLibraryCacheService:
+    """
+    Service layer for the Audiobookshelf library mirror
+
+    sync_library() does a full pull the first time a library is seen (or when
+    forced) and afterwards only fetches items whose updatedAt is at or after
+    the newest cached updatedAt. If ABS reports a different item count than
+    the mirror holds after an incremental sync, items were removed and a full
+    pull reconciles them.
+    """
+
+    @staticmethod
+    def get_watermark(db: Session, library_id: str) -> Optional[int]:
+        """
+        Get the newest cached updatedAt for a library
+
+        Args:
+            db: Database session
+            library_id: ABS library ID
+
+        Returns:
+            Epoch milliseconds, or None if the library has not been synced
+        """
+        return db.query(func.max(AbsLibraryItem.updated_at_ms)).filter(
+            AbsLibraryItem.library_id == library_id
+        ).scalar()
+
+    @staticmethod
+    def count_items(db: Session, library_id: str) -> int:
+        """Count cached items for a library."""
+        return db.query(func.count(AbsLibraryItem.id)).filter(
+            AbsLibraryItem.library_id == library_id
+        ).scalar() or 0
+
+    @staticmethod
+    def upsert_items(db: Session, library_id: str, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update cached items by ABS ID
+
+        Args:
+            db: Database session
+            library_id: ABS library ID
+            items: ABS library item dicts
+
+        Returns:
+            Number of items written (not committed)
+        """
+        items = [item for item in items if item.get("id")]
+        if not items:
+            return 0
+
+        existing = {
+            row.abs_id: row
+            for row in db.query(AbsLibraryItem).filter(
+                AbsLibraryItem.abs_id.in_([item["id"] for item in items])
+            )
+        }
+
+        for item in items:
+            metadata = _metadata(item)
+            values = {
+                "library_id": library_id,
+                "title": (metadata.get("title") or "")[:500] or None,
+                "author": (metadata.get("authorName") or metadata.get("author") or "")[:500] or None,
+                "series": (metadata.get("seriesName") or "")[:500] or None,
+                "added_at_ms": item.get("addedAt"),
+                "updated_at_ms": item.get("updatedAt") or item.get("addedAt"),
+                "item": item,
+                "synced_at": datetime.utcnow(),
+            }
+
+            row = existing.get(item["id"])
+            if row is None:
+                db.add(AbsLibraryItem(abs_id=item["id"], **values))
+            else:
+                for key, value in values.items():
+                    setattr(row, key, value)
+
+        return len(items)
+
+    @staticmethod
+    def _replace_library(db: Session, library_id: str, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert a full pull and delete cached items ABS no longer has."""
+        seen = {item["id"] for item in items if item.get("id")}
+        cached = {
+            abs_id for (abs_id,) in db.query(AbsLibraryItem.abs_id).filter(
+                AbsLibraryItem.library_id == library_id
+            )
+        }
+        removed = cached - seen
+
+        written = 0
+        for start in range(0, len(items), 500):
+            written += AbsLibraryCacheService.upsert_items(db, library_id, items[start:start + 500])
+
+        removed_list = list(removed)
+        for start in range(0, len(removed_list), 500):
+            db.query(AbsLibraryItem).filter(
+                AbsLibraryItem.abs_id.in_(removed_list[start:start + 500])
+            ).delete(synchronize_session=False)
+
+        return {"upserted": written, "removed": len(removed)}
+
+    @staticmethod
+    async def sync_library(
+        db: Session,
+        client,
+        library_id: Optional[str] = None,
+        force_full: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Bring the local mirror up to date with Audiobookshelf
+
+        Args:
+            db: Database session
+            client: AudiobookshelfClient
+            library_id: ABS library ID (defaults to the first library)
+            force_full: Re-download every item instead of syncing changes
+
+        Returns:
+            Dict with:
+                - success: bool
+                - data: dict with library_id, library_name, mode (full/incremental),
+                  fetched, upserted, removed, total
+                - error: str if failed
+        """
+        try:
+            library_name = None
+            if not library_id:
+                libraries = await client.get_libraries()
+                if not libraries:
+                    return {"success": False, "data": None, "error": "No Audiobookshelf libraries found"}
+                library_id = libraries[0]["id"]
+                library_name = libraries[0].get("name")
+
+            watermark = None if force_full else AbsLibraryCacheService.get_watermark(db, library_id)
+            stats = {"upserted": 0, "removed": 0}
+            mode = "incremental"
+
+            if watermark is not None:
+                delta = await client.get_library_items_since(library_id, watermark)
+                fetched = len(delta["items"])
+                if delta["ordered"]:
+                    stats["upserted"] = AbsLibraryCacheService.upsert_items(db, library_id, delta["items"])
+                    db.flush()
+                    if AbsLibraryCacheService.count_items(db, library_id) != delta["total"]:
+                        logger.info("ABS item count differs from mirror, reconciling with a full pull")
+                        mode = "full"
+                else:
+                    mode = "full"
+            else:
+                mode = "full"
+
+            if mode == "full":
+                items = await client.get_library_items(library_id=library_id, limit=500)
+                fetched = len(items)
+                stats = AbsLibraryCacheService._replace_library(db, library_id, items)
+
+            db.commit()
+
+            total = AbsLibraryCacheService.count_items(db, library_id)
+            logger.info(
+                f"ABS library sync ({mode}): fetched {fetched}, upserted {stats['upserted']}, "
+                f"removed {stats['removed']}, cached {total}"
+            )
+
+            return {
+                "success": True,
+                "data": {
+                    "library_id": library_id,
+                    "library_name": library_name,
+                    "mode": mode,
+                    "fetched": fetched,
+                    "upserted": stats["upserted"],
+                    "removed": stats["removed"],
+                    "total": total,
+                },
+                "error": None
+            }
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error syncing ABS library cache: {str(e)}")
+            return {
+                "success": False,
+                "data": None,
+                "error": f"Failed to sync ABS library cache: {str(e)}"
+            }
+
+    @staticmethod
+    def get_items(
+        db: Session,
+        library_id: str,
+        recently_added: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get cached library items
+
+        Args:
+            db: Database session
+            library_id: ABS library ID
+            recently_added: Order newest addedAt first (default: insertion order)
+            limit: Maximum number of items
+
+        Returns:
+            List of ABS library item dicts, as returned by the ABS API
+        """
+        query = db.query(AbsLibraryItem.item).filter(AbsLibraryItem.library_id == library_id)
+        if recently_added:
+            query = query.order_by(AbsLibraryItem.added_at_ms.desc())
+        else:
+            query = query.order_by(AbsLibraryItem.id)
+        if limit:
+            query = query.limit(limit)
+        return [item for (item,) in query]
+
+    @staticmethod
+    def iter_items(
+        db: Session,
+        library_id: str,
+        record: Optional[type] = None,
+        recently_added: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> Iterator[Any]:
+        """
+        Stream cached library items without loading the whole library
+
+        Rows are fetched batch_size at a time and each item is projected with
+        record.from_item() before the next one is decoded.
+
+        Args:
+            db: Database session
+            library_id: ABS library ID
+            record: Record class with a from_item() classmethod (None yields dicts)
+            recently_added: Order newest addedAt first (default: insertion order)
+            limit: Maximum number of items
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Records (or ABS library item dicts)
+        """
+        query = db.query(AbsLibraryItem.item).filter(AbsLibraryItem.library_id == library_id)
+        if recently_added:
+            query = query.order_by(AbsLibraryItem.added_at_ms.desc())
+        else:
+            query = query.order_by(AbsLibraryItem.id)
+        if limit:
+            query = query.limit(limit)
+
+        for (item,) in query.yield_per(batch_size):
+            yield record.from_item(item) if record else item
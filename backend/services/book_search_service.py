@@ -0,0 +1,277 @@
+"""
+Book Search Service - Indexed, typo-tolerant book search
+Ranks active books against a query over title, author, series and narrator
+using the search index created by the add_book_search_index migration:
+pg_trgm GIN indexes on PostgreSQL, an FTS5 trigram table on SQLite
+"""
+
+from typing import Optional, Dict, Any, List, Set
+import logging
+import re
+import weakref
+
+from sqlalchemy import func, literal, or_, text
+from sqlalchemy.orm import Session
+
+from backend.models.book import Book
+
+logger = logging.getLogger(__name__)
+
+# Searched columns and the weight of a match in each
+SEARCH_FIELDS = {"title": 1.0, "author": 0.8, "series": 0.6, "narrator": 0.5}
+
+# Share of the query's trigrams a field must contain to match
+MIN_SIMILARITY = 0.3
+
+# FTS5 candidates fetched per requested result, re-ranked by similarity
+SQLITE_CANDIDATES = 10
+
+# Search backend per engine, detected on first use
+_backends: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def trigrams(value: Optional[str]) -> Set[str]:
+    """
+    Trigrams of a string the way pg_trgm extracts them
+
+    Each lower-cased word is padded with two spaces in front and one behind,
+    so short words and word starts still produce trigrams.
+    """
+    grams = set()
+    for word in _WORD_RE.findall((value or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(query_grams: Set[str], value: Optional[str]) -> float:
+    """Share of the query's trigrams found in value (0.0 - 1.0)."""
+    if not query_grams:
+        return 0.0
+    return len(query_grams & trigrams(value)) / len(query_grams)
+
+
+def score_book(query_grams: Set[str], book: Any) -> tuple:
+    """
+    Similarity of a book to a query
+
+    Returns:
+        Tuple of (best field similarity, best weighted field similarity)
+    """
+    similarities = {field: similarity(query_grams, getattr(book, field)) for field in SEARCH_FIELDS}
+    return (
+        max(similarities.values()),
+        max(similarities[field] * weight for field, weight in SEARCH_FIELDS.items())
+    )
+
+
+def typo_pieces(word: str) -> List[str]:
+    """
+    Three-letter pieces covering a word
+
+    A typo (including two swapped letters) touches at most two neighbouring
+    pieces, so words of six letters or more keep at least one intact.
+    """
+    if len(word) <= 3:
+        return [word]
+    starts = list(range(0, len(word) - 2, 3))
+    if starts[-1] != len(word) - 3:
+        starts.append(len(word) - 3)
+    return [word[start:start + 3] for start in starts]
+
+
+def _fts_phrase(value: str) -> str:
+    return '"{}"'.format(value.replace('"', '""'))
+
+
+class BookSearchService:
+    """
+    Service layer for ranked book search
+
+    The backend is chosen per database: "trigram" (PostgreSQL with the
+    pg_trgm indexes), "fts5" (SQLite with the books_fts table) or "like"
+    (no search index yet; unindexed ILIKE, ranked the same way).
+    """
+
+    @staticmethod
+    def detect_backend(db: Session) -> str:
+        """
+        Search backend available on the session's database
+
+        Returns:
+            "trigram", "fts5" or "like"
+        """
+        engine = db.get_bind()
+        backend = _backends.get(engine)
+        if backend is None:
+            dialect = engine.dialect.name
+            backend = "like"
+            if dialect == "postgresql":
+                found = db.execute(text(
+                    "SELECT 1 FROM pg_indexes WHERE indexname = 'idx_books_title_trgm'"
+                )).first()
+                backend = "trigram" if found else "like"
+            elif dialect == "sqlite":
+                found = db.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books_fts'"
+                )).first()
+                backend = "fts5" if found else "like"
+            if backend == "like":
+                logger.warning("Book search index not found, searching without it (run alembic upgrade)")
+            _backends[engine] = backend
+        return backend
+
+    @staticmethod
+    def search(
+        db: Session,
+        query: str,
+        limit: int = 10,
+        status: Optional[str] = "active"
+    ) -> Dict[str, Any]:
+        """
+        Search books by title, author, series and narrator
+
+        Matches tolerate typos and partial words; results are ordered by
+        score, the best weighted trigram similarity over the searched fields.
+
+        Args:
+            db: Database session
+            query: Search query string
+            limit: Maximum results to return
+            status: Only books with this status (None for all)
+
+        Returns:
+            Dict with success, data (list of Books, best first), scores
+            (book id -> score), count, backend, error
+        """
+        try:
+            query = query.strip()
+            backend = BookSearchService.detect_backend(db)
+
+            if backend == "trigram":
+                ranked = BookSearchService._search_trigram(db, query, limit, status)
+            elif backend == "fts5":
+                ranked = BookSearchService._search_fts5(db, query, limit, status)
+            else:
+                ranked = BookSearchService._search_like(db, query, limit, status)
+
+            return {
+                "success": True,
+                "data": [book for book, _ in ranked],
+                "scores": {book.id: round(score, 4) for book, score in ranked},
+                "count": len(ranked),
+                "backend": backend,
+                "error": None
+            }
+
+        except Exception as e:
+            logger.error(f"Error searching books with query '{query}': {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "data": [],
+                "scores": {},
+                "count": 0,
+                "backend": None
+            }
+
+    @staticmethod
+    def _search_trigram(db: Session, query: str, limit: int, status: Optional[str]) -> List[tuple]:
+        """PostgreSQL: word similarity over the pg_trgm GIN indexes."""
+        db.execute(
+            text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+            {"threshold": str(MIN_SIMILARITY)}
+        )
+
+        columns = [getattr(Book, field) for field in SEARCH_FIELDS]
+        pattern = f"%{query}%"
+        score = func.greatest(*(
+            func.word_similarity(query, func.coalesce(column, "")) * weight
+            for column, weight in zip(columns, SEARCH_FIELDS.values())
+        )).label("score")
+
+        # "<%" is pg_trgm's word similarity operator; both it and ILIKE use the GIN indexes
+        matches = or_(
+            *(literal(query).op("<%")(column) for column in columns),
+            *(column.ilike(pattern) for column in columns)
+        )
+
+        rows = db.query(Book, score).filter(matches)
+        if status:
+            rows = rows.filter(Book.status == status)
+        return [(book, float(value)) for book, value in rows.order_by(score.desc(), Book.id.desc()).limit(limit)]
+
+    @staticmethod
+    def _search_fts5(db: Session, query: str, limit: int, status: Optional[str]) -> List[tuple]:
+        """SQLite: FTS5 trigram candidates of the status, re-ranked by similarity."""
+        words = [word for word in _WORD_RE.findall(query.lower()) if len(word) >= 3]
+        if not words:
+            return BookSearchService._search_like(db, query, limit, status)
+
+        candidates = limit * SQLITE_CANDIDATES
+
+        # Every word as a substring: cheap, and enough unless the query has a typo
+        exact = " AND ".join(_fts_phrase(word) for word in words)
+        candidate_ids = BookSearchService._fts_ids(db, exact, candidates, status)
+
+        # The status filter is already applied, so this counts usable matches
+        if len(candidate_ids) < limit:
+            # Each word by its pieces: one typo leaves at least one piece intact
+            tolerant = " AND ".join(
+                "(" + " OR ".join(_fts_phrase(piece) for piece in typo_pieces(word)) + ")"
+                for word in words
+            )
+            candidate_ids += BookSearchService._fts_ids(db, tolerant, candidates, status)
+
+        if not candidate_ids:
+            return []
+
+        books = db.query(Book).filter(Book.id.in_(set(candidate_ids))).all()
+        return BookSearchService._rank(query, books, limit)
+
+    @staticmethod
+    def _fts_ids(db: Session, match: str, candidates: int, status: Optional[str]) -> List[int]:
+        """Ids of books with the status matching an FTS5 query, best bm25 first."""
+        status_filter = "AND books.status = :status " if status else ""
+        return [row[0] for row in db.execute(
+            text(
+                "SELECT books_fts.rowid FROM books_fts JOIN books ON books.id = books_fts.rowid "
+                f"WHERE books_fts MATCH :match {status_filter}"
+                "ORDER BY bm25(books_fts, :w_title, :w_author, :w_series, :w_narrator) "
+                "LIMIT :candidates"
+            ),
+            {
+                "match": match,
+                "status": status,
+                "w_title": SEARCH_FIELDS["title"],
+                "w_author": SEARCH_FIELDS["author"],
+                "w_series": SEARCH_FIELDS["series"],
+                "w_narrator": SEARCH_FIELDS["narrator"],
+                "candidates": candidates,
+            }
+        )]
+
+    @staticmethod
+    def _search_like(db: Session, query: str, limit: int, status: Optional[str]) -> List[tuple]:
+        """No index: substring match on each field, ranked the same way."""
+        pattern = f"%{query}%"
+        books = db.query(Book).filter(or_(
+            *(getattr(Book, field).ilike(pattern) for field in SEARCH_FIELDS)
+        ))
+        if status:
+            books = books.filter(Book.status == status)
+        return BookSearchService._rank(query, books.limit(limit * SQLITE_CANDIDATES).all(), limit, min_similarity=0.0)
+
+    @staticmethod
+    def _rank(query: str, books: List[Book], limit: int, min_similarity: float = MIN_SIMILARITY) -> List[tuple]:
+        """Score books against the query, best first."""
+        query_grams = trigrams(query)
+        scored = []
+        for book in books:
+            best, score = score_book(query_grams, book)
+            if best >= min_similarity:
+                scored.append((book, score))
+        scored.sort(key=lambda pair: (-pair[1], -pair[0].id))
+        return scored[:limit]
@@ -10,9 +10,24 @@ from sqlalchemy.orm import Session
 import logging
 
 from backend.models.book import Book
+from backend.services.book_search_service import BookSearchService
+from backend.utils.pagination import InvalidCursorError, paginate
 
 logger = logging.getLogger(__name__)
 
+# Columns the book listing returns (skips description and metadata_source)
+BOOK_LIST_COLUMNS = (
+    Book.id,
+    Book.abs_id,
+    Book.title,
+    Book.author,
+    Book.series,
+    Book.series_number,
+    Book.metadata_completeness_percent,
+    Book.status,
+    Book.date_added,
+)
+
 
 class BookService:
     """
@@ -191,7 +206,10 @@ class BookService:
         limit: int = 10
     ) -> Dict[str, Any]:
         """
-        Search books by title or author
+        Search books by title, author, series or narrator
+
+        Uses the book search index (see BookSearchService); matches tolerate
+        typos and are ranked best first.
 
         Args:
             db: Database session
@@ -199,35 +217,10 @@ class BookService:
             limit: Maximum results to return
 
         Returns:
-            Dict with success, data (list of Books), count, error
+            Dict with success, data (list of Books), scores (book id -> score),
+            count, error
         """
-        try:
-            search_pattern = f"%{query}%"
-
-            books = db.query(Book).filter(
-                or_(
-                    Book.title.ilike(search_pattern),
-                    Book.author.ilike(search_pattern)
-                )
-            ).filter(
-                Book.status == "active"
-            ).limit(limit).all()
-
-            return {
-                "success": True,
-                "data": books,
-                "count": len(books),
-                "error": None
-            }
-
-        except Exception as e:
-            logger.error(f"Error searching books with query '{query}': {e}", exc_info=True)
-            return {
-                "success": False,
-                "error": str(e),
-                "data": [],
-                "count": 0
-            }
+        return BookSearchService.search(db, query=query, limit=limit)
 
     @staticmethod
     def get_all_books(
@@ -282,6 +275,69 @@ class BookService:
                 "page_info": None
             }
 
+    @staticmethod
+    def list_books(
+        db: Session,
+        status: Optional[str] = "active",
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact"
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the book listing, newest first
+
+        Only BOOK_LIST_COLUMNS are loaded. Pages are read by keyset on
+        (date_added, id) when a cursor is given or offset is 0, so deep pages
+        cost the same as the first.
+
+        Args:
+            db: Database session
+            status: Filter by status (None for all)
+            limit: Maximum results per page
+            offset: Number of records to skip (ignored when cursor is given)
+            cursor: page_info.next_cursor of the previous page ("" = first page)
+            count: Total to report: exact, estimated or none
+
+        Returns:
+            Dict with success, data (list of rows with BOOK_LIST_COLUMNS),
+            total (None if not counted), page_info (limit, offset, has_more,
+            next_cursor), error
+
+        Raises:
+            InvalidCursorError: The cursor is malformed
+        """
+        try:
+            query = db.query(*BOOK_LIST_COLUMNS)
+
+            if status:
+                query = query.filter(Book.status == status)
+
+            books, total, page_info = paginate(
+                db, query, Book.date_added, Book.id, limit,
+                offset=offset, cursor=cursor, count=count
+            )
+
+            return {
+                "success": True,
+                "data": books,
+                "total": total,
+                "page_info": page_info,
+                "error": None
+            }
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error listing books: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "data": [],
+                "total": 0,
+                "page_info": None
+            }
+
     @staticmethod
     def update_book(
         db: Session,
@@ -109,35 +109,50 @@ class DailyMetadataUpdateService:
             errors = []
             books_processed = 0
 
-            for book in books_to_update:
-                if books_processed >= self.daily_max:
-                    logger.info(f"Reached daily limit ({self.daily_max} books)")
-                    break
+            # Reserve today's Google Books quota for the batch up front, so other
+            # jobs and processes cannot take it mid-run; cache hits cost nothing.
+            # At most daily_max books are processed, so reserve no more than that
+            reserve_count = min(len(books_to_update), self.daily_max)
+            with self.google_books_client.reserved(reserve_count) as reservation:
+                if reservation.granted == 0:
+                    status = self.google_books_client.get_rate_limit_status()
+                    error_msg = f"Google Books daily quota used up (resets in {status['reset_in']})"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
 
-                try:
-                    result = await self._update_book_metadata(book)
+                for book in books_to_update:
+                    if books_processed >= self.daily_max:
+                        logger.info(f"Reached daily limit ({self.daily_max} books)")
+                        break
 
-                    if result:
-                        updated_records.append(result)
-                        logger.info(
-                            f"✓ Updated {result['title']} "
-                            f"({len(result['fields_updated'])} fields)"
-                        )
+                    if reservation.remaining <= 0:
+                        logger.info(f"Reserved quota used up after {books_processed} books")
+                        break
 
-                    books_processed += 1
+                    try:
+                        result = await self._update_book_metadata(book)
 
-                except GoogleBooksRateLimitError as e:
-                    error_msg = f"Rate limit exceeded at book {books_processed + 1}: {str(e)}"
-                    logger.warning(error_msg)
-                    errors.append(error_msg)
-                    break  # Stop processing on rate limit
+                        if result:
+                            updated_records.append(result)
+                            logger.info(
+                                f"✓ Updated {result['title']} "
+                                f"({len(result['fields_updated'])} fields)"
+                            )
 
-                except Exception as e:
-                    error_msg = f"Error updating {book.title} (ID: {book.id}): {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    books_processed += 1
-                    continue
+                        books_processed += 1
+
+                    except GoogleBooksRateLimitError as e:
+                        error_msg = f"Rate limit exceeded at book {books_processed + 1}: {str(e)}"
+                        logger.warning(error_msg)
+                        errors.append(error_msg)
+                        break  # Stop processing on rate limit
+
+                    except Exception as e:
+                        error_msg = f"Error updating {book.title} (ID: {book.id}): {str(e)}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        books_processed += 1
+                        continue
 
             return {
                 'success': len(errors) == 0 or len(updated_records) > 0,
@@ -145,7 +160,7 @@ class DailyMetadataUpdateService:
                 'books_updated': len(updated_records),
                 'updated_records': updated_records,
                 'errors': errors,
-                'rate_limit_remaining': self.daily_max - books_processed
+                'rate_limit_remaining': self.google_books_client.get_rate_limit_status()['requests_remaining']
             }
 
         except Exception as e:
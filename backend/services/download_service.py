@@ -11,9 +11,29 @@ import asyncio
 
 from backend.models.download import Download
 from backend.models.book import Book
+from backend.utils.pagination import InvalidCursorError, paginate
 
 logger = logging.getLogger(__name__)
 
+# Columns the download listing returns (skips magnet links and torrent URLs)
+DOWNLOAD_LIST_COLUMNS = (
+    Download.id,
+    Download.book_id,
+    Download.missing_book_id,
+    Download.title,
+    Download.author,
+    Download.source,
+    Download.status,
+    Download.qbittorrent_status,
+    Download.abs_import_status,
+    Download.retry_count,
+    Download.max_retries,
+    Download.date_queued,
+    Download.date_completed,
+    Download.last_attempt,
+    Download.next_retry,
+)
+
 
 class DownloadService:
     """
@@ -134,6 +154,68 @@ class DownloadService:
                 "data": None
             }
 
+    @staticmethod
+    def list_downloads(
+        db: Session,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact"
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the download listing, newest first
+
+        Only DOWNLOAD_LIST_COLUMNS are loaded. Pages are read by keyset on
+        (date_queued, id) when a cursor is given or offset is 0.
+
+        Args:
+            db: Database session
+            status: Filter by status (None for all)
+            limit: Maximum results per page
+            offset: Number of records to skip (ignored when cursor is given)
+            cursor: page_info.next_cursor of the previous page ("" = first page)
+            count: Total to report: exact, estimated or none
+
+        Returns:
+            Dict with success, data (list of rows with DOWNLOAD_LIST_COLUMNS),
+            total (None if not counted), page_info (limit, offset, has_more,
+            next_cursor), error
+
+        Raises:
+            InvalidCursorError: The cursor is malformed
+        """
+        try:
+            query = db.query(*DOWNLOAD_LIST_COLUMNS)
+
+            if status:
+                query = query.filter(Download.status == status)
+
+            downloads, total, page_info = paginate(
+                db, query, Download.date_queued, Download.id, limit,
+                offset=offset, cursor=cursor, count=count
+            )
+
+            return {
+                "success": True,
+                "data": downloads,
+                "total": total,
+                "page_info": page_info,
+                "error": None
+            }
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error listing downloads: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "data": [],
+                "total": 0,
+                "page_info": None
+            }
+
     @staticmethod
     def get_all_pending(db: Session) -> Dict[str, Any]:
         """
@@ -489,7 +571,8 @@ class DownloadService:
     async def on_download_completed(
         db: Session,
         download_id: int,
-        torrent_name: Optional[str] = None
+        torrent_name: Optional[str] = None,
+        torrent_mirror=None
     ) -> Dict[str, Any]:
         """
         GAP 1 + GAP 4 IMPLEMENTATION: Handle download completion event.
@@ -507,6 +590,7 @@ class DownloadService:
             db: Database session
             download_id: Download ID
             torrent_name: Torrent name (optional, loaded from DB if not provided)
+            torrent_mirror: Optional QBittorrentStateMirror shared with the monitor
 
         Returns:
             Dict with status, scan_result, integrity_result, errors
@@ -536,7 +620,7 @@ class DownloadService:
             db.commit()
 
             # GAP 4: Run integrity check
-            integrity_service = IntegrityCheckService(db)
+            integrity_service = IntegrityCheckService(db, torrent_mirror=torrent_mirror)
             integrity_result = await integrity_service.verify_download(
                 download_id=download_id,
                 torrent_hash=download.qbittorrent_hash
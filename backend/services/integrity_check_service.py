@@ -32,9 +32,11 @@ class IntegrityCheckService:
     - Queues new download for best alternative
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, torrent_mirror=None):
         self.db = db_session
         self.qb_client = None
+        # Shared QBittorrentStateMirror (avoids pulling the full torrent list)
+        self.torrent_mirror = torrent_mirror
 
     async def initialize_qbittorrent(self) -> bool:
         """Initialize qBittorrent client connection."""
@@ -104,19 +106,21 @@ class IntegrityCheckService:
 
             logger.info(f"GAP 4: Starting integrity check for download {download_id}: {download.title}")
 
-            # Initialize qBittorrent client
-            if not self.qb_client:
+            # Initialize qBittorrent client (only needed without a shared mirror)
+            if self.torrent_mirror is None and not self.qb_client:
                 await self.initialize_qbittorrent()
 
             # 2. Get torrent info
             torrent_info = None
-            if self.qb_client:
+            if self.torrent_mirror is not None:
                 try:
-                    torrents = await self.qb_client.get_all_torrents()
-                    for t in torrents:
-                        if t.get('hash') == torrent_hash:
-                            torrent_info = t
-                            break
+                    await self.torrent_mirror.sync()
+                    torrent_info = self.torrent_mirror.get_torrent(torrent_hash)
+                except Exception as e:
+                    logger.warning(f"Could not get torrent info from mirror: {e}")
+            elif self.qb_client:
+                try:
+                    torrent_info = await self.qb_client.get_torrent_status(torrent_hash)
                 except Exception as e:
                     logger.warning(f"Could not get torrent info: {e}")
 
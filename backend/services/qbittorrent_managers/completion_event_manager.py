@@ -9,6 +9,11 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from backend.integrations.qbittorrent_state_mirror import (
+    QBittorrentStateMirror,
+    TorrentChangeEvent,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +30,10 @@ class CompletionEventManager:
     GAP 1 Implementation: Automatically detects when torrents complete
     and triggers metadata scanning via DownloadService.
 
+    When the monitor service has a QBittorrentStateMirror attached, completion
+    detection is event-driven: the mirror publishes state/progress changes
+    and this manager only queues the completions, no full-list diff needed.
+
     Args:
         monitor_service: Reference to parent QBittorrentMonitorService
     """
@@ -34,6 +43,37 @@ class CompletionEventManager:
         self.monitor_service = monitor_service
         self.last_checked_torrents = {}  # Track torrent states for change detection
         self.completion_history = []  # Recent completions
+        self.pending_events = []  # Completions published by the state mirror
+
+    def on_mirror_event(self, event: TorrentChangeEvent) -> None:
+        """
+        Mirror subscriber: queue completion events for the next detection pass.
+
+        Args:
+            event: Change event published by QBittorrentStateMirror
+        """
+        if not event.is_completion:
+            return
+
+        if any(e['torrent_hash'] == event.torrent_hash for e in self.pending_events):
+            return
+
+        mirror = self._get_mirror()
+        torrent = mirror.get_torrent(event.torrent_hash) if mirror else None
+        current_state = (torrent or {}).get('state', event.current if event.kind == 'state_changed' else '')
+
+        self.pending_events.append({
+            'torrent_hash': event.torrent_hash,
+            'torrent_name': event.torrent_name,
+            'previous_state': event.previous if event.kind == 'state_changed' else 'downloading',
+            'current_state': (current_state or '').lower(),
+            'detected_at': event.detected_at
+        })
+
+    def _get_mirror(self) -> Optional[QBittorrentStateMirror]:
+        """Get the monitor service's shared torrent mirror, if one is attached."""
+        mirror = getattr(self.monitor_service, 'torrent_mirror', None)
+        return mirror if isinstance(mirror, QBittorrentStateMirror) else None
 
     async def detect_completion_events(self) -> List[Dict[str, str]]:
         """
@@ -64,6 +104,24 @@ class CompletionEventManager:
                 if not await self.monitor_service.initialize_qbittorrent():
                     return []
 
+            mirror = self._get_mirror()
+            if mirror is not None:
+                # Event-driven: the sync publishes completions into pending_events
+                await mirror.sync()
+                completion_events, self.pending_events = self.pending_events, []
+                for event in completion_events:
+                    logger.info(
+                        f"Completion detected: {event['torrent_name']} "
+                        f"({event['torrent_hash']}) transitioned "
+                        f"from {event['previous_state']} -> {event['current_state']}"
+                    )
+                self.completion_history.extend(completion_events)
+
+                if completion_events:
+                    logger.info(f"Detected {len(completion_events)} completion events")
+
+                return completion_events
+
             # Get all torrents
             torrents = await self.monitor_service.qb_client.get_all_torrents()
 
@@ -189,7 +247,8 @@ class CompletionEventManager:
                         result = await DownloadService.on_download_completed(
                             db=db,
                             download_id=download.id,
-                            torrent_name=torrent_name
+                            torrent_name=torrent_name,
+                            torrent_mirror=self._get_mirror()
                         )
 
                         if result.get('status') == 'success':
@@ -269,7 +328,8 @@ class CompletionEventManager:
                 result = await DownloadService.on_download_completed(
                     db=db,
                     download_id=download.id,
-                    torrent_name=download.title
+                    torrent_name=download.title,
+                    torrent_mirror=self._get_mirror()
                 )
 
                 success = result.get('status') == 'success'
@@ -332,8 +392,11 @@ class CompletionEventManager:
             >>> stats = manager.get_completion_stats()
             >>> print(f"Total completions: {stats['total_tracked']}")
         """
+        mirror = self._get_mirror()
+        monitored = len(mirror.torrents) if mirror is not None else len(self.last_checked_torrents)
         return {
             'total_tracked': len(self.completion_history),
-            'torrents_being_monitored': len(self.last_checked_torrents),
+            'torrents_being_monitored': monitored,
+            'pending_events': len(self.pending_events),
             'last_update': datetime.utcnow().isoformat()
         }
@@ -9,6 +9,8 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from backend.integrations.qbittorrent_state_mirror import QBittorrentStateMirror
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +19,7 @@ class TorrentStateManager:
     Manager for torrent state tracking and categorization.
 
     Encapsulates all state-related operations including:
-    - Fetching torrents from qBittorrent
+    - Fetching torrents from qBittorrent (via the shared state mirror)
     - Categorizing torrents by state (downloading, seeding, stalled, etc.)
     - Maintaining state cache for change detection
     - Providing state statistics
@@ -67,8 +69,13 @@ class TorrentStateManager:
                 }
 
         try:
-            # Fetch all torrents from qBittorrent
-            all_torrents = await self.monitor_service.qb_client.get_all_torrents()
+            # Read from the shared incremental mirror when available
+            mirror = self.get_mirror()
+            if mirror is not None:
+                await mirror.sync()
+                all_torrents = mirror.get_torrents()
+            else:
+                all_torrents = await self.monitor_service.qb_client.get_all_torrents()
 
             # Initialize state buckets
             states = {
@@ -139,6 +146,11 @@ class TorrentStateManager:
                 'errored': []
             }
 
+    def get_mirror(self) -> Optional[QBittorrentStateMirror]:
+        """Get the monitor service's shared torrent mirror, if one is attached."""
+        mirror = getattr(self.monitor_service, 'torrent_mirror', None)
+        return mirror if isinstance(mirror, QBittorrentStateMirror) else None
+
     async def get_state_summary(self) -> Dict[str, int]:
         """
         Get summary counts of torrents by state.
@@ -31,6 +31,10 @@ class QBittorrentMonitorService:
 
     PHASE 3 REFACTORED: Now uses 4 specialized managers for single responsibility.
 
+    All managers read torrents from one QBittorrentStateMirror that follows
+    qBittorrent's sync/maindata deltas, so a monitoring cycle costs a single
+    incremental request instead of one full torrent list per manager.
+
     Manager Responsibilities:
     - TorrentStateManager: Fetch and categorize torrents by state
     - TorrentControlManager: Control operations (pause, resume, restart)
@@ -42,6 +46,7 @@ class QBittorrentMonitorService:
 
     def __init__(self):
         self.qb_client = None
+        self.torrent_mirror = None  # QBittorrentStateMirror shared by all managers
         self.monitoring_active = False
 
         # Initialize 4 specialized managers
@@ -55,6 +60,8 @@ class QBittorrentMonitorService:
         try:
             from backend.integrations.qbittorrent_client import QBittorrentClient
             self.qb_client = QBittorrentClient()
+            self.torrent_mirror = self.qb_client.mirror
+            self.torrent_mirror.subscribe(self.completion_manager.on_mirror_event)
             self.monitoring_active = True
             logger.info("QBittorrent client initialized")
             return True
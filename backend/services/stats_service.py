@@ -0,0 +1,209 @@
+"""
+Stats Service - Aggregated library and download statistics
+Computes dashboard counters with one grouped query per table and keeps the
+result as an in-memory snapshot refreshed by the scheduler
+"""
+
+from typing import Optional, Dict, Any
+from datetime import datetime
+import threading
+import time
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.config import get_settings
+from backend.models.book import Book
+from backend.models.series import Series
+from backend.models.author import Author
+from backend.models.download import Download
+from backend.models.failed_attempt import FailedAttempt
+
+logger = logging.getLogger(__name__)
+
+BOOK_STATUSES = ("active", "archived", "duplicate")
+DOWNLOAD_STATUSES = ("queued", "downloading", "completed", "failed", "abandoned")
+
+# Latest snapshot shared by every request handler in this process
+_snapshot: Optional[Dict[str, Any]] = None
+_snapshot_monotonic: float = 0.0
+_snapshot_lock = threading.Lock()
+
+
+class StatsService:
+    """
+    Service layer for dashboard statistics
+
+    compute_snapshot() runs a fixed number of grouped queries regardless of
+    library size. get_snapshot() serves the cached result and only recomputes
+    when it is older than DASHBOARD_STATS_MAX_AGE_SECONDS, so the
+    /system/stats endpoints stay constant-time while the scheduler keeps
+    the snapshot warm.
+    """
+
+    @staticmethod
+    def get_book_counts(db: Session) -> Dict[str, int]:
+        """
+        Count books per status with a single GROUP BY
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dict mapping every known status (and any unknown ones) to a count
+        """
+        counts = {status_name: 0 for status_name in BOOK_STATUSES}
+        rows = db.query(Book.status, func.count(Book.id)).group_by(Book.status).all()
+        for status_name, count in rows:
+            counts[status_name] = count
+        return counts
+
+    @staticmethod
+    def get_download_counts(db: Session, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Count downloads per status and source with a single GROUP BY
+
+        The retry-due count rides along as a FILTERed aggregate, using the
+        same rule as DownloadService.get_retry_due().
+
+        Args:
+            db: Database session
+            now: Reference time for retry-due (defaults to datetime.now())
+
+        Returns:
+            Dict with status, source and retry_due counts
+        """
+        now = now or datetime.now()
+        retry_due = func.count(Download.id).filter(
+            Download.status == "queued",
+            Download.next_retry.isnot(None),
+            Download.next_retry <= now
+        )
+
+        rows = db.query(
+            Download.status,
+            Download.source,
+            func.count(Download.id),
+            retry_due
+        ).group_by(Download.status, Download.source).all()
+
+        by_status = {status_name: 0 for status_name in DOWNLOAD_STATUSES}
+        by_source: Dict[str, int] = {}
+        retry_due_count = 0
+        for status_name, source, count, due in rows:
+            by_status[status_name] = by_status.get(status_name, 0) + count
+            by_source[source] = by_source.get(source, 0) + count
+            retry_due_count += due or 0
+
+        return {
+            "by_status": by_status,
+            "by_source": by_source,
+            "retry_due": retry_due_count,
+            "total": sum(by_status.values())
+        }
+
+    @staticmethod
+    def compute_snapshot(db: Session) -> Dict[str, Any]:
+        """
+        Compute all dashboard statistics
+
+        Args:
+            db: Database session
+
+        Returns:
+            Snapshot dict with books, series, authors, downloads,
+            failed_attempts and computed_at
+        """
+        books = StatsService.get_book_counts(db)
+        downloads = StatsService.get_download_counts(db)
+
+        return {
+            "books": books,
+            "series": db.query(func.count(Series.id)).scalar() or 0,
+            "authors": db.query(func.count(Author.id)).scalar() or 0,
+            "downloads": downloads,
+            "failed_attempts": db.query(func.count(FailedAttempt.id)).scalar() or 0,
+            "computed_at": datetime.utcnow().isoformat()
+        }
+
+    @staticmethod
+    def refresh_snapshot(db: Session) -> Dict[str, Any]:
+        """
+        Recompute and store the dashboard snapshot
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dict with:
+                - success: bool
+                - data: snapshot dict if successful
+                - error: str if failed
+        """
+        global _snapshot, _snapshot_monotonic
+
+        try:
+            snapshot = StatsService.compute_snapshot(db)
+            with _snapshot_lock:
+                _snapshot = snapshot
+                _snapshot_monotonic = time.monotonic()
+
+            return {
+                "success": True,
+                "data": snapshot,
+                "error": None
+            }
+
+        except Exception as e:
+            logger.error(f"Error refreshing stats snapshot: {str(e)}")
+            return {
+                "success": False,
+                "data": None,
+                "error": f"Failed to refresh stats snapshot: {str(e)}"
+            }
+
+    @staticmethod
+    def get_snapshot(db: Session, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the dashboard snapshot, recomputing it only when stale
+
+        Args:
+            db: Database session (used only if the snapshot is missing or stale)
+            max_age: Maximum snapshot age in seconds
+                     (defaults to DASHBOARD_STATS_MAX_AGE_SECONDS)
+
+        Returns:
+            Dict with:
+                - success: bool
+                - data: snapshot dict if successful
+                - error: str if failed
+                - age_seconds: float age of the returned snapshot
+        """
+        if max_age is None:
+            max_age = get_settings().DASHBOARD_STATS_MAX_AGE_SECONDS
+
+        with _snapshot_lock:
+            snapshot = _snapshot
+            age = time.monotonic() - _snapshot_monotonic
+
+        if snapshot is not None and age <= max_age:
+            return {
+                "success": True,
+                "data": snapshot,
+                "error": None,
+                "age_seconds": age
+            }
+
+        result = StatsService.refresh_snapshot(db)
+        result["age_seconds"] = 0.0
+        return result
+
+    @staticmethod
+    def invalidate_snapshot() -> None:
+        """Drop the cached snapshot so the next read recomputes it."""
+        global _snapshot, _snapshot_monotonic
+
+        with _snapshot_lock:
+            _snapshot = None
+            _snapshot_monotonic = 0.0
@@ -0,0 +1,275 @@
+"""
+Tag Sync Service - Keeps audio file tags in line with the library layout
+Reads the tags already in each file, writes only the frames that differ and
+remembers (size, mtime, tag hash) per file so files untouched since the last
+run are skipped without being opened
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Union
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from mamcrawler.storage import open_state_db
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.m4b', '.flac', '.ogg')
+
+# Logical tag -> ID3v2 frame / MP4 atom
+ID3_FRAMES = {'title': 'TIT2', 'artist': 'TPE1', 'albumartist': 'TPE2', 'album': 'TALB'}
+MP4_ATOMS = {'title': '\xa9nam', 'artist': '\xa9ART', 'albumartist': 'aART', 'album': '\xa9alb'}
+
+# Outcomes of sync_file()
+WRITTEN = 'written'      # tags differed and were rewritten
+UNCHANGED = 'unchanged'  # file was read, tags already matched
+CACHED = 'cached'        # unchanged since last run, not opened
+SKIPPED = 'skipped'      # format without tag support here
+FAILED = 'failed'
+
+TAG_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tag_state (
+    path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, tag_hash TEXT NOT NULL
+);
+"""
+
+
+def path_tags(file_path: str, library_path: str) -> Dict[str, str]:
+    """
+    Tags for an audio file derived from its place in the library
+
+    Layout: <library>/Author/Series/Title {Narrator}/file.mp3
+
+    Args:
+        file_path: Audio file inside the library
+        library_path: Library root
+
+    Returns:
+        Dict of logical tag name -> value, for the values that are present
+    """
+    root = os.path.dirname(file_path)
+    parts = file_path.split(os.sep)
+
+    folder_name = os.path.basename(root) if root != library_path else ""
+    parent_folders = parts[-3:-1] if len(parts) >= 3 else []
+
+    title = folder_name or "Unknown"
+    author = parent_folders[0] if parent_folders else "Unknown"
+    series = parent_folders[1] if len(parent_folders) > 1 else ""
+
+    # Narrator from a "{Narrator}" suffix on the book folder
+    narrator = None
+    if '{' in title and '}' in title:
+        narrator = title[title.find('{') + 1:title.find('}')].strip()
+
+    tags = {
+        'title': title,
+        'artist': narrator or author,
+        'albumartist': author,
+        'album': series,
+    }
+    return {key: value for key, value in tags.items() if value}
+
+
+def tag_hash(tags: Dict[str, str]) -> str:
+    """Stable hash of a desired tag set."""
+    return hashlib.sha256(json.dumps(tags, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class TagStateStore:
+    """
+    Per-file record of the last successful tag sync
+
+    A file whose size, mtime and desired tag hash all match its row was
+    already in sync after the last run and has not been touched since.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            path: SQLite file holding the state (None = memory only)
+        """
+        self.path = str(path) if path else None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """State connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.path, TAG_STATE_SCHEMA)
+        return self._conn
+
+    def is_synced(self, path: str, size: int, mtime_ns: int, digest: str) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM tag_state WHERE path = ? AND size = ? AND mtime_ns = ? AND tag_hash = ?",
+                (path, size, mtime_ns, digest)
+            ).fetchone()
+        return row is not None
+
+    def record(self, path: str, size: int, mtime_ns: int, digest: str):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tag_state (path, size, mtime_ns, tag_hash) VALUES (?, ?, ?, ?)",
+                (path, size, mtime_ns, digest)
+            )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _sync_id3(file_path: str, desired: Dict[str, str]) -> bool:
+    """Write the ID3 frames that differ from desired. Returns True if the file was saved."""
+    from mutagen.id3 import ID3, ID3NoHeaderError, Frames
+
+    try:
+        tags = ID3(file_path)
+    except ID3NoHeaderError:
+        tags = ID3()
+
+    changed = False
+    for name, value in desired.items():
+        frame_id = ID3_FRAMES[name]
+        frame = tags.get(frame_id)
+        if frame is not None and list(frame.text) == [value]:
+            continue
+        tags.setall(frame_id, [Frames[frame_id](encoding=3, text=[value])])
+        changed = True
+
+    if changed:
+        tags.save(file_path, v2_version=4)
+    return changed
+
+
+def _sync_mp4(file_path: str, desired: Dict[str, str]) -> bool:
+    """Write the MP4 atoms that differ from desired. Returns True if the file was saved."""
+    from mutagen.mp4 import MP4
+
+    audio = MP4(file_path)
+    if audio.tags is None:
+        audio.add_tags()
+
+    changed = False
+    for name, value in desired.items():
+        atom = MP4_ATOMS[name]
+        if audio.tags.get(atom) != [value]:
+            audio.tags[atom] = [value]
+            changed = True
+
+    if changed:
+        audio.save()
+    return changed
+
+
+class TagSyncService:
+    """
+    Service layer for writing library metadata into audio file tags
+
+    Files are handled on a bounded thread pool so tag I/O never blocks the
+    event loop, and a TagStateStore lets repeat runs skip every file that is
+    unchanged since it was last synced.
+    """
+
+    def __init__(self, state_path: Optional[Union[str, Path]] = None, max_workers: int = 8):
+        """
+        Args:
+            state_path: SQLite file for per-file sync state (None = memory only)
+            max_workers: Files tagged concurrently
+        """
+        self.state = TagStateStore(state_path)
+        self.max_workers = max_workers
+
+    def sync_file(self, file_path: str, desired: Dict[str, str]) -> str:
+        """
+        Bring one file's tags in line with desired
+
+        Args:
+            file_path: Audio file
+            desired: Logical tag name -> value
+
+        Returns:
+            One of WRITTEN, UNCHANGED, CACHED, SKIPPED, FAILED
+        """
+        lower = file_path.lower()
+        if lower.endswith('.mp3'):
+            writer = _sync_id3
+        elif lower.endswith(('.m4a', '.m4b')):
+            writer = _sync_mp4
+        else:
+            return SKIPPED
+
+        try:
+            path = os.path.abspath(file_path)
+            digest = tag_hash(desired)
+            stat = os.stat(path)
+            if self.state.is_synced(path, stat.st_size, stat.st_mtime_ns, digest):
+                return CACHED
+
+            changed = writer(path, desired)
+            if changed:
+                stat = os.stat(path)
+            self.state.record(path, stat.st_size, stat.st_mtime_ns, digest)
+            return WRITTEN if changed else UNCHANGED
+
+        except Exception as e:
+            logger.warning(f"Tag sync failed for {file_path}: {e}")
+            return FAILED
+
+    @staticmethod
+    def scan_library(library_path: str) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Find audio files in a library with their desired tags
+
+        Returns:
+            List of (file path, desired tags)
+        """
+        found = []
+        for root, dirs, files in os.walk(library_path):
+            for file in files:
+                if file.lower().endswith(AUDIO_EXTENSIONS):
+                    file_path = os.path.join(root, file)
+                    found.append((file_path, path_tags(file_path, library_path)))
+        return found
+
+    async def sync_library(self, library_path: str) -> Dict[str, Any]:
+        """
+        Sync tags for every audio file in a library
+
+        Args:
+            library_path: Library root
+
+        Returns:
+            Dict with counts per outcome: written, unchanged, cached, skipped, failed
+        """
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, self.scan_library, library_path)
+
+        counts = {WRITTEN: 0, UNCHANGED: 0, CACHED: 0, SKIPPED: 0, FAILED: 0}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='tag-sync') as executor:
+            outcomes = await asyncio.gather(*(
+                loop.run_in_executor(executor, self.sync_file, file_path, desired)
+                for file_path, desired in files
+            ))
+
+        for outcome in outcomes:
+            counts[outcome] += 1
+
+        logger.info(
+            f"Tag sync of {len(files)} files: {counts[WRITTEN]} written, {counts[UNCHANGED]} unchanged, "
+            f"{counts[CACHED]} skipped as unchanged since last run, {counts[FAILED]} failed"
+        )
+        return counts
+
+    def close(self):
+        """Close the state store."""
+        self.state.close()
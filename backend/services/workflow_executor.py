@@ -29,14 +29,18 @@ import time
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Set, Optional, Tuple
 from dotenv import load_dotenv
 import logging
 
 import logging
 # Use backend imports
 from backend.config import get_settings
+from backend.database import get_db_context
+from backend.integrations.abs_client import AudiobookshelfClient
+from backend.integrations.abs_records import BookRecord, NarratorRecord
 from backend.integrations.qbittorrent_resilient import ResilientQBittorrentClient
+from backend.services.abs_library_cache_service import AbsLibraryCacheService
 from backend.utils.log_config import get_logger
 
 # Setup logging
@@ -67,6 +71,8 @@ class RealExecutionWorkflow:
         self.existing_books = {}
         self.existing_titles = set()
         self.existing_authors = set()
+        self.library_id = None
+        self.library_name = None
         self.qb_session = None
 
         self.log("=" * 100, "INIT")
@@ -88,142 +94,172 @@ class RealExecutionWorkflow:
         except Exception:
             pass
 
-    async def get_library_data(self) -> Dict:
-        """Get complete library inventory"""
-        self.log("Scanning current AudiobookShelf library...", "SCAN")
+    def _abs_client(self) -> AudiobookshelfClient:
+        """Create an Audiobookshelf client for library reads."""
+        return AudiobookshelfClient(
+            self.abs_url,
+            self.abs_token,
+            timeout=120,
+            page_concurrency=get_settings().ABS_PAGE_CONCURRENCY
+        )
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
+    async def _sync_library_mirror(self, client: AudiobookshelfClient, db) -> Optional[Dict]:
+        """
+        Sync the local ABS mirror (incremental after the first run)
 
-                # Get library
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status != 200:
-                        self.log(f"Failed to get libraries: HTTP {resp.status}", "FAIL")
-                        return {}
+        Sets self.library_id / self.library_name on success.
 
-                    libs_data = await resp.json()
-                    lib_id = libs_data['libraries'][0]['id']
-                    lib_name = libs_data['libraries'][0]['name']
-
-                # Get all items - with duplicate detection for API bugs
-                all_items = []
-                seen_ids = set()  # Track seen item IDs to detect cycles
-                offset = 0
-                page = 0
-                max_pages = 500  # Hard limit to prevent infinite loops
-                consecutive_duplicates = 0
-                max_consecutive = 3  # Stop if we see 3 pages of all duplicates (instead of 5)
-
-                while page < max_pages:
-                    retry_count = 0
-                    max_retries = 3
-                    items = []
-
-                    while retry_count < max_retries:
-                        try:
-                            # Increase timeout significantly and add read/connect timeouts
-                            timeout = aiohttp.ClientTimeout(total=120, connect=30, sock_read=60)
-                            async with session.get(
-                                f'{self.abs_url}/api/libraries/{lib_id}/items',
-                                headers=headers,
-                                params={'limit': 500, 'offset': offset},
-                                timeout=timeout
-                            ) as resp:
-                                if resp.status != 200:
-                                    self.log(f"HTTP {resp.status} at offset {offset}, retrying...", "WARN")
-                                    retry_count += 1
-                                    await asyncio.sleep(2)
-                                    continue
-
-                                result = await resp.json()
-                                items = result.get('results', [])
-
-                                if not items:
-                                    self.log(f"Pagination complete at offset {offset}", "SCAN")
-                                    break
+        Returns:
+            sync_library() data dict, or None if the mirror is disabled or failed
+        """
+        if not get_settings().ABS_LIBRARY_CACHE_ENABLED:
+            return None
 
-                                # Check if all items in this batch are duplicates
-                                page_has_new = False
-                                for item in items:
-                                    item_id = item.get('id')
-                                    if item_id not in seen_ids:
-                                        seen_ids.add(item_id)
-                                        all_items.append(item)
-                                        page_has_new = True
-
-                                if not page_has_new:
-                                    consecutive_duplicates += 1
-                                    self.log(f"Page {page} had all duplicates ({consecutive_duplicates}/{ max_consecutive})", "WARN")
-                                    if consecutive_duplicates >= max_consecutive:
-                                        self.log(f"Stopping - detected API cycle (pages returning duplicate items)", "SCAN")
-                                        break
-                                else:
-                                    consecutive_duplicates = 0
+        result = await AbsLibraryCacheService.sync_library(db, client)
+        if not result["success"]:
+            self.log(f"Library mirror unavailable: {result['error']}", "WARN")
+            return None
 
-                                offset += 500
-                                page += 1
-                                retry_count = 0  # Reset on success
+        data = result["data"]
+        self.library_id = data["library_id"]
+        self.library_name = data["library_name"]
+        self.log(
+            f"Library mirror: {data['total']} items ({data['mode']} sync, "
+            f"{data['fetched']} fetched)", "SCAN"
+        )
+        return data
+
+    async def _resolve_library(self, client: AudiobookshelfClient) -> Optional[str]:
+        """Look up the first ABS library directly (mirror fallback)."""
+        libraries = await client.get_libraries()
+        if not libraries:
+            return None
+        self.library_id = libraries[0]['id']
+        self.library_name = libraries[0].get('name')
+        return self.library_id
 
-                                if page % 5 == 0:
-                                    self.log(f"Loaded {len(all_items)} unique items (page {page})...", "SCAN")
-                                break
+    async def get_library_items_cached(
+        self,
+        recently_added: bool = False,
+        limit: Optional[int] = None
+    ) -> Tuple[str, Optional[str], List[Dict]]:
+        """
+        Get library items from the local ABS mirror
 
-                        except asyncio.TimeoutError:
-                            retry_count += 1
-                            self.log(f"Timeout at offset {offset}, retry {retry_count}/{max_retries}...", "WARN")
-                            await asyncio.sleep(5)
-                        except Exception as e:
-                            retry_count += 1
-                            self.log(f"Error at offset {offset}: {str(e)[:100]}, retry {retry_count}/{max_retries}...", "WARN")
-                            await asyncio.sleep(5)
+        Syncs abs_library_items incrementally (a full pull only the first time)
+        and reads the items from the database. Falls back to a direct
+        Audiobookshelf fetch if the mirror is disabled or unavailable.
+
+        Returns:
+            (library_id, library_name, items)
+        """
+        async with self._abs_client() as client:
+            try:
+                with get_db_context() as db:
+                    data = await self._sync_library_mirror(client, db)
+                    if data:
+                        items = AbsLibraryCacheService.get_items(
+                            db, data["library_id"], recently_added=recently_added, limit=limit
+                        )
+                        return data["library_id"], data["library_name"], items
+            except Exception as e:
+                self.log(f"Library mirror unavailable: {e}", "WARN")
 
-                    if retry_count >= max_retries:
-                        self.log(f"Failed to load items at offset {offset} after {max_retries} retries", "FAIL")
-                        break
+            lib_id = await self._resolve_library(client)
+            if not lib_id:
+                return None, None, []
+            if recently_added:
+                items = await client.get_recent_library_items(lib_id, limit=limit or 100)
+            else:
+                items = await client.get_library_items(library_id=lib_id, limit=500)
+            if limit:
+                items = items[:limit]
+            return lib_id, self.library_name, items
 
-                    if not items or consecutive_duplicates >= max_consecutive:
-                        break
+    async def iter_library_records(
+        self,
+        record: type,
+        recently_added: bool = False,
+        limit: Optional[int] = None
+    ) -> AsyncIterator:
+        """
+        Stream library items as compact records (BookRecord, NarratorRecord...)
 
-                    if page >= max_pages:
-                        self.log(f"Reached max pages limit ({max_pages})", "WARN")
-                        break
+        Reads from the local ABS mirror in batches, or streams pages straight
+        from Audiobookshelf when the mirror is unavailable. Only the record
+        fields stay alive, never the full item list. self.library_id and
+        self.library_name are set before the first record is yielded.
+        """
+        async with self._abs_client() as client:
+            data = None
+            try:
+                with get_db_context() as db:
+                    data = await self._sync_library_mirror(client, db)
+                    if data:
+                        for item in AbsLibraryCacheService.iter_items(
+                            db, data["library_id"], record=record,
+                            recently_added=recently_added, limit=limit
+                        ):
+                            yield item
+                        return
+            except Exception as e:
+                if data:
+                    raise
+                self.log(f"Library mirror unavailable: {e}", "WARN")
 
-                self.log(f"Library scan complete: {len(all_items)} items", "OK")
+            lib_id = await self._resolve_library(client)
+            if not lib_id:
+                return
 
-                # Extract existing books
-                for item in all_items:
-                    metadata = item.get('media', {}).get('metadata', {})
-                    title = metadata.get('title', '').strip()
-                    author = metadata.get('author', '').strip()
-                    series = metadata.get('seriesName', '').strip()
-
-                    if title:
-                        title_lower = title.lower()
-                        self.existing_books[title_lower] = {
-                            'title': title,
-                            'author': author,
-                            'series': series,
-                            'id': item.get('id')
-                        }
-                        self.existing_titles.add(title_lower)
-
-                    if author:
-                        self.existing_authors.add(author.lower())
-
-                self.log(f"Existing books: {len(self.existing_titles)}", "OK")
-                self.log(f"Existing authors: {len(self.existing_authors)}", "OK")
+            if recently_added:
+                for item in await client.get_recent_library_items(lib_id, limit=limit or 100):
+                    yield record.from_item(item)
+                return
 
-                return {
-                    'library_id': lib_id,
-                    'library_name': lib_name,
-                    'total_items': len(all_items),
-                    'items': all_items
-                }
+            count = 0
+            async for item in client.iter_library_items(lib_id, record=record):
+                if limit and count >= limit:
+                    break
+                count += 1
+                yield item
+
+    async def get_library_data(self) -> Dict:
+        """Get complete library inventory"""
+        self.log("Scanning current AudiobookShelf library...", "SCAN")
+
+        try:
+            total_items = 0
+
+            # Extract existing books
+            async for book in self.iter_library_records(BookRecord):
+                total_items += 1
+
+                if book.title:
+                    title_lower = book.title.lower()
+                    self.existing_books[title_lower] = {
+                        'title': book.title,
+                        'author': book.author,
+                        'series': book.series,
+                        'id': book.id
+                    }
+                    self.existing_titles.add(title_lower)
+
+                if book.author:
+                    self.existing_authors.add(book.author.lower())
+
+            if not self.library_id:
+                self.log("Failed to get libraries", "FAIL")
+                return {}
+
+            self.log(f"Library scan complete: {total_items} items", "OK")
+            self.log(f"Existing books: {len(self.existing_titles)}", "OK")
+            self.log(f"Existing authors: {len(self.existing_authors)}", "OK")
+
+            return {
+                'library_id': self.library_id,
+                'library_name': self.library_name,
+                'total_items': total_items
+            }
 
         except Exception as e:
             self.log(f"Library scan error: {e}", "FAIL")
@@ -618,10 +654,7 @@ class RealExecutionWorkflow:
         self.log("PHASE 7+: WRITING ID3 METADATA TO AUDIO FILES", "PHASE")
 
         try:
-            from mutagen.mp3 import MP3
-            from mutagen.id3 import ID3, TIT2, TPE1, TPE2, TALB, COMM
-            from mutagen.easyid3 import EasyID3
-            import os
+            from backend.services.tag_sync_service import TagSyncService
 
             if not library_path:
                 # Try to get library path from environment or use default
@@ -631,96 +664,26 @@ class RealExecutionWorkflow:
                 self.log(f"Library path not found: {library_path}", "WARN")
                 return {'written': 0, 'failed': 0, 'skipped': 0}
 
-            written_count = 0
-            failed_count = 0
-            skipped_count = 0
-
-            # Walk through library and find audio files
-            for root, dirs, files in os.walk(library_path):
-                for file in files:
-                    # Support common audiobook formats
-                    if not file.lower().endswith(('.mp3', '.m4a', '.m4b', '.flac', '.ogg')):
-                        continue
-
-                    file_path = os.path.join(root, file)
-
-                    try:
-                        # Try to get metadata from folder name or parent folders
-                        # Format: /audiobooks/Author/Series/Title {Narrator}/file.mp3
-                        parts = file_path.split(os.sep)
-
-                        # Extract metadata from path structure
-                        folder_name = os.path.basename(root) if root != library_path else ""
-                        parent_folders = parts[-3:-1] if len(parts) >= 3 else []
-
-                        # Basic metadata extraction (can be enhanced)
-                        title = folder_name or "Unknown"
-                        author = parent_folders[0] if parent_folders else "Unknown"
-                        series = parent_folders[1] if len(parent_folders) > 1 else ""
-
-                        # Try to extract narrator from folder name {Narrator}
-                        narrator = None
-                        if '{' in title and '}' in title:
-                            start = title.find('{') + 1
-                            end = title.find('}')
-                            narrator = title[start:end].strip()
-
-                        # Write ID3 tags
-                        if file_path.lower().endswith(('.mp3',)):
-                            # MP3 with ID3v2.4
-                            try:
-                                audio = EasyID3(file_path)
-                                audio['title'] = title
-                                audio['artist'] = narrator if narrator else author
-                                audio['albumartist'] = author
-                                if series:
-                                    audio['album'] = series
-                                audio.save(v2_version=4)
-                                written_count += 1
-                            except:
-                                # Fall back to mutagen MP3
-                                try:
-                                    audio = MP3(file_path, ID3=ID3)
-                                    if audio.tags is None:
-                                        audio.add_tags()
-                                    audio.tags[TIT2] = TIT2(text=[title])
-                                    audio.tags[TPE1] = TPE1(text=[narrator if narrator else author])
-                                    audio.tags[TPE2] = TPE2(text=[author])
-                                    if series:
-                                        audio.tags[TALB] = TALB(text=[series])
-                                    audio.save()
-                                    written_count += 1
-                                except Exception as e:
-                                    failed_count += 1
-
-                        elif file_path.lower().endswith(('.m4a', '.m4b')):
-                            # M4A/M4B (iTunes format)
-                            try:
-                                from mutagen.mp4 import MP4
-                                audio = MP4(file_path)
-                                audio['\xa9nam'] = [title]  # Title
-                                audio['\xa9ART'] = [narrator if narrator else author]  # Artist (narrator)
-                                audio['aART'] = [author]  # Album Artist (author)
-                                if series:
-                                    audio['\xa9alb'] = [series]  # Album (series)
-                                audio.save()
-                                written_count += 1
-                            except Exception as e:
-                                failed_count += 1
-
-                        else:
-                            # Other formats - skip for now
-                            skipped_count += 1
-
-                    except Exception as e:
-                        self.log(f"Error processing {file_path}: {e}", "WARN")
-                        failed_count += 1
-
-            self.log(f"ID3 metadata written: {written_count} files, {failed_count} failed, {skipped_count} skipped", "OK")
+            # Only files whose tags differ are rewritten; files untouched since
+            # the last run are skipped without being opened
+            settings = get_settings()
+            tag_sync = TagSyncService(settings.TAG_SYNC_STATE_FILE, settings.TAG_SYNC_CONCURRENCY)
+            try:
+                counts = await tag_sync.sync_library(library_path)
+            finally:
+                tag_sync.close()
+
+            self.log(
+                f"ID3 metadata written: {counts['written']} files, {counts['failed']} failed, "
+                f"{counts['skipped']} skipped, {counts['unchanged'] + counts['cached']} already up to date",
+                "OK"
+            )
             return {
-                'written': written_count,
-                'failed': failed_count,
-                'skipped': skipped_count
+                'written': counts['written'],
+                'failed': counts['failed'],
+                'skipped': counts['skipped'],
+                'unchanged': counts['unchanged'],
+                'cached': counts['cached']
             }
 
         except Exception as e:
@@ -732,68 +695,47 @@ class RealExecutionWorkflow:
         self.log("PHASE 8B: VALIDATE METADATA QUALITY (absToolbox)", "PHASE")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
-
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
-
-                # Get recently added items for quality check
-                async with session.get(
-                    f'{self.abs_url}/api/libraries/{lib_id}/items',
-                    headers=headers,
-                    params={'limit': 100, 'sortBy': 'addedAt'}
-                ) as resp:
-                    if resp.status == 200:
-                        items = (await resp.json()).get('results', [])
-                        self.log(f"Checking quality for {len(items)} recent items...", "QUALITY")
-
-                        issues = {'invalid_format': [], 'missing_fields': []}
-                        checked = 0
-
-                        for item in items:
-                            checked += 1
-                            metadata = item.get('media', {}).get('metadata', {})
-                            item_issues = []
-
-                            # Check required fields
-                            if not metadata.get('authorName'):
-                                item_issues.append("Missing author name")
-                            if not metadata.get('title'):
-                                item_issues.append("Missing title")
-                            if not metadata.get('narrator'):
-                                item_issues.append("Missing narrator info")
-
-                            # Check format issues
-                            author = metadata.get('authorName', '')
-                            if author and author.startswith('Unknown'):
-                                item_issues.append("Unknown author - needs clarification")
-
-                            if item_issues:
-                                issues['invalid_format'].append({
-                                    'title': metadata.get('title', 'Unknown'),
-                                    'author': author,
-                                    'issues': item_issues
-                                })
+            self.log("Checking quality for recent items...", "QUALITY")
+
+            issues = {'invalid_format': [], 'missing_fields': []}
+            checked = 0
+
+            async for book in self.iter_library_records(NarratorRecord, recently_added=True, limit=100):
+                checked += 1
+                item_issues = []
+
+                # Check required fields
+                if not book.author:
+                    item_issues.append("Missing author name")
+                if not book.title:
+                    item_issues.append("Missing title")
+                if not book.narrator:
+                    item_issues.append("Missing narrator info")
+
+                # Check format issues
+                if book.author.startswith('Unknown'):
+                    item_issues.append("Unknown author - needs clarification")
+
+                if item_issues:
+                    issues['invalid_format'].append({
+                        'title': book.title or 'Unknown',
+                        'author': book.author,
+                        'issues': item_issues
+                    })
 
-                        self.log(f"Quality check complete: {len(issues['invalid_format'])} issues found", "QUALITY")
+            self.log(f"Quality check complete: {len(issues['invalid_format'])} issues found", "QUALITY")
 
-                        if issues['invalid_format']:
-                            self.log("Top quality issues:", "WARN")
-                            for issue in issues['invalid_format'][:5]:
-                                self.log(f"  - {issue['title']}: {', '.join(issue['issues'])}", "WARN")
+            if issues['invalid_format']:
+                self.log("Top quality issues:", "WARN")
+                for issue in issues['invalid_format'][:5]:
+                    self.log(f"  - {issue['title']}: {', '.join(issue['issues'])}", "WARN")
 
-                        return {
-                            'checked': checked,
-                            'issues_count': len(issues['invalid_format']),
-                            'issues': issues,
-                            'timestamp': datetime.now().isoformat()
-                        }
+            return {
+                'checked': checked,
+                'issues_count': len(issues['invalid_format']),
+                'issues': issues,
+                'timestamp': datetime.now().isoformat()
+            }
 
         except Exception as e:
             self.log(f"Quality validation error: {e}", "FAIL")
@@ -807,91 +749,77 @@ class RealExecutionWorkflow:
             async with aiohttp.ClientSession() as session:
                 headers = {'Authorization': f'Bearer {self.abs_token}'}
 
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
+                # Recently added items from the library mirror
+                _, _, items = await self.get_library_items_cached(recently_added=True, limit=50)
+                self.log(f"Standardizing {len(items)} recent items...", "STANDARD")
 
-                # Get recently added items for standardization
-                async with session.get(
-                    f'{self.abs_url}/api/libraries/{lib_id}/items',
-                    headers=headers,
-                    params={'limit': 50, 'sortBy': 'addedAt'}
-                ) as resp:
-                    if resp.status == 200:
-                        items = (await resp.json()).get('results', [])
-                        self.log(f"Standardizing {len(items)} recent items...", "STANDARD")
-
-                        standardized = 0
-                        changes_made = []
-
-                        for item in items:
-                            item_id = item.get('id')
-                            metadata = item.get('media', {}).get('metadata', {})
-                            update_needed = False
-                            updates = {}
-
-                            # Standardize author name (fix "LastName, FirstName" to "FirstName LastName")
-                            author = metadata.get('authorName', '').strip()
-                            if author and ',' in author:
-                                parts = [p.strip() for p in author.split(',')]
-                                if len(parts) == 2:
-                                    standardized_author = f"{parts[1]} {parts[0]}"
-                                    updates['authorName'] = standardized_author
-                                    update_needed = True
-                                    changes_made.append({
-                                        'title': metadata.get('title'),
-                                        'field': 'authorName',
-                                        'from': author,
-                                        'to': standardized_author
-                                    })
-
-                            # Standardize narrator (remove "Narrated by" prefix)
-                            narrator = metadata.get('narrator', '').strip()
-                            if narrator and narrator.lower().startswith('narrated by'):
-                                standardized_narrator = narrator.replace('Narrated by ', '').replace('narrated by ', '').strip()
-                                updates['narrator'] = standardized_narrator
-                                update_needed = True
-                                changes_made.append({
-                                    'title': metadata.get('title'),
-                                    'field': 'narrator',
-                                    'from': narrator,
-                                    'to': standardized_narrator
-                                })
+                standardized = 0
+                changes_made = []
+
+                for item in items:
+                    item_id = item.get('id')
+                    metadata = item.get('media', {}).get('metadata', {})
+                    update_needed = False
+                    updates = {}
+
+                    # Standardize author name (fix "LastName, FirstName" to "FirstName LastName")
+                    author = metadata.get('authorName', '').strip()
+                    if author and ',' in author:
+                        parts = [p.strip() for p in author.split(',')]
+                        if len(parts) == 2:
+                            standardized_author = f"{parts[1]} {parts[0]}"
+                            updates['authorName'] = standardized_author
+                            update_needed = True
+                            changes_made.append({
+                                'title': metadata.get('title'),
+                                'field': 'authorName',
+                                'from': author,
+                                'to': standardized_author
+                            })
+
+                    # Standardize narrator (remove "Narrated by" prefix)
+                    narrator = metadata.get('narrator', '').strip()
+                    if narrator and narrator.lower().startswith('narrated by'):
+                        standardized_narrator = narrator.replace('Narrated by ', '').replace('narrated by ', '').strip()
+                        updates['narrator'] = standardized_narrator
+                        update_needed = True
+                        changes_made.append({
+                            'title': metadata.get('title'),
+                            'field': 'narrator',
+                            'from': narrator,
+                            'to': standardized_narrator
+                        })
+
+                    # Apply updates if needed
+                    if update_needed:
+                        try:
+                            async with session.patch(
+                                f'{self.abs_url}/api/items/{item_id}',
+                                headers=headers,
+                                json={'media': {'metadata': updates}},
+                                timeout=aiohttp.ClientTimeout(total=30)
+                            ) as update_resp:
+                                if update_resp.status in [200, 204]:
+                                    standardized += 1
+                                else:
+                                    self.log(f"  Failed to update {item_id}", "WARN")
+                        except Exception as e:
+                            self.log(f"  Error updating {item_id}: {e}", "WARN")
+
+                self.log(f"Standardized {standardized} items with {len(changes_made)} changes", "OK")
 
-                            # Apply updates if needed
-                            if update_needed:
-                                try:
-                                    async with session.patch(
-                                        f'{self.abs_url}/api/items/{item_id}',
-                                        headers=headers,
-                                        json={'media': {'metadata': updates}},
-                                        timeout=aiohttp.ClientTimeout(total=30)
-                                    ) as update_resp:
-                                        if update_resp.status in [200, 204]:
-                                            standardized += 1
-                                        else:
-                                            self.log(f"  Failed to update {item_id}", "WARN")
-                                except Exception as e:
-                                    self.log(f"  Error updating {item_id}: {e}", "WARN")
-
-                        self.log(f"Standardized {standardized} items with {len(changes_made)} changes", "OK")
-
-                        if changes_made:
-                            self.log("Sample changes made:", "OK")
-                            for change in changes_made[:5]:
-                                self.log(f"  {change['title']}: {change['field']}", "OK")
-
-                        return {
-                            'processed': len(items),
-                            'standardized': standardized,
-                            'changes_count': len(changes_made),
-                            'changes': changes_made,
-                            'timestamp': datetime.now().isoformat()
-                        }
+                if changes_made:
+                    self.log("Sample changes made:", "OK")
+                    for change in changes_made[:5]:
+                        self.log(f"  {change['title']}: {change['field']}", "OK")
+
+                return {
+                    'processed': len(items),
+                    'standardized': standardized,
+                    'changes_count': len(changes_made),
+                    'changes': changes_made,
+                    'timestamp': datetime.now().isoformat()
+                }
 
         except Exception as e:
             self.log(f"Standardization error: {e}", "FAIL")
@@ -902,85 +830,49 @@ class RealExecutionWorkflow:
         self.log("PHASE 8D: NARRATOR DETECTION (absToolbox)", "PHASE")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
-
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
-
-                # Get all items to detect narrators
-                narrator_map = {}  # narrator -> count
-                missing_narrator = 0
-                detected = 0
-
-                all_items = []
-                offset = 0
-                page = 0
-
-                while page < 100:
-                    try:
-                        async with session.get(
-                            f'{self.abs_url}/api/libraries/{lib_id}/items',
-                            headers=headers,
-                            params={'limit': 500, 'offset': offset},
-                            timeout=aiohttp.ClientTimeout(total=120, connect=30, sock_read=60)
-                        ) as resp:
-                            if resp.status != 200:
-                                break
-
-                            result = await resp.json()
-                            items = result.get('results', [])
-                            if not items:
-                                break
-
-                            all_items.extend(items)
-                            offset += 500
-                            page += 1
-                    except Exception as e:
-                        self.log(f"  Error loading items: {e}", "WARN")
-                        break
-
-                # Analyze narrator data
-                for item in all_items:
-                    metadata = item.get('media', {}).get('metadata', {})
-                    narrator = metadata.get('narrator', '').strip()
-
-                    if narrator:
-                        # Standardize narrator name
-                        clean_narrator = narrator.replace('Narrated by ', '').replace('narrated by ', '').strip()
-                        if clean_narrator not in narrator_map:
-                            narrator_map[clean_narrator] = 0
-                        narrator_map[clean_narrator] += 1
-                        detected += 1
-                    else:
-                        missing_narrator += 1
+            # Get all items to detect narrators
+            narrator_map = {}  # narrator -> count
+            missing_narrator = 0
+            detected = 0
+
+            total_items = 0
+
+            # Analyze narrator data
+            async for book in self.iter_library_records(NarratorRecord):
+                total_items += 1
+                narrator = book.narrator
+
+                if narrator:
+                    # Standardize narrator name
+                    clean_narrator = narrator.replace('Narrated by ', '').replace('narrated by ', '').strip()
+                    if clean_narrator not in narrator_map:
+                        narrator_map[clean_narrator] = 0
+                    narrator_map[clean_narrator] += 1
+                    detected += 1
+                else:
+                    missing_narrator += 1
 
-                # Sort by frequency
-                top_narrators = sorted(narrator_map.items(), key=lambda x: x[1], reverse=True)[:10]
+            # Sort by frequency
+            top_narrators = sorted(narrator_map.items(), key=lambda x: x[1], reverse=True)[:10]
 
-                self.log(f"Narrator Analysis Complete:", "NARRATOR")
-                self.log(f"  Total items analyzed: {len(all_items)}", "NARRATOR")
-                self.log(f"  Items with narrator info: {detected}", "NARRATOR")
-                self.log(f"  Items missing narrator: {missing_narrator}", "NARRATOR")
-                self.log(f"  Unique narrators: {len(narrator_map)}", "NARRATOR")
-                self.log(f"Top 10 Narrators:", "NARRATOR")
-                for narrator, count in top_narrators:
-                    self.log(f"  {narrator}: {count} books", "NARRATOR")
+            self.log(f"Narrator Analysis Complete:", "NARRATOR")
+            self.log(f"  Total items analyzed: {total_items}", "NARRATOR")
+            self.log(f"  Items with narrator info: {detected}", "NARRATOR")
+            self.log(f"  Items missing narrator: {missing_narrator}", "NARRATOR")
+            self.log(f"  Unique narrators: {len(narrator_map)}", "NARRATOR")
+            self.log(f"Top 10 Narrators:", "NARRATOR")
+            for narrator, count in top_narrators:
+                self.log(f"  {narrator}: {count} books", "NARRATOR")
 
-                return {
-                    'total_items': len(all_items),
-                    'with_narrator': detected,
-                    'missing_narrator': missing_narrator,
-                    'unique_narrators': len(narrator_map),
-                    'top_narrators': top_narrators,
-                    'narrator_map': narrator_map,
-                    'timestamp': datetime.now().isoformat()
-                }
+            return {
+                'total_items': total_items,
+                'with_narrator': detected,
+                'missing_narrator': missing_narrator,
+                'unique_narrators': len(narrator_map),
+                'top_narrators': top_narrators,
+                'narrator_map': narrator_map,
+                'timestamp': datetime.now().isoformat()
+            }
 
         except Exception as e:
             self.log(f"Narrator detection error: {e}", "FAIL")
@@ -1001,76 +893,47 @@ class RealExecutionWorkflow:
 
         try:
             async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
-
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
-
-                # Get items without narrator (process in batches)
-                offset = 0
-                batch_size = 50
-                max_batches = 20  # Limit to first 1000 items to save API quota
-
-                for batch_num in range(max_batches):
-                    async with session.get(
-                        f'{self.abs_url}/api/libraries/{lib_id}/items',
-                        headers=headers,
-                        params={'limit': batch_size, 'offset': offset}
-                    ) as resp:
-                        if resp.status != 200:
-                            break
-
-                        items = (await resp.json()).get('results', [])
-                        if not items:
-                            break
-
-                        for item in items:
-                            metadata = item.get('media', {}).get('metadata', {})
-                            narrator = metadata.get('narrator', '').strip()
-
-                            # Skip if already has narrator
-                            if narrator:
-                                continue
-
-                            title = metadata.get('title', '')
-                            author = metadata.get('authorName', '')
-
-                            if not title or not author:
-                                failed += 1
-                                continue
-
-                            attempted += 1
-
-                            # Query Google Books for narrator
-                            narrator_found = await self.query_google_books_narrator(
-                                session, google_key, title, author
-                            )
-
-                            if narrator_found:
-                                # Update item with narrator
-                                update_success = await self.update_item_narrator_with_retry(
-                                    session,
-                                    item.get('id'),
-                                    narrator_found,
-                                    max_retries=2
-                                )
-                                if update_success:
-                                    populated += 1
-                                    self.log(f"  {title}: {narrator_found}", "OK")
-                                else:
-                                    failed += 1
-                            else:
-                                failed += 1
+                # Items without narrator (collected first so no library read
+                # stays open while Google Books is queried)
+                max_items = 1000  # Limit to first 1000 items to save API quota
+                candidates = [
+                    book async for book in self.iter_library_records(NarratorRecord, limit=max_items)
+                    if not book.narrator
+                ]
+
+                for book in candidates:
+                    title = book.title
+                    author = book.author
+
+                    if not title or not author:
+                        failed += 1
+                        continue
 
-                            # Rate limit Google Books requests
-                            await asyncio.sleep(0.3)
+                    attempted += 1
+
+                    # Query Google Books for narrator
+                    narrator_found = await self.query_google_books_narrator(
+                        session, google_key, title, author
+                    )
+
+                    if narrator_found:
+                        # Update item with narrator
+                        update_success = await self.update_item_narrator_with_retry(
+                            session,
+                            book.id,
+                            narrator_found,
+                            max_retries=2
+                        )
+                        if update_success:
+                            populated += 1
+                            self.log(f"  {title}: {narrator_found}", "OK")
+                        else:
+                            failed += 1
+                    else:
+                        failed += 1
 
-                        offset += batch_size
+                    # Rate limit Google Books requests
+                    await asyncio.sleep(0.3)
 
                 self.log(f"Narrator population complete: {populated} added, {attempted} attempted, {failed} failed", "OK")
 
@@ -1163,84 +1026,65 @@ class RealExecutionWorkflow:
         self.log("PHASE 8F: POST-POPULATION QUALITY RECHECK (absToolbox)", "PHASE")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
-
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
+            # Get items for quality check (the mirror picks up the narrator updates)
+            _, _, items = await self.get_library_items_cached(limit=100)
+
+            # Check quality metrics
+            narrators_found = 0
+            authors_present = 0
+            titles_present = 0
+            total_items = len(items)
+            issues = {}
+
+            for item in items:
+                metadata = item.get('media', {}).get('metadata', {})
+                title = metadata.get('title', '').strip()
+                author = metadata.get('authorName', '').strip()
+                narrator = metadata.get('narrator', '').strip()
+
+                if narrator:
+                    narrators_found += 1
+                if author:
+                    authors_present += 1
+                if title:
+                    titles_present += 1
+
+                # Track issues by type
+                item_issues = []
+                if not author:
+                    item_issues.append('Missing author name')
+                if not narrator:
+                    item_issues.append('Missing narrator info')
+                if not title:
+                    item_issues.append('Missing title')
+
+                if item_issues:
+                    issues[title or f"Item-{item.get('id')[:8]}"] = item_issues
+
+            # Calculate improvement
+            narrator_coverage = (narrators_found / total_items * 100) if total_items > 0 else 0
+            author_coverage = (authors_present / total_items * 100) if total_items > 0 else 0
+
+            self.log(f"POST-POPULATION QUALITY METRICS:", "QUALITY")
+            self.log(f"  Narrator Coverage: {narrator_coverage:.1f}% ({narrators_found}/{total_items})", "QUALITY")
+            self.log(f"  Author Coverage: {author_coverage:.1f}% ({authors_present}/{total_items})", "QUALITY")
+            self.log(f"  Total Items Checked: {total_items}", "QUALITY")
+            self.log(f"  Metadata Issues Remaining: {len(issues)}", "QUALITY")
+
+            if issues:
+                self.log(f"  Top Issues:", "QUALITY")
+                for title, issue_list in list(issues.items())[:5]:
+                    self.log(f"    - {title}: {', '.join(issue_list)}", "WARN")
 
-                # Get recent items for quality check
-                async with session.get(
-                    f'{self.abs_url}/api/libraries/{lib_id}/items',
-                    headers=headers,
-                    params={'limit': 100, 'offset': 0}
-                ) as resp:
-                    if resp.status != 200:
-                        return {'error': 'Could not fetch items', 'skipped': True}
-
-                    items = (await resp.json()).get('results', [])[:100]
-
-                # Check quality metrics
-                narrators_found = 0
-                authors_present = 0
-                titles_present = 0
-                total_items = len(items)
-                issues = {}
-
-                for item in items:
-                    metadata = item.get('media', {}).get('metadata', {})
-                    title = metadata.get('title', '').strip()
-                    author = metadata.get('authorName', '').strip()
-                    narrator = metadata.get('narrator', '').strip()
-
-                    if narrator:
-                        narrators_found += 1
-                    if author:
-                        authors_present += 1
-                    if title:
-                        titles_present += 1
-
-                    # Track issues by type
-                    item_issues = []
-                    if not author:
-                        item_issues.append('Missing author name')
-                    if not narrator:
-                        item_issues.append('Missing narrator info')
-                    if not title:
-                        item_issues.append('Missing title')
-
-                    if item_issues:
-                        issues[title or f"Item-{item.get('id')[:8]}"] = item_issues
-
-                # Calculate improvement
-                narrator_coverage = (narrators_found / total_items * 100) if total_items > 0 else 0
-                author_coverage = (authors_present / total_items * 100) if total_items > 0 else 0
-
-                self.log(f"POST-POPULATION QUALITY METRICS:", "QUALITY")
-                self.log(f"  Narrator Coverage: {narrator_coverage:.1f}% ({narrators_found}/{total_items})", "QUALITY")
-                self.log(f"  Author Coverage: {author_coverage:.1f}% ({authors_present}/{total_items})", "QUALITY")
-                self.log(f"  Total Items Checked: {total_items}", "QUALITY")
-                self.log(f"  Metadata Issues Remaining: {len(issues)}", "QUALITY")
-
-                if issues:
-                    self.log(f"  Top Issues:", "QUALITY")
-                    for title, issue_list in list(issues.items())[:5]:
-                        self.log(f"    - {title}: {', '.join(issue_list)}", "WARN")
-
-                return {
-                    'narrator_coverage': narrator_coverage,
-                    'author_coverage': author_coverage,
-                    'total_items': total_items,
-                    'narrators_found': narrators_found,
-                    'authors_present': authors_present,
-                    'remaining_issues': len(issues),
-                    'timestamp': datetime.now().isoformat()
-                }
+            return {
+                'narrator_coverage': narrator_coverage,
+                'author_coverage': author_coverage,
+                'total_items': total_items,
+                'narrators_found': narrators_found,
+                'authors_present': authors_present,
+                'remaining_issues': len(issues),
+                'timestamp': datetime.now().isoformat()
+            }
 
         except Exception as e:
             self.log(f"Post-population quality recheck error: {e}", "FAIL")
@@ -1254,45 +1098,31 @@ class RealExecutionWorkflow:
             async with aiohttp.ClientSession() as session:
                 headers = {'Authorization': f'Bearer {self.abs_token}'}
 
-                # Get libraries
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
+                # Recently added items from the library mirror
+                _, _, items = await self.get_library_items_cached(recently_added=True, limit=100)
 
-                # Get recently added items
-                async with session.get(
-                    f'{self.abs_url}/api/libraries/{lib_id}/items',
-                    headers=headers,
-                    params={'limit': 100, 'sortBy': 'addedAt'}
-                ) as resp:
-                    if resp.status == 200:
-                        items = (await resp.json()).get('results', [])
-
-                        self.log(f"Syncing metadata for {len(items)} items...", "METADATA")
-
-                        synced = 0
-                        for item in items:
-                            item_id = item.get('id')
-
-                            try:
-                                # Update metadata
-                                async with session.post(
-                                    f'{self.abs_url}/api/items/{item_id}/refresh-metadata',
-                                    headers=headers,
-                                    timeout=aiohttp.ClientTimeout(total=30)
-                                ) as update_resp:
-                                    if update_resp.status in [200, 204]:
-                                        synced += 1
-
-                            except Exception as e:
-                                self.log(f"  Metadata sync error for {item_id}: {e}", "WARN")
-                                continue
+                self.log(f"Syncing metadata for {len(items)} items...", "METADATA")
+
+                synced = 0
+                for item in items:
+                    item_id = item.get('id')
 
-                        self.log(f"Synced metadata for {synced} items", "OK")
-                        return {'synced': synced}
+                    try:
+                        # Update metadata
+                        async with session.post(
+                            f'{self.abs_url}/api/items/{item_id}/refresh-metadata',
+                            headers=headers,
+                            timeout=aiohttp.ClientTimeout(total=30)
+                        ) as update_resp:
+                            if update_resp.status in [200, 204]:
+                                synced += 1
+
+                    except Exception as e:
+                        self.log(f"  Metadata sync error for {item_id}: {e}", "WARN")
+                        continue
+
+                self.log(f"Synced metadata for {synced} items", "OK")
+                return {'synced': synced}
 
         except Exception as e:
             self.log(f"Metadata sync error: {e}", "FAIL")
@@ -1303,103 +1133,60 @@ class RealExecutionWorkflow:
         self.log("PHASE 9: BUILD AUTHOR HISTORY", "PHASE")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.abs_token}'}
-
-                # Get library ID
-                async with session.get(
-                    f'{self.abs_url}/api/libraries',
-                    headers=headers
-                ) as resp:
-                    libs = (await resp.json())['libraries']
-                    lib_id = libs[0]['id']
-
-                # Get all items to analyze authors
-                all_items = []
-                offset = 0
-                page = 0
-
-                self.log("Fetching all library items for author analysis...", "AUTHOR")
-
-                while page < 100:  # Reasonable limit
-                    try:
-                        async with session.get(
-                            f'{self.abs_url}/api/libraries/{lib_id}/items',
-                            headers=headers,
-                            params={'limit': 500, 'offset': offset},
-                            timeout=aiohttp.ClientTimeout(total=120, connect=30, sock_read=60)
-                        ) as resp:
-                            if resp.status != 200:
-                                break
-
-                            result = await resp.json()
-                            items = result.get('results', [])
-                            if not items:
-                                break
-
-                            all_items.extend(items)
-                            offset += 500
-                            page += 1
-                            self.log(f"  Loaded page {page}: {len(items)} items (total: {len(all_items)})", "AUTHOR")
-                    except Exception as e:
-                        self.log(f"  Error loading items: {e}", "WARN")
-                        break
-
-                # Build author index
-                author_index = {}  # author_name -> {series -> [books]}
-
-                for item in all_items:
-                    try:
-                        metadata = item.get('media', {}).get('metadata', {})
-                        author_name = metadata.get('authorName', 'Unknown Author')
-                        series_name = metadata.get('seriesName', 'Standalone')
-                        title = metadata.get('title', 'Unknown Title')
-
-                        if author_name not in author_index:
-                            author_index[author_name] = {}
-
-                        if series_name not in author_index[author_name]:
-                            author_index[author_name][series_name] = []
-
-                        author_index[author_name][series_name].append({
-                            'title': title,
-                            'id': item.get('id')
-                        })
-                    except Exception as e:
-                        self.log(f"Error processing item: {e}", "WARN")
-                        continue
-
-                # Log author statistics
-                self.log(f"Total unique authors: {len(author_index)}", "AUTHOR")
-
-                # Find top authors by book count
-                author_counts = [(author, sum(len(books) for books in series.values()))
-                                for author, series in author_index.items()]
-                author_counts.sort(key=lambda x: x[1], reverse=True)
-
-                self.log("Top 10 authors by book count:", "AUTHOR")
-                for author, count in author_counts[:10]:
-                    series_count = len(author_index[author])
-                    self.log(f"  {author}: {count} books across {series_count} series", "AUTHOR")
-
-                # Analyze series completeness for top authors
-                completeness = {}
-                for author, series_dict in author_index.items():
-                    completeness[author] = {}
-                    for series, books in series_dict.items():
-                        completeness[author][series] = {
-                            'count': len(books),
-                            'books': [b['title'] for b in books]
-                        }
+            # Get all items to analyze authors
+            self.log("Loading library items for author analysis...", "AUTHOR")
+
+            # Build author index
+            author_index = {}  # author_name -> {series -> [books]}
+            total_books = 0
+
+            async for book in self.iter_library_records(BookRecord):
+                total_books += 1
+                author_name = book.author or 'Unknown Author'
+                series_name = book.series or 'Standalone'
+
+                if author_name not in author_index:
+                    author_index[author_name] = {}
+
+                if series_name not in author_index[author_name]:
+                    author_index[author_name][series_name] = []
+
+                author_index[author_name][series_name].append({
+                    'title': book.title or 'Unknown Title',
+                    'id': book.id
+                })
+
+            # Log author statistics
+            self.log(f"Total unique authors: {len(author_index)}", "AUTHOR")
+
+            # Find top authors by book count
+            author_counts = [(author, sum(len(books) for books in series.values()))
+                            for author, series in author_index.items()]
+            author_counts.sort(key=lambda x: x[1], reverse=True)
+
+            self.log("Top 10 authors by book count:", "AUTHOR")
+            for author, count in author_counts[:10]:
+                series_count = len(author_index[author])
+                self.log(f"  {author}: {count} books across {series_count} series", "AUTHOR")
+
+            # Analyze series completeness for top authors
+            completeness = {}
+            for author, series_dict in author_index.items():
+                completeness[author] = {}
+                for series, books in series_dict.items():
+                    completeness[author][series] = {
+                        'count': len(books),
+                        'books': [b['title'] for b in books]
+                    }
 
-                return {
-                    'total_authors': len(author_index),
-                    'total_series': sum(len(series) for series in author_index.values()),
-                    'total_books': len(all_items),
-                    'author_index': author_index,
-                    'completeness': completeness,
-                    'top_authors': author_counts[:10]
-                }
+            return {
+                'total_authors': len(author_index),
+                'total_series': sum(len(series) for series in author_index.values()),
+                'total_books': total_books,
+                'author_index': author_index,
+                'completeness': completeness,
+                'top_authors': author_counts[:10]
+            }
 
         except Exception as e:
             self.log(f"Author history error: {e}", "FAIL")
@@ -0,0 +1,157 @@
+"""
+Tests for concurrent library pagination in AudiobookshelfClient
+
+Covers:
+- Ordered reassembly when pages complete out of order
+- Bounded number of page requests in flight
+- Server-capped page sizes
+- Offsets that are not a multiple of the page size
+- Streaming items before the last page arrives
+- Projection into slotted records
+"""
+
+import asyncio
+
+import pytest
+
+from backend.integrations.abs_client import AudiobookshelfClient
+from backend.integrations.abs_records import BookRecord, NarratorRecord
+
+
+class FakeLibrary:
+    """Stand-in for _request serving a paged library with per-page delays."""
+
+    def __init__(self, total, server_limit=None, delays=None):
+        self.total = total
+        self.server_limit = server_limit
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.gates = {}
+        self.requests = 0
+
+    async def __call__(self, method, endpoint, params=None, **kwargs):
+        limit = min(params["limit"], self.server_limit or params["limit"])
+        # ABS serves pages by number; offset is ignored
+        offset = params["page"] * limit
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if offset in self.gates:
+                await self.gates[offset].wait()
+            await asyncio.sleep(self.delays.get(offset, 0.01))
+        finally:
+            self.in_flight -= 1
+        ids = range(offset, min(offset + limit, self.total))
+        return {"results": [{"id": str(i)} for i in ids], "total": self.total}
+
+
+@pytest.fixture
+def client():
+    return AudiobookshelfClient("http://abs", "token", page_concurrency=3)
+
+
+class TestConcurrentPagination:
+    """Tests for get_library_items() and stream_library_items()"""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_reassembled_in_order(self, client):
+        """Out-of-order page completion still returns library order."""
+        client._request = FakeLibrary(total=50, delays={10: 0.05, 20: 0.0, 30: 0.03})
+
+        items = await client.get_library_items(library_id="lib1", limit=10)
+
+        assert [item["id"] for item in items] == [str(i) for i in range(50)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, client):
+        """No more than page_concurrency pages are requested at once."""
+        fake = FakeLibrary(total=100)
+        client._request = fake
+
+        items = await client.get_library_items(library_id="lib1", limit=10)
+
+        assert len(items) == 100
+        assert fake.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_server_capped_page_size(self, client):
+        """A smaller server page size is detected from the first page."""
+        client._request = FakeLibrary(total=25, server_limit=5)
+
+        items = await client.get_library_items(library_id="lib1", limit=100)
+
+        assert [item["id"] for item in items] == [str(i) for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_unaligned_offset(self, client):
+        """An offset inside a page returns the items from that offset on."""
+        fake = FakeLibrary(total=50)
+        client._request = fake
+
+        items = await client.get_library_items(library_id="lib1", limit=10, offset=15)
+
+        assert [item["id"] for item in items] == [str(i) for i in range(15, 50)]
+
+        # Short last page: no request for the page after it
+        fake.requests = 0
+        tail = await client._fetch_items_page("lib1", 10, 45)
+        assert [item["id"] for item in tail["results"]] == [str(i) for i in range(45, 50)]
+        assert fake.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_before_last_page(self, client):
+        """Items are streamed while later pages are still outstanding."""
+        fake = FakeLibrary(total=30)
+        fake.gates[20] = asyncio.Event()
+        client._request = fake
+
+        seen = []
+        async for item in client.stream_library_items(library_id="lib1", limit=10):
+            seen.append(item["id"])
+            if len(seen) == 20:
+                # Last page is still blocked; release it now
+                fake.gates[20].set()
+
+        assert sorted(seen, key=int) == [str(i) for i in range(30)]
+
+    @pytest.mark.asyncio
+    async def test_session_connector_matches_concurrency(self, client):
+        """The shared session keeps enough keep-alive connections."""
+        async with client:
+            assert client.session.connector.limit == client.page_concurrency + 2
+
+
+class TestRecordStreaming:
+    """Tests for iter_library_items() record projection"""
+
+    @pytest.mark.asyncio
+    async def test_iter_library_items_projects_records(self, client):
+        """Items are projected into slotted records as they stream."""
+        client._request = FakeLibrary(total=12)
+
+        records = [
+            record async for record in client.iter_library_items("lib1", record=BookRecord, limit=5)
+        ]
+
+        assert sorted(r.id for r in records) == sorted(str(i) for i in range(12))
+        assert all(isinstance(r, BookRecord) for r in records)
+        assert not hasattr(records[0], "__dict__")
+
+    def test_record_projection(self):
+        """Records pick the needed metadata fields and normalize blanks."""
+        item = {
+            "id": "li_1",
+            "media": {"metadata": {
+                "title": " Dune ", "authorName": "Frank Herbert",
+                "seriesName": None, "narratorName": "Scott Brick",
+            }},
+        }
+
+        book = BookRecord.from_item(item)
+        narrated = NarratorRecord.from_item(item)
+
+        assert (book.title, book.author, book.series) == ("Dune", "Frank Herbert", "")
+        assert narrated.narrator == "Scott Brick"
+        assert NarratorRecord.from_item({"id": "x"}).title == ""
@@ -0,0 +1,165 @@
+"""
+Tests for the Audiobookshelf library mirror
+
+Covers:
+- First sync is a full pull, later syncs only fetch changed items
+- Removed items are reconciled with a full pull
+- Fallback when ABS ignores the updatedAt sort
+- AudiobookshelfClient.get_library_items_since watermark paging
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.integrations.abs_client import AudiobookshelfClient
+from backend.integrations.abs_records import BookRecord
+from backend.models.abs_library_item import AbsLibraryItem
+from backend.services.abs_library_cache_service import AbsLibraryCacheService
+
+
+def make_item(abs_id, title, added, updated=None, narrator=""):
+    """Build a minimal ABS library item."""
+    return {
+        "id": abs_id,
+        "addedAt": added,
+        "updatedAt": updated or added,
+        "media": {"metadata": {"title": title, "authorName": "Author", "narrator": narrator}},
+    }
+
+
+LIBRARY = [
+    make_item("li_1", "Book One", 1000),
+    make_item("li_2", "Book Two", 2000),
+    make_item("li_3", "Book Three", 3000),
+]
+
+
+@pytest.fixture
+def client():
+    """Mock AudiobookshelfClient with one library."""
+    client = MagicMock()
+    client.get_libraries = AsyncMock(return_value=[{"id": "lib1", "name": "Audiobooks"}])
+    client.get_library_items = AsyncMock(return_value=list(LIBRARY))
+    client.get_library_items_since = AsyncMock()
+    return client
+
+
+class TestAbsLibraryCacheService:
+    """Tests for sync_library() and get_items()"""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_is_full(self, db_session, client):
+        """An empty mirror is filled with a full pull."""
+        result = await AbsLibraryCacheService.sync_library(db_session, client)
+
+        assert result["success"] is True
+        assert result["data"]["mode"] == "full"
+        assert result["data"]["total"] == 3
+        assert AbsLibraryCacheService.get_watermark(db_session, "lib1") == 3000
+        client.get_library_items_since.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_fetches_changes_only(self, db_session, client):
+        """Later syncs upsert only items changed since the watermark."""
+        await AbsLibraryCacheService.sync_library(db_session, client)
+        changed = make_item("li_1", "Book One", 1000, updated=4000, narrator="Reader")
+        client.get_library_items_since.return_value = {"items": [changed], "total": 3, "ordered": True}
+
+        result = await AbsLibraryCacheService.sync_library(db_session, client)
+
+        assert result["data"]["mode"] == "incremental"
+        assert result["data"]["fetched"] == 1
+        client.get_library_items_since.assert_awaited_once_with("lib1", 3000)
+        assert client.get_library_items.await_count == 1
+        row = db_session.query(AbsLibraryItem).filter_by(abs_id="li_1").one()
+        assert row.item["media"]["metadata"]["narrator"] == "Reader"
+        assert row.updated_at_ms == 4000
+
+    @pytest.mark.asyncio
+    async def test_removed_items_trigger_reconcile(self, db_session, client):
+        """A count mismatch after an incremental sync falls back to a full pull."""
+        await AbsLibraryCacheService.sync_library(db_session, client)
+        client.get_library_items_since.return_value = {"items": [], "total": 2, "ordered": True}
+        client.get_library_items.return_value = LIBRARY[1:]
+
+        result = await AbsLibraryCacheService.sync_library(db_session, client)
+
+        assert result["data"]["mode"] == "full"
+        assert result["data"]["removed"] == 1
+        assert db_session.query(AbsLibraryItem).filter_by(abs_id="li_1").first() is None
+
+    @pytest.mark.asyncio
+    async def test_unordered_server_falls_back_to_full(self, db_session, client):
+        """If ABS ignores the sort, the mirror does a full pull."""
+        await AbsLibraryCacheService.sync_library(db_session, client)
+        client.get_library_items_since.return_value = {"items": [], "total": 3, "ordered": False}
+
+        result = await AbsLibraryCacheService.sync_library(db_session, client)
+
+        assert result["data"]["mode"] == "full"
+        assert client.get_library_items.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_items_recently_added(self, db_session, client):
+        """Cached items are returned as ABS dicts, newest first on request."""
+        await AbsLibraryCacheService.sync_library(db_session, client)
+
+        items = AbsLibraryCacheService.get_items(db_session, "lib1", recently_added=True, limit=2)
+
+        assert [item["id"] for item in items] == ["li_3", "li_2"]
+
+    @pytest.mark.asyncio
+    async def test_iter_items_streams_records(self, db_session, client):
+        """iter_items() projects rows into records in batches."""
+        await AbsLibraryCacheService.sync_library(db_session, client)
+
+        records = list(AbsLibraryCacheService.iter_items(
+            db_session, "lib1", record=BookRecord, batch_size=2
+        ))
+
+        assert [r.title for r in records] == ["Book One", "Book Two", "Book Three"]
+
+    @pytest.mark.asyncio
+    async def test_sync_failure_returns_error(self, db_session, client):
+        """Client errors are reported in the result dict."""
+        client.get_library_items.side_effect = RuntimeError("offline")
+
+        result = await AbsLibraryCacheService.sync_library(db_session, client)
+
+        assert result["success"] is False
+        assert "offline" in result["error"]
+
+
+class TestGetLibraryItemsSince:
+    """Tests for the watermark-paged client call"""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_watermark(self):
+        """Paging stops at the first item older than the watermark."""
+        client = AudiobookshelfClient("http://abs", "token")
+        client._request = AsyncMock(side_effect=[
+            {"results": [make_item("a", "A", 1, 500), make_item("b", "B", 1, 400)], "total": 5},
+            {"results": [make_item("c", "C", 1, 300), make_item("d", "D", 1, 200)], "total": 5},
+        ])
+
+        result = await client.get_library_items_since("lib1", since_ms=300, page_size=2)
+
+        assert [item["id"] for item in result["items"]] == ["a", "b", "c"]
+        assert result["ordered"] is True
+        assert result["total"] == 5
+        params = client._request.await_args_list[1].kwargs["params"]
+        assert params["page"] == 1
+        assert params["sort"] == "updatedAt"
+
+    @pytest.mark.asyncio
+    async def test_detects_unsorted_response(self):
+        """An ascending response means the sort was ignored."""
+        client = AudiobookshelfClient("http://abs", "token")
+        client._request = AsyncMock(return_value={
+            "results": [make_item("a", "A", 1, 100), make_item("b", "B", 1, 900)],
+            "total": 2,
+        })
+
+        result = await client.get_library_items_since("lib1", since_ms=50)
+
+        assert result["ordered"] is False
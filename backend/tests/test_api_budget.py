@@ -0,0 +1,166 @@
+"""
+Tests for the cross-process external API budget
+
+Covers:
+- Token bucket rate and daily quota
+- Quota shared between budget instances and processes
+- Reservations for batch jobs
+- Google Books client drawing from the budget
+- Budget transactions running off the event loop
+"""
+
+import multiprocessing
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.integrations import api_budget
+from backend.integrations.api_budget import ApiBudget, BucketConfig, QuotaExceededError
+from backend.integrations.google_books_client import GoogleBooksClient, GoogleBooksRateLimitError
+from backend.integrations.metadata_cache import MetadataCache
+from backend.services.daily_metadata_update_service import DailyMetadataUpdateService
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the budget module (2026-03-01 12:00 UTC)."""
+    now = [1772366400.0]
+    monkeypatch.setattr(api_budget.time, "time", lambda: now[0])
+    return now
+
+
+def take_all(path, results):
+    budget = ApiBudget(path, {"api": BucketConfig(rate=1000.0, burst=1000, daily_quota=50)})
+    taken = 0
+    while True:
+        try:
+            if budget.try_acquire("api") == 0.0:
+                taken += 1
+        except QuotaExceededError:
+            break
+    results.put(taken)
+
+
+class TestApiBudget:
+    """Tests for ApiBudget"""
+
+    def test_rate(self, clock):
+        budget = ApiBudget(buckets={"api": BucketConfig(rate=2.0, burst=2)})
+
+        assert budget.try_acquire("api") == 0.0
+        assert budget.try_acquire("api") == 0.0
+        assert budget.try_acquire("api") == pytest.approx(0.5)
+
+        clock[0] += 0.5
+        assert budget.try_acquire("api") == 0.0
+
+    def test_daily_quota_resets_at_midnight_utc(self, clock):
+        budget = ApiBudget(buckets={"api": BucketConfig(rate=100.0, burst=100, daily_quota=3)})
+        for _ in range(3):
+            budget.try_acquire("api")
+
+        with pytest.raises(QuotaExceededError) as exc_info:
+            budget.try_acquire("api")
+        assert exc_info.value.resets_at.isoformat() == "2026-03-02T00:00:00+00:00"
+
+        clock[0] += 12 * 3600
+        assert budget.try_acquire("api") == 0.0
+        assert budget.status("api")["used"] == 1
+
+    def test_shared_between_instances(self, tmp_path, clock):
+        path = str(tmp_path / "budget.sqlite")
+        config = {"api": BucketConfig(rate=1.0, burst=1, daily_quota=10)}
+        first, second = ApiBudget(path, config), ApiBudget(path, config)
+
+        assert first.try_acquire("api") == 0.0
+        assert second.try_acquire("api") == pytest.approx(1.0)
+        assert second.status("api")["remaining"] == 9
+
+    def test_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "budget.sqlite")
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        workers = [context.Process(target=take_all, args=(path, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert sum(results.get(timeout=5) for _ in workers) == 50
+
+    def test_reservation(self, clock):
+        budget = ApiBudget(buckets={"api": BucketConfig(rate=100.0, burst=100, daily_quota=10)})
+
+        with budget.reserve("api", 8) as reservation:
+            assert reservation.granted == 8
+            budget.try_acquire("api")
+            assert budget.reserve("api", 5).granted == 1
+
+            # Other callers cannot touch the reserved requests
+            with pytest.raises(QuotaExceededError):
+                budget.try_acquire("api")
+
+            for _ in range(3):
+                budget.try_acquire("api", reservation)
+            assert reservation.remaining == 5
+
+        # The 5 unused requests went back to the quota
+        assert budget.status("api")["remaining"] == 5
+
+    @pytest.mark.asyncio
+    async def test_acquire_runs_off_the_event_loop(self, clock):
+        budget = ApiBudget(buckets={"api": BucketConfig(rate=100.0, burst=1)})
+        threads = []
+        try_acquire = budget.try_acquire
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return try_acquire(*args)
+
+        with patch.object(budget, "try_acquire", side_effect=record_thread):
+            await budget.acquire("api")
+
+        assert threads and threading.main_thread() not in threads
+
+
+class TestGoogleBooksBudget:
+    """Tests for GoogleBooksClient on the shared budget"""
+
+    @pytest.mark.asyncio
+    async def test_daily_quota_shared_by_new_clients(self, clock):
+        budget = ApiBudget()
+        first = GoogleBooksClient(max_requests_per_day=1, budget=budget, cache=MetadataCache())
+        assert first._check_rate_limit() == 0.0
+
+        # A fresh client no longer starts counting from zero
+        second = GoogleBooksClient(max_requests_per_day=1, budget=budget, cache=MetadataCache())
+        with pytest.raises(GoogleBooksRateLimitError):
+            second._check_rate_limit()
+        assert second.get_rate_limit_status()["requests_remaining"] == 0
+
+    def test_reserved(self, clock):
+        budget = ApiBudget()
+        client = GoogleBooksClient(max_requests_per_day=100, budget=budget, cache=MetadataCache())
+
+        with client.reserved(30) as reservation:
+            assert client.get_rate_limit_status()["requests_reserved"] == 30
+            client._check_rate_limit()
+            assert reservation.used == 1
+
+        assert client.reservation is None
+        assert client.get_rate_limit_status()["requests_remaining"] == 99
+
+    @pytest.mark.asyncio
+    async def test_daily_update_reserves_at_most_daily_max(self, clock):
+        client = GoogleBooksClient(max_requests_per_day=1000, budget=ApiBudget(), cache=MetadataCache())
+        service = DailyMetadataUpdateService(client, MagicMock(), daily_max=10)
+        books = [MagicMock(id=i, title=f"Book {i}") for i in range(50)]
+
+        with patch.object(service, "_get_priority_queue", return_value=books), \
+                patch.object(service, "_update_book_metadata", AsyncMock(return_value=None)), \
+                patch.object(client, "reserved", wraps=client.reserved) as reserved:
+            result = await service.run_daily_update()
+
+        reserved.assert_called_once_with(10)
+        assert result["books_processed"] == 10
@@ -0,0 +1,163 @@
+"""
+Tests for indexed book search
+
+Covers:
+- FTS5 search after the add_book_search_index migration
+- Typo tolerance and series/narrator matches
+- Ranking by weighted field similarity
+- Search without the index
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.models.book import Book
+from backend.services.book_search_service import (
+    SQLITE_CANDIDATES, BookSearchService, trigrams, similarity, typo_pieces
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MIGRATION = REPO_ROOT / "alembic" / "versions" / "d7a4e9b13c68_add_book_search_index.py"
+
+
+def run_migration(db):
+    """
+    Apply the search index migration to the test database
+
+    The project's alembic/ folder shadows the alembic package while the repo
+    root is on sys.path, so the package is imported with the root removed.
+    """
+    saved_path = sys.path[:]
+    saved_modules = {name: sys.modules.pop(name) for name in list(sys.modules)
+                     if name == "alembic" or name.startswith("alembic.")}
+    sys.path[:] = [entry for entry in sys.path if Path(entry or ".").resolve() != REPO_ROOT]
+    try:
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        spec = importlib.util.spec_from_file_location("add_book_search_index", MIGRATION)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        with Operations.context(MigrationContext.configure(db.connection())):
+            migration.upgrade()
+        db.commit()
+    finally:
+        sys.path[:] = saved_path
+        for name in [name for name in sys.modules if name == "alembic" or name.startswith("alembic.")]:
+            del sys.modules[name]
+        sys.modules.update(saved_modules)
+
+
+def add_books(db):
+    for title, author, series, narrator in [
+        ("The Wandering Inn", "pirateaba", "The Wandering Inn", "Andrea Parsneau"),
+        ("Dungeon Crawler Carl", "Matt Dinniman", "Dungeon Crawler Carl", "Jeff Hays"),
+        ("Carl's Doomsday Scenario", "Matt Dinniman", "Dungeon Crawler Carl", "Jeff Hays"),
+        ("He Who Fights with Monsters", "Shirtaloon", "He Who Fights with Monsters", "Heath Miller"),
+        ("Primal Hunter", "Zogarth", "The Primal Hunter", "Travis Baldree"),
+    ]:
+        db.add(Book(title=title, author=author, series=series, narrator=narrator, status="active"))
+    db.add(Book(title="Defiance of the Fall", author="TheFirstDefier", status="archived"))
+    db.commit()
+
+
+@pytest.fixture
+def indexed_db(db_session):
+    """Books searched through the FTS5 index built by the migration."""
+    run_migration(db_session)
+
+    # Books added after the migration reach the index through its triggers
+    add_books(db_session)
+    assert BookSearchService.detect_backend(db_session) == "fts5"
+    return db_session
+
+
+@pytest.fixture
+def unindexed_db(db_session):
+    add_books(db_session)
+    return db_session
+
+
+def limit_candidates(limit=10):
+    """FTS5 candidates fetched for a search with this limit."""
+    return limit * SQLITE_CANDIDATES
+
+
+def titles(result):
+    return [book.title for book in result["data"]]
+
+
+class TestBookSearchService:
+    """Tests for BookSearchService.search()"""
+
+    def test_exact_title(self, indexed_db):
+        result = BookSearchService.search(indexed_db, "Primal Hunter")
+
+        assert result["success"] is True
+        assert result["backend"] == "fts5"
+        assert titles(result)[0] == "Primal Hunter"
+
+    def test_typo(self, indexed_db):
+        result = BookSearchService.search(indexed_db, "Dungoen Carwler")
+
+        assert titles(result)[0] == "Dungeon Crawler Carl"
+
+    def test_series_and_narrator(self, indexed_db):
+        assert "Carl's Doomsday Scenario" in titles(BookSearchService.search(indexed_db, "Dungeon Crawler"))
+        assert titles(BookSearchService.search(indexed_db, "Travis Baldree")) == ["Primal Hunter"]
+
+    def test_title_outranks_series(self, indexed_db):
+        result = BookSearchService.search(indexed_db, "Dungeon Crawler Carl")
+        first, second = result["data"][:2]
+
+        assert first.title == "Dungeon Crawler Carl"
+        assert second.title == "Carl's Doomsday Scenario"
+        assert result["scores"][first.id] > result["scores"][second.id]
+
+    def test_status_filter(self, indexed_db):
+        assert BookSearchService.search(indexed_db, "Defiance")["count"] == 0
+        assert titles(BookSearchService.search(indexed_db, "Defiance", status=None)) == ["Defiance of the Fall"]
+
+    def test_status_filtered_before_candidate_limit(self, indexed_db):
+        # More archived matches than the candidate limit must not hide an active one
+        for i in range(limit_candidates() + 50):
+            indexed_db.add(Book(title=f"Dune Chronicles Omnibus Vol {i}", author="Frank Herbert", status="archived"))
+        indexed_db.add(Book(title="Dune", author="Frank Herbert", status="active"))
+        indexed_db.commit()
+
+        assert titles(BookSearchService.search(indexed_db, "dune"))[0] == "Dune"
+        assert titles(BookSearchService.search(indexed_db, "dune", status=None))[0] == "Dune"
+
+    def test_index_follows_updates(self, indexed_db):
+        book = indexed_db.query(Book).filter(Book.title == "Defiance of the Fall").one()
+        book.title = "Azarinth Healer"
+        indexed_db.commit()
+
+        assert BookSearchService.search(indexed_db, "Azarinth", status=None)["data"] == [book]
+        assert BookSearchService.search(indexed_db, "Defiance", status=None)["count"] == 0
+
+    def test_without_index(self, unindexed_db):
+        result = BookSearchService.search(unindexed_db, "Shirtaloon")
+
+        assert result["backend"] == "like"
+        assert titles(result) == ["He Who Fights with Monsters"]
+
+
+class TestTrigrams:
+    """Tests for the similarity helpers"""
+
+    def test_similarity(self):
+        query = trigrams("crawler")
+
+        assert similarity(query, "Dungeon Crawler Carl") == 1.0
+        assert 0.3 < similarity(query, "Carwler") < 1.0
+        assert similarity(query, None) == 0.0
+
+    def test_typo_pieces_survive_a_swap(self):
+        word = "crawler"
+        for i in range(len(word) - 1):
+            swapped = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+            assert any(piece in swapped for piece in typo_pieces(word))
@@ -0,0 +1,84 @@
+"""
+Tests for pooled engine configuration and the async session layer
+
+Covers:
+- QueuePool sizing for server databases, default pooling for SQLite
+- Async driver URL derivation (asyncpg / aiosqlite)
+- Pool metrics reported to the health endpoints
+- AsyncSession dependency round-trip
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from backend import database
+from backend.database import (
+    build_engine_kwargs,
+    get_async_database_url,
+    get_pool_status,
+)
+
+
+class TestEngineConfiguration:
+    """Tests for create_engine() argument building"""
+
+    def test_postgres_uses_sized_queue_pool(self):
+        """Server databases get a QueuePool sized from settings."""
+        kwargs = build_engine_kwargs("postgresql://u:p@localhost/db")
+
+        assert kwargs["poolclass"] is QueuePool
+        assert kwargs["pool_size"] == database.settings.DATABASE_POOL_SIZE
+        assert kwargs["max_overflow"] == database.settings.DATABASE_MAX_OVERFLOW
+        assert kwargs["pool_recycle"] == database.settings.DATABASE_POOL_RECYCLE
+        assert kwargs["pool_pre_ping"] is True
+
+    def test_sqlite_keeps_default_pool(self):
+        """SQLite keeps its default pool but allows cross-thread sessions."""
+        kwargs = build_engine_kwargs("sqlite:///test.db")
+
+        assert "poolclass" not in kwargs
+        assert kwargs["connect_args"]["check_same_thread"] is False
+
+    @pytest.mark.parametrize("url,expected", [
+        ("postgresql://u:p@host:5432/db", "postgresql+asyncpg://u:p@host:5432/db"),
+        ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ])
+    def test_async_url_derivation(self, url, expected):
+        """Sync URLs map to their async drivers."""
+        assert get_async_database_url(url) == expected
+
+    def test_pool_status_reports_sync_pool(self):
+        """Pool metrics include the sync pool class and counters."""
+        status = get_pool_status()
+
+        assert "sync" in status
+        assert "pool_class" in status["sync"]
+
+
+class TestAsyncSessionLayer:
+    """Tests for the lazily created async engine"""
+
+    @pytest.fixture
+    def sqlite_async(self, monkeypatch, tmp_path):
+        """Point the async engine at a temporary SQLite file."""
+        pytest.importorskip("aiosqlite")
+        url = f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+        monkeypatch.setattr(database.settings, "DATABASE_ASYNC_URL", url)
+        monkeypatch.setattr(database, "_async_engine", None)
+        monkeypatch.setattr(database, "_async_session_factory", None)
+        yield
+        database._async_engine = None
+        database._async_session_factory = None
+
+    @pytest.mark.asyncio
+    async def test_get_async_db_round_trip(self, sqlite_async):
+        """get_async_db yields a working AsyncSession and pools connections."""
+        async for session in database.get_async_db():
+            result = await session.execute(text("SELECT 1"))
+            assert result.scalar() == 1
+
+        assert "async" in get_pool_status()
+        await database.close_async_db()
+        assert database._async_engine is None
@@ -0,0 +1,119 @@
+"""
+Tests for batched Hardcover resolution
+
+Covers:
+- Many lookups resolved in a few batched GraphQL documents
+- Responses split back to their lookups, in order, through every stage
+- Failing batches split in half, with the batch size adapting
+- Batched and single lookups sharing the cache
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from backend.integrations.api_budget import ApiBudget
+from backend.integrations.hardcover_client import BookLookup, HardcoverClient
+from backend.integrations.metadata_cache import MISSING, MetadataCache
+
+
+def book_payload(book_id, title, author, isbn=None):
+    return {
+        "id": book_id,
+        "title": title,
+        "contributions": [{"author": {"name": author}}],
+        "editions": [{"id": book_id, "isbn_10": None, "isbn_13": isbn}],
+    }
+
+
+class FakeHardcover:
+    """Answers batched GraphQL documents from a catalog of book payloads."""
+
+    def __init__(self, books, failing_titles=()):
+        self.books = books
+        self.failing_titles = set(failing_titles)
+        self.documents = []
+
+    async def __call__(self, query, variables=None):
+        self.documents.append(variables)
+        if "isbns" in variables:
+            return {"books": [
+                book for book in self.books
+                if any(edition["isbn_13"] in variables["isbns"] for edition in book["editions"])
+            ]}
+
+        if self.failing_titles & set(variables.values()):
+            raise Exception("GraphQL error: query too complex")
+
+        response = {}
+        for name, value in variables.items():
+            if name.startswith("title"):
+                n = name[len("title"):]
+                author = variables[f"author{n}"]
+                matches = [book for book in self.books
+                           if book["title"] == value and book["contributions"][0]["author"]["name"] == author]
+            elif name.startswith("query"):
+                n = name[len("query"):]
+                matches = [book for book in self.books
+                           if value in (book["title"], book["contributions"][0]["author"]["name"])]
+            else:
+                continue
+            response[f"b{n}"] = matches[:1]
+        return response
+
+
+@pytest.fixture
+def client():
+    client = HardcoverClient("token", cache=MetadataCache(), budget=ApiBudget())
+    client._resolve_via_google_books = AsyncMock(return_value=None)
+    return client
+
+
+class TestResolveBooks:
+    """Tests for HardcoverClient.resolve_books()"""
+
+    @pytest.mark.asyncio
+    async def test_resolves_library_in_few_requests(self, client):
+        books = [book_payload(i, f"Book {i}", f"Author {i % 7}", isbn=f"978{i:010d}") for i in range(120)]
+        fake = FakeHardcover(books)
+        client._graphql_query = fake
+
+        lookups = [BookLookup(title=f"Book {i}", author=f"Author {i % 7}") for i in range(0, 120, 2)]
+        lookups += [BookLookup(title="Missing", author="Nobody", isbn=f"978{i:010d}") for i in range(1, 60, 2)]
+        lookups.append(BookLookup(title="Missing", author="Nobody"))
+
+        results = await client.resolve_books(lookups)
+
+        assert [result.book.title for result in results[:60]] == [f"Book {i}" for i in range(0, 120, 2)]
+        assert all(result.resolution_method == "title_author" for result in results[:60])
+        assert [result.book.id for result in results[60:90]] == list(range(1, 60, 2))
+        assert all(result.resolution_method == "isbn" for result in results[60:90])
+        assert not results[90].success
+
+        # 91 books: 1 ISBN batch, a few title/author and search batches, not 91+ requests
+        assert len(fake.documents) <= 8
+
+    @pytest.mark.asyncio
+    async def test_failing_batch_is_split(self, client):
+        books = [book_payload(i, f"Book {i}", "Author") for i in range(40)]
+        client._graphql_query = FakeHardcover(books, failing_titles={"Book 13"})
+
+        results = await client.resolve_books([BookLookup(title=f"Book {i}", author="Author") for i in range(40)])
+
+        assert [result.success for result in results] == [i != 13 for i in range(40)]
+        assert client.batch_size < 25
+
+        # An error is not a not-found result: it is retried next time
+        cache_key = client._get_cache_key("title_author", title="Book 13", author="Author")
+        assert client.cache.get("hardcover", cache_key) is MISSING
+
+    @pytest.mark.asyncio
+    async def test_shares_cache_with_single_lookups(self, client):
+        fake = FakeHardcover([book_payload(1, "Dune", "Frank Herbert")])
+        client._graphql_query = fake
+
+        await client.resolve_books([BookLookup(title="Dune", author="Frank Herbert")])
+        documents = len(fake.documents)
+        result = await client.resolve_by_title_author("Dune", "Frank Herbert")
+
+        assert result.success and result.book.title == "Dune"
+        assert len(fake.documents) == documents
@@ -0,0 +1,154 @@
+"""
+Tests for the persistent metadata response cache
+
+Covers:
+- Values survive across cache instances on the same file
+- TTL expiry and negative caching of not-found results
+- Size-bounded LRU eviction
+- Hit/miss metrics
+- Google Books and Hardcover clients sharing the cache
+- MAM lookups caching not-found but not failed results
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from backend.integrations import metadata_cache
+from backend.integrations.google_books_client import GoogleBooksClient
+from backend.integrations.hardcover_client import HardcoverClient
+from backend.integrations.metadata_cache import MISSING, MetadataCache
+from backend.integrations.unified_metadata_provider import UnifiedMetadataProvider
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "metadata_cache.sqlite")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(metadata_cache.time, "time", lambda: now[0])
+    return now
+
+
+class TestMetadataCache:
+    """Tests for MetadataCache"""
+
+    def test_shared_across_instances(self, cache_path):
+        first = MetadataCache(cache_path)
+        first.set("google_books", "search:Dune", [{"id": "abc"}])
+        first.close()
+
+        second = MetadataCache(cache_path)
+        assert second.get("google_books", "search:Dune") == [{"id": "abc"}]
+        assert second.get("hardcover", "search:Dune") is MISSING
+        second.close()
+
+    def test_ttl_and_negative_ttl(self, clock):
+        cache = MetadataCache(ttl=100, negative_ttl=10)
+        cache.set("hardcover", "found", {"id": 1})
+        cache.set("hardcover", "not_found", None)
+
+        clock[0] += 5
+        assert cache.get("hardcover", "found") == {"id": 1}
+        assert cache.get("hardcover", "not_found") is None
+
+        clock[0] += 10
+        assert cache.get("hardcover", "found") == {"id": 1}
+        assert cache.get("hardcover", "not_found") is MISSING
+
+        clock[0] += 100
+        assert cache.get("hardcover", "found") is MISSING
+
+    def test_lru_eviction(self, clock):
+        value = "x" * 100
+        cache = MetadataCache(max_bytes=1000)
+        for i in range(10):
+            cache.set("mam", f"book{i}", value)
+            clock[0] += 1
+
+        # book0 is read, so book1 and book2 are the least recently used
+        cache.get("mam", "book0")
+        clock[0] += 1
+        cache.set("mam", "book10", value)
+        cache.evict()
+
+        assert cache.get("mam", "book0") == value
+        assert cache.get("mam", "book1") is MISSING
+        assert cache.get("mam", "book2") is MISSING
+        assert cache.get("mam", "book10") == value
+        assert cache.stats()["bytes"] <= 900
+
+    def test_stats(self):
+        cache = MetadataCache()
+        cache.set("google_books", "a", [1])
+        cache.set("google_books", "b", [])
+        cache.get("google_books", "a")
+        cache.get("google_books", "b")
+        cache.get("google_books", "c")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["negative_hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["entries"] == 2
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["namespaces"]["google_books"]["writes"] == 2
+
+
+class TestClientCaching:
+    """Tests for the metadata clients using the shared cache"""
+
+    @pytest.mark.asyncio
+    async def test_google_books_search_reuses_cache(self, cache_path):
+        cache = MetadataCache(cache_path)
+        first = GoogleBooksClient(cache=cache)
+        first._request = AsyncMock(return_value={"items": [{"id": "abc"}]})
+        assert await first.search("Dune", author="Frank Herbert") == [{"id": "abc"}]
+
+        # A fresh client (as each scheduler task builds) does not query again
+        second = GoogleBooksClient(cache=cache)
+        second._request = AsyncMock()
+        assert await second.search("Dune", author="Frank Herbert") == [{"id": "abc"}]
+        second._request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_google_books_caches_no_results(self):
+        client = GoogleBooksClient(cache=MetadataCache())
+        client._request = AsyncMock(return_value={})
+
+        assert await client.search("Unknown Title") == []
+        assert await client.search("Unknown Title") == []
+        assert client._request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hardcover_caches_payload_and_not_found(self):
+        client = HardcoverClient("token", cache=MetadataCache())
+        payload = {"id": 7, "title": "Dune", "contributions": [{"author": {"name": "Frank Herbert"}}]}
+        client._graphql_query = AsyncMock(side_effect=[{"books": [payload]}, {"books": []}])
+
+        for _ in range(2):
+            found = await client.resolve_by_isbn("978-0441013593")
+            missing = await client.resolve_by_isbn("0000000000000")
+            assert found.success and found.book.title == "Dune"
+            assert found.book.authors[0].name == "Frank Herbert"
+            assert not missing.success
+
+        assert client._graphql_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mam_caches_not_found_but_not_failures(self):
+        mam_client = AsyncMock()
+        mam_client.search_and_extract.side_effect = [None, {}, {"title": "Dune"}]
+        provider = UnifiedMetadataProvider(mam_client=mam_client, cache=MetadataCache())
+
+        # A failed lookup is retried on the next call
+        assert not (await provider._try_mam("Dune", "Frank Herbert")).success
+        assert provider.cache.get("mam", "Dune|Frank Herbert") is MISSING
+
+        # MAM answering "no match" is remembered
+        for _ in range(2):
+            result = await provider._try_mam("Dune", "Frank Herbert")
+            assert not result.success
+        assert provider.cache.get("mam", "Dune|Frank Herbert") is None
+        assert mam_client.search_and_extract.await_count == 2
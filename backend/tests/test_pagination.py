@@ -0,0 +1,85 @@
+"""
+Tests for keyset pagination of the book and download listings
+
+Covers:
+- Walking cursors visits every row once, in the offset order
+- Timestamp ties and rows without a timestamp
+- Offset pages hand over to cursors
+- Listing rows carry only the projected columns
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from backend.models.book import Book
+from backend.services.book_service import BookService
+from backend.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def books(db_session):
+    """25 active books with timestamp ties, two undated books and one archived book."""
+    start = datetime(2026, 1, 1)
+    for i in range(25):
+        db_session.add(Book(title=f"Book {i}", status="active", date_added=start + timedelta(days=i // 3)))
+    for i in range(2):
+        book = Book(title=f"Undated {i}", status="active")
+        db_session.add(book)
+        db_session.flush()
+        book.date_added = None
+    db_session.add(Book(title="Archived", status="archived", date_added=start))
+    db_session.commit()
+    return db_session
+
+
+def offset_order(db):
+    rows = db.query(Book.id).filter(Book.status == "active").order_by(
+        Book.date_added.desc().nulls_last(), Book.id.desc()
+    ).all()
+    return [row.id for row in rows]
+
+
+class TestKeysetPagination:
+    """Tests for BookService.list_books() paging"""
+
+    def test_cursor_walk_matches_offset_order(self, books):
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            result = BookService.list_books(books, limit=4, cursor=cursor, count="none")
+            assert result["success"] is True
+            assert result["total"] is None
+            seen.extend(row.id for row in result["data"])
+            cursor = result["page_info"]["next_cursor"]
+            assert result["page_info"]["has_more"] is (cursor is not None)
+
+        assert seen == offset_order(books)
+        assert len(seen) == 27
+
+    def test_offset_page_hands_over_to_cursor(self, books):
+        first = BookService.list_books(books, limit=5, offset=5)
+        second = BookService.list_books(books, limit=5, cursor=first["page_info"]["next_cursor"])
+
+        assert first["total"] == 27
+        assert [row.id for row in first["data"] + second["data"]] == offset_order(books)[5:15]
+
+    def test_rows_are_projected(self, books):
+        row = BookService.list_books(books, limit=1)["data"][0]
+
+        assert row.title == "Book 24"
+        assert not hasattr(row, "description")
+
+    def test_estimated_count_without_postgres_is_exact(self, books):
+        result = BookService.list_books(books, status=None, limit=1, cursor="", count="estimated")
+
+        assert result["total"] == 28
+
+    def test_invalid_cursor(self, books):
+        with pytest.raises(InvalidCursorError):
+            BookService.list_books(books, cursor="not-a-cursor")
+
+    def test_cursor_round_trip(self):
+        when = datetime(2026, 1, 2, 3, 4, 5, 6)
+
+        assert decode_cursor(encode_cursor(when, 42)) == (when, 42)
+        assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
@@ -0,0 +1,213 @@
+"""
+Tests for QBittorrentStateMirror (sync/maindata delta mirror)
+
+Covers:
+- Full snapshot and incremental delta application
+- Change events (state transitions, progress/ratio crossings, removals)
+- Sync throttling shared across managers
+- Event-driven completion detection in CompletionEventManager
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.integrations.qbittorrent_state_mirror import (
+    QBittorrentStateMirror,
+    TorrentChangeEvent,
+)
+from backend.services.qbittorrent_managers import (
+    TorrentStateManager,
+    CompletionEventManager,
+)
+
+
+FULL_SNAPSHOT = {
+    'rid': 1,
+    'full_update': True,
+    'torrents': {
+        'h1': {'name': 'book-one', 'state': 'downloading', 'progress': 0.4, 'ratio': 0.0},
+        'h2': {'name': 'book-two', 'state': 'uploading', 'progress': 1.0, 'ratio': 0.9},
+    },
+    'categories': {'audiobooks': {'name': 'audiobooks', 'savePath': '/data'}},
+    'server_state': {'dl_info_speed': 100},
+}
+
+
+@pytest.fixture
+def client():
+    """Mock QBittorrentClient returning maindata responses."""
+    client = MagicMock()
+    client.get_maindata = AsyncMock(return_value=FULL_SNAPSHOT)
+    return client
+
+
+@pytest.fixture
+def mirror(client):
+    """Mirror with throttling disabled so every sync hits the client."""
+    return QBittorrentStateMirror(client, min_sync_interval=0)
+
+
+class TestQBittorrentStateMirror:
+    """Tests for delta application and event publishing"""
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_is_baseline(self, mirror, client):
+        """First full update fills the mirror without publishing events."""
+        events = await mirror.sync()
+
+        assert events == []
+        assert mirror.rid == 1
+        assert set(mirror.torrents) == {'h1', 'h2'}
+        assert mirror.get_torrent('h1')['hash'] == 'h1'
+        assert 'audiobooks' in mirror.categories
+        client.get_maindata.assert_awaited_once_with(rid=0)
+
+    @pytest.mark.asyncio
+    async def test_delta_merges_changed_fields(self, mirror, client):
+        """Partial torrent updates merge into the existing entry."""
+        await mirror.sync()
+        client.get_maindata.return_value = {
+            'rid': 2,
+            'torrents': {'h1': {'progress': 0.6}},
+            'server_state': {'up_info_speed': 50},
+        }
+
+        await mirror.sync()
+
+        client.get_maindata.assert_awaited_with(rid=1)
+        assert mirror.get_torrent('h1')['progress'] == 0.6
+        assert mirror.get_torrent('h1')['name'] == 'book-one'
+        assert mirror.server_state == {'dl_info_speed': 100, 'up_info_speed': 50}
+
+    @pytest.mark.asyncio
+    async def test_completion_publishes_events(self, mirror, client):
+        """Finishing a download publishes state change and progress crossing."""
+        received = []
+        mirror.subscribe(received.append)
+        await mirror.sync()
+        client.get_maindata.return_value = {
+            'rid': 2,
+            'torrents': {'h1': {'state': 'uploading', 'progress': 1.0}},
+        }
+
+        events = await mirror.sync()
+
+        kinds = [(e.kind, e.threshold) for e in events]
+        assert ('state_changed', None) in kinds
+        assert ('progress_crossed', 0.5) in kinds
+        assert ('progress_crossed', 1.0) in kinds
+        assert received == events
+        assert any(e.is_completion for e in events)
+
+    @pytest.mark.asyncio
+    async def test_ratio_threshold_and_removal(self, mirror, client):
+        """Ratio crossings and removed hashes are published."""
+        await mirror.sync()
+        client.get_maindata.return_value = {
+            'rid': 2,
+            'torrents': {'h2': {'ratio': 1.2}},
+            'torrents_removed': ['h1'],
+        }
+
+        events = await mirror.sync()
+
+        assert [(e.kind, e.torrent_hash) for e in events] == [
+            ('removed', 'h1'),
+            ('ratio_crossed', 'h2'),
+        ]
+        assert events[1].threshold == 1.0
+        assert mirror.get_torrent('h1') is None
+
+    @pytest.mark.asyncio
+    async def test_sync_is_throttled(self, client):
+        """Repeated syncs inside min_sync_interval reuse the mirror."""
+        mirror = QBittorrentStateMirror(client, min_sync_interval=60)
+
+        await mirror.sync()
+        await mirror.sync()
+        await mirror.sync(force=True)
+
+        assert client.get_maindata.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_torrents_filters(self, mirror):
+        """get_torrents supports the get_all_torrents filters."""
+        await mirror.sync()
+
+        assert [t['hash'] for t in mirror.get_torrents(filter_state='downloading')] == ['h1']
+        assert [t['hash'] for t in mirror.get_torrents(filter_state='seeding')] == ['h2']
+        assert [t['hash'] for t in mirror.get_torrents(filter_state='completed')] == ['h2']
+        assert mirror.get_torrents(category='audiobooks') == []
+
+    @pytest.mark.asyncio
+    async def test_stalled_and_paused_downloads(self, mirror, client):
+        """Stalled and paused downloads count as downloading, like qBittorrent's filter."""
+        client.get_maindata.return_value = {
+            'rid': 1,
+            'full_update': True,
+            'torrents': {
+                'h1': {'name': 'book-one', 'state': 'stalledDL', 'progress': 1.0},
+                'h3': {'name': 'book-three', 'state': 'pausedDL', 'progress': 0.2},
+            },
+        }
+        await mirror.sync()
+
+        assert [t['hash'] for t in mirror.get_torrents(filter_state='downloading')] == ['h1', 'h3']
+
+        # Already at 100%: only the state change marks the completion
+        client.get_maindata.return_value = {'rid': 2, 'torrents': {'h1': {'state': 'stalledUP'}}}
+        events = await mirror.sync()
+
+        assert [e.kind for e in events] == ['state_changed']
+        assert events[0].is_completion
+
+    def test_failing_subscriber_does_not_break_sync(self, mirror):
+        """Subscriber exceptions are logged, not raised."""
+        mirror.subscribe(MagicMock(side_effect=RuntimeError('boom')))
+        event = TorrentChangeEvent(kind='added', torrent_hash='h9', torrent_name='x')
+
+        mirror._publish([event])
+
+
+class TestMirrorBackedManagers:
+    """Managers read from the shared mirror instead of get_all_torrents()"""
+
+    @pytest.fixture
+    def service(self, client, mirror):
+        service = MagicMock()
+        service.qb_client = client
+        service.qb_client.get_all_torrents = AsyncMock()
+        service.torrent_mirror = mirror
+        return service
+
+    @pytest.mark.asyncio
+    async def test_state_manager_uses_mirror(self, service):
+        """State categorisation comes from the mirror."""
+        manager = TorrentStateManager(service)
+
+        states = await manager.get_torrent_states()
+
+        assert len(states['downloading']) == 1
+        assert len(states['seeding']) == 1
+        service.qb_client.get_all_torrents.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_completion_detection_is_event_driven(self, service, client, mirror):
+        """Completions published by the mirror are drained once."""
+        manager = CompletionEventManager(service)
+        mirror.subscribe(manager.on_mirror_event)
+        await mirror.sync()
+        client.get_maindata.return_value = {
+            'rid': 2,
+            'torrents': {'h1': {'state': 'uploading', 'progress': 1.0}},
+        }
+
+        events = await manager.detect_completion_events()
+
+        assert len(events) == 1
+        assert events[0]['torrent_hash'] == 'h1'
+        assert events[0]['previous_state'] == 'downloading'
+        assert events[0]['current_state'] == 'uploading'
+        assert manager.pending_events == []
+        assert manager.get_completion_stats()['torrents_being_monitored'] == 2
+        service.qb_client.get_all_torrents.assert_not_awaited()
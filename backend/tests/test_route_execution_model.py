@@ -0,0 +1,45 @@
+"""
+Tests for the route execution model
+
+Handlers that only do synchronous ORM work must be plain ``def`` functions
+so FastAPI runs them in its threadpool instead of on the event loop.
+"""
+
+import ast
+import inspect
+from pathlib import Path
+
+import pytest
+
+from backend.routes import authors, books, downloads, series, system
+
+
+ROUTE_MODULES = [books, downloads, series, authors, system]
+
+
+def _db_routes(module):
+    """Yield (name, endpoint) for every route that takes a db session."""
+    for route in module.router.routes:
+        endpoint = getattr(route, "endpoint", None)
+        if endpoint and "db" in inspect.signature(endpoint).parameters:
+            yield route.endpoint.__name__, endpoint
+
+
+def _awaits(module, name):
+    """Check whether a handler's source contains an await."""
+    tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
+            return any(isinstance(n, ast.Await) for n in ast.walk(node))
+    return False
+
+
+@pytest.mark.parametrize("module", ROUTE_MODULES, ids=lambda m: m.__name__.rsplit(".", 1)[-1])
+def test_sync_orm_routes_run_in_threadpool(module):
+    """Handlers without awaits that use a Session are not coroutines."""
+    offenders = [
+        name for name, endpoint in _db_routes(module)
+        if inspect.iscoroutinefunction(endpoint) and not _awaits(module, name)
+    ]
+
+    assert offenders == []
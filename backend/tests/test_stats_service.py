@@ -0,0 +1,109 @@
+"""
+Tests for StatsService (grouped dashboard statistics and snapshot)
+
+Covers:
+- Per-status / per-source counts from grouped queries
+- Retry-due counting via the FILTERed aggregate
+- Snapshot caching, staleness and invalidation
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.models.author import Author
+from backend.models.book import Book
+from backend.models.download import Download
+from backend.models.failed_attempt import FailedAttempt
+from backend.models.series import Series
+from backend.services.stats_service import StatsService
+
+
+@pytest.fixture
+def populated_db(db_session):
+    """Small library with books, downloads and failures in every status."""
+    past = datetime.now() - timedelta(hours=1)
+    future = datetime.now() + timedelta(hours=1)
+
+    db_session.add_all([
+        Book(title="A", status="active"),
+        Book(title="B", status="active"),
+        Book(title="C", status="archived"),
+        Book(title="D", status="duplicate"),
+        Series(name="Series One"),
+        Author(name="Author One"),
+        Author(name="Author Two"),
+        Download(title="d1", source="MAM", status="queued", next_retry=past),
+        Download(title="d2", source="MAM", status="queued", next_retry=future),
+        Download(title="d3", source="MAM", status="completed"),
+        Download(title="d4", source="Manual", status="failed"),
+        Download(title="d5", source="Manual", status="abandoned"),
+        FailedAttempt(task_name="MAM", reason="timeout", first_attempt=past, last_attempt=past),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.fixture(autouse=True)
+def clean_snapshot():
+    """Each test starts without a cached snapshot."""
+    StatsService.invalidate_snapshot()
+    yield
+    StatsService.invalidate_snapshot()
+
+
+class TestStatsService:
+    """Tests for the grouped count queries"""
+
+    def test_book_counts(self, populated_db):
+        """Books are counted per status in one query."""
+        counts = StatsService.get_book_counts(populated_db)
+
+        assert counts == {"active": 2, "archived": 1, "duplicate": 1}
+
+    def test_download_counts(self, populated_db):
+        """Status, source and retry-due counts come from one grouped query."""
+        counts = StatsService.get_download_counts(populated_db)
+
+        assert counts["by_status"] == {
+            "queued": 2, "downloading": 0, "completed": 1, "failed": 1, "abandoned": 1
+        }
+        assert counts["by_source"] == {"MAM": 3, "Manual": 2}
+        assert counts["retry_due"] == 1
+        assert counts["total"] == 5
+
+    def test_empty_database(self, db_session):
+        """Known statuses are reported as zero on an empty library."""
+        snapshot = StatsService.compute_snapshot(db_session)
+
+        assert snapshot["books"] == {"active": 0, "archived": 0, "duplicate": 0}
+        assert snapshot["downloads"]["total"] == 0
+        assert snapshot["series"] == 0
+        assert snapshot["failed_attempts"] == 0
+
+
+class TestStatsSnapshot:
+    """Tests for the cached dashboard snapshot"""
+
+    def test_snapshot_is_reused_until_stale(self, populated_db):
+        """A fresh snapshot is served without re-querying."""
+        first = StatsService.get_snapshot(populated_db, max_age=60)
+        populated_db.add(Book(title="E", status="active"))
+        populated_db.commit()
+
+        cached = StatsService.get_snapshot(populated_db, max_age=60)
+        refreshed = StatsService.get_snapshot(populated_db, max_age=0)
+
+        assert first["success"] is True
+        assert cached["data"]["books"]["active"] == 2
+        assert refreshed["data"]["books"]["active"] == 3
+
+    def test_refresh_replaces_snapshot(self, populated_db):
+        """refresh_snapshot() is what the scheduler task calls."""
+        StatsService.get_snapshot(populated_db, max_age=60)
+        populated_db.add(Series(name="Series Two"))
+        populated_db.commit()
+
+        StatsService.refresh_snapshot(populated_db)
+
+        assert StatsService.get_snapshot(populated_db, max_age=60)["data"]["series"] == 2
@@ -0,0 +1,97 @@
+"""
+Tests for the audio tag sync service
+
+Covers:
+- Tags derived from the library layout are written on the first run
+- Files untouched since the last run are skipped without being opened
+- Touched files with matching tags are read but not rewritten
+- Only frames that differ are replaced
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from mutagen.id3 import ID3, TXXX
+
+from backend.services.tag_sync_service import TagSyncService, path_tags
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Library with one MP3 book and one unsupported file."""
+    book = tmp_path / "Brandon Sanderson" / "Mistborn" / "The Final Empire {Michael Kramer}"
+    book.mkdir(parents=True)
+    (book / "part1.mp3").write_bytes(b"\xff\xfb\x90\x00" * 256)
+    (book / "cover.flac").write_bytes(b"fLaC")
+    return tmp_path
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = TagSyncService(tmp_path / "tag_state.sqlite", max_workers=2)
+    yield service
+    service.close()
+
+
+def mp3_path(library):
+    return str(library / "Brandon Sanderson" / "Mistborn" / "The Final Empire {Michael Kramer}" / "part1.mp3")
+
+
+class TestTagSyncService:
+    """Tests for sync_library() and sync_file()"""
+
+    def test_path_tags(self, library):
+        tags = path_tags(mp3_path(library), str(library))
+
+        assert tags["title"] == "The Final Empire {Michael Kramer}"
+        assert tags["artist"] == "Michael Kramer"
+
+    @pytest.mark.asyncio
+    async def test_first_run_writes_tags(self, library, service):
+        counts = await service.sync_library(str(library))
+
+        assert counts["written"] == 1
+        assert counts["skipped"] == 1
+        tags = ID3(mp3_path(library))
+        assert tags["TPE1"].text == ["Michael Kramer"]
+        assert tags["TIT2"].text == ["The Final Empire {Michael Kramer}"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_not_opened(self, library, service):
+        await service.sync_library(str(library))
+
+        with patch("mutagen.id3.ID3") as mock_id3:
+            counts = await service.sync_library(str(library))
+
+        mock_id3.assert_not_called()
+        assert counts["cached"] == 1
+        assert counts["written"] == 0
+
+    @pytest.mark.asyncio
+    async def test_touched_file_with_matching_tags_is_not_rewritten(self, library, service):
+        await service.sync_library(str(library))
+        path = mp3_path(library)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(ID3, "save") as mock_save:
+            counts = await service.sync_library(str(library))
+
+        mock_save.assert_not_called()
+        assert counts["unchanged"] == 1
+
+    def test_only_differing_frames_are_replaced(self, library, service):
+        path = mp3_path(library)
+        desired = path_tags(path, str(library))
+        service.sync_file(path, desired)
+
+        tags = ID3(path)
+        tags.add(TXXX(encoding=3, desc="ASIN", text=["B002UZMLXM"]))
+        tags.setall("TPE1", [])
+        tags.save(path)
+
+        assert service.sync_file(path, desired) == "written"
+        tags = ID3(path)
+        assert tags["TPE1"].text == ["Michael Kramer"]
+        assert tags["TXXX:ASIN"].text == ["B002UZMLXM"]
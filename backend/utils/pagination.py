@@ -0,0 +1,193 @@
+"""
+Keyset pagination helpers for listing endpoints
+Pages through a table ordered newest first on (timestamp, id) using opaque
+cursors, so every page costs the same however deep it is
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Query, Session
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor could not be decoded."""
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: int) -> str:
+    """
+    Encode the position after a row as an opaque cursor
+
+    Args:
+        sort_value: Row's sort timestamp (None if unset)
+        row_id: Row's primary key
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [sort_value.isoformat() if sort_value else None, row_id]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a cursor from encode_cursor()
+
+    Returns:
+        Tuple of (sort timestamp or None, row id)
+
+    Raises:
+        InvalidCursorError: The cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_page(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of a query ordered by sort_column desc, id_column desc
+
+    Rows without a sort timestamp come after all dated rows. Dated and
+    undated rows are read with separate queries so each one can walk an
+    index on (filter columns, sort_column, id_column) instead of sorting.
+
+    Args:
+        query: Filtered query selecting at least sort_column and id_column
+        sort_column: Timestamp column to order by
+        id_column: Primary key column (tie-breaker)
+        limit: Page size
+        cursor: Cursor from a previous page (None = first page)
+
+    Returns:
+        Tuple of (rows, next cursor or None on the last page)
+
+    Raises:
+        InvalidCursorError: The cursor is malformed
+    """
+    sort_value, last_id = decode_cursor(cursor) if cursor else (None, None)
+    rows: List[Any] = []
+
+    # Dated rows, unless the cursor is already in the undated tail
+    if last_id is None or sort_value is not None:
+        dated = query.filter(sort_column.isnot(None))
+        if sort_value is not None:
+            dated = dated.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < last_id)
+            ))
+        rows = dated.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        undated = query.filter(sort_column.is_(None))
+        if last_id is not None and sort_value is None:
+            undated = undated.filter(id_column < last_id)
+        rows.extend(undated.order_by(id_column.desc()).limit(limit + 1 - len(rows)).all())
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """
+    Approximate number of rows a query returns
+
+    On PostgreSQL this is the planner's row estimate, which costs no table
+    scan. Other databases get an exact COUNT.
+
+    Args:
+        db: Database session
+        query: Filtered query
+
+    Returns:
+        Estimated row count
+    """
+    query = query.order_by(None)
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return query.count()
+
+    statement = query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {statement}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def paginate(
+    db: Session,
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> Tuple[List[Any], Optional[int], Dict[str, Any]]:
+    """
+    Page a query by cursor or by offset
+
+    Both modes use the same order, so the next_cursor of any page continues
+    where it ended. A cursor (or offset 0) reads by keyset; a non-zero offset
+    falls back to OFFSET for clients that jump to a page number.
+
+    Args:
+        db: Database session
+        query: Filtered query selecting the listed columns
+        sort_column: Timestamp column to order by (newest first)
+        id_column: Primary key column (tie-breaker)
+        limit: Page size
+        offset: Rows to skip (ignored when cursor is given)
+        cursor: Cursor from a previous page ("" = first page)
+        count: Total to report: exact, estimated or none
+
+    Returns:
+        Tuple of (rows, total or None, page_info dict with limit, offset,
+        has_more and next_cursor)
+
+    Raises:
+        InvalidCursorError: The cursor is malformed
+    """
+    if cursor is not None or not offset:
+        rows, next_cursor = keyset_page(query, sort_column, id_column, limit, cursor or None)
+        offset = None if cursor else 0
+    else:
+        rows = query.order_by(
+            sort_column.desc().nulls_last(), id_column.desc()
+        ).offset(offset).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(getattr(rows[-1], sort_column.key), getattr(rows[-1], id_column.key))
+
+    if count == "exact":
+        total = query.order_by(None).count()
+    elif count == "estimated":
+        total = estimate_count(db, query)
+    else:
+        total = None
+
+    page_info = {
+        "limit": limit,
+        "offset": offset,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor
+    }
+    return rows, total, page_info
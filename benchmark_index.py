@@ -0,0 +1,133 @@
+"""
+Recall vs. latency benchmark for FAISS index types.
+
+Reads the vectors out of the existing index, builds each candidate index
+type from them in memory and measures, for a sweep of nprobe / efSearch
+values, recall@k against exact search and single-query latency. Use it to
+pick RAGConfig.index_type and its query parameters for the current corpus.
+
+Usage:
+    python benchmark_index.py
+    python benchmark_index.py --types ivf_flat,hnsw --queries 500 --k 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import faiss
+import numpy as np
+
+from mamcrawler.config import DEFAULT_RAG_CONFIG
+from mamcrawler.rag.indexing import FAISSIndexManager, INDEX_TYPES, build_index
+
+SWEEPS = {
+    "flat": ("", [None]),
+    "ivf_flat": ("nprobe", [1, 4, 16, 64]),
+    "ivf_pq": ("nprobe", [1, 4, 16, 64]),
+    "hnsw": ("efSearch", [16, 32, 64, 128]),
+}
+
+
+def make_queries(vectors: np.ndarray, count: int, noise: float, seed: int) -> np.ndarray:
+    """Sample stored vectors, perturb them and re-normalize, as stand-in queries."""
+    rng = np.random.default_rng(seed)
+    picks = vectors[rng.choice(len(vectors), size=min(count, len(vectors)), replace=False)]
+    queries = picks + rng.normal(scale=noise, size=picks.shape).astype(np.float32)
+    faiss.normalize_L2(queries)
+    return queries.astype(np.float32)
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    """Mean fraction of the exact top-k found by the approximate search."""
+    hits = [len(set(row[row >= 0]) & set(expected)) / len(expected) for row, expected in zip(found, truth)]
+    return statistics.mean(hits)
+
+
+def time_queries(index, queries: np.ndarray, k: int) -> Dict[str, object]:
+    """Run queries one at a time, as the search tools do."""
+    latencies = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        _, ids = index.search(query.reshape(1, -1), k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(ids[0])
+    latencies.sort()
+    return {
+        "ids": np.array(results),
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def run(index_path: str, types: List[str], query_count: int, k: int, noise: float, seed: int) -> List[dict]:
+    manager = FAISSIndexManager(DEFAULT_RAG_CONFIG, index_path)
+    ids, vectors = manager.export_vectors()
+    print(f"Loaded {len(ids)} vectors (dimension {vectors.shape[1]}) from {index_path}", file=sys.stderr)
+
+    queries = make_queries(vectors, query_count, noise, seed)
+    exact = faiss.IndexIDMap(faiss.IndexFlatL2(vectors.shape[1]))
+    exact.add_with_ids(vectors, ids)
+    _, truth = exact.search(queries, k)
+
+    rows = []
+    for index_type in types:
+        start = time.perf_counter()
+        try:
+            index = build_index(index_type, ids, vectors, DEFAULT_RAG_CONFIG)
+        except ValueError as e:
+            print(f"Skipping {index_type}: {e}", file=sys.stderr)
+            continue
+        build_seconds = time.perf_counter() - start
+
+        parameter, values = SWEEPS[index_type]
+        for value in values:
+            if parameter:
+                faiss.ParameterSpace().set_index_parameter(index, parameter, value)
+            timing = time_queries(index, queries, k)
+            rows.append({
+                "type": index_type,
+                "param": f"{parameter}={value}" if parameter else "-",
+                "recall": recall_at_k(timing["ids"], truth),
+                "p50_ms": timing["p50"],
+                "p95_ms": timing["p95"],
+                "build_s": build_seconds,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAISS recall vs. latency benchmark")
+    parser.add_argument("--index", default=DEFAULT_RAG_CONFIG.index_path, help="Index file")
+    parser.add_argument("--types", default=",".join(INDEX_TYPES), help="Comma-separated index types")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--noise", type=float, default=0.02, help="Query perturbation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.index):
+        print(f"ERROR: {args.index} not found. Run: python ingest.py")
+        sys.exit(1)
+
+    types = [t.strip() for t in args.types.split(",") if t.strip()]
+    unknown = [t for t in types if t not in INDEX_TYPES]
+    if unknown:
+        parser.error(f"unknown index types: {', '.join(unknown)}")
+
+    rows = run(args.index, types, args.queries, args.k, args.noise, args.seed)
+
+    print(f"{'type':<10} {'param':<14} {'recall@' + str(args.k):>10} {'p50 ms':>8} {'p95 ms':>8} {'build s':>8}")
+    for row in rows:
+        print(
+            f"{row['type']:<10} {row['param']:<14} {row['recall']:>10.3f} "
+            f"{row['p50_ms']:>8.3f} {row['p95_ms']:>8.3f} {row['build_s']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """
 CLI query interface for RAG system.
 Uses modular components from mamcrawler package.
+Searches through the resident search server (search_server.py) when it is
+running and falls back to loading the model and index in-process.
 Supports three modes for remote API:
 - "off": never call Anthropic
 - "ask": ask before each call
@@ -10,11 +12,9 @@ Supports three modes for remote API:
 import sys
 import os
 import json
-import anthropic
 
-import database
-from mamcrawler.rag import EmbeddingService, FAISSIndexManager
 from mamcrawler.config import DEFAULT_RAG_CONFIG, REMOTE_MODE
+from search_client import query_server
 
 
 def ask_permission():
@@ -38,40 +38,27 @@ def main():
     query = sys.argv[1]
     config = DEFAULT_RAG_CONFIG
 
-    if not os.path.exists(config.index_path) or not os.path.exists(config.db_path):
-        print("ERROR: index.faiss or database missing. Run: python ingest.py")
-        return
-
-    print("Loading embedding model:", config.model_name)
-    embeddings = EmbeddingService(config)
-    index_mgr = FAISSIndexManager(config)
-
-    print("Embedding query…")
-    qvec = embeddings.encode_query(query)
-
-    print("Searching index…")
-    distances, ids = index_mgr.search(qvec, config.top_k)
-    top_ids = ids[0]  # Get first row
-    top_scores = distances[0]  # Get first row
-
-    print("Retrieving chunks…")
-    # Filter out invalid IDs (0 or negative)
-    valid_ids = [int(id) for id in top_ids if id > 0]
-    chunks = database.get_chunks_by_ids(valid_ids)
+    hits = query_server(query, config.top_k)
+    if hits is None:
+        if not os.path.exists(config.index_path) or not os.path.exists(config.db_path):
+            print("ERROR: index.faiss or database missing. Run: python ingest.py")
+            return
+        # Loading the model here takes seconds; search_server.py keeps it warm
+        print("No search server running; loading embedding model:", config.model_name)
+        from search_server import SearchEngine
+        hits = SearchEngine(config).search(query, config.top_k)
 
     # Always display local RAG results
     rag_json = {
         "query": query,
         "results": [
             {
-                "chunk_id": chunk_id,
-                "file": chunk_data[1],  # path
-                "content": chunk_data[0],  # text
-                "score": float(score),
+                "chunk_id": hit["chunk_id"],
+                "file": hit["source"],
+                "content": hit["content"],
+                "score": hit["score"],
             }
-            for chunk_id, chunk_data, score in zip(
-                valid_ids, chunks, top_scores[: len(valid_ids)]
-            )
+            for hit in hits
         ],
     }
 
@@ -98,6 +85,8 @@ def main():
     # If REMOTE_MODE == "on", no prompt
     print("\nCalling Anthropic API…")
 
+    import anthropic  # slow to import; only needed for the remote call
+
     client = anthropic.Anthropic(api_key=api_key)
 
     try:
@@ -1,99 +1,433 @@
-import sqlite3
-import os
+"""
+SQLite metadata store for the RAG index (files and their text chunks).
 
-def create_tables(db_path='metadata.sqlite'):
+MetadataStore keeps one connection per database file open for the life of
+the process, in WAL mode so readers (search) do not block the writer
+(ingest/watcher). sqlite3 caches the prepared statements of a connection,
+so reusing it also avoids re-preparing the same SQL on every call.
+
+Chunk text is also indexed in an FTS5 table (chunks_fts) for BM25 keyword
+search, which needs neither FAISS nor the embedding model.
+
+The module-level functions are kept for existing callers and delegate to
+the shared store for their db_path.
+"""
+
+import re
+import threading
+from contextlib import contextmanager
+
+from mamcrawler.storage import open_state_db
+
+DEFAULT_DB_PATH = 'metadata.sqlite'
+
+# Prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+# Max host parameters per IN (...) query (SQLite's default limit is 999)
+MAX_SQL_PARAMS = 900
+
+_WORD = re.compile(r"\w")
+
+
+def fts_query(text):
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every whitespace-separated term is quoted (so punctuation such as the
+    dot in a rule number "2.3" or a torrent ID's dashes cannot break the
+    query syntax) and the terms are OR-ed; BM25 ranks chunks that match more
+    of them first.
+    """
+    terms = [term for term in text.split() if _WORD.search(term)]
+    return " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+class MetadataStore:
+    """Connection-managed access to the files/chunks metadata database."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self):
+        """The store's connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        return self._conn
+
+    def close(self):
+        """Close the connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def transaction(self):
+        """Run statements in one write transaction."""
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def create_tables(self):
+        """Create the SQLite database tables for storing file and chunk metadata."""
+        with self.transaction() as conn:
+            # Table to track files and their processed state
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS files (
+                file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT UNIQUE NOT NULL,
+                last_modified REAL NOT NULL,
+                file_hash TEXT NOT NULL
+            )''')
+
+            # Table to store the actual text chunks and their metadata
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_id INTEGER NOT NULL,
+                chunk_text TEXT NOT NULL,
+                header_metadata TEXT,
+                FOREIGN KEY(file_id) REFERENCES files(file_id)
+            )''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_file_id ON chunks(file_id)")
+
+            # Full-text index over the chunks (BM25 keyword search). It is an
+            # external-content table, so the text is stored once, in chunks;
+            # the triggers keep the index in step with every insert/delete.
+            fts_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunks_fts'"
+            ).fetchone()
+            conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+                chunk_text,
+                header_metadata,
+                content='chunks',
+                content_rowid='chunk_id'
+            )''')
+            conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_insert AFTER INSERT ON chunks BEGIN
+                INSERT INTO chunks_fts(rowid, chunk_text, header_metadata)
+                VALUES (new.chunk_id, new.chunk_text, new.header_metadata);
+            END''')
+            conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_delete AFTER DELETE ON chunks BEGIN
+                INSERT INTO chunks_fts(chunks_fts, rowid, chunk_text, header_metadata)
+                VALUES ('delete', old.chunk_id, old.chunk_text, old.header_metadata);
+            END''')
+            conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_update AFTER UPDATE ON chunks BEGIN
+                INSERT INTO chunks_fts(chunks_fts, rowid, chunk_text, header_metadata)
+                VALUES ('delete', old.chunk_id, old.chunk_text, old.header_metadata);
+                INSERT INTO chunks_fts(rowid, chunk_text, header_metadata)
+                VALUES (new.chunk_id, new.chunk_text, new.header_metadata);
+            END''')
+            if not fts_exists:
+                # Databases created before the FTS table: index existing chunks
+                conn.execute("INSERT INTO chunks_fts(chunks_fts) VALUES ('rebuild')")
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def get_file_details(self, path):
+        """Get (file_id, file_hash) for a path, or None."""
+        rows = self._query("SELECT file_id, file_hash FROM files WHERE path = ?", (path,))
+        return rows[0] if rows else None
+
+    def insert_or_update_file(self, path, last_modified, file_hash):
+        """Insert or update file record."""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR REPLACE INTO files (path, last_modified, file_hash) VALUES (?, ?, ?)",
+                (path, last_modified, file_hash)
+            )
+            return cursor.lastrowid
+
+    def begin_file(self, path, last_modified):
+        """
+        Register a file for (re)indexing without discarding its old chunks.
+
+        The row keeps its file_id and gets an empty file_hash, which marks it
+        as pending until finalize_files() records the real hash. A crashed
+        ingest therefore re-processes the file on the next run.
+
+        Returns:
+            Tuple of (file_id, chunk IDs the file had before this run)
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO files (path, last_modified, file_hash) VALUES (?, ?, '')
+                ON CONFLICT(path) DO UPDATE SET
+                    last_modified = excluded.last_modified,
+                    file_hash = ''
+                """,
+                (path, last_modified)
+            )
+            file_id = conn.execute(
+                "SELECT file_id FROM files WHERE path = ?", (path,)
+            ).fetchone()[0]
+            stale_ids = [
+                row[0] for row in conn.execute(
+                    "SELECT chunk_id FROM chunks WHERE file_id = ?", (file_id,)
+                )
+            ]
+        return file_id, stale_ids
+
+    def finalize_files(self, files):
+        """
+        Mark files as indexed and drop the chunks they replaced.
+
+        Args:
+            files: Iterable of (file_id, file_hash, stale_chunk_ids) tuples
+        """
+        files = list(files)
+        if not files:
+            return
+
+        with self.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM chunks WHERE chunk_id = ?",
+                [(chunk_id,) for _, _, chunk_ids in files for chunk_id in chunk_ids]
+            )
+            conn.executemany(
+                "UPDATE files SET file_hash = ? WHERE file_id = ?",
+                [(file_hash, file_id) for file_id, file_hash, _ in files]
+            )
+
+    def delete_file_records(self, file_id):
+        """Delete all records for a file."""
+        self.delete_files([file_id])
+
+    def delete_files(self, file_ids):
+        """Delete several files and all of their chunks in one transaction."""
+        params = [(file_id,) for file_id in file_ids]
+        if not params:
+            return
+        with self.transaction() as conn:
+            conn.executemany("DELETE FROM chunks WHERE file_id = ?", params)
+            conn.executemany("DELETE FROM files WHERE file_id = ?", params)
+
+    # ------------------------------------------------------------------
+    # Chunks
+    # ------------------------------------------------------------------
+
+    def insert_chunk(self, file_id, text, metadata):
+        """Insert a chunk into the database."""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO chunks (file_id, chunk_text, header_metadata) VALUES (?, ?, ?)",
+                (file_id, text, metadata)
+            )
+            return cursor.lastrowid
+
+    def insert_chunks(self, rows):
+        """
+        Insert many chunks in a single transaction.
+
+        Chunk IDs are reserved up front (under the write lock) so the rows
+        can be written with one executemany call.
+
+        Args:
+            rows: Iterable of (file_id, text, metadata) tuples
+
+        Returns:
+            List of chunk IDs, in row order
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+
+        with self.transaction() as conn:
+            first_id = conn.execute(
+                """
+                SELECT MAX(
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'chunks'), 0),
+                    COALESCE((SELECT MAX(chunk_id) FROM chunks), 0)
+                ) + 1
+                """
+            ).fetchone()[0]
+            chunk_ids = list(range(first_id, first_id + len(rows)))
+            conn.executemany(
+                "INSERT INTO chunks (chunk_id, file_id, chunk_text, header_metadata) VALUES (?, ?, ?, ?)",
+                [(chunk_id, *row) for chunk_id, row in zip(chunk_ids, rows)]
+            )
+        return chunk_ids
+
+    def delete_chunks(self, chunk_ids):
+        """Delete chunks by ID in one transaction."""
+        params = [(int(chunk_id),) for chunk_id in chunk_ids]
+        if not params:
+            return
+        with self.transaction() as conn:
+            conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", params)
+
+    def get_chunk_ids_for_file(self, file_id):
+        """Get all chunk IDs for a file."""
+        rows = self._query("SELECT chunk_id FROM chunks WHERE file_id = ?", (file_id,))
+        return [row[0] for row in rows]
+
+    def get_chunk_map(self, chunk_ids):
+        """
+        Get chunks keyed by ID.
+
+        Returns:
+            Dict of chunk_id -> (chunk_text, path, header_metadata)
+        """
+        ids = list(dict.fromkeys(int(chunk_id) for chunk_id in chunk_ids if chunk_id is not None))
+        found = {}
+        for start in range(0, len(ids), MAX_SQL_PARAMS):
+            batch = ids[start:start + MAX_SQL_PARAMS]
+            placeholders = ','.join(['?'] * len(batch))
+            rows = self._query(
+                f"""
+                SELECT c.chunk_id, c.chunk_text, f.path, c.header_metadata
+                FROM chunks c
+                JOIN files f ON c.file_id = f.file_id
+                WHERE c.chunk_id IN ({placeholders})
+                """,
+                batch
+            )
+            for chunk_id, text, path, header in rows:
+                found[chunk_id] = (text, path, header)
+        return found
+
+    def get_chunks_by_ids(self, chunk_ids):
+        """
+        Get chunks by their IDs, in the order the IDs were given.
+
+        FAISS returns IDs best match first, so the rows come back in rank
+        order. IDs that are not in the database (including FAISS's -1
+        padding) are skipped.
+
+        Returns:
+            List of (chunk_text, path, header_metadata) tuples
+        """
+        if chunk_ids is None or len(chunk_ids) == 0:
+            return []
+        found = self.get_chunk_map(chunk_ids)
+        return [found[int(chunk_id)] for chunk_id in chunk_ids if int(chunk_id) in found]
+
+    def search_chunks(self, query, limit=10):
+        """
+        Keyword search over chunk text and headers, ranked by BM25.
+
+        Args:
+            query: Free text; see fts_query()
+            limit: Maximum number of results
+
+        Returns:
+            List of (chunk_id, bm25_score) tuples, best match first
+            (lower score = better match, like a FAISS distance)
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        return self._query(
+            """
+            SELECT rowid, bm25(chunks_fts) AS score
+            FROM chunks_fts
+            WHERE chunks_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+            """,
+            (match, limit)
+        )
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def count_chunks(self, path=None):
+        """Count chunks, optionally for a single file path."""
+        if path is None:
+            return self._query("SELECT COUNT(*) FROM chunks")[0][0]
+        return self._query(
+            "SELECT COUNT(*) FROM chunks c JOIN files f ON c.file_id = f.file_id WHERE f.path = ?",
+            (path,)
+        )[0][0]
+
+    def count_files(self):
+        """Count indexed files."""
+        return self._query("SELECT COUNT(*) FROM files")[0][0]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path=DEFAULT_DB_PATH):
+    """Get the shared MetadataStore for a database file."""
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = _stores[db_path] = MetadataStore(db_path)
+        return store
+
+
+def close_stores():
+    """Close every shared store connection."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
+
+
+def create_tables(db_path=DEFAULT_DB_PATH):
     """Create the SQLite database tables for storing file and chunk metadata."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Table to track files and their processed state
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS files (
-        file_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        path TEXT UNIQUE NOT NULL,
-        last_modified REAL NOT NULL,
-        file_hash TEXT NOT NULL
-    )''')
-
-    # Table to store the actual text chunks and their metadata
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS chunks (
-        chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        file_id INTEGER NOT NULL,
-        chunk_text TEXT NOT NULL,
-        header_metadata TEXT,
-        FOREIGN KEY(file_id) REFERENCES files(file_id)
-    )''')
-    conn.commit()
-    conn.close()
-
-def insert_chunk(file_id, text, metadata, db_path='metadata.sqlite'):
+    get_store(db_path).create_tables()
+
+def insert_chunk(file_id, text, metadata, db_path=DEFAULT_DB_PATH):
     """Insert a chunk into the database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO chunks (file_id, chunk_text, header_metadata) VALUES (?, ?, ?)",
-        (file_id, text, metadata)
-    )
-    chunk_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return chunk_id
-
-def get_file_details(path, db_path='metadata.sqlite'):
+    return get_store(db_path).insert_chunk(file_id, text, metadata)
+
+def get_file_details(path, db_path=DEFAULT_DB_PATH):
     """Get file details from database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT file_id, file_hash FROM files WHERE path = ?", (path,))
-    result = cursor.fetchone()
-    conn.close()
-    return result
-
-def insert_or_update_file(path, last_modified, file_hash, db_path='metadata.sqlite'):
+    return get_store(db_path).get_file_details(path)
+
+def insert_or_update_file(path, last_modified, file_hash, db_path=DEFAULT_DB_PATH):
     """Insert or update file record."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT OR REPLACE INTO files (path, last_modified, file_hash) VALUES (?, ?, ?)",
-        (path, last_modified, file_hash)
-    )
-    file_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return file_id
-
-def get_chunk_ids_for_file(file_id, db_path='metadata.sqlite'):
+    return get_store(db_path).insert_or_update_file(path, last_modified, file_hash)
+
+def get_chunk_ids_for_file(file_id, db_path=DEFAULT_DB_PATH):
     """Get all chunk IDs for a file."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT chunk_id FROM chunks WHERE file_id = ?", (file_id,))
-    chunk_ids = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return chunk_ids
-
-def delete_file_records(file_id, db_path='metadata.sqlite'):
+    return get_store(db_path).get_chunk_ids_for_file(file_id)
+
+def delete_file_records(file_id, db_path=DEFAULT_DB_PATH):
     """Delete all records for a file."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM chunks WHERE file_id = ?", (file_id,))
-    cursor.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
-    conn.commit()
-    conn.close()
-
-def get_chunks_by_ids(chunk_ids, db_path='metadata.sqlite'):
-    """Get chunks by their IDs."""
-    if not chunk_ids:
-        return []
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    placeholders = ','.join(['?'] * len(chunk_ids))
-    query = f"""
-    SELECT c.chunk_text, f.path, c.header_metadata
-    FROM chunks c
-    JOIN files f ON c.file_id = f.file_id
-    WHERE c.chunk_id IN ({placeholders})
-    """
-    cursor.execute(query, chunk_ids)
-    results = cursor.fetchall()
-    conn.close()
-    return results
\ No newline at end of file
+    get_store(db_path).delete_file_records(file_id)
+
+def get_chunks_by_ids(chunk_ids, db_path=DEFAULT_DB_PATH):
+    """Get chunks by their IDs, in the order the IDs were given."""
+    return get_store(db_path).get_chunks_by_ids(chunk_ids)
+
+def begin_file(path, last_modified, db_path=DEFAULT_DB_PATH):
+    """Register a file for (re)indexing; see MetadataStore.begin_file."""
+    return get_store(db_path).begin_file(path, last_modified)
+
+def insert_chunks(rows, db_path=DEFAULT_DB_PATH):
+    """Insert many chunks in one transaction; see MetadataStore.insert_chunks."""
+    return get_store(db_path).insert_chunks(rows)
+
+def finalize_files(files, db_path=DEFAULT_DB_PATH):
+    """Mark files as indexed; see MetadataStore.finalize_files."""
+    get_store(db_path).finalize_files(files)
+
+def search_chunks(query, limit=10, db_path=DEFAULT_DB_PATH):
+    """Keyword (BM25) search over chunks; see MetadataStore.search_chunks."""
+    return get_store(db_path).search_chunks(query, limit)
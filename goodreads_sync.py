@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from backend.integrations.abs_client import AudiobookshelfClient
-from backend.integrations.hardcover_client import HardcoverClient
+from backend.integrations.hardcover_client import BookLookup, HardcoverClient
 
 # Configure logging to file for Dashboard compatibility
 log_file = f"master_manager_goodreads_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -175,14 +175,23 @@ class GoodreadsSync:
                     
                     logger.info(f"Page {page}: Found {len(feed.entries)} books.")
                     
+                    lookups = []
                     for entry in feed.entries:
                         try:
-                            await self._process_book(entry, user_id, hc_client)
+                            lookup = await self._process_book(entry, user_id)
+                            if lookup:
+                                lookups.append(lookup)
                         except Exception as e:
                             logger.error(f"Error processing book: {e}")
-                        
-                        # Respect rate limits for Hardcover/Google (Increased to 10s)
-                        await asyncio.sleep(10)
+
+                    # Resolve the page's read books in batched Hardcover requests
+                    # (Hardcover and Google Books requests are paced by the shared API budget)
+                    matches = await hc_client.resolve_books(lookups)
+                    for lookup, match in zip(lookups, matches):
+                        try:
+                            await self._sync_to_hardcover(lookup, match, hc_client)
+                        except Exception as e:
+                            logger.error(f"Error syncing '{lookup.title}' to Hardcover: {e}")
                     
                     if len(feed.entries) < 100:
                         break
@@ -198,7 +207,8 @@ class GoodreadsSync:
             logger.error(f"Error fetching ABS users: {e}")
         return None
 
-    async def _process_book(self, entry, abs_user_id, hc_client):
+    async def _process_book(self, entry, abs_user_id):
+        """Sync a read book to ABS; returns its Hardcover lookup (None if unread)."""
         title = html.unescape(entry.get('title', ''))
         author = html.unescape(entry.get('author_name', ''))
         isbn = entry.get('isbn')
@@ -235,7 +245,7 @@ class GoodreadsSync:
             if 'read' in shelf_names: is_read = True
                 
         if not is_read:
-            return
+            return None
 
         # --- ABS SYNC (BRUTE FORCE) ---
         found_item = await self._brute_force_match(title, author)
@@ -256,23 +266,9 @@ class GoodreadsSync:
         else:
             logger.warning(f"Could not find '{title}' in ABS library (Local Cache search failed).")
 
-        # --- HARDCOVER SYNC ---
-        if hc_client:
-            clean_title = title.split('(')[0].strip()
-            await self._sync_to_hardcover(clean_title, author, isbn, hc_client)
-
-    async def _sync_to_hardcover(self, title, author, isbn, hc_client):
-        logger.info(f"Syncing to Hardcover: {title}")
-        
-        # Resolve
-        match = await hc_client.resolve_book(title, author, isbn)
-        if not match.success or not match.book:
-            logger.warning(f"Could not resolve '{title}' on Hardcover.")
-            return
-
-        # Update Status
-        if await hc_client.update_book_status(match.book.id, "read"):
-            logger.info(f"Updated Hardcover status for '{match.book.title}'")
+        # --- HARDCOVER SYNC (resolved in batches by run) ---
+        clean_title = title.split('(')[0].strip()
+        return BookLookup(title=clean_title, author=author, isbn=isbn or None)
 
     async def _sync_to_abs(self, title, author, user_id):
         try:
@@ -307,16 +303,14 @@ class GoodreadsSync:
         except Exception as e:
             logger.error(f"ABS Sync Error for {title}: {e}")
 
-    async def _sync_to_hardcover(self, title, author, isbn, hc_client):
-        # Try resolve
-        logger.info(f"Syncing to Hardcover: {title}")
-        match = await hc_client.resolve_book(title, author)
-        
+    async def _sync_to_hardcover(self, lookup, match, hc_client):
+        logger.info(f"Syncing to Hardcover: {lookup.title}")
+
         if match.success and match.book:
              await hc_client.update_book_status(match.book.id, "read")
-             logger.info(f"Updated Hardcover status for '{title}'")
+             logger.info(f"Updated Hardcover status for '{lookup.title}'")
         else:
-             logger.warning(f"Could not resolve '{title}' on Hardcover.")
+             logger.warning(f"Could not resolve '{lookup.title}' on Hardcover.")
 
 if __name__ == "__main__":
     syncer = GoodreadsSync()
@@ -1,10 +1,21 @@
 """
 RAG indexing pipeline for MAMcrawler.
 Uses modular components from mamcrawler package.
+
+Files are read one at a time through a generator and their chunks are
+embedded in fixed-size batches, so memory stays bounded no matter how many
+guides are ingested. Each batch is written to SQLite in one transaction and
+added to FAISS; every few batches the index is saved and the files that are
+fully indexed get their hash recorded. That hash is the resume checkpoint: a
+file whose run was interrupted still has an empty hash and is re-processed
+on the next run.
 """
 
 import os
 import hashlib
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+
 import numpy as np
 import database
 
@@ -13,84 +24,190 @@ from mamcrawler.rag import MarkdownChunker, EmbeddingService, FAISSIndexManager
 from mamcrawler.config import DEFAULT_RAG_CONFIG
 from mamcrawler.utils import safe_read_markdown
 
+# Chunks embedded (and written to SQLite) per batch
+BATCH_SIZE = 256
+
+# Batches between index saves / file checkpoints
+CHECKPOINT_BATCHES = 8
+
+
+@dataclass
+class PendingFile:
+    """A changed file whose chunks are being indexed."""
+
+    path: str
+    file_id: int
+    file_hash: str
+    stale_chunk_ids: List[int] = field(default_factory=list)
 
-def process_file(path: str, chunker: MarkdownChunker) -> tuple:
+
+def iter_markdown_files(target_dir: str) -> Iterator[str]:
     """
-    Process a single file: chunk, and prepare for embedding.
+    Yield markdown file paths under a directory, in a stable order.
 
     Args:
-        path: Path to markdown file
-        chunker: MarkdownChunker instance
+        target_dir: Directory containing markdown files
+    """
+    for root, dirs, files in os.walk(target_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(".md"):
+                yield os.path.join(root, file)
 
-    Returns:
-        Tuple of (chunks_to_embed, chunk_ids)
+
+def iter_changed_files(
+    target_dir: str, chunker: MarkdownChunker
+) -> Iterator[Tuple[PendingFile, List[Tuple[str, str, str]]]]:
     """
-    markdown_content = safe_read_markdown(path)
+    Yield new or modified files with their chunks, one file at a time.
 
-    # Check if file is new or modified
-    file_hash = hashlib.sha256(markdown_content.encode()).hexdigest()
-    existing = database.get_file_details(path)
-    if existing and existing[1] == file_hash:
-        return [], []  # No change
+    Unchanged files (same content hash) are skipped. Changed files are
+    registered as pending in SQLite before they are yielded.
 
-    # Add/update file record in SQLite
-    file_id = database.insert_or_update_file(path, os.path.getmtime(path), file_hash)
+    Args:
+        target_dir: Directory containing markdown files
+        chunker: MarkdownChunker instance
 
-    # Chunk the document using unified chunker
-    chunks = chunker.chunk(markdown_content)
+    Yields:
+        Tuple of (PendingFile, chunks) where chunks are
+        (text_to_embed, raw_text, header_context) tuples
+    """
+    for path in iter_markdown_files(target_dir):
+        markdown_content = safe_read_markdown(path)
 
-    chunks_to_embed = []
-    chunk_ids = []
+        # Check if file is new or modified
+        file_hash = hashlib.sha256(markdown_content.encode()).hexdigest()
+        existing = database.get_file_details(path)
+        if existing and existing[1] == file_hash:
+            continue
 
-    for text_to_embed, raw_text, header_context in chunks:
-        # Save chunk to SQLite and get its ID
-        chunk_id = database.insert_chunk(file_id, raw_text, header_context)
-        chunk_ids.append(chunk_id)
-        chunks_to_embed.append(text_to_embed)
+        file_id, stale_chunk_ids = database.begin_file(path, os.path.getmtime(path))
+        yield PendingFile(path, file_id, file_hash, stale_chunk_ids), chunker.chunk(markdown_content)
 
-    return chunks_to_embed, chunk_ids
 
+class IngestPipeline:
+    """
+    Streams chunks from changed files into SQLite and FAISS in batches.
+    """
 
-def main(target_dir: str = "guides_output"):
+    def __init__(
+        self,
+        chunker: MarkdownChunker,
+        embedding_service: EmbeddingService,
+        index_manager: FAISSIndexManager,
+        batch_size: int = BATCH_SIZE,
+        checkpoint_batches: int = CHECKPOINT_BATCHES,
+    ):
+        """
+        Args:
+            chunker: MarkdownChunker instance
+            embedding_service: EmbeddingService instance
+            index_manager: FAISSIndexManager instance
+            batch_size: Chunks embedded per batch
+            checkpoint_batches: Batches between index saves
+        """
+        self.chunker = chunker
+        self.embedding_service = embedding_service
+        self.index_manager = index_manager
+        self.batch_size = batch_size
+        self.checkpoint_batches = checkpoint_batches
+
+        self.files_processed = 0
+        self.chunks_indexed = 0
+
+        self._batch: List[Tuple[int, str, str, str]] = []
+        self._completed: List[PendingFile] = []
+        self._batches_since_checkpoint = 0
+        self._index_dirty = False
+
+    def run(self, target_dir: str) -> None:
+        """
+        Index every new or modified markdown file under target_dir.
+
+        Args:
+            target_dir: Directory containing markdown files
+        """
+        for pending, chunks in iter_changed_files(target_dir, self.chunker):
+            print(f"Processing {pending.path}")
+            self.files_processed += 1
+
+            # Old vectors go now; their rows are deleted at the checkpoint
+            if pending.stale_chunk_ids:
+                self.index_manager.remove(np.array(pending.stale_chunk_ids))
+                self._index_dirty = True
+
+            for text_to_embed, raw_text, header_context in chunks:
+                self._batch.append((pending.file_id, text_to_embed, raw_text, header_context))
+                if len(self._batch) >= self.batch_size:
+                    self._flush_batch()
+
+            # Every chunk of this file is queued; it is done after the next checkpoint
+            self._completed.append(pending)
+
+        self._flush_batch()
+        self._checkpoint()
+
+    def _flush_batch(self) -> None:
+        """Embed the current batch, write its rows and add its vectors."""
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        embeddings = self.embedding_service.encode([row[1] for row in batch])
+        chunk_ids = database.insert_chunks(
+            (file_id, raw_text, header_context)
+            for file_id, _, raw_text, header_context in batch
+        )
+        self.index_manager.add(embeddings, np.array(chunk_ids))
+        self._index_dirty = True
+        self.chunks_indexed += len(batch)
+
+        self._batches_since_checkpoint += 1
+        if self._batches_since_checkpoint >= self.checkpoint_batches:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """Save the index, then record completed files as indexed."""
+        if self._index_dirty:
+            self.index_manager.save()
+            self._index_dirty = False
+
+        if self._completed:
+            database.finalize_files(
+                (pending.file_id, pending.file_hash, pending.stale_chunk_ids)
+                for pending in self._completed
+            )
+            self._completed = []
+
+        self._batches_since_checkpoint = 0
+
+
+def main(target_dir: str = "guides_output", batch_size: int = BATCH_SIZE):
     """
     Main ingestion function.
 
     Args:
         target_dir: Directory containing markdown files to index
+        batch_size: Chunks embedded per batch
     """
     # Initialize database
     database.create_tables()
 
     # Initialize modular components
-    chunker = MarkdownChunker()
-    embedding_service = EmbeddingService()
-    index_manager = FAISSIndexManager()
-
-    # Process all .md files
-    all_chunks = []
-    all_chunk_ids = []
-    files_processed = 0
-
-    for root, dirs, files in os.walk(target_dir):
-        for file in files:
-            if file.endswith(".md"):
-                path = os.path.join(root, file)
-                print(f"Processing {path}")
-                chunks, chunk_ids = process_file(path, chunker)
-                if chunks:
-                    files_processed += 1
-                all_chunks.extend(chunks)
-                all_chunk_ids.extend(chunk_ids)
-
-    # Embed and index
-    if all_chunks:
-        print(f"Embedding {len(all_chunks)} chunks...")
-        embeddings = embedding_service.encode(all_chunks)
-        index_manager.add(embeddings, np.array(all_chunk_ids))
-        index_manager.save()
-
-    print(f"Indexed {len(all_chunks)} chunks from {files_processed} files")
-    print(f"Total vectors in index: {index_manager.total_vectors}")
+    pipeline = IngestPipeline(
+        MarkdownChunker(),
+        EmbeddingService(),
+        FAISSIndexManager(),
+        batch_size=batch_size,
+    )
+    pipeline.run(target_dir)
+
+    print(f"Indexed {pipeline.chunks_indexed} chunks from {pipeline.files_processed} files")
+    print(f"Total vectors in index: {pipeline.index_manager.total_vectors}")
+
+    cache = pipeline.embedding_service.cache
+    if cache is not None:
+        print(f"Embedding cache: {cache.hits} reused, {cache.misses} embedded")
 
 
 if __name__ == "__main__":
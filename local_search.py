@@ -2,29 +2,37 @@
 Local-only RAG search system (no external APIs)
 Uses FAISS for vector similarity search and SQLite for metadata retrieval.
 Returns raw context chunks that can be used directly in VS Code or other tools.
+
+Search modes: "vector" (embeddings), "keyword" (SQLite FTS5 / BM25, no
+embedding model needed) and "hybrid" (both, fused by reciprocal rank).
+
+Queries go to the resident search server (search_server.py) when one is
+running, which answers in milliseconds. Without it the model and index are
+loaded in-process for this one search.
 """
 
-import faiss
-import numpy as np
-import sqlite3
 import sys
 import os
-from sentence_transformers import SentenceTransformer
-import database
+
+from search_client import query_server
 
 
-def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
+def search_hits(query: str, top_k: int = 10, mode: str = "vector"):
     """
-    Search the local knowledge base without external API calls.
+    Run a search, preferring the resident search server.
 
     Args:
         query: The search query
-        top_k: Number of results to return (default 10)
-        output_format: "markdown", "json", or "text"
+        top_k: Number of results to return
+        mode: "vector", "keyword" or "hybrid"
 
     Returns:
-        Formatted search results with source attribution
+        Result dicts (chunk_id, source, section, content, score), best first
     """
+    hits = query_server(query, top_k, mode)
+    if hits is not None:
+        return hits
+
     # Check for required files
     if not os.path.exists("index.faiss"):
         print("ERROR: index.faiss not found. Run: python ingest.py")
@@ -34,35 +42,41 @@ def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
         print("ERROR: metadata.sqlite not found. Run: python ingest.py")
         sys.exit(1)
 
-    # Load models and indexes
+    # The embedding model loads on the first vector/hybrid search (slow;
+    # start search_server.py to keep it warm)
     try:
-        print(f"Loading FAISS index and embedding model...", file=sys.stderr)
-        index = faiss.read_index("index.faiss")
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        print(f"Model loaded. Searching for: '{query}'", file=sys.stderr)
+        print("No search server running; loading FAISS index...", file=sys.stderr)
+        from search_server import SearchEngine
+        engine = SearchEngine()
+        print(f"Searching ({mode}) for: '{query}'", file=sys.stderr)
+        return engine.search(query, top_k, mode)
     except Exception as e:
         print(f"ERROR loading models/index: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Embed query
-    query_vector = model.encode([query])
-    faiss.normalize_L2(query_vector.astype(np.float32))
 
-    # Search FAISS
-    D, I = index.search(query_vector.astype(np.float32), top_k)
-    chunk_ids = tuple(I[0])
+def search_local(query: str, top_k: int = 10, output_format: str = "markdown", mode: str = "vector"):
+    """
+    Search the local knowledge base without external API calls.
 
-    if not any(chunk_ids):
-        print("No results found.", file=sys.stderr)
-        return None
+    Args:
+        query: The search query
+        top_k: Number of results to return (default 10)
+        output_format: "markdown", "json", or "text"
+        mode: "vector", "keyword" or "hybrid"
 
-    # Get text and metadata from SQLite
-    results = database.get_chunks_by_ids(chunk_ids)
+    Returns:
+        Formatted search results with source attribution
+    """
+    hits = search_hits(query, top_k, mode)
 
-    if not results:
-        print("No chunks found in database.", file=sys.stderr)
+    if not hits:
+        print("No results found.", file=sys.stderr)
         return None
 
+    results = [(hit["content"], hit["source"], hit["section"]) for hit in hits]
+    scores = [hit["score"] for hit in hits]
+
     print(f"Found {len(results)} results", file=sys.stderr)
 
     # Format output based on requested format
@@ -75,7 +89,7 @@ def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
                 "source": path,
                 "section": headers,
                 "content": text,
-                "score": float(D[0][i])  # Distance score (lower = more similar)
+                "score": scores[i]  # Distance/BM25 (lower = better); RRF for hybrid (higher = better)
             })
         return json.dumps(output, indent=2)
 
@@ -85,7 +99,7 @@ def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
             output_lines.append(f"=== Result {i+1} ===")
             output_lines.append(f"Source: {path}")
             output_lines.append(f"Section: {headers}")
-            output_lines.append(f"Score: {D[0][i]:.4f}")
+            output_lines.append(f"Score: {scores[i]:.4f}")
             output_lines.append("")
             output_lines.append(text)
             output_lines.append("")
@@ -100,7 +114,10 @@ def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
             output_lines.append(f"## Result {i+1}\n")
             output_lines.append(f"**Source:** `{path}`  ")
             output_lines.append(f"**Section:** {headers}  ")
-            output_lines.append(f"**Similarity:** {1 - D[0][i]:.4f}  \n")  # Convert distance to similarity
+            if mode == "vector":
+                output_lines.append(f"**Similarity:** {1 - scores[i]:.4f}  \n")  # Convert distance to similarity
+            else:
+                output_lines.append(f"**Score ({mode}):** {scores[i]:.4f}  \n")
             output_lines.append("### Content\n")
             output_lines.append(f"{text}\n")
             output_lines.append("---\n")
@@ -111,18 +128,20 @@ def search_local(query: str, top_k: int = 10, output_format: str = "markdown"):
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python local_search.py <query> [--top-k N] [--format markdown|json|text]")
+        print("Usage: python local_search.py <query> [--top-k N] [--format markdown|json|text] [--mode vector|keyword|hybrid]")
         print("")
         print("Examples:")
         print("  python local_search.py 'qbittorrent settings'")
         print("  python local_search.py 'how to configure qbit' --top-k 5")
         print("  python local_search.py 'port forwarding' --format json")
+        print("  python local_search.py 'rule 2.3' --mode keyword")
         sys.exit(1)
 
     # Parse arguments
     args = sys.argv[1:]
     top_k = 10
     output_format = "markdown"
+    mode = "vector"
     query_parts = []
 
     i = 0
@@ -133,6 +152,9 @@ def main():
         elif args[i] == "--format" and i + 1 < len(args):
             output_format = args[i + 1]
             i += 2
+        elif args[i] == "--mode" and i + 1 < len(args):
+            mode = args[i + 1]
+            i += 2
         else:
             query_parts.append(args[i])
             i += 1
@@ -143,8 +165,12 @@ def main():
         print("ERROR: No query provided", file=sys.stderr)
         sys.exit(1)
 
+    if mode not in ("vector", "keyword", "hybrid"):
+        print(f"ERROR: Unknown mode '{mode}'", file=sys.stderr)
+        sys.exit(1)
+
     # Perform search
-    result = search_local(query, top_k=top_k, output_format=output_format)
+    result = search_local(query, top_k=top_k, output_format=output_format, mode=mode)
 
     if result:
         print(result)
@@ -0,0 +1,332 @@
+"""
+Shared ffprobe metadata for audio files.
+
+Every audio module needs some subset of the same facts about a file -
+duration, tags, codec/bitrate, chapters. Rather than each spawning its own
+ffprobe, they call probe_audio(), which runs one
+
+    ffprobe -show_format -show_streams -show_chapters
+
+per file and keeps the parsed result in a persistent SQLite cache keyed by
+(path, size, mtime). A file that is re-encoded, re-tagged or replaced gets a
+new size/mtime and is probed again on the next call.
+
+Usage:
+    from mamcrawler.audio_probe import probe_audio, ProbeError
+
+    probe = probe_audio("/path/to/book.m4b")
+    print(probe.duration, probe.tag("narrator"), len(probe.chapters))
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from mamcrawler.config import DEFAULT_OUTPUT_CONFIG
+from mamcrawler.storage import open_state_db
+
+logger = logging.getLogger(__name__)
+
+FFPROBE_TIMEOUT = 30
+
+# Parsed probes kept in memory in front of the SQLite cache
+MEMORY_CACHE_SIZE = 1024
+
+PROBE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, data TEXT NOT NULL
+);
+"""
+
+
+class ProbeError(Exception):
+    """ffprobe could not read the file (the message holds its stderr)."""
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class AudioStream:
+    """First audio stream of a file."""
+
+    codec: Optional[str]
+    bitrate: Optional[int]  # bits per second
+    sample_rate: Optional[int]
+    channels: Optional[int]
+    duration: Optional[float]
+
+    @classmethod
+    def from_ffprobe(cls, stream: Dict[str, Any]) -> "AudioStream":
+        return cls(
+            codec=stream.get('codec_name'),
+            bitrate=_int(stream.get('bit_rate')),
+            sample_rate=_int(stream.get('sample_rate')),
+            channels=_int(stream.get('channels')),
+            duration=_float(stream.get('duration')),
+        )
+
+
+@dataclass(frozen=True)
+class Chapter:
+    """A chapter marker embedded in the file."""
+
+    index: int  # ffprobe chapter id
+    title: str
+    start_time: float
+    end_time: float
+
+    @property
+    def duration(self) -> float:
+        return self.end_time - self.start_time
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """Parsed ffprobe output for one file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    duration: Optional[float]  # container duration in seconds
+    bitrate: Optional[int]  # container bitrate, bits per second
+    format_name: Optional[str]
+    tags: Dict[str, str] = field(default_factory=dict)
+    streams: List[Dict[str, Any]] = field(default_factory=list)
+    chapters: List[Chapter] = field(default_factory=list)
+
+    @classmethod
+    def from_ffprobe(cls, path: str, size: int, mtime_ns: int, data: Dict[str, Any]) -> "AudioProbe":
+        """Build a probe from ffprobe's JSON output."""
+        fmt = data.get('format', {})
+        chapters = [
+            Chapter(
+                index=chapter.get('id', i),
+                title=chapter.get('tags', {}).get('title', f'Chapter {i + 1}'),
+                start_time=_float(chapter.get('start_time')) or 0.0,
+                end_time=_float(chapter.get('end_time')) or 0.0,
+            )
+            for i, chapter in enumerate(data.get('chapters', []))
+        ]
+        return cls(
+            path=path,
+            size=size,
+            mtime_ns=mtime_ns,
+            duration=_float(fmt.get('duration')),
+            bitrate=_int(fmt.get('bit_rate')),
+            format_name=fmt.get('format_name'),
+            tags=dict(fmt.get('tags', {})),
+            streams=list(data.get('streams', [])),
+            chapters=chapters,
+        )
+
+    @property
+    def audio_stream(self) -> Optional[AudioStream]:
+        """The first audio stream, or None if the file has none."""
+        for stream in self.streams:
+            if stream.get('codec_type') == 'audio':
+                return AudioStream.from_ffprobe(stream)
+        return None
+
+    def tag(self, *names: str) -> Optional[str]:
+        """
+        First non-empty container tag among names.
+
+        Tried as given, so callers control precedence and case
+        (e.g. tag('narrator', 'artist', 'NARRATOR')).
+        """
+        for name in names:
+            value = self.tags.get(name)
+            if value:
+                return value
+        return None
+
+
+def run_ffprobe(path: str, timeout: int = FFPROBE_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run ffprobe once for format, streams and chapters.
+
+    Raises:
+        ProbeError: ffprobe failed or printed unparseable output
+        subprocess.TimeoutExpired: ffprobe took longer than timeout
+        FileNotFoundError: ffprobe is not installed
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        '-show_chapters',
+        str(path)
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise ProbeError(result.stderr.strip() or f"ffprobe exited with {result.returncode}")
+
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        raise ProbeError(f"Invalid ffprobe output: {e}") from e
+
+
+class ProbeCache:
+    """
+    Persistent cache of ffprobe results.
+
+    One row per path holding the size and mtime it was probed at; a lookup
+    whose stat differs is a miss and the row is replaced after re-probing.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file holding the cache (None = memory only)
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._memory: "OrderedDict[str, AudioProbe]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per path being probed, so concurrent callers share one ffprobe
+        self._probing: Dict[str, threading.Lock] = {}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Cache connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.path, PROBE_CACHE_SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> Tuple[str, int, int]:
+        """(absolute path, size, mtime_ns) of a file."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return path, stat.st_size, stat.st_mtime_ns
+
+    def get(self, path: Union[str, Path]) -> Optional[AudioProbe]:
+        """Cached probe of a file if it is unchanged since it was probed."""
+        key, size, mtime_ns = self._key(path)
+        with self._lock:
+            probe = self._memory.get(key)
+            if probe is not None and (probe.size, probe.mtime_ns) == (size, mtime_ns):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return probe
+
+            row = self.conn.execute(
+                "SELECT data FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (key, size, mtime_ns)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            probe = AudioProbe.from_ffprobe(key, size, mtime_ns, json.loads(row[0]))
+            self._remember(probe)
+            self.hits += 1
+            return probe
+
+    def probe(self, path: Union[str, Path], timeout: int = FFPROBE_TIMEOUT) -> AudioProbe:
+        """
+        Probe a file, running ffprobe only if it is not cached or has changed.
+
+        Raises:
+            FileNotFoundError: The file (or ffprobe) does not exist
+            ProbeError / subprocess.TimeoutExpired: see run_ffprobe()
+        """
+        probe = self.get(path)
+        if probe is not None:
+            return probe
+
+        key = os.path.abspath(path)
+        with self._lock:
+            path_lock = self._probing.setdefault(key, threading.Lock())
+        try:
+            with path_lock:
+                # Another thread may have probed it while we waited
+                probe = self.get(key)
+                if probe is not None:
+                    return probe
+
+                key, size, mtime_ns = self._key(key)
+                data = run_ffprobe(key, timeout)
+                probe = AudioProbe.from_ffprobe(key, size, mtime_ns, data)
+
+                with self._lock:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO probes (path, size, mtime_ns, data) VALUES (?, ?, ?, ?)",
+                        (key, size, mtime_ns, json.dumps(data))
+                    )
+                    self._remember(probe)
+                return probe
+        finally:
+            with self._lock:
+                self._probing.pop(key, None)
+
+    def invalidate(self, path: Union[str, Path]):
+        """Forget a file (e.g. after rewriting it within the same mtime tick)."""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._memory.pop(key, None)
+            self.conn.execute("DELETE FROM probes WHERE path = ?", (key,))
+
+    def _remember(self, probe: AudioProbe):
+        self._memory[probe.path] = probe
+        self._memory.move_to_end(probe.path)
+        while len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        """Close the cache connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Module-level singleton
+_cache = None
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the shared probe cache (stored at OutputConfig.probe_cache_file)."""
+    global _cache
+    if _cache is None:
+        _cache = ProbeCache(DEFAULT_OUTPUT_CONFIG.probe_cache_file)
+    return _cache
+
+
+def probe_audio(path: Union[str, Path], timeout: int = FFPROBE_TIMEOUT) -> AudioProbe:
+    """
+    Probe an audio file through the shared cache.
+
+    Raises:
+        FileNotFoundError: The file (or ffprobe) does not exist
+        ProbeError: ffprobe could not read the file
+        subprocess.TimeoutExpired: ffprobe took longer than timeout
+    """
+    return get_probe_cache().probe(path, timeout)
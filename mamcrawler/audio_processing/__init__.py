@@ -21,6 +21,7 @@ from mamcrawler.audio_processing.normalizer import AudioNormalizer, get_audio_no
 from mamcrawler.audio_processing.merger import AudioMerger, get_audio_merger
 from mamcrawler.audio_processing.chapter_handler import ChapterHandler, get_chapter_handler
 from mamcrawler.audio_processing.file_namer import FileNamer, get_file_namer
+from mamcrawler.audio_processing.encode_planner import EncodePlan, EncodePlanner
 from mamcrawler.audio_processing.processor_orchestrator import AudioProcessorOrchestrator, get_audio_processor_orchestrator
 
 __all__ = [
@@ -28,6 +29,8 @@ __all__ = [
     'AudioMerger',
     'ChapterHandler',
     'FileNamer',
+    'EncodePlan',
+    'EncodePlanner',
     'AudioProcessorOrchestrator',
     'get_audio_normalizer',
     'get_audio_merger',
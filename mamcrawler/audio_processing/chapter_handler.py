@@ -11,10 +11,11 @@ Features:
 
 import logging
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,47 +51,33 @@ class ChapterHandler:
             return None
 
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-print_format', 'json',
-                '-show_chapters',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.debug(f"ffprobe failed or no chapters found: {result.stderr}")
-                return []
-
-            data = json.loads(result.stdout)
-            chapters = data.get('chapters', [])
+            chapters = probe_audio(file_path).chapters
 
             if not chapters:
                 logger.debug(f"No chapters found in {file_path}")
                 return []
 
             # Extract relevant chapter info
-            chapter_list = []
-            for ch in chapters:
-                chapter_list.append({
-                    'index': ch.get('id', len(chapter_list)),
-                    'title': ch.get('tags', {}).get('title', f'Chapter {len(chapter_list) + 1}'),
-                    'start_time': float(ch.get('start_time', 0)),
-                    'end_time': float(ch.get('end_time', 0)),
-                    'duration': float(ch.get('end_time', 0)) - float(ch.get('start_time', 0))
-                })
+            chapter_list = [
+                {
+                    'index': ch.index,
+                    'title': ch.title,
+                    'start_time': ch.start_time,
+                    'end_time': ch.end_time,
+                    'duration': ch.duration
+                }
+                for ch in chapters
+            ]
 
             logger.info(f"Extracted {len(chapter_list)} chapters from {file_path}")
             return chapter_list
 
+        except ProbeError as e:
+            logger.debug(f"ffprobe failed or no chapters found: {e}")
+            return []
         except subprocess.TimeoutExpired:
             logger.error(f"ffprobe timeout for {audio_file}")
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error extracting chapters from {audio_file}: {e}")
             return None
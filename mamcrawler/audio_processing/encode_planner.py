@@ -0,0 +1,373 @@
+"""
+Encode Planner Module
+Plans a single ffmpeg pass that merges, normalizes, chapters and tags an audiobook.
+
+Running merge, normalization and chapter embedding as separate steps copies
+or re-encodes a 10-40 hour book three or four times. The planner instead
+builds one ffmpeg invocation:
+
+    concat demuxer (split parts)  ->  loudnorm (measured values)  ->  encoder
+    ffmetadata input              ->  global tags + chapter markers
+
+and leaves out whatever is a no-op: a single file is not concatenated, a book
+already at target loudness is stream-copied instead of re-encoded, and a file
+whose chapters and tags already match is not rewritten at all.
+
+Usage:
+    planner = EncodePlanner(normalizer)
+    analysis = normalizer.analyze_loudness(inputs)
+    plan = planner.plan(inputs, "/out/Book.m4b", metadata, analysis)
+    result = planner.execute(plan)
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from mamcrawler.audio_probe import probe_audio
+from mamcrawler.audio_processing.normalizer import AudioNormalizer, write_concat_file
+
+logger = logging.getLogger(__name__)
+
+# Codec that can be stream-copied into each output format
+COPY_CODECS = {'m4b': 'aac', 'mp3': 'mp3'}
+
+# A full-book encode; scaled for 40-hour audiobooks
+ENCODE_TIMEOUT = 4 * 3600
+
+
+def escape_ffmetadata(value: Any) -> str:
+    """Escape a value for an ;FFMETADATA1 file."""
+    text = str(value)
+    for char in ('\\', '=', ';', '#', '\n'):
+        text = text.replace(char, '\\' + char)
+    return text
+
+
+def metadata_tags(metadata: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Container tags for an audiobook's metadata dict.
+
+    Args:
+        metadata: Audiobook metadata (title, author, narrator, year ...)
+
+    Returns:
+        dict of ffmpeg tag name -> value, for the values that are present
+    """
+    title = metadata.get('title')
+    author = metadata.get('author')
+    year = metadata.get('releaseYear') or metadata.get('year')
+    tags = {
+        'title': title,
+        'album': title,
+        'artist': author,
+        'album_artist': author,
+        'composer': metadata.get('narrator'),
+        'date': str(year) if year else None,
+        'genre': 'Audiobook',
+    }
+    return {key: str(value) for key, value in tags.items() if value}
+
+
+@dataclass
+class EncodePlan:
+    """One ffmpeg pass producing a finished audiobook."""
+
+    inputs: List[str]
+    output_path: str
+    output_format: str = 'm4b'
+    audio_filter: Optional[str] = None  # loudnorm second pass, None = no normalization
+    reencode: bool = False
+    chapters: List[Dict[str, Any]] = field(default_factory=list)
+    tags: Dict[str, str] = field(default_factory=dict)
+    steps: List[str] = field(default_factory=list)  # work this plan does
+    skipped: List[str] = field(default_factory=list)  # steps found to be no-ops
+
+    @property
+    def is_noop(self) -> bool:
+        """True when the single input already is the finished file."""
+        return not self.steps
+
+    def ffmetadata(self) -> str:
+        """Global tags and chapter markers as an ;FFMETADATA1 document."""
+        lines = [';FFMETADATA1']
+        lines.extend(f'{key}={escape_ffmetadata(value)}' for key, value in self.tags.items())
+
+        for chapter in self.chapters:
+            lines.extend([
+                '',
+                '[CHAPTER]',
+                'TIMEBASE=1/1000',
+                f"START={int(round(chapter['start_time'] * 1000))}",
+                f"END={int(round(chapter['end_time'] * 1000))}",
+                f"title={escape_ffmetadata(chapter['title'])}",
+            ])
+
+        return '\n'.join(lines) + '\n'
+
+    def ffmpeg_command(
+        self,
+        output_file: str,
+        metadata_file: str,
+        concat_file: Optional[str] = None,
+        encoder_args: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Build the ffmpeg invocation.
+
+        Args:
+            output_file: File ffmpeg writes
+            metadata_file: ffmetadata() written to disk
+            concat_file: Concat list for multiple inputs
+            encoder_args: Encoder arguments used when re-encoding
+
+        Returns:
+            list: ffmpeg argv
+        """
+        if len(self.inputs) > 1:
+            input_args = ['-f', 'concat', '-safe', '0', '-i', str(concat_file)]
+        else:
+            input_args = ['-i', str(self.inputs[0])]
+
+        cmd = [
+            'ffmpeg',
+            '-hide_banner',
+            *input_args,
+            '-f', 'ffmetadata', '-i', str(metadata_file),
+            '-map', '0:a:0',
+            '-map_metadata', '1',
+            '-map_chapters', '1',
+        ]
+
+        if self.audio_filter:
+            cmd.extend(['-af', self.audio_filter])
+        if self.reencode:
+            cmd.extend(encoder_args or [])
+        else:
+            cmd.extend(['-c:a', 'copy'])
+
+        if self.output_format == 'm4b':
+            cmd.extend(['-f', 'ipod', '-movflags', '+faststart'])
+        else:
+            cmd.extend(['-f', 'mp3'])
+
+        cmd.extend(['-y', str(output_file)])
+        return cmd
+
+
+class EncodePlanner:
+    """Plans and runs single-pass audiobook encodes"""
+
+    def __init__(self, normalizer: AudioNormalizer):
+        """
+        Initialize encode planner.
+
+        Args:
+            normalizer: Provides target loudness, loudnorm filter and encoder settings
+        """
+        self.normalizer = normalizer
+
+    def plan(
+        self,
+        inputs: List[str],
+        output_path: str,
+        metadata: Dict[str, Any],
+        analysis: Optional[Dict[str, Any]] = None
+    ) -> EncodePlan:
+        """
+        Plan the encode for an audiobook.
+
+        Args:
+            inputs: Audio files in playback order (one, or split parts)
+            output_path: Final output path
+            metadata: Audiobook metadata for tags
+            analysis: analyze_loudness() result for the inputs (None skips
+                normalization)
+
+        Returns:
+            EncodePlan
+        """
+        probes = [probe_audio(path) for path in inputs]
+        plan = EncodePlan(
+            inputs=list(inputs),
+            output_path=str(output_path),
+            output_format=self.normalizer.output_format
+        )
+
+        if len(inputs) > 1:
+            plan.steps.append('merge')
+        else:
+            plan.skipped.append('merge')
+
+        if analysis and analysis.get('valid') and self.normalizer.needs_normalization(analysis):
+            plan.audio_filter = self.normalizer.loudnorm_filter(analysis)
+            plan.steps.append('normalize')
+        else:
+            plan.skipped.append('normalize')
+
+        # Stream copy is only possible without a filter and with one codec the container takes
+        codecs = {probe.audio_stream.codec if probe.audio_stream else None for probe in probes}
+        plan.reencode = bool(plan.audio_filter) or codecs != {COPY_CODECS[plan.output_format]}
+        if plan.reencode and 'normalize' not in plan.steps:
+            plan.steps.append('transcode')
+
+        plan.chapters = self._plan_chapters(probes)
+        source_chapters = [
+            (round(ch.start_time, 3), round(ch.end_time, 3), ch.title) for ch in probes[0].chapters
+        ]
+        planned_chapters = [
+            (round(ch['start_time'], 3), round(ch['end_time'], 3), ch['title']) for ch in plan.chapters
+        ]
+        if len(inputs) > 1 or planned_chapters != source_chapters:
+            plan.steps.append('chapters')
+        else:
+            plan.skipped.append('chapters')
+
+        # Keep the source's other tags; metadata wins where both are set
+        desired = metadata_tags(metadata)
+        plan.tags = {**probes[0].tags, **desired}
+        if any(probes[0].tags.get(key) != value for key, value in desired.items()):
+            plan.steps.append('tags')
+        else:
+            plan.skipped.append('tags')
+
+        # A single file that needed nothing is not rewritten
+        if plan.steps:
+            plan.steps.append('encode' if plan.reencode else 'remux')
+
+        logger.info(
+            f"Encode plan for {Path(output_path).name}: steps={plan.steps}, skipped={plan.skipped}"
+        )
+        return plan
+
+    def _plan_chapters(self, probes: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Chapter markers for the output.
+
+        Each input keeps its own chapters, shifted by the length of the parts
+        before it; an input without chapters becomes one "Part N" chapter.
+        """
+        chapters = []
+        offset = 0.0
+
+        for part_num, probe in enumerate(probes, start=1):
+            duration = probe.duration or 0.0
+            if probe.chapters:
+                for ch in probe.chapters:
+                    chapters.append({
+                        'title': ch.title,
+                        'start_time': offset + ch.start_time,
+                        'end_time': offset + ch.end_time,
+                    })
+            elif len(probes) > 1:
+                chapters.append({
+                    'title': f'Part {part_num}',
+                    'start_time': offset,
+                    'end_time': offset + duration,
+                })
+            offset += duration
+
+        for index, chapter in enumerate(chapters):
+            chapter['index'] = index
+            chapter['duration'] = chapter['end_time'] - chapter['start_time']
+        return chapters
+
+    def execute(self, plan: EncodePlan) -> Dict[str, Any]:
+        """
+        Run a plan, writing plan.output_path.
+
+        The encode goes to a hidden file beside the output and is renamed
+        into place, so a failed or interrupted run never leaves a partial
+        audiobook at the final path.
+
+        Args:
+            plan: Plan from plan()
+
+        Returns:
+            dict: {
+                'success': bool,
+                'output_file': str,
+                'steps': list,
+                'details': str
+            }
+        """
+        output_file = Path(plan.output_path)
+
+        if plan.is_noop:
+            # Hard link where possible: no data is copied for a finished source
+            try:
+                os.link(plan.inputs[0], output_file)
+            except OSError:
+                shutil.copy2(plan.inputs[0], output_file)
+            return {
+                'success': True,
+                'output_file': str(output_file),
+                'steps': [],
+                'details': 'Source already finished, copied as is'
+            }
+
+        partial_file = output_file.parent / f".{output_file.stem}.partial{output_file.suffix}"
+        metadata_fd, metadata_file = tempfile.mkstemp(prefix='.ffmetadata_', suffix='.txt', dir=output_file.parent)
+        concat_file = None
+
+        try:
+            with open(metadata_fd, 'w', encoding='utf-8') as f:
+                f.write(plan.ffmetadata())
+            if len(plan.inputs) > 1:
+                concat_file = write_concat_file(plan.inputs, str(output_file.parent))
+
+            cmd = plan.ffmpeg_command(
+                str(partial_file),
+                metadata_file,
+                str(concat_file) if concat_file else None,
+                self.normalizer.encoder_args()
+            )
+
+            logger.info(f"Encoding {output_file.name} ({', '.join(plan.steps)})...")
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=ENCODE_TIMEOUT)
+
+            if result.returncode != 0:
+                logger.error(f"ffmpeg encode failed: {result.stderr}")
+                return {
+                    'success': False,
+                    'output_file': str(output_file),
+                    'steps': [],
+                    'details': f'ffmpeg error: {result.stderr[:200]}'
+                }
+
+            os.replace(partial_file, output_file)
+            logger.info(f"Successfully encoded {output_file.name}")
+
+            return {
+                'success': True,
+                'output_file': str(output_file),
+                'steps': list(plan.steps),
+                'details': f"Single pass: {', '.join(plan.steps)}"
+            }
+
+        except subprocess.TimeoutExpired:
+            logger.error(f"ffmpeg encode timeout for {output_file}")
+            return {
+                'success': False,
+                'output_file': str(output_file),
+                'steps': [],
+                'details': 'Encode process timeout'
+            }
+        except Exception as e:
+            logger.error(f"Error encoding {output_file}: {e}")
+            return {
+                'success': False,
+                'output_file': str(output_file),
+                'steps': [],
+                'details': f'Exception: {str(e)}'
+            }
+        finally:
+            for path in (Path(metadata_file), concat_file, partial_file):
+                if path is not None and path.exists():
+                    path.unlink()
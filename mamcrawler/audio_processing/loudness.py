@@ -0,0 +1,259 @@
+"""
+Loudness Measurement Module
+Segment-parallel EBU R128 loudness measurement for long audiobooks.
+
+A single loudnorm pass decodes a book on one core. Here the timeline is cut
+into segments that separate ffmpeg processes measure at the same time with
+the ebur128 filter, which logs the momentary (400 ms) and short-term (3 s)
+loudness every 100 ms. Integrated loudness and loudness range are then
+computed over the blocks of all segments together, with the absolute and
+relative gates of ITU-R BS.1770 / EBU Tech 3342, so the result matches a
+single pass over the whole file instead of averaging per-segment figures.
+
+Each segment is decoded from 3 s before its start, so its first short-term
+and momentary blocks see the same audio a single pass would; only the
+blocks ending inside the segment are kept.
+"""
+
+import logging
+import math
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# BS.1770 gates (LUFS / LU)
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+LRA_RELATIVE_GATE = -20.0
+LRA_LOW_PERCENTILE = 0.10
+LRA_HIGH_PERCENTILE = 0.95
+
+# ebur128 logs one block every 100 ms
+BLOCK_STEP = 0.1
+
+# Audio decoded before each segment so its 3 s short-term window is full
+PREROLL = 3.0
+
+_FRAME_RE = re.compile(r't:\s*([\d.]+).*?\bM:\s*(-?inf|nan|-?[\d.]+)\s+S:\s*(-?inf|nan|-?[\d.]+)')
+_PEAK_RE = re.compile(r'Peak:\s*(-?inf|-?[\d.]+)\s*dBFS')
+
+
+def _energy(loudness: float) -> float:
+    return 10 ** ((loudness + 0.691) / 10)
+
+
+def _loudness(energy: float) -> float:
+    return -0.691 + 10 * math.log10(energy)
+
+
+def _mean_loudness(blocks: List[float]) -> float:
+    return _loudness(sum(_energy(block) for block in blocks) / len(blocks))
+
+
+def gated_loudness(momentary: List[float]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Integrated loudness of 400 ms block loudness values.
+
+    Returns:
+        tuple: (integrated loudness LUFS, relative gate threshold LUFS);
+        (None, None) if every block is below the absolute gate
+    """
+    blocks = [block for block in momentary if block > ABSOLUTE_GATE]
+    if not blocks:
+        return None, None
+
+    threshold = _mean_loudness(blocks) + RELATIVE_GATE
+    gated = [block for block in blocks if block > threshold]
+    return _mean_loudness(gated), threshold
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of sorted values."""
+    position = (len(values) - 1) * fraction
+    low = math.floor(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def loudness_range(short_term: List[float]) -> float:
+    """Loudness range (LU) of 3 s short-term loudness values (EBU Tech 3342)."""
+    blocks = [block for block in short_term if block > ABSOLUTE_GATE]
+    if not blocks:
+        return 0.0
+
+    threshold = _mean_loudness(blocks) + LRA_RELATIVE_GATE
+    gated = sorted(block for block in blocks if block > threshold)
+    return _percentile(gated, LRA_HIGH_PERCENTILE) - _percentile(gated, LRA_LOW_PERCENTILE)
+
+
+@dataclass
+class SegmentLoudness:
+    """Blocks measured for one segment of the timeline."""
+
+    start: float
+    momentary: List[float] = field(default_factory=list)
+    short_term: List[float] = field(default_factory=list)
+    true_peak: Optional[float] = None
+
+
+def parse_ebur128_log(
+    stderr: str,
+    start: float = 0.0,
+    preroll: float = 0.0,
+    length: Optional[float] = None
+) -> SegmentLoudness:
+    """
+    Parse ebur128 framelog output for one segment.
+
+    Args:
+        stderr: ffmpeg output of ebur128 with framelog=info and peak=true
+        start: Segment start on the book's timeline
+        preroll: Seconds decoded before start (blocks ending there are dropped)
+        length: Segment length (None = to the end)
+
+    Returns:
+        SegmentLoudness with the blocks ending inside the segment
+    """
+    segment = SegmentLoudness(start=start)
+    # Half a step of slack absorbs the rounding of logged timestamps
+    first = preroll + BLOCK_STEP / 2
+    last = preroll + length + BLOCK_STEP / 2 if length is not None else math.inf
+
+    for match in _FRAME_RE.finditer(stderr):
+        t = float(match.group(1))
+        if not first < t <= last:
+            continue
+        momentary, short_term = float(match.group(2)), float(match.group(3))
+        if not math.isnan(momentary):
+            segment.momentary.append(momentary)
+        if not math.isnan(short_term):
+            segment.short_term.append(short_term)
+
+    peaks = _PEAK_RE.findall(stderr)
+    if peaks:
+        segment.true_peak = float(peaks[-1])
+    return segment
+
+
+def combine_segments(segments: List[SegmentLoudness]) -> Dict[str, Optional[float]]:
+    """
+    Combine segment measurements into whole-book loudness statistics.
+
+    Gating is applied across the blocks of all segments, as a single pass
+    over the whole timeline would.
+
+    Returns:
+        dict: {
+            'integrated_loudness': float (LUFS),
+            'loudness_range': float (LU),
+            'true_peak': float (dBFS),
+            'threshold': float (LUFS)
+        }
+    """
+    momentary = [block for segment in segments for block in segment.momentary]
+    short_term = [block for segment in segments for block in segment.short_term]
+    peaks = [segment.true_peak for segment in segments if segment.true_peak is not None]
+
+    integrated, threshold = gated_loudness(momentary)
+    return {
+        'integrated_loudness': integrated,
+        'loudness_range': loudness_range(short_term) if integrated is not None else None,
+        'true_peak': max(peaks) if peaks else None,
+        'threshold': threshold,
+    }
+
+
+def split_timeline(duration: float, segments: int) -> List[Tuple[float, Optional[float]]]:
+    """
+    Cut a timeline into segments aligned to the 100 ms block grid.
+
+    Returns:
+        list of (start, length) pairs; the last length is None (to the end)
+    """
+    step = max(BLOCK_STEP, round(duration / segments / BLOCK_STEP) * BLOCK_STEP)
+    starts = [round(i * step, 1) for i in range(segments) if i * step < duration]
+    return [
+        (start, round(starts[i + 1] - start, 1) if i + 1 < len(starts) else None)
+        for i, start in enumerate(starts)
+    ]
+
+
+def measure_segment(
+    input_args: List[str],
+    start: float,
+    length: Optional[float],
+    timeout: float
+) -> SegmentLoudness:
+    """
+    Measure one segment with ffmpeg's ebur128 filter.
+
+    Args:
+        input_args: ffmpeg input arguments ('-i', path or a concat list)
+        start: Segment start (seconds)
+        length: Segment length (None = to the end)
+        timeout: Seconds before ffmpeg is killed
+
+    Raises:
+        subprocess.TimeoutExpired: The segment took longer than timeout
+        subprocess.CalledProcessError: ffmpeg failed; its partial log would
+            only cover part of the segment
+    """
+    preroll = min(PREROLL, start)
+    cmd = ['ffmpeg', '-hide_banner', '-nostats']
+    if start:
+        cmd.extend(['-ss', f'{start - preroll:.3f}'])
+    cmd.extend(input_args)
+    if length is not None:
+        cmd.extend(['-t', f'{length + preroll:.3f}'])
+    cmd.extend([
+        '-map', '0:a:0',
+        '-af', 'ebur128=peak=true:framelog=info',
+        '-f', 'null',
+        '-'
+    ])
+
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        logger.warning(f"ebur128 measurement failed for segment at {start:.1f}s: {result.stderr[-200:]}")
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+    return parse_ebur128_log(result.stderr, start, preroll, length)
+
+
+def measure_loudness_parallel(
+    input_args: List[str],
+    duration: float,
+    segments: int,
+    timeout: float
+) -> Dict[str, Any]:
+    """
+    Measure loudness with the timeline split over parallel ffmpeg processes.
+
+    Args:
+        input_args: ffmpeg input arguments
+        duration: Total length in seconds
+        segments: Number of segments (and processes)
+        timeout: Per-segment timeout
+
+    Returns:
+        dict: combine_segments() result plus 'segments' (count measured)
+
+    Raises:
+        subprocess.TimeoutExpired: A segment took longer than timeout
+        subprocess.CalledProcessError: A segment could not be measured
+    """
+    timeline = split_timeline(duration, segments)
+
+    # Threads only wait on the ffmpeg processes doing the work
+    with ThreadPoolExecutor(max_workers=len(timeline)) as executor:
+        measured = list(executor.map(
+            lambda segment: measure_segment(input_args, segment[0], segment[1], timeout),
+            timeline
+        ))
+
+    stats = combine_segments(measured)
+    stats['segments'] = len(measured)
+    return stats
@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import os
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -216,21 +218,11 @@ class AudioMerger:
 
         for file_path in file_list:
             try:
-                cmd = [
-                    'ffprobe',
-                    '-v', 'error',
-                    '-show_entries', 'format=duration',
-                    '-of', 'default=noprint_wrappers=1:nokey=1:noescapestrings=1',
-                    str(file_path)
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                try:
-                    duration = float(result.stdout.strip())
-                    total_duration += duration
-                except ValueError:
+                duration = probe_audio(file_path).duration
+                if duration is None:
                     logger.warning(f"Could not parse duration for {file_path}")
+                else:
+                    total_duration += duration
 
             except Exception as e:
                 logger.warning(f"Error getting duration for {file_path}: {e}")
@@ -257,32 +249,21 @@ class AudioMerger:
         try:
             for file_num, file_path in enumerate(file_list):
                 # Get file duration
-                cmd = [
-                    'ffprobe',
-                    '-v', 'error',
-                    '-show_entries', 'format=duration',
-                    '-of', 'default=noprint_wrappers=1:nokey=1:noescapestrings=1',
-                    str(file_path)
-                ]
-
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                try:
-                    duration = float(result.stdout.strip())
-
-                    # Create chapter marker at file boundary
-                    chapters.append({
-                        'index': file_num + 1,
-                        'title': f'Part {file_num + 1}',
-                        'start_time': cumulative_time,
-                        'end_time': cumulative_time + duration,
-                        'duration': duration
-                    })
+                duration = probe_audio(file_path).duration
+                if duration is None:
+                    logger.warning(f"Could not parse duration for {file_path}")
+                    continue
 
-                    cumulative_time += duration
+                # Create chapter marker at file boundary
+                chapters.append({
+                    'index': file_num + 1,
+                    'title': f'Part {file_num + 1}',
+                    'start_time': cumulative_time,
+                    'end_time': cumulative_time + duration,
+                    'duration': duration
+                })
 
-                except ValueError:
-                    logger.warning(f"Could not parse duration for {file_path}")
+                cumulative_time += duration
 
             logger.info(f"Preserved {len(chapters)} chapter boundaries from split files")
 
@@ -362,18 +343,9 @@ class AudioMerger:
     def _get_file_duration(self, file_path: str) -> float:
         """Get duration of audio file in seconds"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1:noescapestrings=1',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            return float(result.stdout.strip())
-
-        except (ValueError, subprocess.TimeoutExpired):
+            return probe_audio(file_path).duration or 0.0
+
+        except (ProbeError, subprocess.TimeoutExpired):
             return 0.0
 
 
@@ -3,20 +3,97 @@ Audio Normalization Module
 Standardizes loudness levels across diverse audio sources using ffmpeg's loudnorm filter.
 
 Features:
-- LUFS analysis (Loudness Units relative to Full Scale)
+- LUFS analysis (Loudness Units relative to Full Scale), segment-parallel for long books
 - Loudness normalization to target level (-16 LUFS default for audiobooks)
 - Dynamic range preservation
 - Support for m4b and mp3 output formats
 """
 
 import logging
+import os
 import subprocess
 import json
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List, Union
+
+from mamcrawler.audio_probe import probe_audio, ProbeError
+from mamcrawler.audio_processing.loudness import measure_loudness_parallel
 
 logger = logging.getLogger(__name__)
 
+# loudnorm targets besides integrated loudness
+TRUE_PEAK = -1.5
+LOUDNESS_RANGE = 11
+
+# Books within this many LU of target are left alone
+TARGET_TOLERANCE = 0.5
+
+OUTPUT_BITRATE = '128k'
+
+# A loudness pass decodes the whole book (or segment); 40-hour books need a while
+ANALYSIS_TIMEOUT = 3600
+
+# Books at least this long are measured in parallel segments ...
+PARALLEL_MIN_DURATION = 1800.0
+
+# ... of at least this many seconds each, one per core
+MIN_SEGMENT_SECONDS = 300.0
+
+
+def analysis_segments(duration: Optional[float]) -> int:
+    """Number of parallel segments to measure a book of duration seconds in."""
+    if not duration or duration < PARALLEL_MIN_DURATION:
+        return 1
+    return max(1, min(os.cpu_count() or 1, int(duration // MIN_SEGMENT_SECONDS)))
+
+
+def write_concat_file(audio_files: List[str], directory: Optional[str] = None) -> Path:
+    """
+    Write an ffmpeg concat demuxer list for audio_files.
+
+    Args:
+        audio_files: Files in playback order
+        directory: Where to put the list (default: system temp dir)
+
+    Returns:
+        Path of the list file; the caller deletes it
+    """
+    fd, path = tempfile.mkstemp(prefix='.concat_', suffix='.txt', dir=directory)
+    with open(fd, 'w', encoding='utf-8') as f:
+        for file_path in audio_files:
+            # Absolute paths, single quotes escaped for the concat demuxer
+            escaped_path = str(Path(file_path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped_path}'\n")
+    return Path(path)
+
+
+def parse_loudnorm_json(stderr: str) -> Dict[str, Optional[float]]:
+    """
+    Parse the JSON block loudnorm prints with print_format=json.
+
+    Returns:
+        dict of loudnorm keys (input_i, input_tp, input_lra, input_thresh,
+        target_offset, ...) to floats; empty if no block was found
+    """
+    start = stderr.rfind('{')
+    end = stderr.rfind('}')
+    if start == -1 or end < start:
+        return {}
+
+    try:
+        data = json.loads(stderr[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+
+    values = {}
+    for key, value in data.items():
+        try:
+            values[key] = float(value)
+        except (TypeError, ValueError):
+            values[key] = None
+    return values
+
 
 class AudioNormalizer:
     """Handles audio loudness normalization with LUFS analysis and adjustment"""
@@ -36,113 +113,90 @@ class AudioNormalizer:
         if output_format not in self.supported_formats:
             raise ValueError(f"Output format must be one of {self.supported_formats}")
 
-    def analyze_loudness(self, audio_file: str) -> Optional[Dict[str, Any]]:
+    def analyze_loudness(
+        self,
+        audio_file: Union[str, List[str]],
+        segments: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Analyze loudness of audio file using ffprobe and loudnorm filter.
+        Analyze loudness of audio file using ffmpeg.
+
+        Books of PARALLEL_MIN_DURATION or longer are cut into segments that
+        are measured by parallel ffmpeg processes (see loudness.py); shorter
+        ones get a single loudnorm pass.
 
         Args:
-            audio_file: Path to audio file
+            audio_file: Path to audio file, or the ordered parts of a split
+                audiobook (measured as one stream, without merging them first)
+            segments: Number of parallel segments (default: automatic;
+                1 forces a single pass)
 
         Returns:
             dict: {
                 'integrated_loudness': float (LUFS),
                 'loudness_range': float (LU),
                 'true_peak': float (dBFS),
+                'threshold': float (LUFS),
+                'target_offset': float (LU, single pass only),
                 'duration': float (seconds),
+                'segments': int,
                 'valid': bool
             }
             Returns None if analysis fails
         """
-        audio_path = Path(audio_file)
+        audio_files = [audio_file] if isinstance(audio_file, (str, Path)) else list(audio_file)
 
-        if not audio_path.exists():
-            logger.error(f"Audio file not found: {audio_file}")
-            return None
+        for path in audio_files:
+            if not Path(path).exists():
+                logger.error(f"Audio file not found: {path}")
+                return None
 
+        concat_file = None
         try:
-            # Use ffmpeg loudnorm filter to analyze loudness
-            cmd = [
-                'ffmpeg',
-                '-i', str(audio_path),
-                '-af', 'loudnorm=I=-16:TP=-1.5:LRA=11:print_format=json',
-                '-f', 'null',
-                '-'
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            # Extract loudnorm output from stderr
-            output = result.stderr
+            if len(audio_files) == 1:
+                input_args = ['-i', str(audio_files[0])]
+            else:
+                concat_file = write_concat_file(audio_files)
+                input_args = ['-f', 'concat', '-safe', '0', '-i', str(concat_file)]
+
+            # Duration comes from the shared ffprobe cache
+            duration = None
+            try:
+                duration = sum(probe_audio(path).duration or 0.0 for path in audio_files)
+            except (ProbeError, subprocess.TimeoutExpired) as e:
+                logger.debug(f"Could not probe duration: {e}")
+
+            if segments is None:
+                segments = analysis_segments(duration)
+
+            measured = None
+            if segments > 1 and duration:
+                try:
+                    measured = measure_loudness_parallel(input_args, duration, segments, ANALYSIS_TIMEOUT)
+                except subprocess.CalledProcessError:
+                    # A failed segment leaves only part of the book measured
+                    logger.warning("Segmented loudness analysis failed, falling back to a single pass")
+            if measured is None:
+                measured = self._measure_single_pass(input_args)
 
-            # Parse loudnorm JSON output if present
             loudness_stats = {
-                'integrated_loudness': None,
-                'loudness_range': None,
-                'true_peak': None,
-                'duration': None,
+                'integrated_loudness': measured.get('integrated_loudness'),
+                'loudness_range': measured.get('loudness_range'),
+                'true_peak': measured.get('true_peak'),
+                'threshold': measured.get('threshold'),
+                'target_offset': measured.get('target_offset'),
+                'duration': duration,
+                'segments': measured.get('segments', 1),
                 'valid': False
             }
 
-            # Extract individual values from loudnorm output
-            for line in output.split('\n'):
-                if 'Parsed_loudnorm' in line:
-                    if 'Integrated loudness' in line:
-                        try:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                value_str = parts[-1].strip().split()[0]
-                                loudness_stats['integrated_loudness'] = float(value_str)
-                        except (ValueError, IndexError):
-                            pass
-                    elif 'Loudness range' in line:
-                        try:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                value_str = parts[-1].strip().split()[0]
-                                loudness_stats['loudness_range'] = float(value_str)
-                        except (ValueError, IndexError):
-                            pass
-                    elif 'True peak' in line:
-                        try:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                value_str = parts[-1].strip().split()[0]
-                                loudness_stats['true_peak'] = float(value_str)
-                        except (ValueError, IndexError):
-                            pass
-
-            # Also get duration from ffprobe
-            duration_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1:noescapestrings=1',
-                str(audio_path)
-            ]
-
-            duration_result = subprocess.run(
-                duration_cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            try:
-                loudness_stats['duration'] = float(duration_result.stdout.strip())
-            except ValueError:
-                loudness_stats['duration'] = None
-
             # Mark as valid if we got at least integrated loudness
             loudness_stats['valid'] = loudness_stats['integrated_loudness'] is not None
 
             logger.info(
-                f"Loudness analysis for {audio_path.name}: "
-                f"{loudness_stats['integrated_loudness']} LUFS"
+                f"Loudness analysis for {Path(audio_files[0]).name}: "
+                f"{loudness_stats['integrated_loudness']} LUFS "
+                f"({loudness_stats['segments']} segment(s))"
             )
 
             return loudness_stats
@@ -153,6 +207,62 @@ class AudioNormalizer:
         except Exception as e:
             logger.error(f"Error analyzing loudness for {audio_file}: {e}")
             return None
+        finally:
+            if concat_file is not None and concat_file.exists():
+                concat_file.unlink()
+
+    def _measure_single_pass(self, input_args: List[str]) -> Dict[str, Optional[float]]:
+        """Measure with one loudnorm pass over the whole input."""
+        # Decode-only pass: loudnorm measures and prints JSON, nothing is written
+        cmd = [
+            'ffmpeg',
+            '-hide_banner',
+            *input_args,
+            '-map', '0:a:0',
+            '-af', f'loudnorm=I={self.target_lufs}:TP={TRUE_PEAK}:LRA={LOUDNESS_RANGE}:print_format=json',
+            '-f', 'null',
+            '-'
+        ]
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=ANALYSIS_TIMEOUT
+        )
+
+        measured = parse_loudnorm_json(result.stderr)
+        return {
+            'integrated_loudness': measured.get('input_i'),
+            'loudness_range': measured.get('input_lra'),
+            'true_peak': measured.get('input_tp'),
+            'threshold': measured.get('input_thresh'),
+            'target_offset': measured.get('target_offset'),
+        }
+
+    def needs_normalization(self, analysis: Dict[str, Any]) -> bool:
+        """Whether measured loudness is far enough from target to re-encode for."""
+        return abs(analysis['integrated_loudness'] - self.target_lufs) >= TARGET_TOLERANCE
+
+    def loudnorm_filter(self, analysis: Dict[str, Any]) -> str:
+        """
+        Second-pass loudnorm filter using measured values from analyze_loudness().
+
+        With all measurements supplied loudnorm can apply a linear gain
+        instead of dynamic compression.
+        """
+        parts = [
+            f"loudnorm=I={self.target_lufs}:TP={TRUE_PEAK}:LRA={LOUDNESS_RANGE}",
+            f"measured_I={analysis['integrated_loudness']}",
+            f"measured_LRA={analysis['loudness_range'] or 0}",
+            f"measured_TP={analysis['true_peak'] or 0}",
+        ]
+        if analysis.get('threshold') is not None:
+            parts.append(f"measured_thresh={analysis['threshold']}")
+        if analysis.get('target_offset') is not None:
+            parts.append(f"offset={analysis['target_offset']}")
+        parts.append("linear=true")
+        return ':'.join(parts)
 
     def normalize_to_target(
         self,
@@ -211,7 +321,7 @@ class AudioNormalizer:
             original_loudness = analysis['integrated_loudness']
 
             # If already at target, just copy file
-            if abs(original_loudness - self.target_lufs) < 0.5:
+            if not self.needs_normalization(analysis):
                 logger.info(
                     f"{input_file.name} already at target loudness "
                     f"({original_loudness} LUFS), skipping normalization"
@@ -227,18 +337,11 @@ class AudioNormalizer:
                 }
 
             # Build ffmpeg command with loudnorm filter
-            loudnorm_filter = (
-                f"loudnorm=I={self.target_lufs}:TP=-1.5:LRA=11:measured_I={original_loudness}:"
-                f"measured_LRA={analysis['loudness_range'] or 0}:"
-                f"measured_TP={analysis['true_peak'] or 0}"
-            )
-
             cmd = [
                 'ffmpeg',
                 '-i', str(input_file),
-                '-af', loudnorm_filter,
-                '-c:a', 'aac' if self.output_format == 'm4b' else 'libmp3lame',
-                '-b:a', '128k',
+                '-af', self.loudnorm_filter(analysis),
+                *self.encoder_args(),
                 '-y',
                 str(output_file)
             ]
@@ -294,6 +397,13 @@ class AudioNormalizer:
                 'details': f'Exception: {str(e)}'
             }
 
+    def encoder_args(self) -> List[str]:
+        """ffmpeg audio encoder arguments for the output format."""
+        return [
+            '-c:a', 'aac' if self.output_format == 'm4b' else 'libmp3lame',
+            '-b:a', OUTPUT_BITRATE,
+        ]
+
     def preserve_dynamic_range(self) -> Dict[str, str]:
         """
         Get ffmpeg filter string for dynamic range preservation.
@@ -3,10 +3,11 @@ Audio Processor Orchestrator Module
 Coordinates the complete audio processing pipeline with progress tracking and error handling.
 
 Pipeline:
-1. Normalize loudness (optional, if already normalized detected)
-2. Merge files (if split files detected)
-3. Extract and embed chapters
-4. Rename file according to standard convention
+1. Detect split files
+2. Measure loudness (one decode pass over all parts)
+3. Work out the standard file name
+4. Merge, normalize, write chapters and tags in one ffmpeg pass
+   (see encode_planner; no-op steps are skipped)
 
 All steps logged to operation logger with timestamps and status.
 """
@@ -14,12 +15,13 @@ All steps logged to operation logger with timestamps and status.
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 
 from mamcrawler.audio_processing.normalizer import get_audio_normalizer
 from mamcrawler.audio_processing.merger import get_audio_merger
 from mamcrawler.audio_processing.chapter_handler import get_chapter_handler
 from mamcrawler.audio_processing.file_namer import get_file_namer
+from mamcrawler.audio_processing.encode_planner import EncodePlanner
 from backend.logging.operation_logger import get_operation_logger
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,7 @@ class AudioProcessorOrchestrator:
         self.merger = get_audio_merger()
         self.chapter_handler = get_chapter_handler()
         self.file_namer = get_file_namer()
+        self.encode_planner = EncodePlanner(self.normalizer)
         self.operation_logger = get_operation_logger()
 
     def process_audiobook(
@@ -68,79 +71,37 @@ class AudioProcessorOrchestrator:
             }
         """
         start_time = time.time()
-        input_file = Path(input_path)
         title = metadata.get('title', 'Unknown')
         author = metadata.get('author', 'Unknown')
 
         steps_completed = []
         steps_failed = []
-        current_file = None
 
         try:
-            # Step 1: Handle multi-file merging
+            # Step 1: Collect input files (split parts are merged by the encode)
             self._log_step(title, author, "merge", "Starting merge detection...")
-            merge_result = self._process_merge(input_path)
+            inputs, error = self._collect_inputs(input_path)
 
-            if merge_result['processed']:
-                steps_completed.append('merge')
-                current_file = merge_result['output_file']
-                self._log_step(title, author, "merge", f"Merged {merge_result['merged_count']} files")
-            elif merge_result['error']:
+            if error:
                 steps_failed.append('merge')
-                self._log_step(title, author, "merge", f"Merge failed: {merge_result['error']}", False)
+                self._log_step(title, author, "merge", f"Merge failed: {error}", False)
                 return self._failed_processing(title, author, "Merge failed", steps_completed, steps_failed)
+
+            if len(inputs) > 1:
+                self._log_step(title, author, "merge", f"Found {len(inputs)} split files to merge")
             else:
-                # Single file, no merge needed
-                current_file = input_path
                 self._log_step(title, author, "merge", "Single file, no merge needed")
 
-            # Step 2: Normalize loudness
+            # Step 2: Measure loudness (decode only, across all parts, nothing written)
             self._log_step(title, author, "normalize", "Starting loudness analysis...")
-            norm_output = str(Path(current_file).parent / f".{Path(current_file).stem}_normalized.m4b")
-
-            norm_result = self.normalizer.normalize_to_target(current_file, norm_output)
+            analysis = self.normalizer.analyze_loudness(inputs)
 
-            if not norm_result['success']:
+            if not analysis or not analysis['valid']:
                 steps_failed.append('normalize')
-                self._log_step(title, author, "normalize", f"Normalization failed: {norm_result['details']}", False)
+                self._log_step(title, author, "normalize", "Normalization failed: Loudness analysis failed", False)
                 return self._failed_processing(title, author, "Normalization failed", steps_completed, steps_failed)
 
-            steps_completed.append('normalize')
-            current_file = norm_output
-            self._log_step(title, author, "normalize", f"Normalized to {self.normalizer.target_lufs} LUFS")
-
-            # Step 3: Extract chapters
-            self._log_step(title, author, "chapters", "Extracting chapter metadata...")
-            chapters = self.chapter_handler.extract_chapters(current_file)
-
-            if chapters is None:
-                chapters = []
-
-            if len(chapters) > 0:
-                # Create and embed chapters
-                chapters_file = str(Path(current_file).parent / f".{Path(current_file).stem}_chapters.txt")
-                self.chapter_handler.create_chapters_file(chapters, chapters_file)
-
-                # Embed chapters in output
-                chapters_output = str(Path(current_file).parent / f".{Path(current_file).stem}_with_chapters.m4b")
-                embed_result = self.chapter_handler.embed_chapters_in_m4b(
-                    current_file,
-                    chapters_file,
-                    chapters_output
-                )
-
-                if embed_result['success']:
-                    steps_completed.append('chapters')
-                    current_file = chapters_output
-                    self._log_step(title, author, "chapters", f"Embedded {embed_result['chapters_embedded']} chapters")
-                else:
-                    # Continue without chapters if embedding fails
-                    steps_failed.append('chapters')
-                    self._log_step(title, author, "chapters", f"Chapter embedding failed: {embed_result['details']}", False)
-            else:
-                self._log_step(title, author, "chapters", "No chapters found in source audio")
-
-            # Step 4: Rename and organize file
+            # Step 3: Work out the final path, so the encode is written there directly
             self._log_step(title, author, "rename", "Generating standardized filename...")
             naming_result = self.file_namer.generate_filename(
                 author=author,
@@ -173,16 +134,25 @@ class AudioProcessorOrchestrator:
                 self._log_step(title, author, "rename", "Could not resolve duplicate filename", False)
                 return self._failed_processing(title, author, "Duplicate resolution failed", steps_completed, steps_failed)
 
-            # Move/rename file to final location
-            import shutil
-            try:
-                shutil.move(current_file, final_path)
-                steps_completed.append('rename')
-                self._log_step(title, author, "rename", f"Renamed to: {Path(final_path).name}")
-            except Exception as e:
-                steps_failed.append('rename')
-                self._log_step(title, author, "rename", f"File move failed: {str(e)}", False)
-                return self._failed_processing(title, author, "File move failed", steps_completed, steps_failed)
+            # Step 4: One ffmpeg pass for merge, normalization, chapters and tags
+            plan = self.encode_planner.plan(inputs, final_path, metadata, analysis)
+            self._log_step(
+                title, author, "encode",
+                f"Planned {', '.join(plan.steps) or 'no changes'}"
+                + (f" (skipping {', '.join(plan.skipped)})" if plan.skipped else "")
+            )
+
+            encode_result = self.encode_planner.execute(plan)
+
+            if not encode_result['success']:
+                steps_failed.append('encode')
+                self._log_step(title, author, "encode", f"Encode failed: {encode_result['details']}", False)
+                return self._failed_processing(title, author, "Encode failed", steps_completed, steps_failed)
+
+            steps_completed.extend(encode_result['steps'])
+            steps_completed.append('rename')
+            self._log_step(title, author, "encode", encode_result['details'])
+            self._log_step(title, author, "rename", f"Renamed to: {Path(final_path).name}")
 
             # Calculate processing time
             duration = time.time() - start_time
@@ -221,57 +191,30 @@ class AudioProcessorOrchestrator:
                 steps_failed
             )
 
-    def _process_merge(self, input_path: str) -> Dict[str, Any]:
-        """Check for split files and merge if needed"""
+    def _collect_inputs(self, input_path: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Find the audio files making up an audiobook.
+
+        Returns:
+            tuple: (files in playback order, error message or None)
+        """
         input_file = Path(input_path)
 
+        # Single file
+        if not input_file.is_dir():
+            return [str(input_file)], None
+
         # If input is a directory, check for split files
-        if input_file.is_dir():
-            split_files = self.merger.detect_split_files(str(input_file))
-
-            if split_files and len(split_files) > 1:
-                output_path = input_file / "merged.m4b"
-                merge_result = self.merger.merge_files(split_files, str(output_path), self.output_format)
-
-                if merge_result['success']:
-                    return {
-                        'processed': True,
-                        'output_file': merge_result['output_file'],
-                        'merged_count': merge_result['merged_count'],
-                        'error': None
-                    }
-                else:
-                    return {
-                        'processed': False,
-                        'output_file': None,
-                        'merged_count': 0,
-                        'error': merge_result['details']
-                    }
-            else:
-                # No split files found, look for single audio file
-                audio_files = list(input_file.glob('*.m4b')) + list(input_file.glob('*.mp3'))
-                if audio_files:
-                    return {
-                        'processed': False,
-                        'output_file': None,
-                        'merged_count': 0,
-                        'error': None
-                    }
-                else:
-                    return {
-                        'processed': False,
-                        'output_file': None,
-                        'merged_count': 0,
-                        'error': 'No audio files found in directory'
-                    }
-        else:
-            # Single file
-            return {
-                'processed': False,
-                'output_file': None,
-                'merged_count': 0,
-                'error': None
-            }
+        split_files = self.merger.detect_split_files(str(input_file))
+        if split_files and len(split_files) > 1:
+            return split_files, None
+
+        # No split files found, look for single audio file
+        audio_files = sorted(input_file.glob('*.m4b')) + sorted(input_file.glob('*.mp3'))
+        if audio_files:
+            return [str(audio_files[0])], None
+
+        return [], 'No audio files found in directory'
 
     def _log_step(
         self,
@@ -7,6 +7,7 @@ import logging
 import asyncio
 from typing import List, Dict, Set, Optional
 from mamcrawler.goodreads import GoodreadsMetadata
+from mamcrawler.library_matcher import LibraryMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,8 @@ class AuthorSeriesCompletion:
     def __init__(self):
         self.goodreads = GoodreadsMetadata()
         self.wishlist = []
+        self._matcher: Optional[LibraryMatcher] = None
+        self._matcher_source: Optional[List[Dict]] = None
     
     async def gather_library_authors(self, abs_library: List[Dict]) -> Set[str]:
         """
@@ -90,10 +93,8 @@ class AuthorSeriesCompletion:
         logger.info(f"✓ Found {len(mam_books)} books by {author} on MAM")
         
         # Filter out books already in library
-        missing = []
-        for book in mam_books:
-            if not self._is_in_library(book, abs_library):
-                missing.append(book)
+        owned = self._library_matcher(abs_library).contains_many(mam_books)
+        missing = [book for book, is_owned in zip(mam_books, owned) if not is_owned]
         
         if missing:
             logger.info(f"📥 Missing {len(missing)} books by {author}:")
@@ -129,44 +130,21 @@ class AuthorSeriesCompletion:
             return []
         
         # Filter out books already in library
-        missing = []
-        for book in series_books:
-            if not self._is_in_library(book, abs_library):
-                missing.append(book)
+        owned = self._library_matcher(abs_library).contains_many(series_books)
+        missing = [book for book, is_owned in zip(series_books, owned) if not is_owned]
         
         if missing:
             logger.info(f"📥 Missing {len(missing)} books from {series_name}")
         
         return missing
     
-    def _is_in_library(self, book: Dict, library: List[Dict]) -> bool:
-        """Check if book is in library (fuzzy match)."""
-        book_title = book.get('title', '').lower()
-        book_author = book.get('author', '').lower()
-        
-        for lib_item in library:
-            lib_title = lib_item.get('title', '').lower()
-            lib_author = lib_item.get('author', '').lower()
-            
-            if self._fuzzy_match(book_title, lib_title) and book_author == lib_author:
-                return True
-        
-        return False
-    
-    def _fuzzy_match(self, str1: str, str2: str, threshold: float = 0.85) -> bool:
-        """Fuzzy string matching."""
-        # Remove subtitles
-        str1_base = str1.split(':')[0].split('(')[0].strip()
-        str2_base = str2.split(':')[0].split('(')[0].strip()
-        
-        if str1_base == str2_base:
-            return True
-        
-        try:
-            from fuzzywuzzy import fuzz
-            return fuzz.ratio(str1_base, str2_base) / 100.0 >= threshold
-        except ImportError:
-            return str1_base == str2_base
+    def _library_matcher(self, library: List[Dict]) -> LibraryMatcher:
+        """Get the index for a library, reusing it while the same list is passed."""
+        if (self._matcher is None or library is not self._matcher_source
+                or len(self._matcher) != len(library)):
+            self._matcher = LibraryMatcher(library)
+            self._matcher_source = library
+        return self._matcher
     
     async def build_wishlist(self,
                              abs_library: List[Dict],
@@ -4,7 +4,7 @@ Single source of truth for all constants and settings.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Shared user agents (kept up-to-date)
 USER_AGENTS = [
@@ -77,7 +77,22 @@ class RAGConfig:
     dimension: int = 384
     index_path: str = "index.faiss"
     db_path: str = "metadata.sqlite"
+    # Content-addressed embedding cache (None disables it)
+    embedding_cache_path: Optional[str] = "embedding_cache.sqlite"
     top_k: int = 5
+    # FAISS index type: "flat" (exact), "ivf_flat", "ivf_pq" or "hnsw"
+    index_type: str = "flat"
+    nlist: Optional[int] = None  # IVF lists (None = 4 * sqrt(n))
+    nprobe: int = 16  # IVF lists scanned per query
+    pq_m: int = 48  # IVF-PQ sub-quantizers (must divide dimension)
+    pq_nbits: int = 8
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+    train_min_vectors: int = 10000  # IVF is trained once this many vectors exist
+    # Resident search server (search_server.py)
+    search_host: str = "127.0.0.1"
+    search_port: int = 8765
     llm_model: str = "claude-haiku-4-5"
     max_tokens: int = 1500
     headers_to_split: List[Tuple[str, str]] = field(
@@ -93,6 +108,8 @@ class OutputConfig:
     forum_dir: str = "forum_qbittorrent_output"
     state_file: str = "crawler_state.json"
     log_file: str = "stealth_crawler.log"
+    # Persistent ffprobe results (mamcrawler.audio_probe; None = memory only)
+    probe_cache_file: Optional[str] = "ffprobe_cache.sqlite"
 
 
 # Default instances for easy import
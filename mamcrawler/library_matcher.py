@@ -0,0 +1,218 @@
+"""
+Library Matcher.
+Indexed fuzzy title/author lookup for "is this book already in the library?".
+
+The library is indexed once by normalized author; each author bucket keeps
+its normalized title keys plus a trigram index so a query is only scored
+against titles that could reach the similarity threshold. Scoring uses
+rapidfuzz (batched with process.cdist for many queries) and falls back to
+difflib when rapidfuzz is not installed.
+"""
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    Normalize a title into a match key.
+
+    Drops subtitles ("Title: Subtitle", "Title (Book 1)"), lowercases,
+    strips punctuation and collapses whitespace.
+    """
+    if not title:
+        return ''
+    base = title.lower().split(':')[0].split('(')[0]
+    base = _PUNCTUATION.sub(' ', base)
+    return _WHITESPACE.sub(' ', base).strip()
+
+
+def normalize_author(author: Optional[str]) -> str:
+    """Normalize an author name into a bucket key."""
+    if not author:
+        return ''
+    return _WHITESPACE.sub(' ', author.lower()).strip()
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Character trigrams of a key, padded so short keys still produce some."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _AuthorBucket:
+    """Title keys for one author plus a trigram index over them."""
+
+    __slots__ = ('keys', 'key_set', 'grams')
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.key_set: Set[str] = set()
+        self.grams: Dict[str, Set[int]] = defaultdict(set)
+
+    def add(self, key: str) -> None:
+        if key in self.key_set:
+            return
+        index = len(self.keys)
+        self.keys.append(key)
+        self.key_set.add(key)
+        for gram in _trigrams(key):
+            self.grams[gram].add(index)
+
+    def candidates(self, key: str, threshold: float, blocking_min: int) -> List[str]:
+        """
+        Title keys that can possibly score >= threshold against key.
+
+        Small buckets are returned whole. Larger ones are blocked on shared
+        trigrams and on length: ratio = 2*M / (len_a + len_b) can only reach
+        the threshold if the shorter key is at least threshold / (2 - threshold)
+        of the longer one.
+        """
+        if len(self.keys) <= blocking_min:
+            return self.keys
+
+        indices: Set[int] = set()
+        for gram in _trigrams(key):
+            indices.update(self.grams.get(gram, ()))
+
+        min_ratio = threshold / (2 - threshold)
+        length = len(key)
+        result = []
+        for index in indices:
+            candidate = self.keys[index]
+            shorter, longer = sorted((length, len(candidate)))
+            if longer == 0 or shorter / longer >= min_ratio:
+                result.append(candidate)
+        return result
+
+
+class LibraryMatcher:
+    """
+    Index of library books for fast membership checks.
+
+    Matches the previous linear scan: the normalized author must be equal and
+    the normalized titles must match exactly or score >= threshold with a
+    plain edit-distance ratio.
+
+    Usage:
+        matcher = LibraryMatcher(abs_library)
+        if not matcher.contains(book['title'], book['author']):
+            missing.append(book)
+    """
+
+    # Buckets this small are scored whole; blocking only pays off above it
+    BLOCKING_MIN = 32
+
+    def __init__(self, library: Iterable[Dict], threshold: float = 0.85):
+        """
+        Args:
+            library: Library items with 'title' and 'author' keys
+            threshold: Minimum title similarity (0-1) for a fuzzy match
+        """
+        self.threshold = threshold
+        self._buckets: Dict[str, _AuthorBucket] = {}
+        self._size = 0
+
+        for item in library:
+            self.add(item.get('title'), item.get('author'))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, title: Optional[str], author: Optional[str]) -> None:
+        """Add a book to the index."""
+        author_key = normalize_author(author)
+        bucket = self._buckets.get(author_key)
+        if bucket is None:
+            bucket = self._buckets[author_key] = _AuthorBucket()
+        bucket.add(normalize_title(title))
+        self._size += 1
+
+    def contains(self, title: Optional[str], author: Optional[str]) -> bool:
+        """Check if a book with this title and author is in the library."""
+        bucket = self._buckets.get(normalize_author(author))
+        if bucket is None:
+            return False
+
+        key = normalize_title(title)
+        if key in bucket.key_set:
+            return True
+
+        candidates = bucket.candidates(key, self.threshold, self.BLOCKING_MIN)
+        if not candidates:
+            return False
+        return self._best_score(key, candidates) >= self.threshold * 100
+
+    def contains_book(self, book: Dict) -> bool:
+        """contains() for a book metadata dict."""
+        return self.contains(book.get('title'), book.get('author'))
+
+    def contains_many(self, books: List[Dict]) -> List[bool]:
+        """
+        Membership for many books at once.
+
+        Queries are grouped by author and each group is scored against its
+        candidate titles in a single process.cdist call.
+
+        Returns:
+            One bool per book, in input order
+        """
+        results = [False] * len(books)
+        pending: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+
+        for position, book in enumerate(books):
+            author_key = normalize_author(book.get('author'))
+            bucket = self._buckets.get(author_key)
+            if bucket is None:
+                continue
+            key = normalize_title(book.get('title'))
+            if key in bucket.key_set:
+                results[position] = True
+            else:
+                pending[author_key].append((position, key))
+
+        for author, queries in pending.items():
+            bucket = self._buckets[author]
+            if not RAPIDFUZZ_AVAILABLE:
+                for position, key in queries:
+                    candidates = bucket.candidates(key, self.threshold, self.BLOCKING_MIN)
+                    results[position] = bool(candidates) and (
+                        self._best_score(key, candidates) >= self.threshold * 100
+                    )
+                continue
+
+            choices: Set[str] = set()
+            for _, key in queries:
+                choices.update(bucket.candidates(key, self.threshold, self.BLOCKING_MIN))
+            if not choices:
+                continue
+
+            scores = process.cdist(
+                [key for _, key in queries],
+                list(choices),
+                scorer=fuzz.ratio,
+                score_cutoff=self.threshold * 100,
+            )
+            for (position, _), row in zip(queries, scores):
+                results[position] = bool(row.any())
+
+        return results
+
+    @staticmethod
+    def _best_score(key: str, candidates: List[str]) -> float:
+        """Best 0-100 similarity of key against candidates."""
+        if RAPIDFUZZ_AVAILABLE:
+            match = process.extractOne(key, candidates, scorer=fuzz.ratio)
+            return match[1] if match else 0.0
+        return max(SequenceMatcher(None, key, candidate).ratio() for candidate in candidates) * 100
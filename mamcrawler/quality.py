@@ -179,8 +179,8 @@ class QualityFilter:
         """
         import os
         import subprocess
-        import json
         from pathlib import Path
+        from mamcrawler.audio_probe import probe_audio, ProbeError
         
         logger.info(f"🔍 Starting integrity check for: {torrent_path}")
         
@@ -228,35 +228,17 @@ class QualityFilter:
             for audio_file in audio_files:
                 # Use ffprobe to validate audio
                 try:
-                    result = subprocess.run(
-                        [
-                            'ffprobe',
-                            '-v', 'error',
-                            '-show_entries', 'format=duration,size',
-                            '-of', 'json',
-                            str(audio_file)
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-                    
-                    if result.returncode != 0:
-                        logger.error(f"✗ ffprobe failed for {audio_file.name}: {result.stderr}")
-                        return False
-                    
-                    probe_data = json.loads(result.stdout)
-                    file_duration = float(probe_data.get('format', {}).get('duration', 0))
+                    file_duration = probe_audio(audio_file).duration or 0.0
                     total_duration += file_duration
                     
                     logger.debug(f"✓ {audio_file.name}: {file_duration:.2f}s")
                     
+                except ProbeError as e:
+                    logger.error(f"✗ ffprobe failed for {audio_file.name}: {e}")
+                    return False
                 except subprocess.TimeoutExpired:
                     logger.error(f"✗ ffprobe timeout for {audio_file.name}")
                     return False
-                except json.JSONDecodeError:
-                    logger.error(f"✗ Invalid ffprobe output for {audio_file.name}")
-                    return False
                 except FileNotFoundError:
                     logger.error("✗ ffprobe not found. Please install ffmpeg.")
                     return False
@@ -1,7 +1,26 @@
-"""RAG (Retrieval-Augmented Generation) components."""
+"""RAG (Retrieval-Augmented Generation) components.
 
-from .chunking import MarkdownChunker
-from .embeddings import EmbeddingService
-from .indexing import FAISSIndexManager
+Components are imported on first access: embeddings pulls in
+sentence-transformers (several seconds), which keyword-only search and the
+thin search clients never need.
+"""
 
-__all__ = ['MarkdownChunker', 'EmbeddingService', 'FAISSIndexManager']
+import importlib
+
+_COMPONENTS = {
+    'MarkdownChunker': '.chunking',
+    'EmbeddingService': '.embeddings',
+    'EmbeddingCache': '.embedding_cache',
+    'FAISSIndexManager': '.indexing',
+}
+
+__all__ = list(_COMPONENTS)
+
+
+def __getattr__(name):
+    module = _COMPONENTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
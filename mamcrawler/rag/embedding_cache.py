@@ -0,0 +1,120 @@
+"""
+Content-addressed embedding cache for RAG system.
+Lets unchanged chunks skip the embedding model when a guide is re-indexed.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Sequence
+
+import numpy as np
+
+from ..storage import open_state_db
+
+# Max host parameters per IN (...) query (SQLite's default limit is 999)
+MAX_SQL_PARAMS = 900
+
+EMBEDDING_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL);
+"""
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of raw (unnormalized) embedding vectors.
+
+    Entries are keyed by sha256(model name + text), so editing one section of
+    a guide only misses for the chunks whose text changed, and switching
+    models never returns vectors from the old one.
+    """
+
+    def __init__(self, path: str, model_name: str):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file holding the cache (created on first use)
+            model_name: Embedding model the vectors come from
+        """
+        self.path = path
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Cache connection, opened on first use."""
+        if self._conn is None:
+            self._conn = open_state_db(self.path, EMBEDDING_CACHE_SCHEMA)
+        return self._conn
+
+    def key(self, text: str) -> bytes:
+        """Cache key for a text under this cache's model."""
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Dict of text -> float32 vector for the texts that were cached
+        """
+        keys = {self.key(text): text for text in texts}
+        found = {}
+        key_list = list(keys)
+
+        with self._lock:
+            for start in range(0, len(key_list), MAX_SQL_PARAMS):
+                batch = key_list[start:start + MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, vector in rows:
+                    found[keys[key]] = np.frombuffer(vector, dtype=np.float32)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray):
+        """
+        Store vectors for texts in one transaction.
+
+        Args:
+            texts: Texts that were embedded
+            vectors: Matching raw embedding vectors
+        """
+        rows = [
+            (self.key(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self):
+        """Close the cache connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,6 +1,7 @@
 """
 Unified embedding service for RAG system.
 Singleton pattern to avoid loading the model multiple times.
+Chunk embeddings are looked up in a content-addressed cache first.
 """
 
 from typing import List
@@ -9,6 +10,7 @@ from sentence_transformers import SentenceTransformer
 import faiss
 
 from ..config import RAGConfig, DEFAULT_RAG_CONFIG
+from .embedding_cache import EmbeddingCache
 
 
 class EmbeddingService:
@@ -41,15 +43,19 @@ class EmbeddingService:
         self.config = config or DEFAULT_RAG_CONFIG
         print(f"Loading embedding model: {self.config.model_name}")
         self.model = SentenceTransformer(self.config.model_name)
+        self.cache = None
+        if self.config.embedding_cache_path:
+            self.cache = EmbeddingCache(self.config.embedding_cache_path, self.config.model_name)
         self._initialized = True
 
-    def encode(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+    def encode(self, texts: List[str], normalize: bool = True, use_cache: bool = True) -> np.ndarray:
         """
         Encode texts to embeddings.
 
         Args:
             texts: List of texts to encode
             normalize: Whether to L2 normalize (required for FAISS)
+            use_cache: Reuse cached vectors for texts embedded before
 
         Returns:
             Numpy array of embeddings (float32)
@@ -57,14 +63,29 @@ class EmbeddingService:
         if not texts:
             return np.array([], dtype=np.float32).reshape(0, self.dimension)
 
-        embeddings = self.model.encode(texts)
-        embeddings = embeddings.astype(np.float32)
+        if use_cache and self.cache is not None:
+            embeddings = self._encode_cached(texts)
+        else:
+            embeddings = self.model.encode(texts)
+            embeddings = embeddings.astype(np.float32)
 
         if normalize:
             faiss.normalize_L2(embeddings)
 
         return embeddings
 
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """Encode only the texts missing from the cache, then store them."""
+        vectors = self.cache.get_many(texts)
+        missing = [text for text in dict.fromkeys(texts) if text not in vectors]
+
+        if missing:
+            fresh = self.model.encode(missing).astype(np.float32)
+            self.cache.put_many(missing, fresh)
+            vectors.update(zip(missing, fresh))
+
+        return np.stack([vectors[text] for text in texts])
+
     def encode_query(self, query: str) -> np.ndarray:
         """
         Encode a single query for search.
@@ -75,7 +96,7 @@ class EmbeddingService:
         Returns:
             Normalized embedding array with shape (1, dimension)
         """
-        return self.encode([query])
+        return self.encode([query], use_cache=False)
 
     @property
     def dimension(self) -> int:
@@ -0,0 +1,32 @@
+"""
+Rank fusion for hybrid (keyword + vector) retrieval.
+
+BM25 scores and L2 distances are on unrelated scales, so results are merged
+by rank with reciprocal-rank fusion: score(d) = sum over rankings of
+1 / (k + rank of d), ranks starting at 1.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+SEARCH_MODES = ("vector", "keyword", "hybrid")
+
+# Standard RRF damping constant; larger values flatten the top ranks
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[int]], k: int = RRF_K) -> List[Tuple[int, float]]:
+    """
+    Merge several rankings of IDs into one.
+
+    Args:
+        rankings: ID lists, each best first
+        k: Damping constant
+
+    Returns:
+        List of (id, fused_score) tuples, best first (higher = better)
+    """
+    scores: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
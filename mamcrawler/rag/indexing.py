@@ -1,21 +1,111 @@
 """
 FAISS index management for RAG system.
 Unified interface for index operations.
+
+Index types (RAGConfig.index_type):
+- flat: exact search, IndexIDMap(IndexFlatL2)
+- ivf_flat / ivf_pq: inverted-file ANN search; vectors are kept in a flat
+  index until train_min_vectors exist, then the IVF index is trained on them
+- hnsw: graph ANN search; HNSW cannot delete, so removed IDs are kept as
+  tombstones (filtered at search time) until the index is rebuilt
 """
 
-from typing import Tuple, Optional
+import math
+import os
+from typing import Optional, Set, Tuple
 from pathlib import Path
 import numpy as np
 import faiss
 
 from ..config import RAGConfig, DEFAULT_RAG_CONFIG
 
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+# Minimum training points per IVF list
+MIN_POINTS_PER_LIST = 39
+
+_INDEX_CLASS_TYPES = {
+    "IndexHNSWFlat": "hnsw",
+    "IndexIVFFlat": "ivf_flat",
+    "IndexIVFPQ": "ivf_pq",
+}
+
+
+def _inner_index(index: faiss.Index) -> faiss.Index:
+    """Unwrap an IndexIDMap to the index that stores the vectors."""
+    if type(index).__name__.startswith("IndexIDMap"):
+        return faiss.downcast_index(index.index)
+    return index
+
+
+def index_type_of(index: faiss.Index) -> str:
+    """Get the INDEX_TYPES name of a FAISS index ("flat" for anything else)."""
+    return _INDEX_CLASS_TYPES.get(type(_inner_index(index)).__name__, "flat")
+
+
+def _new_hnsw(dimension: int, config: RAGConfig) -> faiss.Index:
+    """Empty HNSW index wrapped for custom IDs."""
+    hnsw = faiss.IndexHNSWFlat(dimension, config.hnsw_m)
+    hnsw.hnsw.efConstruction = config.ef_construction
+    return faiss.IndexIDMap(hnsw)
+
+
+def _nlist(n: int, config: RAGConfig) -> int:
+    """Number of IVF lists for n training vectors."""
+    nlist = config.nlist or int(4 * math.sqrt(n))
+    return max(1, min(nlist, n // MIN_POINTS_PER_LIST))
+
+
+def build_index(
+    index_type: str, ids: np.ndarray, vectors: np.ndarray, config: RAGConfig = None
+) -> faiss.Index:
+    """
+    Build (and train, for IVF) a new index of the given type.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        ids: Chunk IDs
+        vectors: Matching float32 vectors
+        config: RAG configuration (nlist, pq_m, hnsw_m ...)
+
+    Returns:
+        The populated index
+    """
+    config = config or DEFAULT_RAG_CONFIG
+    dimension = vectors.shape[1] if len(vectors) else config.dimension
+
+    if index_type == "flat":
+        index = faiss.IndexIDMap(faiss.IndexFlatL2(dimension))
+    elif index_type == "hnsw":
+        index = _new_hnsw(dimension, config)
+    elif index_type in ("ivf_flat", "ivf_pq"):
+        nlist = _nlist(len(vectors), config)
+        min_points = nlist if index_type == "ivf_flat" else max(nlist, 2 ** config.pq_nbits)
+        if len(vectors) < min_points:
+            raise ValueError(f"{index_type} needs at least {min_points} vectors to train, got {len(vectors)}")
+
+        quantizer = faiss.IndexFlatL2(dimension)
+        if index_type == "ivf_flat":
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist)
+        else:
+            if dimension % config.pq_m:
+                raise ValueError(f"pq_m={config.pq_m} must divide dimension {dimension}")
+            index = faiss.IndexIVFPQ(quantizer, dimension, nlist, config.pq_m, config.pq_nbits)
+        index.train(vectors)
+    else:
+        raise ValueError(f"Unknown index_type {index_type!r}, expected one of {INDEX_TYPES}")
+
+    if len(vectors):
+        index.add_with_ids(vectors, ids)
+    return index
+
 
 class FAISSIndexManager:
     """
     Manages FAISS index for vector similarity search.
 
-    Uses IndexIDMap to support custom IDs that correspond to database chunk IDs.
+    Uses IndexIDMap (or the IVF index's own IDs) to support custom IDs that
+    correspond to database chunk IDs.
     """
 
     def __init__(self, config: RAGConfig = None, index_path: str = None):
@@ -27,19 +117,48 @@ class FAISSIndexManager:
             index_path: Optional override for index file path
         """
         self.config = config or DEFAULT_RAG_CONFIG
+        if self.config.index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index_type {self.config.index_type!r}, expected one of {INDEX_TYPES}")
+
         self.index_path = Path(index_path or self.config.index_path)
+        self._deleted: Set[int] = set()
         self.index = self._load_or_create()
+        self._configure()
+
+    @property
+    def _tombstone_path(self) -> Path:
+        return Path(f"{self.index_path}.deleted.npy")
+
+    @property
+    def index_type(self) -> str:
+        """Type of the loaded index (may differ from config until rebuilt)."""
+        return index_type_of(self.index)
 
     def _load_or_create(self) -> faiss.Index:
         """Load existing index or create new one."""
         if self.index_path.exists():
             print(f"Loading existing index from {self.index_path}")
-            return faiss.read_index(str(self.index_path))
+            index = faiss.read_index(str(self.index_path))
+            if index_type_of(index) == "hnsw" and self._tombstone_path.exists():
+                self._deleted = set(np.load(self._tombstone_path).tolist())
+            return index
 
-        print(f"Creating new FAISS index (dimension={self.config.dimension})")
+        print(f"Creating new FAISS index (type={self.config.index_type}, dimension={self.config.dimension})")
+        if self.config.index_type == "hnsw":
+            return _new_hnsw(self.config.dimension, self.config)
+
+        # IVF types start flat and are trained once enough vectors exist
         base_index = faiss.IndexFlatL2(self.config.dimension)
         return faiss.IndexIDMap(base_index)
 
+    def _configure(self):
+        """Apply query-time parameters (nprobe / efSearch) to the index."""
+        index_type = index_type_of(self.index)
+        if index_type.startswith("ivf"):
+            faiss.ParameterSpace().set_index_parameter(self.index, "nprobe", self.config.nprobe)
+        elif index_type == "hnsw":
+            faiss.ParameterSpace().set_index_parameter(self.index, "efSearch", self.config.ef_search)
+
     def add(self, embeddings: np.ndarray, ids: np.ndarray):
         """
         Add embeddings with IDs to index.
@@ -55,6 +174,14 @@ class FAISSIndexManager:
         ids = ids.astype(np.int64)
         self.index.add_with_ids(embeddings, ids)
 
+        if self._awaiting_training() and self.index.ntotal >= self.config.train_min_vectors:
+            print(f"Training {self.config.index_type} index on {self.index.ntotal} vectors")
+            self.rebuild()
+
+    def _awaiting_training(self) -> bool:
+        """True while an IVF index is configured but vectors are still in the flat staging index."""
+        return self.config.index_type.startswith("ivf") and index_type_of(self.index) == "flat"
+
     def remove(self, ids: np.ndarray):
         """
         Remove embeddings by IDs.
@@ -66,7 +193,10 @@ class FAISSIndexManager:
             return
 
         ids = np.array(ids, dtype=np.int64)
-        self.index.remove_ids(ids)
+        if index_type_of(self.index) == "hnsw":
+            self._deleted.update(int(chunk_id) for chunk_id in ids)
+        else:
+            self.index.remove_ids(ids)
 
     def search(self, query_embedding: np.ndarray, k: int = None) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -86,18 +216,97 @@ class FAISSIndexManager:
         if query_embedding.ndim == 1:
             query_embedding = query_embedding.reshape(1, -1)
 
-        distances, ids = self.index.search(query_embedding, k)
+        if not self._deleted:
+            distances, ids = self.index.search(query_embedding, k)
+            return distances, ids
+
+        # Over-fetch so tombstoned IDs can be dropped without losing results
+        fetch = min(self.index.ntotal, k + len(self._deleted))
+        raw_distances, raw_ids = self.index.search(query_embedding, max(fetch, k))
+
+        distances = np.full((len(query_embedding), k), np.inf, dtype=np.float32)
+        ids = np.full((len(query_embedding), k), -1, dtype=np.int64)
+        for row, (row_distances, row_ids) in enumerate(zip(raw_distances, raw_ids)):
+            keep = [i for i, chunk_id in enumerate(row_ids) if chunk_id >= 0 and int(chunk_id) not in self._deleted][:k]
+            distances[row, :len(keep)] = row_distances[keep]
+            ids[row, :len(keep)] = row_ids[keep]
         return distances, ids
 
+    def export_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read every live (ID, vector) pair out of the index.
+
+        IVF-PQ vectors come back as their (lossy) decoded approximations.
+
+        Returns:
+            Tuple of (ids int64 array, vectors float32 array)
+        """
+        index_type = index_type_of(self.index)
+        dimension = self.index.d
+
+        if index_type.startswith("ivf"):
+            invlists = self.index.invlists
+            ids = [
+                faiss.rev_swig_ptr(invlists.get_ids(list_no), invlists.list_size(list_no)).copy()
+                for list_no in range(self.index.nlist)
+                if invlists.list_size(list_no)
+            ]
+            ids = np.concatenate(ids).astype(np.int64) if ids else np.empty(0, dtype=np.int64)
+            self.index.set_direct_map_type(faiss.DirectMap.Hashtable)
+            try:
+                vectors = np.vstack([self.index.reconstruct(int(chunk_id)) for chunk_id in ids]) \
+                    if len(ids) else np.empty((0, dimension), dtype=np.float32)
+            finally:
+                self.index.set_direct_map_type(faiss.DirectMap.NoMap)
+        else:
+            ids = faiss.vector_to_array(self.index.id_map).astype(np.int64)
+            vectors = _inner_index(self.index).reconstruct_n(0, self.index.ntotal) \
+                if len(ids) else np.empty((0, dimension), dtype=np.float32)
+
+        if self._deleted:
+            live = np.array([int(chunk_id) not in self._deleted for chunk_id in ids], dtype=bool)
+            ids, vectors = ids[live], vectors[live]
+        return ids, vectors.astype(np.float32)
+
+    def rebuild(self, index_type: Optional[str] = None):
+        """
+        Rebuild the index, compacting away removed vectors.
+
+        Args:
+            index_type: Type to convert to (defaults to config.index_type)
+        """
+        ids, vectors = self.export_vectors()
+        self.index = build_index(index_type or self.config.index_type, ids, vectors, self.config)
+        self._deleted.clear()
+        self._configure()
+
     def save(self):
-        """Persist index to disk."""
-        faiss.write_index(self.index, str(self.index_path))
+        """
+        Persist index to disk.
+
+        Files are written beside the target and renamed over it, so a reader
+        (e.g. the search server reloading on mtime) never sees a partial index.
+        Tombstones are written before the index they apply to and removed
+        after it.
+        """
+        if self._deleted:
+            tmp = Path(f"{self._tombstone_path}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, np.fromiter(self._deleted, dtype=np.int64))
+            os.replace(tmp, self._tombstone_path)
+
+        tmp = Path(f"{self.index_path}.tmp")
+        faiss.write_index(self.index, str(tmp))
+        os.replace(tmp, self.index_path)
+
+        if not self._deleted and self._tombstone_path.exists():
+            self._tombstone_path.unlink()
         print(f"Index saved to {self.index_path}")
 
     @property
     def total_vectors(self) -> int:
         """Get total number of vectors in index."""
-        return self.index.ntotal
+        return self.index.ntotal - len(self._deleted)
 
 
 # Module-level singleton
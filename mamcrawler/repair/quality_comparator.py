@@ -12,10 +12,11 @@ Metrics:
 
 import logging
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +30,7 @@ class QualityComparator:
 
     def get_audio_properties(self, audio_file: str) -> Optional[Dict[str, Any]]:
         """
-        Extract audio properties using ffprobe.
+        Extract audio properties using the shared ffprobe cache.
 
         Args:
             audio_file: Path to audio file
@@ -52,68 +53,28 @@ class QualityComparator:
             return None
 
         try:
-            # Get file size
-            file_size = file_path.stat().st_size
-
-            # Use ffprobe to get audio properties
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-print_format', 'json',
-                '-show_streams',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.error(f"ffprobe failed: {result.stderr}")
-                return None
-
-            data = json.loads(result.stdout)
-            streams = data.get('streams', [])
-
-            # Find audio stream
-            audio_stream = None
-            for stream in streams:
-                if stream.get('codec_type') == 'audio':
-                    audio_stream = stream
-                    break
+            probe = probe_audio(file_path)
 
+            audio_stream = probe.audio_stream
             if not audio_stream:
                 logger.error(f"No audio stream found in {audio_file}")
                 return None
 
-            # Extract properties
-            codec = audio_stream.get('codec_name', 'unknown')
-            bitrate = audio_stream.get('bit_rate')
-            if bitrate:
-                bitrate_kbps = int(bitrate) // 1000
-            else:
-                bitrate_kbps = None
-
-            sample_rate = audio_stream.get('sample_rate')
-            if sample_rate:
-                sample_rate = int(sample_rate)
-
-            channels = audio_stream.get('channels', 2)
-            duration = float(audio_stream.get('duration', 0))
-
             return {
-                'codec': codec,
-                'bitrate_kbps': bitrate_kbps,
-                'sample_rate': sample_rate,
-                'channels': channels,
-                'duration_seconds': duration,
-                'file_size_bytes': file_size
+                'codec': audio_stream.codec or 'unknown',
+                'bitrate_kbps': audio_stream.bitrate // 1000 if audio_stream.bitrate else None,
+                'sample_rate': audio_stream.sample_rate,
+                'channels': audio_stream.channels or 2,
+                'duration_seconds': audio_stream.duration or 0.0,
+                'file_size_bytes': probe.size
             }
 
+        except ProbeError as e:
+            logger.error(f"ffprobe failed: {e}")
+            return None
         except subprocess.TimeoutExpired:
             logger.error(f"ffprobe timeout for {audio_file}")
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error getting audio properties: {e}")
             return None
@@ -7,6 +7,7 @@ import logging
 import asyncio
 from typing import List, Dict, Optional
 from mamcrawler.goodreads import GoodreadsMetadata
+from mamcrawler.library_matcher import LibraryMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -74,62 +75,10 @@ class SeriesCompletion:
         Returns:
             List of missing books
         """
-        missing = []
+        matcher = LibraryMatcher(abs_library)
+        owned = matcher.contains_many(series_books)
         
-        for book in series_books:
-            if not self._is_in_library(book, abs_library):
-                missing.append(book)
-        
-        return missing
-    
-    def _is_in_library(self, book: Dict, library: List[Dict]) -> bool:
-        """
-        Check if a book is already in the library.
-        
-        Uses fuzzy matching on title and author.
-        """
-        book_title = book.get('title', '').lower()
-        book_author = book.get('author', '').lower()
-        
-        for lib_item in library:
-            lib_title = lib_item.get('title', '').lower()
-            lib_author = lib_item.get('author', '').lower()
-            
-            # Exact match
-            if book_title == lib_title and book_author == lib_author:
-                return True
-            
-            # Fuzzy match (handle subtitle variations)
-            if self._fuzzy_title_match(book_title, lib_title) and book_author == lib_author:
-                return True
-        
-        return False
-    
-    def _fuzzy_title_match(self, title1: str, title2: str, threshold: float = 0.85) -> bool:
-        """
-        Fuzzy match two titles.
-        
-        Handles:
-        - Subtitle variations ("Title: Subtitle" vs "Title")
-        - Punctuation differences
-        - Minor spelling variations
-        """
-        # Remove common subtitle separators
-        title1_base = title1.split(':')[0].split('(')[0].strip()
-        title2_base = title2.split(':')[0].split('(')[0].strip()
-        
-        # Simple character-based similarity
-        if title1_base == title2_base:
-            return True
-        
-        # Try fuzzywuzzy if available
-        try:
-            from fuzzywuzzy import fuzz
-            score = fuzz.ratio(title1_base, title2_base) / 100.0
-            return score >= threshold
-        except ImportError:
-            # Fallback to exact match
-            return title1_base == title2_base
+        return [book for book, is_owned in zip(series_books, owned) if not is_owned]
     
     async def download_missing_books(self,
                                      missing_books: List[Dict],
@@ -1,5 +1,6 @@
 """Storage and persistence components."""
 
 from .markdown_writer import GuideMarkdownWriter
+from .state_db import open_state_db
 
-__all__ = ['GuideMarkdownWriter']
+__all__ = ['GuideMarkdownWriter', 'open_state_db']
@@ -0,0 +1,47 @@
+"""
+Small SQLite state databases (caches, ledgers, sync state).
+
+Every such store opens its file the same way: autocommit mode so callers
+control transactions explicitly, usable from any thread (callers serialize
+access with their own lock), WAL so several processes can read while one
+writes, and synchronous=NORMAL, which is safe with WAL and avoids an fsync
+per write.
+"""
+
+import sqlite3
+from typing import Optional
+
+# sqlite3's default prepared statement cache size
+DEFAULT_CACHED_STATEMENTS = 128
+
+
+def open_state_db(
+    path: Optional[str],
+    schema_sql: str = "",
+    timeout: float = 30,
+    cached_statements: int = DEFAULT_CACHED_STATEMENTS
+) -> sqlite3.Connection:
+    """
+    Open a WAL-mode SQLite database and create its schema.
+
+    Args:
+        path: Database file (None = in-memory)
+        schema_sql: CREATE ... IF NOT EXISTS statements to run
+        timeout: Seconds to wait for another connection's write lock
+        cached_statements: Size of the prepared statement cache
+
+    Returns:
+        Connection in autocommit mode (isolation_level=None)
+    """
+    conn = sqlite3.connect(
+        path or ":memory:",
+        timeout=timeout,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=cached_statements,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if schema_sql:
+        conn.executescript(schema_sql)
+    return conn
@@ -6,10 +6,11 @@ Minimum viable structure: 3 chapters (unless known single-track)
 
 import logging
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +28,7 @@ class ChapterVerifier:
 
     def extract_chapters(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
         """
-        Extract chapter metadata from audio file using ffprobe.
+        Extract chapter metadata from audio file using the shared ffprobe cache.
 
         Args:
             file_path: Path to audio file
@@ -42,46 +43,32 @@ class ChapterVerifier:
             return None
 
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-print_format', 'json',
-                '-show_chapters',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.debug(f"ffprobe failed or no chapters found: {result.stderr}")
-                return []
-
-            data = json.loads(result.stdout)
-            chapters = data.get('chapters', [])
+            chapters = probe_audio(file_path).chapters
 
             if not chapters:
                 logger.debug(f"No chapters found in {file_path}")
                 return []
 
             # Extract relevant chapter info
-            chapter_list = []
-            for ch in chapters:
-                chapter_list.append({
-                    'index': ch.get('id', len(chapter_list)),
-                    'start_time': float(ch.get('start_time', 0)),
-                    'end_time': float(ch.get('end_time', 0)),
-                    'title': ch.get('tags', {}).get('title', f'Chapter {len(chapter_list) + 1}'),
-                })
+            chapter_list = [
+                {
+                    'index': ch.index,
+                    'start_time': ch.start_time,
+                    'end_time': ch.end_time,
+                    'title': ch.title,
+                }
+                for ch in chapters
+            ]
 
             logger.info(f"Extracted {len(chapter_list)} chapters from {file_path}")
             return chapter_list
 
+        except ProbeError as e:
+            logger.debug(f"ffprobe failed or no chapters found: {e}")
+            return []
         except subprocess.TimeoutExpired:
             logger.error(f"ffprobe timeout for {file_path}")
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error extracting chapters from {file_path}: {e}")
             return None
@@ -1,15 +1,16 @@
 """
 Duration Verification Module
 Validates audiobook duration falls within acceptable tolerance of expected duration.
-Uses ffprobe to extract actual duration from audio files.
+Uses the shared ffprobe cache to extract actual duration from audio files.
 """
 
 import logging
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,35 +43,20 @@ class DurationVerifier:
             return None
 
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1:nofile=1',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.warning(f"ffprobe failed for {file_path}: {result.stderr}")
-                return None
-
-            duration_str = result.stdout.strip()
-            if not duration_str:
+            duration = probe_audio(file_path).duration
+            if duration is None:
                 logger.warning(f"No duration found in {file_path}")
                 return None
 
-            duration = float(duration_str)
             logger.info(f"Extracted duration from audio: {duration:.2f}s ({duration/3600:.2f}h)")
             return duration
 
+        except ProbeError as e:
+            logger.warning(f"ffprobe failed for {file_path}: {e}")
+            return None
         except subprocess.TimeoutExpired:
             logger.error(f"ffprobe timeout for {file_path}")
             return None
-        except (ValueError, TypeError) as e:
-            logger.error(f"Failed to parse duration from {file_path}: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error extracting duration from {file_path}: {e}")
             return None
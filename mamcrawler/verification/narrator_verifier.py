@@ -6,11 +6,12 @@ Uses fuzzy matching to handle typos and variations in narrator names.
 
 import logging
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from difflib import SequenceMatcher
 
+from mamcrawler.audio_probe import probe_audio, ProbeError
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +29,7 @@ class NarratorVerifier:
 
     def extract_narrator_from_audio(self, file_path: str) -> Optional[str]:
         """
-        Extract narrator from audio file metadata using ffprobe.
+        Extract narrator from audio file metadata using the shared ffprobe cache.
 
         Args:
             file_path: Path to audio file (.m4b, .mp3, .aac)
@@ -43,23 +44,7 @@ class NarratorVerifier:
             return None
 
         try:
-            # Use ffprobe to extract metadata
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-print_format', 'json',
-                '-show_format',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                logger.warning(f"ffprobe failed for {file_path}: {result.stderr}")
-                return None
-
-            data = json.loads(result.stdout)
-            tags = data.get('format', {}).get('tags', {})
+            tags = probe_audio(file_path).tags
 
             # Try various possible narrator tag names
             narrator_fields = ['narrator', 'artist', 'album_artist', 'NARRATOR', 'ARTIST']
@@ -73,12 +58,12 @@ class NarratorVerifier:
             logger.debug(f"No narrator metadata found in audio: {file_path}")
             return None
 
+        except ProbeError as e:
+            logger.warning(f"ffprobe failed for {file_path}: {e}")
+            return None
         except subprocess.TimeoutExpired:
             logger.error(f"ffprobe timeout for {file_path}")
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse ffprobe output for {file_path}: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error extracting narrator from audio {file_path}: {e}")
             return None
@@ -10,10 +10,18 @@ Verification Pipeline:
 
 Failed items are auto-retried up to 3 times with exponential backoff.
 Remaining failures are flagged for manual review.
+
+verify_batch() fans the checks of many audiobooks out over a thread pool
+and yields each audiobook's result as soon as its checks finish. The checks
+spend their time waiting on ffprobe, so threads keep every core busy while
+sharing the verifiers, the operation logger and the ffprobe cache.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
 from pathlib import Path
 import time
 
@@ -25,6 +33,14 @@ from backend.logging.operation_logger import get_operation_logger
 
 logger = logging.getLogger(__name__)
 
+CHECKS = ('narrator', 'duration', 'isbn', 'chapters')
+
+# Audiobooks queued per worker ahead of the ones being checked
+BATCH_PREFETCH = 2
+
+# How often verify_batch() wakes to enforce timeouts and cancellation
+POLL_INTERVAL = 0.5
+
 
 class VerificationOrchestrator:
     """Orchestrates complete verification workflow with retry logic"""
@@ -71,19 +87,164 @@ class VerificationOrchestrator:
             )
 
         # Run all verifications
-        narrator_result = self._verify_narrator(audio_path, metadata)
-        duration_result = self._verify_duration(audio_path, metadata)
-        isbn_result = self._verify_isbn(metadata)
-        chapter_result = self._verify_chapters(audio_path, metadata, title)
-
-        # Collect results
         all_checks = {
-            'narrator': narrator_result,
-            'duration': duration_result,
-            'isbn': isbn_result,
-            'chapters': chapter_result
+            name: self._run_check(name, audio_path, metadata, title)
+            for name in CHECKS
+        }
+
+        return self._build_result(title, author, retry_count, all_checks)
+
+    def verify_batch(
+        self,
+        audiobooks: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        check_timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Verify many audiobooks in parallel, yielding results as they complete.
+
+        Every check of every audiobook is a separate task on a bounded thread
+        pool; audiobooks are pulled from the iterable only as capacity frees
+        up, so a whole library can be streamed through. Results come back in
+        completion order, not input order.
+
+        Args:
+            audiobooks: Dicts with 'audio_path', 'metadata', 'title' and
+                'author' keys (as for verify_audiobook)
+            max_workers: Pool size (default: one per CPU core)
+            check_timeout: Seconds a single check may run before it is
+                recorded as failed (the worker finishes in the background)
+            cancel_event: Set to stop early; queued checks are dropped and
+                no further results are yielded
+
+        Yields:
+            dict: verify_audiobook() result per audiobook
+        """
+        max_workers = max_workers or os.cpu_count() or 4
+        cancel_event = cancel_event or threading.Event()
+        books = iter(audiobooks)
+        exhausted = False
+
+        # future -> (book number, check name); that task -> monotonic start time
+        futures: Dict[Future, Tuple[int, str]] = {}
+        started: Dict[Tuple[int, str], float] = {}
+        # book number -> book / check results so far
+        in_flight: Dict[int, Dict[str, Any]] = {}
+        checks: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        book_count = 0
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='verify')
+        try:
+            while not cancel_event.is_set():
+                # Top up the queue
+                while not exhausted and len(in_flight) < max_workers * BATCH_PREFETCH:
+                    book = next(books, None)
+                    if book is None:
+                        exhausted = True
+                        break
+
+                    title = book.get('title', 'Unknown')
+                    author = book.get('author', 'Unknown')
+                    if not book.get('audio_path') and not book.get('metadata'):
+                        logger.error(f"No audio file or metadata provided for {title}")
+                        yield self._failed_verification(title, author, "No audio file or metadata", 0)
+                        continue
+
+                    book_number = book_count
+                    book_count += 1
+                    in_flight[book_number] = book
+                    checks[book_number] = {}
+                    for name in CHECKS:
+                        future = executor.submit(
+                            self._timed_check, started, (book_number, name),
+                            book.get('audio_path'), book.get('metadata'), title
+                        )
+                        futures[future] = (book_number, name)
+
+                if not futures:
+                    break
+
+                done, _ = wait(list(futures), timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                finished = [(future, future.result()) for future in done]
+
+                if check_timeout is not None:
+                    now = time.monotonic()
+                    finished.extend(
+                        (future, self._timed_out_check(check_timeout))
+                        for future, task in futures.items()
+                        if future not in done and now - started.get(task, now) > check_timeout
+                    )
+
+                for future, check_result in finished:
+                    book_number, name = futures.pop(future)
+                    started.pop((book_number, name), None)
+                    if check_result.get('timed_out'):
+                        logger.error(
+                            f"{name} check timed out after {check_timeout}s for "
+                            f"{in_flight[book_number].get('title', 'Unknown')}"
+                        )
+                    checks[book_number][name] = check_result
+
+                    if len(checks[book_number]) == len(CHECKS):
+                        book = in_flight.pop(book_number)
+                        all_checks = checks.pop(book_number)
+                        yield self._build_result(
+                            book.get('title', 'Unknown'),
+                            book.get('author', 'Unknown'),
+                            0,
+                            {name: all_checks[name] for name in CHECKS}
+                        )
+        finally:
+            # Also reached when the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timed_check(
+        self,
+        started: Dict[Tuple[int, str], float],
+        task: Tuple[int, str],
+        audio_path: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        title: str
+    ) -> Dict[str, Any]:
+        """Run one check on a pool worker, recording when it started"""
+        started[task] = time.monotonic()
+        return self._run_check(task[1], audio_path, metadata, title)
+
+    def _run_check(
+        self,
+        name: str,
+        audio_path: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        title: str
+    ) -> Dict[str, Any]:
+        """Run one of CHECKS"""
+        if name == 'narrator':
+            return self._verify_narrator(audio_path, metadata)
+        if name == 'duration':
+            return self._verify_duration(audio_path, metadata)
+        if name == 'isbn':
+            return self._verify_isbn(metadata)
+        return self._verify_chapters(audio_path, metadata, title)
+
+    def _timed_out_check(self, timeout: float) -> Dict[str, Any]:
+        """Failed result for a check that exceeded its timeout"""
+        return {
+            'match': False,
+            'valid': False,
+            'passed': False,
+            'timed_out': True,
+            'details': f'Check timed out after {timeout}s'
         }
 
+    def _build_result(
+        self,
+        title: str,
+        author: str,
+        retry_count: int,
+        all_checks: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Combine check results into a verification result and log it"""
         # Determine overall pass/fail
         passed = all(check.get('match', check.get('valid', check.get('passed', False)))
                      for check in all_checks.values())
@@ -111,10 +272,10 @@ class VerificationOrchestrator:
             passed=passed,
             failures=failures if failures else None,
             details={
-                'narrator_confidence': narrator_result.get('confidence'),
-                'duration_variance': duration_result.get('variance_percent'),
-                'isbn_match': isbn_result.get('match'),
-                'chapters': chapter_result.get('count')
+                'narrator_confidence': all_checks['narrator'].get('confidence'),
+                'duration_variance': all_checks['duration'].get('variance_percent'),
+                'isbn_match': all_checks['isbn'].get('match'),
+                'chapters': all_checks['chapters'].get('count')
             }
         )
 
@@ -0,0 +1,83 @@
+"""
+Rebuild (and optionally convert) the FAISS index on disk.
+
+Reads every live vector out of the current index, builds a fresh index of
+the requested type and atomically replaces the file. This compacts away
+HNSW tombstones and re-trains IVF centroids after the corpus has grown.
+
+Usage:
+    python rebuild_index.py                 # compact, keep config.index_type
+    python rebuild_index.py --type hnsw     # convert to another index type
+    python rebuild_index.py --type ivf_pq --nlist 1024
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+
+from mamcrawler.config import DEFAULT_RAG_CONFIG
+from mamcrawler.rag.indexing import FAISSIndexManager, INDEX_TYPES
+
+
+def rebuild(index_path: str, index_type: str = None, config=DEFAULT_RAG_CONFIG) -> dict:
+    """
+    Rebuild an index file in place.
+
+    Args:
+        index_path: Path to the FAISS index
+        index_type: Target type (defaults to the loaded index's type)
+        config: RAG configuration (nlist, pq_m, hnsw_m ...)
+
+    Returns:
+        Dict with before/after type and vector counts
+    """
+    manager = FAISSIndexManager(config, index_path)
+    before_type = manager.index_type
+    before_vectors = manager.index.ntotal
+
+    target = index_type or before_type
+    manager.rebuild(target)
+
+    # save() swaps the file in atomically and drops the old tombstones
+    manager.save()
+
+    return {
+        "before_type": before_type,
+        "before_vectors": before_vectors,
+        "after_type": target,
+        "after_vectors": manager.total_vectors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild or convert the FAISS index")
+    parser.add_argument("--index", default=DEFAULT_RAG_CONFIG.index_path, help="Index file")
+    parser.add_argument("--type", choices=INDEX_TYPES, help="Target index type")
+    parser.add_argument("--nlist", type=int, help="IVF lists (default 4 * sqrt(n))")
+    parser.add_argument("--pq-m", type=int, help="IVF-PQ sub-quantizers")
+    parser.add_argument("--hnsw-m", type=int, help="HNSW graph degree")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.index):
+        print(f"ERROR: {args.index} not found. Run: python ingest.py")
+        sys.exit(1)
+
+    overrides = {
+        name: value
+        for name, value in (("nlist", args.nlist), ("pq_m", args.pq_m), ("hnsw_m", args.hnsw_m))
+        if value is not None
+    }
+    if args.type:
+        overrides["index_type"] = args.type
+    config = dataclasses.replace(DEFAULT_RAG_CONFIG, **overrides)
+
+    result = rebuild(args.index, args.type, config)
+    print(
+        f"Rebuilt {args.index}: {result['before_type']} ({result['before_vectors']} vectors) -> "
+        f"{result['after_type']} ({result['after_vectors']} vectors)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Thin client for the resident search server (search_server.py).
+
+Standard library only, so importing it does not pull in torch or FAISS.
+"""
+
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Optional
+
+from mamcrawler.config import DEFAULT_RAG_CONFIG
+
+# Seconds to wait for the server; a local search answers in milliseconds
+CONNECT_TIMEOUT = 5.0
+
+
+def query_server(
+    query: str,
+    top_k: int = None,
+    mode: str = "vector",
+    host: str = None,
+    port: int = None,
+    timeout: float = CONNECT_TIMEOUT,
+) -> Optional[List[Dict]]:
+    """
+    Search through a running search server.
+
+    Args:
+        query: The search query
+        top_k: Number of results to return
+        mode: "vector", "keyword" or "hybrid"
+        host: Server host (defaults to config.search_host)
+        port: Server port (defaults to config.search_port)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Result dicts (chunk_id, source, section, content, score), or None if
+        no server is reachable
+    """
+    host = host or DEFAULT_RAG_CONFIG.search_host
+    port = port or DEFAULT_RAG_CONFIG.search_port
+    params = {"q": query, "mode": mode}
+    if top_k:
+        params["k"] = top_k
+    url = f"http://{host}:{port}/search?{urllib.parse.urlencode(params)}"
+
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))["results"]
+    except (urllib.error.URLError, ConnectionError, TimeoutError, ValueError, KeyError):
+        return None
@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 """
 Local search provider for the unified search system.
-Provides RAG/vector similarity search using FAISS and SQLite.
+Provides RAG search over the local knowledge base: vector similarity (FAISS),
+BM25 keyword search (SQLite FTS5) or both fused by reciprocal rank.
 """
 
-import asyncio
 import logging
 import os
 import sys
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
+import database
+from mamcrawler.rag.fusion import RRF_K, SEARCH_MODES, reciprocal_rank_fusion
 from search_types import SearchProviderInterface, SearchQuery, SearchResult
 
 logger = logging.getLogger(__name__)
@@ -22,7 +24,7 @@ class LocalSearchProvider(SearchProviderInterface):
 
     PROVIDER_TYPE = "local"
     CAPABILITIES = ["vector_search", "semantic_search", "local_knowledge"]
-    RATE_LIMITS = {"requests_per_minute": 120, "delay_seconds": 0.1}
+    RATE_LIMITS = {"requests_per_minute": 120, "delay_seconds": 0}
     CONFIG_REQUIRED = []  # No external config required
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -30,11 +32,18 @@ class LocalSearchProvider(SearchProviderInterface):
         self.index_file = self.config.get('index_file', 'index.faiss')
         self.metadata_file = self.config.get('metadata_file', 'metadata.sqlite')
         self.model_name = self.config.get('model_name', 'all-MiniLM-L6-v2')
+        # "vector", "keyword" (BM25 only, never loads the model) or "hybrid".
+        # Only "vector" reports cosine similarity as confidence; the others
+        # report a normalized rank-fusion score (1.0 = top of every ranking),
+        # so thresholds tuned on similarity don't carry over.
+        self.retrieval_mode = self.config.get('retrieval_mode', 'vector')
+        if self.retrieval_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown retrieval_mode: {self.retrieval_mode}")
 
         # Lazy-loaded components
         self.index = None
         self.model = None
-        self.db_connection = None
+        self.store = None
 
     def _check_requirements(self) -> bool:
         """Check if required files and libraries are available"""
@@ -48,7 +57,6 @@ class LocalSearchProvider(SearchProviderInterface):
 
         try:
             import faiss
-            import sqlite3
             from sentence_transformers import SentenceTransformer
         except ImportError as e:
             logger.error(f"Missing required libraries: {e}")
@@ -57,19 +65,19 @@ class LocalSearchProvider(SearchProviderInterface):
         return True
 
     def _load_components(self):
-        """Load FAISS index, embedding model, and database connection"""
+        """Load FAISS index, embedding model, and the shared metadata store"""
         if not self._check_requirements():
             raise RuntimeError("Local search requirements not met")
 
         try:
             import faiss
-            import sqlite3
             from sentence_transformers import SentenceTransformer
 
             logger.debug("Loading FAISS index and embedding model...")
             self.index = faiss.read_index(self.index_file)
             self.model = SentenceTransformer(self.model_name)
-            self.db_connection = sqlite3.connect(self.metadata_file)
+            self.store = database.get_store(self.metadata_file)
+            self.store.create_tables()
 
             logger.info("Local search components loaded successfully")
 
@@ -79,7 +87,7 @@ class LocalSearchProvider(SearchProviderInterface):
 
     async def search(self, query: SearchQuery) -> List[SearchResult]:
         """
-        Perform vector similarity search
+        Perform vector, keyword (BM25) or hybrid search
 
         Args:
             query: Search query parameters
@@ -88,48 +96,46 @@ class LocalSearchProvider(SearchProviderInterface):
             List of search results
         """
         try:
-            # Load components if not already loaded
-            if self.index is None:
-                self._load_components()
-
-            # Rate limiting
-            await asyncio.sleep(self.RATE_LIMITS["delay_seconds"])
-
-            # Embed query
-            import numpy as np
-            query_vector = self.model.encode([query.query])
-            faiss.normalize_L2(query_vector.astype(np.float32))
-
-            # Search FAISS
-            D, I = self.index.search(query_vector.astype(np.float32), query.limit)
-
-            if not any(I[0]):
+            if self.retrieval_mode == "vector":
+                hits = [(chunk_id, 1 - distance) for chunk_id, distance in self._vector_search(query.query, query.limit)]
+            else:
+                candidates = query.limit if self.retrieval_mode == "keyword" else query.limit * 4
+                rankings = [[chunk_id for chunk_id, _ in self._keyword_search(query.query, candidates)]]
+                if self.retrieval_mode == "hybrid":
+                    rankings.append([chunk_id for chunk_id, _ in self._vector_search(query.query, candidates)])
+                # Fused scores scaled so a top hit in every ranking is 1.0
+                best = len(rankings) / (RRF_K + 1)
+                hits = [(chunk_id, score / best) for chunk_id, score in reciprocal_rank_fusion(rankings)[:query.limit]]
+
+            if not hits:
                 logger.info(f"No local search results for: {query.query}")
                 return []
 
-            # Get text and metadata from SQLite
-            chunk_ids = tuple(I[0])
-            results_data = self._get_chunks_by_ids(chunk_ids)
+            # Get text and metadata from SQLite, keeping rank order
+            chunk_map = self._get_chunk_map(chunk_id for chunk_id, _ in hits)
+            hits = [(chunk_id, score) for chunk_id, score in hits if chunk_id in chunk_map]
 
-            if not results_data:
+            if not hits:
                 logger.warning("No chunks found in database")
                 return []
 
             # Convert to SearchResult format
             results = []
-            for i, (text, path, headers) in enumerate(results_data):
+            for chunk_id, similarity in hits:
+                text, path, headers = chunk_map[chunk_id]
                 result = SearchResult(
                     provider=self.PROVIDER_TYPE,
                     query=query.query,
                     title=headers or "Local Document",
                     description=text[:500] + "..." if len(text) > 500 else text,
                     url=f"file://{path}",
-                    confidence=1 - D[0][i],  # Convert distance to similarity score
+                    confidence=similarity,
                     metadata={
                         'source_file': path,
                         'section': headers,
-                        'similarity_score': float(1 - D[0][i]),
-                        'chunk_index': int(I[0][i])
+                        'similarity_score': similarity,
+                        'retrieval_mode': self.retrieval_mode,
+                        'chunk_index': chunk_id
                     }
                 )
                 results.append(result)
@@ -141,23 +147,37 @@ class LocalSearchProvider(SearchProviderInterface):
             logger.error(f"Local search error: {e}")
             return []
 
-    def _get_chunks_by_ids(self, chunk_ids: tuple) -> List[tuple]:
-        """Get chunks from SQLite database by IDs"""
+    def _vector_search(self, text: str, limit: int) -> List[Tuple[int, float]]:
+        """FAISS search; returns (chunk_id, distance) pairs, best first"""
+        # Load components if not already loaded
+        if self.index is None:
+            self._load_components()
+
+        import faiss
+        import numpy as np
+        query_vector = self.model.encode([text]).astype(np.float32)
+        faiss.normalize_L2(query_vector)
+
+        D, I = self.index.search(query_vector, limit)
+        return [(int(chunk_id), float(distance)) for chunk_id, distance in zip(I[0], D[0]) if chunk_id >= 0]
+
+    def _keyword_search(self, text: str, limit: int) -> List[Tuple[int, float]]:
+        """FTS5 search; returns (chunk_id, bm25) pairs, best first. Needs no model."""
+        if self.store is None:
+            if not os.path.exists(self.metadata_file):
+                raise RuntimeError(f"Metadata database not found: {self.metadata_file}")
+            self.store = database.get_store(self.metadata_file)
+            self.store.create_tables()
+        return self.store.search_chunks(text, limit)
+
+    def _get_chunk_map(self, chunk_ids) -> Dict[int, tuple]:
+        """Get chunks from the metadata store keyed by ID"""
         try:
-            cursor = self.db_connection.cursor()
-            placeholders = ','.join('?' * len(chunk_ids))
-            cursor.execute(f"SELECT text, path, headers FROM chunks WHERE id IN ({placeholders})", chunk_ids)
-
-            results = []
-            for row in cursor.fetchall():
-                text, path, headers = row
-                results.append((text, path, headers))
-
-            return results
+            return self.store.get_chunk_map(chunk_ids)
 
         except Exception as e:
             logger.error(f"Error querying database: {e}")
-            return []
+            return {}
 
     async def get_document_info(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -170,17 +190,13 @@ class LocalSearchProvider(SearchProviderInterface):
             Document metadata or None if not found
         """
         try:
-            if not self.db_connection:
+            if not self.store:
                 self._load_components()
 
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT COUNT(*), path FROM chunks WHERE path = ? GROUP BY path", (file_path,))
-
-            result = cursor.fetchone()
-            if result:
-                chunk_count, path = result
+            chunk_count = self.store.count_chunks(file_path)
+            if chunk_count:
                 return {
-                    'file_path': path,
+                    'file_path': file_path,
                     'chunk_count': chunk_count,
                     'indexed': True
                 }
@@ -193,17 +209,11 @@ class LocalSearchProvider(SearchProviderInterface):
     async def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics about the local index"""
         try:
-            if not self.index or not self.db_connection:
+            if not self.index or not self.store:
                 self._load_components()
 
-            # Get total chunks
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM chunks")
-            total_chunks = cursor.fetchone()[0]
-
-            # Get unique files
-            cursor.execute("SELECT COUNT(DISTINCT path) FROM chunks")
-            total_files = cursor.fetchone()[0]
+            total_chunks = self.store.count_chunks()
+            total_files = self.store.count_files()
 
             return {
                 'total_chunks': total_chunks,
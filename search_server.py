@@ -0,0 +1,280 @@
+"""
+Resident local search server for the RAG system.
+
+Loading the embedding model and FAISS index takes seconds; a query against
+them takes milliseconds. This server loads both once and answers searches
+over localhost HTTP, so local_search.py and cli.py only pay for the query.
+The index file is re-read whenever watcher.py or ingest.py saves a new one.
+
+Search modes: "vector" (FAISS), "keyword" (SQLite FTS5 / BM25, no model
+needed) and "hybrid" (both, merged with reciprocal-rank fusion).
+
+Endpoints:
+    GET  /search?q=<query>&k=<top_k>&mode=<mode>
+                                      -> {"query": ..., "results": [...]}
+    GET  /health                      -> {"status": "ok", "vectors": N}
+    POST /reload                      -> force an index reload
+
+Usage:
+    python search_server.py
+    python search_server.py --port 8765
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import database
+from mamcrawler.rag.indexing import FAISSIndexManager
+from mamcrawler.rag.fusion import SEARCH_MODES, reciprocal_rank_fusion
+from mamcrawler.config import RAGConfig, DEFAULT_RAG_CONFIG
+
+# Candidates taken from each ranking per requested hybrid result
+HYBRID_CANDIDATES = 4
+
+
+class SearchEngine:
+    """
+    Embedding model, FAISS index and metadata store kept in memory.
+
+    The index is reloaded when its file changes on disk (checked before each
+    search; saves are atomic renames, so a changed stat means a complete file).
+    The embedding model is loaded on the first vector or hybrid search, so
+    in-process keyword-only use never pays for it; the resident server calls
+    warm_up() at startup so no client query waits for the model.
+    """
+
+    def __init__(self, config: RAGConfig = None):
+        """
+        Args:
+            config: RAG configuration
+        """
+        self.config = config or DEFAULT_RAG_CONFIG
+        self._embedding_service = None
+        self.store = database.get_store(self.config.db_path)
+        self.store.create_tables()
+        self._lock = threading.RLock()
+        self._index_stamp: Optional[Tuple[int, int]] = None
+        self.index_manager: Optional[FAISSIndexManager] = None
+        self.reload()
+
+    @property
+    def embedding_service(self):
+        """The embedding service, loaded on first use."""
+        if self._embedding_service is None:
+            from mamcrawler.rag.embeddings import EmbeddingService
+            self._embedding_service = EmbeddingService(self.config)
+        return self._embedding_service
+
+    def warm_up(self):
+        """Load the embedding model now instead of on the first search."""
+        self.embedding_service
+
+    def _stamp(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the index file, or None if it is missing."""
+        try:
+            stat = os.stat(self.config.index_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self):
+        """Load the index from disk."""
+        with self._lock:
+            stamp = self._stamp()
+            if stamp is None:
+                raise FileNotFoundError(f"{self.config.index_path} not found. Run: python ingest.py")
+            self.index_manager = FAISSIndexManager(self.config)
+            self._index_stamp = stamp
+
+    def reload_if_changed(self) -> bool:
+        """Reload the index if its file changed since it was loaded."""
+        stamp = self._stamp()
+        if stamp is None or stamp == self._index_stamp:
+            return False
+        try:
+            self.reload()
+        except Exception as e:
+            # Keep serving the index we have
+            print(f"Index reload failed: {e}", file=sys.stderr)
+            return False
+        return True
+
+    def search(self, query: str, top_k: int = None, mode: str = "vector") -> List[Dict]:
+        """
+        Search the knowledge base.
+
+        Args:
+            query: The search query
+            top_k: Number of results to return
+            mode: "vector", "keyword" or "hybrid"
+
+        Returns:
+            Result dicts (chunk_id, source, section, content, score), best
+            match first. score is the L2 distance for vector and the BM25
+            score for keyword search (lower = better), and the fused RRF
+            score for hybrid search (higher = better).
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode {mode!r}, expected one of {SEARCH_MODES}")
+        top_k = top_k or self.config.top_k
+
+        if mode == "vector":
+            hits = self.vector_search(query, top_k)
+        elif mode == "keyword":
+            hits = self.store.search_chunks(query, top_k)
+        else:
+            candidates = top_k * HYBRID_CANDIDATES
+            rankings = [
+                [chunk_id for chunk_id, _ in self.vector_search(query, candidates)],
+                [chunk_id for chunk_id, _ in self.store.search_chunks(query, candidates)],
+            ]
+            hits = reciprocal_rank_fusion(rankings)[:top_k]
+
+        return self._results(hits)
+
+    def vector_search(self, query: str, top_k: int) -> List[Tuple[int, float]]:
+        """FAISS search; returns (chunk_id, distance) pairs, best first."""
+        self.reload_if_changed()
+
+        query_vector = self.embedding_service.encode_query(query)
+        with self._lock:
+            distances, ids = self.index_manager.search(query_vector, top_k)
+
+        return [(int(chunk_id), float(distance)) for chunk_id, distance in zip(ids[0], distances[0]) if chunk_id >= 0]
+
+    def _results(self, hits: List[Tuple[int, float]]) -> List[Dict]:
+        """Attach chunk text and source to ranked (chunk_id, score) pairs."""
+        chunk_map = self.store.get_chunk_map(chunk_id for chunk_id, _ in hits)
+        return [
+            {
+                "chunk_id": chunk_id,
+                "source": chunk_map[chunk_id][1],
+                "section": chunk_map[chunk_id][2],
+                "content": chunk_map[chunk_id][0],
+                "score": score,
+            }
+            for chunk_id, score in hits
+            if chunk_id in chunk_map
+        ]
+
+    @property
+    def total_vectors(self) -> int:
+        return self.index_manager.total_vectors
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a SearchEngine (set as server.engine)."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send(200, {"status": "ok", "vectors": self.server.engine.total_vectors})
+            return
+        if url.path != "/search":
+            self._send(404, {"error": f"unknown path {url.path}"})
+            return
+
+        params = parse_qs(url.query)
+        query = params.get("q", [""])[0].strip()
+        if not query:
+            self._send(400, {"error": "missing q"})
+            return
+        try:
+            top_k = int(params.get("k", [0])[0]) or None
+        except ValueError:
+            self._send(400, {"error": "k must be an integer"})
+            return
+        mode = params.get("mode", ["vector"])[0]
+        if mode not in SEARCH_MODES:
+            self._send(400, {"error": f"mode must be one of {', '.join(SEARCH_MODES)}"})
+            return
+
+        try:
+            results = self.server.engine.search(query, top_k, mode)
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+            return
+        self._send(200, {"query": query, "results": results})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/reload":
+            self._send(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            self.server.engine.reload()
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+            return
+        self._send(200, {"status": "reloaded", "vectors": self.server.engine.total_vectors})
+
+    def _send(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Per-request access logging would dominate a millisecond query
+        pass
+
+
+def make_server(engine: SearchEngine, host: str = None, port: int = None) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) the HTTP server for an engine.
+
+    Args:
+        engine: Loaded SearchEngine
+        host: Bind address (defaults to config.search_host)
+        port: Port (defaults to config.search_port; 0 picks a free one)
+    """
+    host = host or engine.config.search_host
+    port = engine.config.search_port if port is None else port
+    server = ThreadingHTTPServer((host, port), SearchRequestHandler)
+    server.daemon_threads = True
+    server.engine = engine
+    return server
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Resident local RAG search server")
+    parser.add_argument("--host", default=DEFAULT_RAG_CONFIG.search_host)
+    parser.add_argument("--port", type=int, default=DEFAULT_RAG_CONFIG.search_port)
+    args = parser.parse_args()
+
+    if not os.path.exists(DEFAULT_RAG_CONFIG.db_path):
+        print(f"ERROR: {DEFAULT_RAG_CONFIG.db_path} not found. Run: python ingest.py")
+        sys.exit(1)
+
+    try:
+        engine = SearchEngine(DEFAULT_RAG_CONFIG)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    # Load the model before accepting queries: loading it on the first
+    # vector search would outlast the clients' connect timeout
+    print("Loading embedding model...")
+    engine.warm_up()
+
+    server = make_server(engine, args.host, args.port)
+    print(f"Serving {engine.total_vectors} vectors on http://{args.host}:{server.server_address[1]}")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping search server...")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
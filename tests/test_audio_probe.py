@@ -0,0 +1,126 @@
+"""
+Unit tests for mamcrawler.audio_probe module.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mamcrawler.audio_probe import ProbeCache, ProbeError
+
+FFPROBE_OUTPUT = {
+    "format": {"duration": "3600.5", "bit_rate": "64000", "tags": {"artist": "Kate Reading"}},
+    "streams": [
+        {"codec_type": "video", "codec_name": "mjpeg"},
+        {"codec_type": "audio", "codec_name": "aac", "bit_rate": "63999",
+         "sample_rate": "44100", "channels": 2, "duration": "3600.4"},
+    ],
+    "chapters": [
+        {"id": 0, "start_time": "0.0", "end_time": "1800.0", "tags": {"title": "Prologue"}},
+        {"id": 1, "start_time": "1800.0", "end_time": "3600.5", "tags": {}},
+    ],
+}
+
+
+def ffprobe_result(returncode=0, stdout=json.dumps(FFPROBE_OUTPUT), stderr=""):
+    return MagicMock(returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+class TestProbeCache(unittest.TestCase):
+    """Test ProbeCache parsing and invalidation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_path = os.path.join(self.temp_dir, "book.m4b")
+        with open(self.audio_path, "wb") as f:
+            f.write(b"audio")
+        self.cache_path = os.path.join(self.temp_dir, "ffprobe_cache.sqlite")
+        self.cache = ProbeCache(self.cache_path)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    @patch("mamcrawler.audio_probe.subprocess.run", return_value=ffprobe_result())
+    def test_probe_parses_output(self, mock_run):
+        """Test one ffprobe call yields format, stream and chapter data."""
+        probe = self.cache.probe(self.audio_path)
+
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertIn("-show_chapters", mock_run.call_args[0][0])
+        self.assertAlmostEqual(probe.duration, 3600.5)
+        self.assertEqual(probe.tag("narrator", "artist"), "Kate Reading")
+        self.assertEqual(probe.audio_stream.codec, "aac")
+        self.assertEqual(probe.audio_stream.bitrate, 63999)
+        self.assertEqual([c.title for c in probe.chapters], ["Prologue", "Chapter 2"])
+        self.assertAlmostEqual(probe.chapters[1].duration, 1800.5)
+
+    @patch("mamcrawler.audio_probe.subprocess.run", return_value=ffprobe_result())
+    def test_cache_persists(self, mock_run):
+        """Test an unchanged file is not probed again, even by a new cache."""
+        self.cache.probe(self.audio_path)
+        self.cache.probe(self.audio_path)
+        self.cache.close()
+
+        reopened = ProbeCache(self.cache_path)
+        probe = reopened.probe(self.audio_path)
+        reopened.close()
+
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertAlmostEqual(probe.duration, 3600.5)
+
+    @patch("mamcrawler.audio_probe.subprocess.run", return_value=ffprobe_result())
+    def test_changed_file_is_reprobed(self, mock_run):
+        """Test a new size or mtime invalidates the cached probe."""
+        self.cache.probe(self.audio_path)
+
+        with open(self.audio_path, "ab") as f:
+            f.write(b"more audio")
+        self.cache.probe(self.audio_path)
+
+        stat = os.stat(self.audio_path)
+        os.utime(self.audio_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.cache.probe(self.audio_path)
+
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch("mamcrawler.audio_probe.subprocess.run")
+    def test_failure_is_not_cached(self, mock_run):
+        """Test ffprobe errors raise ProbeError and are retried next time."""
+        mock_run.side_effect = [ffprobe_result(returncode=1, stderr="Invalid data"), ffprobe_result()]
+
+        with self.assertRaises(ProbeError):
+            self.cache.probe(self.audio_path)
+        self.assertAlmostEqual(self.cache.probe(self.audio_path).duration, 3600.5)
+
+    @patch("mamcrawler.audio_probe.subprocess.run")
+    def test_concurrent_probes_share_one_call(self, mock_run):
+        """Test threads probing the same file wait for one ffprobe."""
+        def slow_ffprobe(*args, **kwargs):
+            time.sleep(0.2)
+            return ffprobe_result()
+
+        mock_run.side_effect = slow_ffprobe
+        threads = [threading.Thread(target=self.cache.probe, args=(self.audio_path,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_missing_file(self):
+        """Test a missing file raises FileNotFoundError without running ffprobe."""
+        with patch("mamcrawler.audio_probe.subprocess.run") as mock_run:
+            with self.assertRaises(FileNotFoundError):
+                self.cache.probe(os.path.join(self.temp_dir, "missing.m4b"))
+        mock_run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,14 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 import json
-import numpy as np
 
 from cli import ask_permission, main
 
+HITS = [
+    {"chunk_id": 1, "source": "path1", "section": "header1", "content": "chunk text 1", "score": 0.1},
+    {"chunk_id": 2, "source": "path2", "section": "header2", "content": "chunk text 2", "score": 0.2},
+]
+
 
 class TestAskPermission(unittest.TestCase):
     """Test ask_permission function."""
@@ -63,9 +67,10 @@ class TestMain(unittest.TestCase):
         mock_print.assert_called_with("Usage: python cli.py <query>")
 
     @patch("os.path.exists")
+    @patch("cli.query_server", return_value=None)
     @patch("builtins.print")
-    def test_main_missing_files(self, mock_print, mock_exists):
-        """Test main with missing index or database files."""
+    def test_main_missing_files(self, mock_print, mock_query, mock_exists):
+        """Test main with no search server and missing index or database files."""
         mock_exists.return_value = False
         sys.argv = ["cli.py", "test query"]
 
@@ -75,31 +80,29 @@ class TestMain(unittest.TestCase):
             "ERROR: index.faiss or database missing. Run: python ingest.py"
         )
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
+    @patch("os.path.exists", return_value=True)
+    @patch("search_server.SearchEngine")
+    @patch("cli.query_server", return_value=None)
     @patch("builtins.print")
-    def test_main_remote_mode_off(
-        self, mock_print, mock_index_class, mock_embed_class, mock_db, mock_exists
-    ):
-        """Test main with REMOTE_MODE='off'."""
-        mock_exists.return_value = True
+    def test_main_without_search_server(self, mock_print, mock_query, mock_engine_class, mock_exists):
+        """Test main searches in-process when no search server is running."""
         sys.argv = ["cli.py", "test query"]
+        mock_engine_class.return_value.search.return_value = HITS
 
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
+        with patch("cli.REMOTE_MODE", "off"):
+            main()
 
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
+        mock_engine_class.return_value.search.assert_called_once_with("test query", 5)
+        self.assertTrue(
+            any("chunk text 1" in str(call) for call in mock_print.call_args_list)
+        )
 
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+    @patch("cli.query_server")
+    @patch("builtins.print")
+    def test_main_remote_mode_off(self, mock_print, mock_query):
+        """Test main with REMOTE_MODE='off'."""
+        sys.argv = ["cli.py", "test query"]
+        mock_query.return_value = HITS
 
         with patch("cli.REMOTE_MODE", "off"):
             with patch("os.getenv", return_value=None):
@@ -113,31 +116,12 @@ class TestMain(unittest.TestCase):
             any("REMOTE_MODE is off" in str(call) for call in mock_print.call_args_list)
         )
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
+    @patch("cli.query_server")
     @patch("builtins.print")
-    def test_main_remote_mode_ask_no_api_key(
-        self, mock_print, mock_index_class, mock_embed_class, mock_db, mock_exists
-    ):
+    def test_main_remote_mode_ask_no_api_key(self, mock_print, mock_query):
         """Test main with REMOTE_MODE='ask' but no API key."""
-        mock_exists.return_value = True
         sys.argv = ["cli.py", "test query"]
-
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
-
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+        mock_query.return_value = HITS
 
         with patch("cli.REMOTE_MODE", "ask"):
             with patch("os.getenv", return_value=None):
@@ -151,39 +135,19 @@ class TestMain(unittest.TestCase):
             )
         )
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
+    @patch("cli.query_server")
     @patch("cli.ask_permission")
     @patch("builtins.print")
     def test_main_remote_mode_ask_user_declines(
         self,
         mock_print,
         mock_ask,
-        mock_index_class,
-        mock_embed_class,
-        mock_db,
-        mock_exists,
+        mock_query,
     ):
         """Test main with REMOTE_MODE='ask' and user declines."""
-        mock_exists.return_value = True
         sys.argv = ["cli.py", "test query"]
         mock_ask.return_value = False
-
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
-
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+        mock_query.return_value = HITS
 
         with patch("cli.REMOTE_MODE", "ask"):
             with patch("os.getenv", return_value="fake_key"):
@@ -194,41 +158,21 @@ class TestMain(unittest.TestCase):
             any("Skipping cloud API" in str(call) for call in mock_print.call_args_list)
         )
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
+    @patch("cli.query_server")
     @patch("cli.ask_permission")
-    @patch("cli.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     @patch("builtins.print")
     def test_main_remote_mode_ask_user_accepts(
         self,
         mock_print,
         mock_anthropic_class,
         mock_ask,
-        mock_index_class,
-        mock_embed_class,
-        mock_db,
-        mock_exists,
+        mock_query,
     ):
         """Test main with REMOTE_MODE='ask' and user accepts."""
-        mock_exists.return_value = True
         sys.argv = ["cli.py", "test query"]
         mock_ask.return_value = True
-
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
-
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+        mock_query.return_value = HITS
 
         # Mock Anthropic
         mock_client = MagicMock()
@@ -248,38 +192,18 @@ class TestMain(unittest.TestCase):
             any("AI response" in str(call) for call in mock_print.call_args_list)
         )
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
-    @patch("cli.anthropic.Anthropic")
+    @patch("cli.query_server")
+    @patch("anthropic.Anthropic")
     @patch("builtins.print")
     def test_main_remote_mode_on(
         self,
         mock_print,
         mock_anthropic_class,
-        mock_index_class,
-        mock_embed_class,
-        mock_db,
-        mock_exists,
+        mock_query,
     ):
         """Test main with REMOTE_MODE='on'."""
-        mock_exists.return_value = True
         sys.argv = ["cli.py", "test query"]
-
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
-
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+        mock_query.return_value = HITS
 
         # Mock Anthropic
         mock_client = MagicMock()
@@ -297,38 +221,18 @@ class TestMain(unittest.TestCase):
         mock_anthropic_class.assert_called_once_with(api_key="fake_key")
         mock_client.messages.create.assert_called_once()
 
-    @patch("os.path.exists")
-    @patch("cli.database")
-    @patch("cli.EmbeddingService")
-    @patch("cli.FAISSIndexManager")
-    @patch("cli.anthropic.Anthropic")
+    @patch("cli.query_server")
+    @patch("anthropic.Anthropic")
     @patch("builtins.print")
     def test_main_api_error(
         self,
         mock_print,
         mock_anthropic_class,
-        mock_index_class,
-        mock_embed_class,
-        mock_db,
-        mock_exists,
+        mock_query,
     ):
         """Test main with API error."""
-        mock_exists.return_value = True
         sys.argv = ["cli.py", "test query"]
-
-        # Mock components
-        mock_embed = MagicMock()
-        mock_embed.encode_query.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index.search.return_value = (np.array([[0.1, 0.2]]), np.array([[1, 2]]))
-        mock_index_class.return_value = mock_index
-
-        mock_db.get_chunks_by_ids.return_value = [
-            ("chunk text 1", "path1", "header1"),
-            ("chunk text 2", "path2", "header2"),
-        ]
+        mock_query.return_value = HITS
 
         # Mock Anthropic to raise exception
         mock_client = MagicMock()
@@ -16,6 +16,13 @@ from database import (
     get_chunk_ids_for_file,
     delete_file_records,
     get_chunks_by_ids,
+    begin_file,
+    insert_chunks,
+    finalize_files,
+    close_stores,
+    get_store,
+    search_chunks,
+    fts_query,
 )
 
 
@@ -30,8 +37,10 @@ class TestDatabase(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
+        close_stores()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
 
     def test_create_tables(self):
         """Test create_tables function."""
@@ -230,5 +239,146 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(results, [])
 
 
+    def test_begin_file_keeps_id_and_marks_pending(self):
+        """Test begin_file keeps the file_id and returns its old chunks."""
+        create_tables(self.db_path)
+        file_id = insert_or_update_file("test/path.md", 1.0, "hash123", self.db_path)
+        chunk_id = insert_chunk(file_id, "old", "h", self.db_path)
+
+        result = begin_file("test/path.md", 2.0, self.db_path)
+
+        self.assertEqual(result, (file_id, [chunk_id]))
+        self.assertEqual(get_file_details("test/path.md", self.db_path), (file_id, ""))
+
+    def test_insert_chunks(self):
+        """Test insert_chunks writes all rows and returns their IDs in order."""
+        create_tables(self.db_path)
+        insert_chunk(1, "first", "h", self.db_path)
+
+        chunk_ids = insert_chunks([(1, "a", "h1"), (2, "b", "h2")], self.db_path)
+
+        self.assertEqual(len(chunk_ids), 2)
+        self.assertGreater(chunk_ids[0], 1)
+
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT chunk_id, file_id, chunk_text FROM chunks ORDER BY chunk_id"
+        ).fetchall()
+        conn.close()
+        self.assertEqual(rows[1:], [(chunk_ids[0], 1, "a"), (chunk_ids[1], 2, "b")])
+
+    def test_insert_chunks_does_not_reuse_deleted_ids(self):
+        """Test reserved IDs stay above deleted AUTOINCREMENT IDs."""
+        create_tables(self.db_path)
+        chunk_ids = insert_chunks([(1, "a", None), (1, "b", None)], self.db_path)
+        delete_file_records(1, self.db_path)
+
+        new_ids = insert_chunks([(1, "c", None)], self.db_path)
+
+        self.assertGreater(new_ids[0], chunk_ids[-1])
+
+    def test_finalize_files(self):
+        """Test finalize_files records the hash and drops stale chunks."""
+        create_tables(self.db_path)
+        file_id, _ = begin_file("test/path.md", 1.0, self.db_path)
+        stale = insert_chunks([(file_id, "old", None)], self.db_path)
+        fresh = insert_chunks([(file_id, "new", None)], self.db_path)
+
+        finalize_files([(file_id, "hash456", stale)], self.db_path)
+
+        self.assertEqual(get_file_details("test/path.md", self.db_path), (file_id, "hash456"))
+        self.assertEqual(get_chunk_ids_for_file(file_id, self.db_path), fresh)
+
+
+    def test_get_chunks_by_ids_preserves_rank_order(self):
+        """Test rows come back in the order of the requested IDs."""
+        create_tables(self.db_path)
+        file_id = insert_or_update_file("test/path.md", 1.0, "hash", self.db_path)
+        chunk_ids = insert_chunks(
+            [(file_id, "first", "h1"), (file_id, "second", "h2"), (file_id, "third", "h3")],
+            self.db_path,
+        )
+
+        results = get_chunks_by_ids(
+            [chunk_ids[2], -1, chunk_ids[0], chunk_ids[1]], self.db_path
+        )
+
+        self.assertEqual([row[0] for row in results], ["third", "first", "second"])
+
+    def test_store_bulk_delete(self):
+        """Test MetadataStore bulk delete methods."""
+        create_tables(self.db_path)
+        store = get_store(self.db_path)
+        file_a = store.insert_or_update_file("a.md", 1.0, "a")
+        file_b = store.insert_or_update_file("b.md", 1.0, "b")
+        chunk_ids = store.insert_chunks([(file_a, "a1", None), (file_a, "a2", None), (file_b, "b1", None)])
+
+        store.delete_chunks(chunk_ids[:1])
+        self.assertEqual(store.get_chunk_ids_for_file(file_a), [chunk_ids[1]])
+
+        store.delete_files([file_a, file_b])
+        self.assertEqual(store.count_chunks(), 0)
+        self.assertEqual(store.count_files(), 0)
+
+    def test_store_uses_wal_and_one_connection(self):
+        """Test the shared store keeps a single WAL-mode connection."""
+        store = get_store(self.db_path)
+        create_tables(self.db_path)
+        get_file_details("test/path.md", self.db_path)
+
+        self.assertIs(get_store(self.db_path), store)
+        self.assertIs(store.conn, store.conn)
+        self.assertEqual(store.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_search_chunks_stays_in_sync(self):
+        """Test the FTS index follows chunk inserts and deletes."""
+        create_tables(self.db_path)
+        store = get_store(self.db_path)
+        file_id = store.insert_or_update_file("rules.md", 1.0, "h")
+        chunk_ids = store.insert_chunks([
+            (file_id, "Rule 2.3: no ratio cheating", "Rules"),
+            (file_id, "Narrated by Kate Reading", "Narrators"),
+        ])
+
+        self.assertEqual([row[0] for row in search_chunks("rule 2.3", db_path=self.db_path)], [chunk_ids[0]])
+        self.assertEqual([row[0] for row in search_chunks("narrators", db_path=self.db_path)], [chunk_ids[1]])
+
+        store.delete_chunks(chunk_ids[:1])
+        self.assertEqual(search_chunks("ratio", db_path=self.db_path), [])
+
+    def test_search_chunks_ranks_by_bm25(self):
+        """Test chunks matching more query terms rank first."""
+        create_tables(self.db_path)
+        store = get_store(self.db_path)
+        file_id = store.insert_or_update_file("a.md", 1.0, "h")
+        chunk_ids = store.insert_chunks([
+            (file_id, "qbittorrent", None),
+            (file_id, "qbittorrent port forwarding", None),
+        ])
+
+        results = search_chunks("qbittorrent port", db_path=self.db_path)
+
+        self.assertEqual([row[0] for row in results], [chunk_ids[1], chunk_ids[0]])
+
+    def test_create_tables_indexes_existing_chunks(self):
+        """Test a database created before the FTS table gets its chunks indexed."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE files (file_id INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT UNIQUE NOT NULL, last_modified REAL NOT NULL, file_hash TEXT NOT NULL)")
+        conn.execute("CREATE TABLE chunks (chunk_id INTEGER PRIMARY KEY AUTOINCREMENT, file_id INTEGER NOT NULL, chunk_text TEXT NOT NULL, header_metadata TEXT)")
+        conn.execute("INSERT INTO files VALUES (1, 'old.md', 1.0, 'h')")
+        conn.execute("INSERT INTO chunks VALUES (7, 1, 'legacy torrent 12345', NULL)")
+        conn.commit()
+        conn.close()
+
+        create_tables(self.db_path)
+
+        self.assertEqual(search_chunks("12345", db_path=self.db_path)[0][0], 7)
+
+    def test_fts_query_quotes_terms(self):
+        """Test free text cannot break FTS5 query syntax."""
+        self.assertEqual(fts_query('rule 2.3 "x" -'), '"rule" OR "2.3" OR """x"""')
+        self.assertEqual(fts_query("  "), "")
+
+
 if __name__ == "__main__":
     unittest.main()
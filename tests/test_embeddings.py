@@ -4,6 +4,9 @@ Unit tests for mamcrawler.rag.embeddings module.
 
 import unittest
 from unittest.mock import patch, MagicMock
+import os
+import shutil
+import tempfile
 import numpy as np
 
 from mamcrawler.rag.embeddings import (
@@ -11,6 +14,7 @@ from mamcrawler.rag.embeddings import (
     get_embedding_service,
     encode_texts,
 )
+from mamcrawler.rag.embedding_cache import EmbeddingCache
 from mamcrawler.config import RAGConfig
 
 
@@ -22,7 +26,7 @@ class TestEmbeddingService(unittest.TestCase):
         from mamcrawler.rag.embeddings import EmbeddingService
 
         EmbeddingService._reset_singleton()
-        self.config = RAGConfig()
+        self.config = RAGConfig(embedding_cache_path=None)
 
     @patch("mamcrawler.rag.embeddings.SentenceTransformer")
     def test_init(self, mock_transformer):
@@ -120,6 +124,63 @@ class TestEmbeddingService(unittest.TestCase):
         self.assertEqual(service.dimension, self.config.dimension)
 
 
+class TestEmbeddingCache(unittest.TestCase):
+    """Test content-addressed embedding cache."""
+
+    def setUp(self):
+        """Set up a temporary cache file."""
+        EmbeddingService._reset_singleton()
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "cache.sqlite")
+
+    def tearDown(self):
+        """Clean up."""
+        if EmbeddingService._instance is not None and EmbeddingService._instance.cache:
+            EmbeddingService._instance.cache.close()
+        EmbeddingService._reset_singleton()
+        shutil.rmtree(self.temp_dir)
+
+    @patch("mamcrawler.rag.embeddings.SentenceTransformer")
+    def test_only_changed_texts_are_embedded(self, mock_transformer):
+        """Test a re-encode only sends uncached texts to the model."""
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda texts: np.array(
+            [[float(len(text)), 1.0] for text in texts], dtype=np.float32
+        )
+        mock_transformer.return_value = mock_model
+
+        service = EmbeddingService(RAGConfig(embedding_cache_path=self.cache_path))
+        first = service.encode(["aa", "bbb", "aa"], normalize=False)
+        second = service.encode(["bbb", "cccc", "aa"], normalize=False)
+
+        self.assertEqual(mock_model.encode.call_args_list[0].args[0], ["aa", "bbb"])
+        self.assertEqual(mock_model.encode.call_args_list[1].args[0], ["cccc"])
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(second, [[3.0, 1.0], [4.0, 1.0], [2.0, 1.0]])
+        self.assertEqual(service.cache.hits, 2)
+
+    @patch("mamcrawler.rag.embeddings.SentenceTransformer")
+    def test_query_bypasses_cache(self, mock_transformer):
+        """Test encode_query neither reads nor fills the cache."""
+        mock_transformer.return_value.encode.return_value = np.ones((1, 2), dtype=np.float32)
+
+        service = EmbeddingService(RAGConfig(embedding_cache_path=self.cache_path))
+        service.encode_query("query")
+
+        self.assertEqual(len(service.cache), 0)
+
+    def test_keys_include_model_name(self):
+        """Test vectors from one model are not returned for another."""
+        cache_a = EmbeddingCache(self.cache_path, "model-a")
+        cache_a.put_many(["text"], np.ones((1, 2), dtype=np.float32))
+        cache_b = EmbeddingCache(self.cache_path, "model-b")
+
+        self.assertIn("text", cache_a.get_many(["text"]))
+        self.assertEqual(cache_b.get_many(["text"]), {})
+        cache_a.close()
+        cache_b.close()
+
+
 class TestGetEmbeddingService(unittest.TestCase):
     """Test get_embedding_service function."""
 
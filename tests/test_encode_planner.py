@@ -0,0 +1,156 @@
+"""
+Unit tests for mamcrawler.audio_processing.encode_planner module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mamcrawler.audio_probe import AudioProbe, Chapter
+from mamcrawler.audio_processing.encode_planner import EncodePlanner, escape_ffmetadata
+from mamcrawler.audio_processing.normalizer import AudioNormalizer, parse_loudnorm_json
+
+LOUDNORM_STDERR = """[Parsed_loudnorm_0 @ 0x55d]
+{
+\t"input_i" : "-23.54",
+\t"input_tp" : "-7.96",
+\t"input_lra" : "6.70",
+\t"input_thresh" : "-34.02",
+\t"normalization_type" : "dynamic",
+\t"target_offset" : "0.14"
+}
+"""
+
+QUIET = {'integrated_loudness': -23.54, 'loudness_range': 6.7, 'true_peak': -7.96,
+         'threshold': -34.02, 'target_offset': 0.14, 'valid': True}
+AT_TARGET = dict(QUIET, integrated_loudness=-16.2)
+
+TAGS = {'title': 'Dune', 'album': 'Dune', 'artist': 'Frank Herbert', 'album_artist': 'Frank Herbert',
+        'composer': 'Scott Brick', 'genre': 'Audiobook'}
+METADATA = {'title': 'Dune', 'author': 'Frank Herbert', 'narrator': 'Scott Brick'}
+
+
+def audio_probe(path, duration, chapters=(), codec='aac', tags=None):
+    return AudioProbe(
+        path=path, size=1, mtime_ns=1, duration=duration, bitrate=64000, format_name='mov,mp4,m4a',
+        tags=dict(tags or {}),
+        streams=[{'codec_type': 'audio', 'codec_name': codec}],
+        chapters=[Chapter(i, title, start, end) for i, (title, start, end) in enumerate(chapters)],
+    )
+
+
+class TestLoudnormParsing(unittest.TestCase):
+    """Test the normalizer's loudnorm helpers."""
+
+    def test_parse_json_block(self):
+        values = parse_loudnorm_json(LOUDNORM_STDERR)
+
+        self.assertAlmostEqual(values['input_i'], -23.54)
+        self.assertAlmostEqual(values['target_offset'], 0.14)
+        self.assertEqual(parse_loudnorm_json("no stats"), {})
+
+    def test_loudnorm_filter_uses_measurements(self):
+        loudnorm = AudioNormalizer().loudnorm_filter(QUIET)
+
+        self.assertIn("measured_I=-23.54", loudnorm)
+        self.assertIn("measured_thresh=-34.02", loudnorm)
+        self.assertIn("offset=0.14", loudnorm)
+        self.assertTrue(loudnorm.endswith("linear=true"))
+
+
+class TestEncodePlanner(unittest.TestCase):
+    """Test plan construction and execution."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.planner = EncodePlanner(AudioNormalizer(output_format="m4b"))
+        self.output = os.path.join(self.temp_dir, "Dune.m4b")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _plan(self, probes, analysis):
+        with patch("mamcrawler.audio_processing.encode_planner.probe_audio", side_effect=probes):
+            return self.planner.plan([p.path for p in probes], self.output, METADATA, analysis)
+
+    def test_split_book_single_pass(self):
+        """Test parts are concatenated, normalized, chaptered and tagged in one command."""
+        probes = [
+            audio_probe("/in/part1.m4b", 100.0, [("Prologue", 0.0, 40.0), ("One", 40.0, 100.0)]),
+            audio_probe("/in/part2.m4b", 50.0),
+        ]
+
+        plan = self._plan(probes, QUIET)
+
+        self.assertEqual(plan.steps, ['merge', 'normalize', 'chapters', 'tags', 'encode'])
+        self.assertEqual(
+            [(c['title'], c['start_time'], c['end_time']) for c in plan.chapters],
+            [("Prologue", 0.0, 40.0), ("One", 40.0, 100.0), ("Part 2", 100.0, 150.0)]
+        )
+
+        cmd = plan.ffmpeg_command("/out/tmp.m4b", "/out/meta.txt", "/out/concat.txt", ['-c:a', 'aac'])
+        self.assertEqual(cmd.count('-i'), 2)
+        self.assertIn('concat', cmd)
+        self.assertIn('-af', cmd)
+        self.assertIn('aac', cmd)
+        self.assertNotIn('copy', cmd)
+
+        metadata = plan.ffmetadata()
+        self.assertTrue(metadata.startswith(';FFMETADATA1\n'))
+        self.assertIn('composer=Scott Brick', metadata)
+        self.assertIn('START=100000\nEND=150000\ntitle=Part 2', metadata)
+
+    def test_at_target_is_stream_copied(self):
+        """Test a book already at target loudness is remuxed, not re-encoded."""
+        plan = self._plan([audio_probe("/in/book.m4b", 100.0, [("One", 0.0, 100.0)])], AT_TARGET)
+
+        self.assertEqual(plan.steps, ['tags', 'remux'])
+        self.assertEqual(plan.skipped, ['merge', 'normalize', 'chapters'])
+        self.assertIn('copy', plan.ffmpeg_command("/out/tmp.m4b", "/out/meta.txt"))
+
+    def test_mp3_source_is_transcoded(self):
+        """Test a codec the container cannot take is re-encoded without loudnorm."""
+        plan = self._plan([audio_probe("/in/book.mp3", 100.0, codec='mp3', tags=TAGS)], AT_TARGET)
+
+        self.assertIn('transcode', plan.steps)
+        self.assertIsNone(plan.audio_filter)
+
+    def test_finished_source_is_noop(self):
+        """Test nothing is encoded when the source already matches the plan."""
+        source = os.path.join(self.temp_dir, "source.m4b")
+        with open(source, "wb") as f:
+            f.write(b"audio")
+
+        plan = self._plan([audio_probe(source, 100.0, [("One", 0.0, 100.0)], tags=TAGS)], AT_TARGET)
+        self.assertTrue(plan.is_noop)
+
+        with patch("mamcrawler.audio_processing.encode_planner.subprocess.run") as mock_run:
+            result = self.planner.execute(plan)
+
+        mock_run.assert_not_called()
+        self.assertTrue(result['success'])
+        with open(self.output, "rb") as f:
+            self.assertEqual(f.read(), b"audio")
+
+    def test_failed_encode_cleans_up(self):
+        """Test a failed encode leaves no output or temp files behind."""
+        plan = self._plan([
+            audio_probe("/in/part1.m4b", 100.0),
+            audio_probe("/in/part2.m4b", 50.0),
+        ], QUIET)
+
+        with patch("mamcrawler.audio_processing.encode_planner.subprocess.run",
+                   return_value=MagicMock(returncode=1, stderr="boom")):
+            result = self.planner.execute(plan)
+
+        self.assertFalse(result['success'])
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_escape_ffmetadata(self):
+        self.assertEqual(escape_ffmetadata("a=b;c#d\\e"), "a\\=b\\;c\\#d\\\\e")
+
+
+if __name__ == "__main__":
+    unittest.main()
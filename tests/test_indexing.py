@@ -5,10 +5,11 @@ Unit tests for mamcrawler.rag.indexing module.
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 import tempfile
+import shutil
 import os
 import numpy as np
 
-from mamcrawler.rag.indexing import FAISSIndexManager, get_index_manager, reset_manager
+from mamcrawler.rag.indexing import FAISSIndexManager, build_index, get_index_manager, reset_manager
 from mamcrawler.config import RAGConfig
 
 
@@ -176,13 +177,18 @@ class TestFAISSIndexManager(unittest.TestCase):
         mock_index = MagicMock()
         mock_faiss.IndexIDMap.return_value = mock_index
 
+        mock_faiss.write_index.side_effect = lambda index, path: open(path, "wb").close()
+
         manager = FAISSIndexManager(self.config, self.index_path)
 
         manager.save()
 
+        # Written beside the target, then renamed over it
         mock_faiss.write_index.assert_called_once_with(
-            mock_index, str(manager.index_path)
+            mock_index, f"{manager.index_path}.tmp"
         )
+        self.assertTrue(os.path.exists(self.index_path))
+        self.assertFalse(os.path.exists(f"{self.index_path}.tmp"))
 
     @patch("mamcrawler.rag.indexing.faiss")
     def test_total_vectors(self, mock_faiss):
@@ -245,5 +251,88 @@ class TestResetManager(unittest.TestCase):
         self.assertIsNone(_manager)
 
 
+class TestIndexTypes(unittest.TestCase):
+    """Test the ANN index types against real FAISS indexes."""
+
+    def setUp(self):
+        """Set up a small-dimension corpus."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.temp_dir, "index.faiss")
+        rng = np.random.default_rng(0)
+        self.vectors = rng.normal(size=(600, 16)).astype(np.float32)
+        self.vectors /= np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        self.ids = np.arange(1, 601, dtype=np.int64)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def _manager(self, **overrides):
+        config = RAGConfig(dimension=16, train_min_vectors=500, nlist=8, pq_m=4, pq_nbits=4, **overrides)
+        with patch("builtins.print"):
+            return FAISSIndexManager(config, self.index_path)
+
+    def test_invalid_index_type(self):
+        """Test an unknown index type is rejected."""
+        with self.assertRaises(ValueError):
+            self._manager(index_type="lsh")
+
+    def test_ivf_trained_once_enough_vectors(self):
+        """Test an IVF index stays flat until train_min_vectors, then trains."""
+        manager = self._manager(index_type="ivf_flat")
+        manager.add(self.vectors[:400], self.ids[:400])
+        self.assertEqual(manager.index_type, "flat")
+
+        with patch("builtins.print"):
+            manager.add(self.vectors[400:], self.ids[400:])
+        self.assertEqual(manager.index_type, "ivf_flat")
+        self.assertEqual(manager.total_vectors, 600)
+
+        manager.remove(np.array([1, 2]))
+        self.assertEqual(manager.total_vectors, 598)
+        _, ids = manager.search(self.vectors[10], k=1)
+        self.assertEqual(ids[0][0], 11)
+
+    def test_ivf_pq_requires_divisible_dimension(self):
+        """Test pq_m must divide the vector dimension."""
+        config = RAGConfig(dimension=16, nlist=8, pq_m=5, pq_nbits=4)
+        with self.assertRaises(ValueError):
+            build_index("ivf_pq", self.ids, self.vectors, config)
+
+    def test_hnsw_tombstones(self):
+        """Test removed HNSW vectors are hidden, persisted and compacted away."""
+        manager = self._manager(index_type="hnsw")
+        manager.add(self.vectors, self.ids)
+        manager.remove(np.array([11]))
+
+        _, ids = manager.search(self.vectors[10], k=3)
+        self.assertNotIn(11, ids[0])
+        self.assertEqual(manager.total_vectors, 599)
+
+        with patch("builtins.print"):
+            manager.save()
+        reloaded = self._manager(index_type="hnsw")
+        self.assertEqual(reloaded.total_vectors, 599)
+        _, ids = reloaded.search(self.vectors[10], k=3)
+        self.assertNotIn(11, ids[0])
+
+        reloaded.rebuild()
+        self.assertEqual(reloaded.index.ntotal, 599)
+        with patch("builtins.print"):
+            reloaded.save()
+        self.assertFalse(os.path.exists(self.index_path + ".deleted.npy"))
+
+    def test_rebuild_converts_type_keeping_ids(self):
+        """Test rebuild converts a flat index to HNSW with the same chunk IDs."""
+        manager = self._manager()
+        manager.add(self.vectors, self.ids)
+
+        manager.rebuild("hnsw")
+
+        self.assertEqual(manager.index_type, "hnsw")
+        _, ids = manager.search(self.vectors[42], k=1)
+        self.assertEqual(ids[0][0], 43)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,163 +3,233 @@ Unit tests for ingest.py module.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 import tempfile
+import shutil
 import os
 import hashlib
 import numpy as np
 
-from ingest import process_file, main
+import database
+from ingest import iter_changed_files, IngestPipeline, PendingFile, main
 
 
-class TestProcessFile(unittest.TestCase):
-    """Test process_file function."""
+class TestIterChangedFiles(unittest.TestCase):
+    """Test iter_changed_files generator."""
 
     def setUp(self):
         """Set up test fixtures."""
         self.temp_dir = tempfile.mkdtemp()
         self.test_file = os.path.join(self.temp_dir, "test.md")
+        with open(self.test_file, "w") as f:
+            f.write("# Test\n\nContent")
+        with open(os.path.join(self.temp_dir, "notes.txt"), "w") as f:
+            f.write("ignored")
 
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        shutil.rmtree(self.temp_dir)
 
-    @patch("ingest.os.path.getmtime")
-    @patch("ingest.safe_read_markdown")
     @patch("ingest.database")
-    @patch("ingest.MarkdownChunker")
-    def test_process_file_new_file(
-        self, mock_chunker_class, mock_db, mock_read, mock_getmtime
-    ):
-        """Test processing a new file."""
-        content = "# Test\n\nContent"
-        mock_read.return_value = content
-        mock_getmtime.return_value = 1234567890.0
+    def test_new_file(self, mock_db):
+        """Test a new file is registered as pending and chunked."""
+        mock_db.get_file_details.return_value = None
+        mock_db.begin_file.return_value = (1, [])
 
         mock_chunker = MagicMock()
         mock_chunker.chunk.return_value = [
             ("embed_text1", "raw_text1", "header1"),
             ("embed_text2", "raw_text2", "header2"),
         ]
-        mock_chunker_class.return_value = mock_chunker
-
-        mock_db.get_file_details.return_value = None
-        mock_db.insert_or_update_file.return_value = 1
-        mock_db.insert_chunk.side_effect = [10, 11]
 
-        chunks, chunk_ids = process_file(self.test_file, mock_chunker)
+        results = list(iter_changed_files(self.temp_dir, mock_chunker))
 
-        mock_read.assert_called_once_with(self.test_file)
-        mock_db.get_file_details.assert_called_once_with(self.test_file)
-        mock_db.insert_or_update_file.assert_called_once()
-        self.assertEqual(mock_db.insert_chunk.call_count, 2)
-        self.assertEqual(chunks, ["embed_text1", "embed_text2"])
-        self.assertEqual(chunk_ids, [10, 11])
+        self.assertEqual(len(results), 1)
+        pending, chunks = results[0]
+        self.assertEqual(pending.path, self.test_file)
+        self.assertEqual(pending.file_id, 1)
+        self.assertEqual(
+            pending.file_hash, hashlib.sha256(b"# Test\n\nContent").hexdigest()
+        )
+        self.assertEqual(len(chunks), 2)
+        mock_db.begin_file.assert_called_once()
 
-    @patch("ingest.safe_read_markdown")
     @patch("ingest.database")
-    @patch("ingest.MarkdownChunker")
-    def test_process_file_unchanged_file(self, mock_chunker_class, mock_db, mock_read):
-        """Test processing an unchanged file."""
-        content = "# Test\n\nContent"
-        mock_read.return_value = content
-
-        file_hash = hashlib.sha256(content.encode()).hexdigest()
+    def test_unchanged_file(self, mock_db):
+        """Test an unchanged file is skipped without chunking."""
+        file_hash = hashlib.sha256(b"# Test\n\nContent").hexdigest()
         mock_db.get_file_details.return_value = (1, file_hash)
 
         mock_chunker = MagicMock()
-        mock_chunker_class.return_value = mock_chunker
 
-        chunks, chunk_ids = process_file(self.test_file, mock_chunker)
+        results = list(iter_changed_files(self.temp_dir, mock_chunker))
 
-        mock_read.assert_called_once_with(self.test_file)
-        mock_db.get_file_details.assert_called_once_with(self.test_file)
+        self.assertEqual(results, [])
         mock_chunker.chunk.assert_not_called()
-        self.assertEqual(chunks, [])
-        self.assertEqual(chunk_ids, [])
+        mock_db.begin_file.assert_not_called()
 
 
-class TestMain(unittest.TestCase):
-    """Test main function."""
+class TestIngestPipeline(unittest.TestCase):
+    """Test IngestPipeline batching and checkpoints."""
+
+    def setUp(self):
+        """Set up mocked components."""
+        self.embedding_service = MagicMock()
+        self.embedding_service.encode.side_effect = lambda texts: np.ones(
+            (len(texts), 2), dtype=np.float32
+        )
+        self.index_manager = MagicMock()
+
+    def _pipeline(self, **kwargs):
+        return IngestPipeline(MagicMock(), self.embedding_service, self.index_manager, **kwargs)
 
-    @patch("ingest.os.walk")
     @patch("ingest.database")
-    @patch("ingest.MarkdownChunker")
-    @patch("ingest.EmbeddingService")
-    @patch("ingest.FAISSIndexManager")
-    @patch("ingest.process_file")
-    def test_main(
-        self,
-        mock_process_file,
-        mock_index_class,
-        mock_embed_class,
-        mock_chunker_class,
-        mock_db,
-        mock_walk,
-    ):
-        """Test main ingestion function."""
-        # Mock directory structure
-        mock_walk.return_value = [
-            ("/test/dir", [], ["file1.md", "file2.md", "not_md.txt"])
+    @patch("ingest.iter_changed_files")
+    def test_chunks_are_embedded_in_batches(self, mock_iter, mock_db):
+        """Test chunks are embedded and written batch_size at a time."""
+        chunks = [(f"embed{i}", f"raw{i}", "h") for i in range(5)]
+        mock_iter.return_value = [(PendingFile("a.md", 1, "hash", [7]), chunks)]
+        mock_db.insert_chunks.side_effect = lambda rows: list(range(len(list(rows))))
+
+        pipeline = self._pipeline(batch_size=2)
+        with patch("builtins.print"):
+            pipeline.run("/test/dir")
+
+        batch_sizes = [len(call.args[0]) for call in self.embedding_service.encode.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertEqual(mock_db.insert_chunks.call_count, 3)
+        self.assertEqual(self.index_manager.add.call_count, 3)
+        self.index_manager.remove.assert_called_once()
+        self.index_manager.save.assert_called_once()
+        mock_db.finalize_files.assert_called_once()
+        self.assertEqual(pipeline.chunks_indexed, 5)
+        self.assertEqual(pipeline.files_processed, 1)
+
+    @patch("ingest.database")
+    @patch("ingest.iter_changed_files")
+    def test_file_finalized_only_after_index_saved(self, mock_iter, mock_db):
+        """Test a file's hash is recorded after the save that covers its chunks."""
+        events = []
+        self.index_manager.save.side_effect = lambda: events.append("save")
+        mock_db.finalize_files.side_effect = lambda files: events.append(
+            [file_id for file_id, _, _ in files]
+        )
+        mock_db.insert_chunks.side_effect = lambda rows: list(range(len(list(rows))))
+        mock_iter.return_value = [
+            (PendingFile("a.md", 1, "h1"), [("e", "r", "h")] * 3),
+            (PendingFile("b.md", 2, "h2"), [("e", "r", "h")] * 3),
         ]
 
-        # Mock components
-        mock_chunker = MagicMock()
-        mock_chunker_class.return_value = mock_chunker
+        pipeline = self._pipeline(batch_size=2, checkpoint_batches=1)
+        with patch("builtins.print"):
+            pipeline.run("/test/dir")
+
+        # File 1 completes inside batch 2; file 2 only in the final batch
+        self.assertEqual(events, ["save", "save", [1], "save", [2]])
+
+    @patch("ingest.database")
+    @patch("ingest.iter_changed_files")
+    def test_no_changes(self, mock_iter, mock_db):
+        """Test nothing is embedded or saved when no file changed."""
+        mock_iter.return_value = []
 
-        mock_embed = MagicMock()
-        mock_embed_class.return_value = mock_embed
+        pipeline = self._pipeline()
+        pipeline.run("/test/dir")
 
-        mock_index = MagicMock()
-        mock_index.total_vectors = 10
-        mock_index_class.return_value = mock_index
+        self.embedding_service.encode.assert_not_called()
+        self.index_manager.add.assert_not_called()
+        self.index_manager.save.assert_not_called()
+        mock_db.finalize_files.assert_not_called()
 
-        # Mock process_file returns
-        mock_process_file.side_effect = [
-            (["chunk1"], [1]),  # file1.md
-            ([], []),  # file2.md (no changes)
+
+class TestResume(unittest.TestCase):
+    """Test an interrupted ingest resumes from its checkpoint."""
+
+    def setUp(self):
+        """Set up a temporary guides directory and database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "metadata.sqlite")
+        self.guides = os.path.join(self.temp_dir, "guides")
+        os.makedirs(self.guides)
+        for name in ("a.md", "b.md"):
+            with open(os.path.join(self.guides, name), "w") as f:
+                f.write(f"# {name}\n\nContent")
+
+        # Route the module-level database functions to the temp database
+        self.patchers = [
+            patch.object(database, name, _with_db_path(getattr(database, name), self.db_path))
+            for name in (
+                "create_tables", "get_file_details", "begin_file",
+                "insert_chunks", "finalize_files", "get_chunk_ids_for_file",
+            )
         ]
+        for patcher in self.patchers:
+            patcher.start()
+        database.create_tables()
 
-        # Mock embeddings
-        mock_embed.encode.return_value = np.array([[1.0, 2.0]], dtype=np.float32)
+    def tearDown(self):
+        """Clean up."""
+        for patcher in self.patchers:
+            patcher.stop()
+        database.close_stores()
+        shutil.rmtree(self.temp_dir)
+
+    def test_interrupted_file_is_reprocessed(self):
+        """Test a file interrupted mid-batch is picked up again on the next run."""
+        chunker = MagicMock()
+        chunker.chunk.side_effect = lambda content: [(content, content, "h")]
+        embedding_service = MagicMock()
+        embedding_service.encode.side_effect = RuntimeError("model crashed")
 
         with patch("builtins.print"):
-            main("/test/dir")
+            with self.assertRaises(RuntimeError):
+                IngestPipeline(chunker, embedding_service, MagicMock(), batch_size=2).run(self.guides)
 
-        mock_db.create_tables.assert_called_once()
-        self.assertEqual(mock_process_file.call_count, 2)  # Only .md files
-        mock_embed.encode.assert_called_once()
-        mock_index.add.assert_called_once()
-        mock_index.save.assert_called_once()
+        a_path = os.path.join(self.guides, "a.md")
+        self.assertEqual(database.get_file_details(a_path)[1], "")
+
+        embedding_service.encode.side_effect = lambda texts: np.ones((len(texts), 2), dtype=np.float32)
+        pipeline = IngestPipeline(chunker, embedding_service, MagicMock(), batch_size=2)
+        with patch("builtins.print"):
+            pipeline.run(self.guides)
+
+        self.assertEqual(pipeline.files_processed, 2)
+        self.assertNotEqual(database.get_file_details(a_path)[1], "")
+        self.assertEqual(len(database.get_chunk_ids_for_file(database.get_file_details(a_path)[0])), 1)
+
+
+def _with_db_path(func, db_path):
+    """Bind a database function to a test database path."""
+    def wrapper(*args, **kwargs):
+        kwargs.setdefault("db_path", db_path)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+class TestMain(unittest.TestCase):
+    """Test main function."""
 
-    @patch("ingest.os.walk")
     @patch("ingest.database")
     @patch("ingest.MarkdownChunker")
     @patch("ingest.EmbeddingService")
     @patch("ingest.FAISSIndexManager")
-    def test_main_no_chunks(
-        self, mock_index_class, mock_embed_class, mock_chunker_class, mock_db, mock_walk
+    @patch("ingest.IngestPipeline.run")
+    def test_main(
+        self,
+        mock_run,
+        mock_index_class,
+        mock_embed_class,
+        mock_chunker_class,
+        mock_db,
     ):
-        """Test main with no chunks to process."""
-        mock_walk.return_value = [("/test/dir", [], ["file1.md"])]
-
-        mock_chunker = MagicMock()
-        mock_chunker_class.return_value = mock_chunker
-
-        mock_embed = MagicMock()
-        mock_embed_class.return_value = mock_embed
-
-        mock_index = MagicMock()
-        mock_index_class.return_value = mock_index
+        """Test main ingestion function."""
+        mock_index_class.return_value.total_vectors = 10
 
-        with patch("ingest.process_file", return_value=([], [])):
-            with patch("builtins.print"):
-                main("/test/dir")
+        with patch("builtins.print"):
+            main("/test/dir")
 
-        mock_embed.encode.assert_not_called()
-        mock_index.add.assert_not_called()
-        mock_index.save.assert_not_called()
+        mock_db.create_tables.assert_called_once()
+        mock_run.assert_called_once_with("/test/dir")
 
 
 if __name__ == "__main__":
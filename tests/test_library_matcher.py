@@ -0,0 +1,102 @@
+"""
+Unit tests for mamcrawler.library_matcher module.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from mamcrawler import library_matcher
+from mamcrawler.library_matcher import LibraryMatcher, normalize_title
+from mamcrawler.series_completion import SeriesCompletion
+
+
+LIBRARY = [
+    {"title": "The Way of Kings", "author": "Brandon Sanderson"},
+    {"title": "Words of Radiance (The Stormlight Archive, Book 2)", "author": "Brandon Sanderson"},
+    {"title": "Mistborn: The Final Empire", "author": "Brandon Sanderson"},
+    {"title": "Dune", "author": "Frank Herbert"},
+]
+
+
+class TestNormalizeTitle(unittest.TestCase):
+    """Test title key normalization."""
+
+    def test_drops_subtitle_and_punctuation(self):
+        self.assertEqual(normalize_title("Mistborn: The Final Empire"), "mistborn")
+        self.assertEqual(normalize_title("Words of Radiance (Book 2)"), "words of radiance")
+        self.assertEqual(normalize_title("  Ender's   Game "), "ender s game")
+        self.assertEqual(normalize_title(None), "")
+
+
+class TestLibraryMatcher(unittest.TestCase):
+    """Test LibraryMatcher membership checks."""
+
+    def setUp(self):
+        self.matcher = LibraryMatcher(LIBRARY)
+
+    def test_exact_and_subtitle_match(self):
+        self.assertTrue(self.matcher.contains("the way of kings", "BRANDON SANDERSON"))
+        self.assertTrue(self.matcher.contains("Words of Radiance", "Brandon Sanderson"))
+        self.assertTrue(self.matcher.contains("Mistborn", "Brandon Sanderson"))
+
+    def test_fuzzy_match_requires_same_author(self):
+        self.assertTrue(self.matcher.contains("The Way of King", "Brandon Sanderson"))
+        self.assertFalse(self.matcher.contains("The Way of Kings", "Frank Herbert"))
+        self.assertFalse(self.matcher.contains("Oathbringer", "Brandon Sanderson"))
+
+    def test_punctuation_is_ignored(self):
+        # Stripping punctuation lets these match although their raw
+        # lowercased titles score below the 0.85 ratio
+        matcher = LibraryMatcher([{"title": "11/22/63", "author": "Stephen King"}])
+        self.assertTrue(matcher.contains("11.22.63", "Stephen King"))
+        self.assertTrue(matcher.contains("11-22-63: A Novel", "Stephen King"))
+        self.assertFalse(matcher.contains("11/22/64 Redux", "Stephen King"))
+
+    def test_contains_many_matches_contains(self):
+        books = [
+            {"title": "Dune", "author": "Frank Herbert"},
+            {"title": "Dune Messiah", "author": "Frank Herbert"},
+            {"title": "The Way of Kngs", "author": "Brandon Sanderson"},
+            {"title": "Elantris", "author": "Brandon Sanderson"},
+            {"title": "Anything", "author": "Unknown"},
+        ]
+        expected = [self.matcher.contains_book(book) for book in books]
+
+        self.assertEqual(self.matcher.contains_many(books), expected)
+        self.assertEqual(expected, [True, False, True, False, False])
+
+    def test_blocking_keeps_fuzzy_matches_in_large_buckets(self):
+        library = [{"title": f"Chronicle Volume {i}", "author": "A"} for i in range(200)]
+        library.append({"title": "The Name of the Wind", "author": "A"})
+        matcher = LibraryMatcher(library)
+
+        self.assertTrue(matcher.contains("The Name of the Wnd", "A"))
+        self.assertFalse(matcher.contains("The Wise Man's Fear", "A"))
+        self.assertEqual(matcher.contains_many([{"title": "Name of the Wind", "author": "A"}]), [True])
+
+    def test_difflib_fallback(self):
+        with patch.object(library_matcher, "RAPIDFUZZ_AVAILABLE", False):
+            self.assertTrue(self.matcher.contains("The Way of King", "Brandon Sanderson"))
+            self.assertEqual(
+                self.matcher.contains_many([{"title": "Dune Messiah", "author": "Frank Herbert"}]),
+                [False],
+            )
+
+
+class TestSeriesCompletionMatching(unittest.TestCase):
+    """Test SeriesCompletion uses the indexed matcher."""
+
+    def test_find_missing_books(self):
+        completion = SeriesCompletion.__new__(SeriesCompletion)
+        series = [
+            {"title": "The Way of Kings", "author": "Brandon Sanderson"},
+            {"title": "Oathbringer", "author": "Brandon Sanderson"},
+        ]
+
+        missing = completion._find_missing_books(series, LIBRARY)
+
+        self.assertEqual([book["title"] for book in missing], ["Oathbringer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Unit tests for mamcrawler.audio_processing.loudness module.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from mamcrawler.audio_processing.loudness import (
+    PREROLL, combine_segments, gated_loudness, measure_segment, parse_ebur128_log,
+    split_timeline
+)
+from mamcrawler.audio_processing.normalizer import AudioNormalizer, analysis_segments
+
+RATE = 1000  # samples per second; loudness math does not depend on it
+
+
+def synthetic_book(seconds=600, seed=7):
+    """Narration-like signal: varying speech levels, pauses and a loud passage."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(seconds * RATE) / RATE
+    level = np.repeat(rng.uniform(0.05, 0.3, seconds // 5), 5 * RATE)[:len(t)]
+    level[(t % 37) < 2] = 0.0          # pauses (below the absolute gate)
+    level[(t > 200) & (t < 230)] = 0.9  # loud passage
+    level[(t > 400) & (t < 420)] = 0.003  # very quiet passage (relative-gated)
+    return level * np.sin(2 * np.pi * 50 * t)
+
+
+def ebur128_log(samples):
+    """Emulate ebur128 framelog output: M (400 ms) and S (3 s) loudness every 100 ms."""
+    power = np.concatenate([[0.0], np.cumsum(samples.astype(np.float64) ** 2)])
+    step = RATE // 10
+    lines = []
+    peak = 20 * np.log10(np.max(np.abs(samples)) or 1e-12)
+    for end in range(step, len(samples) + 1, step):
+        values = []
+        for window in (0.4, 3.0):
+            start = max(0, end - int(window * RATE))
+            mean_square = (power[end] - power[start]) / (end - start)
+            values.append(-0.691 + 10 * np.log10(mean_square) if mean_square > 0 else float('-inf'))
+        lines.append(
+            f"[Parsed_ebur128_0 @ 0x1] t: {end / RATE:<10g} TARGET:-23 LUFS    "
+            f"M: {values[0]:6.1f} S: {values[1]:6.1f}     I: -70.0 LUFS       LRA:   0.0 LU"
+        )
+    lines.append(f"  True peak:\n    Peak:       {peak:5.1f} dBFS")
+    return "\n".join(lines)
+
+
+def measure_segments(samples, segments):
+    """Measure samples the way measure_segment() cuts the timeline."""
+    duration = len(samples) / RATE
+    measured = []
+    for start, length in split_timeline(duration, segments):
+        preroll = min(PREROLL, start)
+        first = int(round((start - preroll) * RATE))
+        last = len(samples) if length is None else int(round((start + length) * RATE))
+        measured.append(parse_ebur128_log(ebur128_log(samples[first:last]), start, preroll, length))
+    return combine_segments(measured)
+
+
+class TestSegmentedLoudness(unittest.TestCase):
+    """Test that segmented measurement matches a single pass."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.samples = synthetic_book()
+        cls.single = measure_segments(cls.samples, 1)
+
+    def test_matches_single_pass(self):
+        for segments in (2, 7, 16):
+            with self.subTest(segments=segments):
+                combined = measure_segments(self.samples, segments)
+
+                self.assertAlmostEqual(combined['integrated_loudness'], self.single['integrated_loudness'], delta=0.05)
+                self.assertAlmostEqual(combined['threshold'], self.single['threshold'], delta=0.05)
+                self.assertAlmostEqual(combined['loudness_range'], self.single['loudness_range'], delta=0.1)
+                self.assertEqual(combined['true_peak'], self.single['true_peak'])
+
+    def test_gating_is_global(self):
+        """Test gating over all blocks, not an average of per-segment results."""
+        # A quiet half and a loud half: the quiet half is relative-gated away
+        quiet, loud = [-40.0] * 100, [-20.0] * 100
+        integrated, threshold = gated_loudness(quiet + loud)
+
+        self.assertAlmostEqual(integrated, -20.0, places=6)
+        self.assertAlmostEqual(threshold, -30.0 + 10 * np.log10((1 + 0.01) / 2), places=6)
+
+        per_segment_mean = (gated_loudness(quiet)[0] + gated_loudness(loud)[0]) / 2
+        self.assertNotAlmostEqual(integrated, per_segment_mean, places=1)
+
+    def test_silence(self):
+        self.assertEqual(gated_loudness([float('-inf'), -80.0]), (None, None))
+
+    def test_split_timeline(self):
+        timeline = split_timeline(3600.05, 16)
+
+        self.assertEqual(len(timeline), 16)
+        self.assertEqual(timeline[0][0], 0.0)
+        self.assertIsNone(timeline[-1][1])
+        for (start, length), (next_start, _) in zip(timeline, timeline[1:]):
+            self.assertAlmostEqual(start + length, next_start)
+            self.assertAlmostEqual(start * 10, round(start * 10))
+
+    def test_analysis_segments(self):
+        self.assertEqual(analysis_segments(None), 1)
+        self.assertEqual(analysis_segments(600.0), 1)
+        self.assertEqual(analysis_segments(36 * 3600.0), min(os.cpu_count() or 1, 432))
+
+
+class TestFailedSegment(unittest.TestCase):
+    """Test a failed segment invalidates the segmented measurement."""
+
+    def setUp(self):
+        # Partial output of a segment ffmpeg gave up on halfway through
+        self.failed = MagicMock(
+            returncode=1,
+            stdout="",
+            stderr=ebur128_log(synthetic_book(seconds=60)) + "\nError while decoding stream #0:0",
+        )
+
+    @patch("mamcrawler.audio_processing.loudness.subprocess.run")
+    def test_measure_segment_raises(self, mock_run):
+        mock_run.return_value = self.failed
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            measure_segment(["-i", "book.m4b"], 60.0, 60.0, timeout=10)
+
+    @patch("mamcrawler.audio_processing.normalizer.probe_audio")
+    @patch("mamcrawler.audio_processing.loudness.subprocess.run")
+    def test_analysis_falls_back_to_single_pass(self, mock_run, mock_probe):
+        mock_run.return_value = self.failed
+        mock_probe.return_value = MagicMock(duration=36 * 3600.0)
+        single = {
+            'integrated_loudness': -19.5, 'loudness_range': 6.0, 'true_peak': -2.0,
+            'threshold': -30.0, 'target_offset': 0.1,
+        }
+
+        with tempfile.NamedTemporaryFile(suffix=".m4b") as audio:
+            normalizer = AudioNormalizer()
+            with patch.object(normalizer, "_measure_single_pass", return_value=single) as mock_single:
+                analysis = normalizer.analyze_loudness(audio.name, segments=4)
+
+        mock_single.assert_called_once()
+        self.assertEqual(analysis['segments'], 1)
+        self.assertEqual(analysis['integrated_loudness'], -19.5)
+        self.assertTrue(analysis['valid'])
+
+
+@unittest.skipUnless(shutil.which("ffmpeg") and shutil.which("ffprobe"), "ffmpeg not installed")
+class TestSegmentedLoudnessFFmpeg(unittest.TestCase):
+    """Compare segmented and single-pass measurement on generated audio."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_path = os.path.join(self.temp_dir, "synthetic.wav")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-f", "lavfi", "-i", "sine=f=440:d=180:r=16000",
+                "-af", "volume='if(lt(mod(t,30),10),1,if(lt(mod(t,30),20),0.2,0.02))':eval=frame",
+                "-y", self.audio_path,
+            ],
+            check=True,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_single_pass(self):
+        normalizer = AudioNormalizer()
+        single = normalizer.analyze_loudness(self.audio_path, segments=1)
+        segmented = normalizer.analyze_loudness(self.audio_path, segments=6)
+
+        self.assertEqual(segmented['segments'], 6)
+        self.assertAlmostEqual(segmented['integrated_loudness'], single['integrated_loudness'], delta=0.3)
+        self.assertAlmostEqual(segmented['true_peak'], single['true_peak'], delta=0.3)
+        self.assertAlmostEqual(segmented['loudness_range'], single['loudness_range'], delta=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Unit tests for search_server.py, search_client.py and mamcrawler.rag.fusion.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import tempfile
+import shutil
+import os
+import socket
+import threading
+import numpy as np
+
+import database
+from mamcrawler.config import RAGConfig
+from mamcrawler.rag.indexing import FAISSIndexManager
+from mamcrawler.rag.fusion import reciprocal_rank_fusion
+from search_client import query_server
+from search_server import SearchEngine, make_server
+
+
+class TestSearchEngine(unittest.TestCase):
+    """Test SearchEngine against a real index and database."""
+
+    def setUp(self):
+        """Set up a small index and metadata database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = RAGConfig(
+            dimension=4,
+            index_path=os.path.join(self.temp_dir, "index.faiss"),
+            db_path=os.path.join(self.temp_dir, "metadata.sqlite"),
+            embedding_cache_path=None,
+        )
+        store = database.get_store(self.config.db_path)
+        store.create_tables()
+        file_id = store.insert_or_update_file("guide.md", 0.0, "hash")
+        self.chunk_ids = store.insert_chunks(
+            [(file_id, "alpha", "H1"), (file_id, "beta", "H2")]
+        )
+        self.vectors = np.eye(4, dtype=np.float32)[:2]
+        self._save_index(self.vectors, self.chunk_ids)
+
+        self.embedding_service = MagicMock()
+        self.embedding_service.encode_query.return_value = self.vectors[1:2]
+        patcher = patch("mamcrawler.rag.embeddings.EmbeddingService", return_value=self.embedding_service)
+        self.embedding_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up."""
+        database.close_stores()
+        shutil.rmtree(self.temp_dir)
+
+    def _save_index(self, vectors, ids):
+        with patch("builtins.print"):
+            manager = FAISSIndexManager(self.config)
+            manager.add(vectors, np.array(ids))
+            manager.save()
+
+    def _engine(self):
+        with patch("builtins.print"):
+            return SearchEngine(self.config)
+
+    def test_search(self):
+        """Test results come back best match first with their metadata."""
+        engine = self._engine()
+
+        results = engine.search("beta", top_k=2)
+
+        self.assertEqual([r["chunk_id"] for r in results], [self.chunk_ids[1], self.chunk_ids[0]])
+        self.assertEqual(results[0]["content"], "beta")
+        self.assertEqual(results[0]["source"], "guide.md")
+        self.assertEqual(results[0]["section"], "H2")
+        self.assertAlmostEqual(results[0]["score"], 0.0)
+
+    def test_reloads_saved_index(self):
+        """Test a newly saved index is picked up without restarting."""
+        engine = self._engine()
+        self.assertEqual(engine.total_vectors, 2)
+
+        store = database.get_store(self.config.db_path)
+        file_id = store.get_file_details("guide.md")[0]
+        new_id = store.insert_chunks([(file_id, "gamma", "H3")])[0]
+        self._save_index(np.eye(4, dtype=np.float32)[2:3], [new_id])
+        # Make sure the stat differs even on coarse-mtime filesystems
+        stat = os.stat(self.config.index_path)
+        os.utime(self.config.index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.embedding_service.encode_query.return_value = np.eye(4, dtype=np.float32)[2:3]
+        with patch("builtins.print"):
+            results = engine.search("gamma", top_k=1)
+
+        self.assertEqual(engine.total_vectors, 3)
+        self.assertEqual(results[0]["content"], "gamma")
+
+    def test_keyword_search_skips_model(self):
+        """Test keyword search is answered from FTS without the embedding model."""
+        engine = self._engine()
+
+        results = engine.search("alpha", top_k=2, mode="keyword")
+
+        self.assertEqual([r["content"] for r in results], ["alpha"])
+        self.embedding_class.assert_not_called()
+
+    def test_warm_up_loads_model_once(self):
+        """Test warm_up() loads the model so searches don't have to."""
+        engine = self._engine()
+        self.embedding_class.assert_not_called()
+
+        engine.warm_up()
+        engine.search("beta", top_k=1)
+
+        self.embedding_class.assert_called_once()
+
+    def test_hybrid_search_fuses_rankings(self):
+        """Test hybrid search merges keyword and vector rankings."""
+        engine = self._engine()
+
+        # Vector ranks beta first, keyword only matches alpha
+        results = engine.search("alpha", top_k=2, mode="hybrid")
+
+        self.assertEqual({r["content"] for r in results}, {"alpha", "beta"})
+        self.assertEqual(results[0]["content"], "alpha")
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_unknown_mode(self):
+        """Test an unknown search mode is rejected."""
+        with self.assertRaises(ValueError):
+            self._engine().search("alpha", mode="fuzzy")
+
+    def test_missing_index(self):
+        """Test the engine refuses to start without an index."""
+        os.remove(self.config.index_path)
+        with self.assertRaises(FileNotFoundError):
+            self._engine()
+
+
+class TestReciprocalRankFusion(unittest.TestCase):
+    """Test reciprocal_rank_fusion."""
+
+    def test_items_in_both_rankings_win(self):
+        """Test an item ranked by both lists beats items ranked by one."""
+        fused = reciprocal_rank_fusion([[1, 2, 3], [3, 4]], k=60)
+
+        self.assertEqual(fused[0][0], 3)
+        self.assertAlmostEqual(fused[0][1], 1 / 63 + 1 / 61)
+        # Ties keep the order the items were first seen in
+        self.assertEqual([item for item, _ in fused], [3, 1, 2, 4])
+
+
+class TestSearchServer(unittest.TestCase):
+    """Test the HTTP server through the thin client."""
+
+    def setUp(self):
+        """Start a server on a free port around a mocked engine."""
+        self.engine = MagicMock()
+        self.engine.config = RAGConfig()
+        self.engine.search.return_value = [
+            {"chunk_id": 1, "source": "a.md", "section": "H1", "content": "text", "score": 0.5}
+        ]
+        self.server = make_server(self.engine, "127.0.0.1", 0)
+        self.port = self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+
+    def tearDown(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_query_server(self):
+        """Test a search round-trips through HTTP."""
+        results = query_server("qbit settings", 3, host="127.0.0.1", port=self.port)
+
+        self.engine.search.assert_called_once_with("qbit settings", 3, "vector")
+        self.assertEqual(results[0]["source"], "a.md")
+
+    def test_query_server_mode(self):
+        """Test the search mode is passed through."""
+        query_server("rule 2.3", mode="keyword", host="127.0.0.1", port=self.port)
+
+        self.engine.search.assert_called_once_with("rule 2.3", None, "keyword")
+
+    def test_server_error_returns_none(self):
+        """Test a failing search makes the client fall back."""
+        self.engine.search.side_effect = RuntimeError("boom")
+
+        self.assertIsNone(query_server("q", host="127.0.0.1", port=self.port))
+
+    def test_no_server_returns_none(self):
+        """Test the client reports no server when nothing is listening."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            free_port = sock.getsockname()[1]
+
+        self.assertIsNone(query_server("q", host="127.0.0.1", port=free_port, timeout=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
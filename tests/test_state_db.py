@@ -0,0 +1,59 @@
+"""
+Unit tests for mamcrawler.storage.state_db module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from mamcrawler.storage import open_state_db
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_items_value ON items (value);
+"""
+
+
+class TestOpenStateDB(unittest.TestCase):
+    """Test the shared SQLite state database setup."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "state.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_pragmas_and_schema(self):
+        conn = open_state_db(self.path, SCHEMA)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            # NORMAL
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertIsNone(conn.isolation_level)
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+            self.assertTrue({"items", "idx_items_value"} <= names)
+        finally:
+            conn.close()
+
+    def test_reopen_keeps_data(self):
+        conn = open_state_db(self.path, SCHEMA)
+        conn.execute("INSERT INTO items VALUES ('a', '1')")
+        conn.close()
+
+        conn = open_state_db(self.path, SCHEMA)
+        try:
+            self.assertEqual(conn.execute("SELECT value FROM items").fetchone()[0], "1")
+        finally:
+            conn.close()
+
+    def test_in_memory(self):
+        conn = open_state_db(None, SCHEMA)
+        conn.execute("INSERT INTO items VALUES ('a', '1')")
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 1)
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for VerificationOrchestrator batch verification.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mamcrawler.verification.verification_orchestrator import VerificationOrchestrator
+
+
+def book(title, audio_path="/books/a.m4b", metadata=None):
+    return {"title": title, "author": "Author", "audio_path": audio_path, "metadata": metadata or {"title": title}}
+
+
+class TestVerifyBatch(unittest.TestCase):
+    """Test verify_batch fan-out, timeouts and cancellation."""
+
+    def setUp(self):
+        with patch("mamcrawler.verification.verification_orchestrator.get_operation_logger"):
+            self.orchestrator = VerificationOrchestrator()
+        self.orchestrator.narrator_verifier = MagicMock()
+        self.orchestrator.narrator_verifier.verify_audiobook.return_value = {"match": True, "confidence": 1.0}
+        self.orchestrator.duration_verifier = MagicMock()
+        self.orchestrator.duration_verifier.verify_audiobook.return_value = {"valid": True}
+        self.orchestrator.isbn_verifier = MagicMock()
+        self.orchestrator.isbn_verifier.verify_audiobook.return_value = {"valid": True, "match": True}
+        self.orchestrator.chapter_verifier = MagicMock()
+        self.orchestrator.chapter_verifier.verify_audiobook.return_value = {"passed": True, "count": 12}
+
+    def test_matches_verify_audiobook(self):
+        """Test every book gets the same result shape as verify_audiobook."""
+        results = list(self.orchestrator.verify_batch([book(f"Book {i}") for i in range(10)], max_workers=3))
+
+        self.assertEqual(sorted(r["audiobook"] for r in results), sorted(f"Book {i}" for i in range(10)))
+        self.assertTrue(all(r["passed"] for r in results))
+        self.assertEqual(list(results[0]["checks"]), ["narrator", "duration", "isbn", "chapters"])
+        self.assertEqual(self.orchestrator.chapter_verifier.verify_audiobook.call_count, 10)
+
+    def test_results_stream_in_completion_order(self):
+        """Test a slow book does not hold back the ones behind it."""
+        def narrator(audio_path, metadata):
+            if metadata["title"] == "Slow":
+                time.sleep(0.5)
+            return {"match": True}
+
+        self.orchestrator.narrator_verifier.verify_audiobook.side_effect = narrator
+
+        results = self.orchestrator.verify_batch([book("Slow"), book("Fast")], max_workers=4)
+
+        self.assertEqual([r["audiobook"] for r in results], ["Fast", "Slow"])
+
+    def test_check_timeout(self):
+        """Test a hung check is recorded as failed once its timeout passes."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def hang(audio_path, metadata):
+            release.wait(5)
+            return {"valid": True}
+
+        self.orchestrator.duration_verifier.verify_audiobook.side_effect = hang
+
+        start = time.monotonic()
+        results = list(self.orchestrator.verify_batch([book("Hung")], max_workers=4, check_timeout=0.2))
+
+        self.assertLess(time.monotonic() - start, 3)
+        self.assertFalse(results[0]["passed"])
+        self.assertEqual(results[0]["failures"], ["duration"])
+        self.assertTrue(results[0]["checks"]["duration"]["timed_out"])
+
+    def test_cancel(self):
+        """Test setting the cancel event stops the batch."""
+        cancel = threading.Event()
+        books = (book(f"Book {i}") for i in range(1000))
+
+        results = []
+        for result in self.orchestrator.verify_batch(books, max_workers=2, cancel_event=cancel):
+            results.append(result)
+            cancel.set()
+
+        self.assertLess(len(results), 1000)
+        self.assertLess(self.orchestrator.isbn_verifier.verify_audiobook.call_count, 1000)
+
+    def test_book_without_inputs(self):
+        """Test a book with neither audio nor metadata fails without running checks."""
+        results = list(self.orchestrator.verify_batch([{"title": "Empty"}]))
+
+        self.assertEqual(results[0]["failures"], ["verification_failed"])
+        self.orchestrator.narrator_verifier.verify_audiobook.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Unit tests for watcher.py module.
 import unittest
 from unittest.mock import patch, MagicMock
 import tempfile
+import shutil
 import os
 import numpy as np
 
@@ -69,16 +70,17 @@ class TestMarkdownHandler(unittest.TestCase):
         self.handler.on_created(mock_event)
         # Should not process directories
 
-    @patch("watcher.MarkdownHandler._process_file")
-    def test_on_created_md_file(self, mock_process):
-        """Test on_created with markdown file."""
+    def test_on_created_md_file(self):
+        """Test on_created queues a markdown file instead of indexing it."""
         mock_event = MagicMock()
         mock_event.is_directory = False
         mock_event.src_path = "test.md"
 
-        self.handler.on_created(mock_event)
+        with patch("builtins.print"):
+            self.handler.on_created(mock_event)
 
-        mock_process.assert_called_once_with("test.md")
+        self.assertEqual(self.handler._pending, {"test.md": "upsert"})
+        self.mock_embed.encode.assert_not_called()
 
     def test_on_modified_non_md_file(self):
         """Test on_modified with non-markdown file."""
@@ -87,18 +89,18 @@ class TestMarkdownHandler(unittest.TestCase):
         mock_event.src_path = "test.txt"
 
         self.handler.on_modified(mock_event)
-        # Should not process
+        self.assertEqual(self.handler.pending_count, 0)
 
-    @patch("watcher.MarkdownHandler._update_file")
-    def test_on_modified_md_file(self, mock_update):
+    def test_on_modified_md_file(self):
         """Test on_modified with markdown file."""
         mock_event = MagicMock()
         mock_event.is_directory = False
         mock_event.src_path = "test.md"
 
-        self.handler.on_modified(mock_event)
+        with patch("builtins.print"):
+            self.handler.on_modified(mock_event)
 
-        mock_update.assert_called_once_with("test.md")
+        self.assertEqual(self.handler._pending, {"test.md": "upsert"})
 
     def test_on_deleted_non_md_file(self):
         """Test on_deleted with non-markdown file."""
@@ -107,18 +109,19 @@ class TestMarkdownHandler(unittest.TestCase):
         mock_event.src_path = "test.txt"
 
         self.handler.on_deleted(mock_event)
-        # Should not process
+        self.assertEqual(self.handler.pending_count, 0)
 
-    @patch("watcher.MarkdownHandler._delete_file")
-    def test_on_deleted_md_file(self, mock_delete):
-        """Test on_deleted with markdown file."""
+    def test_on_deleted_md_file(self):
+        """Test a delete replaces an earlier queued event for the same path."""
         mock_event = MagicMock()
         mock_event.is_directory = False
         mock_event.src_path = "test.md"
 
-        self.handler.on_deleted(mock_event)
+        with patch("builtins.print"):
+            self.handler.on_created(mock_event)
+            self.handler.on_deleted(mock_event)
 
-        mock_delete.assert_called_once_with("test.md")
+        self.assertEqual(self.handler._pending, {"test.md": "delete"})
 
     @patch("watcher.os.path.getmtime")
     @patch("watcher.database")
@@ -129,8 +132,8 @@ class TestMarkdownHandler(unittest.TestCase):
         mock_read.return_value = content
         mock_getmtime.return_value = 1234567890.0
 
-        mock_db.insert_or_update_file.return_value = 1
-        mock_db.insert_chunk.side_effect = [10, 11]
+        mock_db.begin_file.return_value = (1, [5])
+        mock_db.insert_chunks.return_value = [10, 11]
 
         # Mock chunker.chunk
         self.mock_chunker.chunk.return_value = [
@@ -138,81 +141,53 @@ class TestMarkdownHandler(unittest.TestCase):
             ("embed2", "raw2", "header2"),
         ]
 
-        chunks, chunk_ids = self.handler._chunk_file("test.md")
+        file_id, stale_ids, chunks, chunk_ids = self.handler._chunk_file("test.md")
 
         mock_read.assert_called_once_with("test.md")
         self.mock_chunker.chunk.assert_called_once_with(content)
-        self.assertEqual(mock_db.insert_or_update_file.call_count, 1)
-        self.assertEqual(mock_db.insert_chunk.call_count, 2)
+        mock_db.begin_file.assert_called_once_with("test.md", 1234567890.0)
+        mock_db.insert_chunks.assert_called_once()
+        self.assertEqual(
+            list(mock_db.insert_chunks.call_args.args[0]),
+            [(1, "raw1", "header1"), (1, "raw2", "header2")],
+        )
+        self.assertEqual((file_id, stale_ids), (1, [5]))
         self.assertEqual(chunks, ["embed1", "embed2"])
         self.assertEqual(chunk_ids, [10, 11])
 
-    @patch("watcher.MarkdownHandler._chunk_file")
-    def test_process_file(self, mock_chunk):
-        """Test _process_file method."""
-        mock_chunk.return_value = (["chunk1", "chunk2"], [1, 2])
-
-        self.mock_embed.encode.return_value = np.array([[1.0], [2.0]], dtype=np.float32)
-
-        self.handler._process_file("test.md")
-
-        self.mock_embed.encode.assert_called_once_with(["chunk1", "chunk2"])
-        self.mock_index.add.assert_called_once()
-        self.mock_index.save.assert_called_once()
-
-    @patch("watcher.database")
-    @patch("watcher.safe_read_markdown")
-    def test_update_file_new_file(self, mock_read, mock_db):
-        """Test _update_file with new file."""
-        mock_db.get_file_details.return_value = None
-
-        with patch.object(self.handler, "_process_file") as mock_process:
-            self.handler._update_file("test.md")
-
-            mock_process.assert_called_once_with("test.md")
-
     @patch("watcher.database")
     @patch("watcher.safe_read_markdown")
     @patch("watcher.hashlib")
     def test_update_file_unchanged(self, mock_hashlib, mock_read, mock_db):
         """Test _update_file with unchanged file."""
-        content = "content"
-        mock_read.return_value = content
-
-        mock_hash = MagicMock()
-        mock_hash.hexdigest.return_value = "hash123"
-        mock_hashlib.sha256.return_value = mock_hash
-
+        mock_read.return_value = "content"
+        mock_hashlib.sha256.return_value.hexdigest.return_value = "hash123"
         mock_db.get_file_details.return_value = (1, "hash123")
 
-        with patch.object(self.handler, "_process_file") as mock_process:
-            with patch.object(self.mock_index, "remove") as mock_remove:
-                self.handler._update_file("test.md")
+        with patch.object(self.handler, "_chunk_file") as mock_chunk:
+            result = self.handler._update_file("test.md")
 
-                mock_process.assert_not_called()
-                mock_remove.assert_not_called()
+        mock_chunk.assert_not_called()
+        self.assertEqual(result, (None, [], [], []))
 
     @patch("watcher.database")
     @patch("watcher.safe_read_markdown")
     @patch("watcher.hashlib")
     def test_update_file_changed(self, mock_hashlib, mock_read, mock_db):
-        """Test _update_file with changed file."""
-        content = "new content"
-        mock_read.return_value = content
-
-        mock_new_hash = MagicMock()
-        mock_new_hash.hexdigest.return_value = "new_hash"
-        mock_hashlib.sha256.return_value = mock_new_hash
-
+        """Test _update_file re-chunks a changed file and returns its pending hash."""
+        mock_read.return_value = "new content"
+        mock_hashlib.sha256.return_value.hexdigest.return_value = "new_hash"
         mock_db.get_file_details.return_value = (1, "old_hash")
-        mock_db.get_chunk_ids_for_file.return_value = [10, 11]
 
-        with patch.object(self.handler, "_process_file") as mock_process:
-            self.handler._update_file("test.md")
+        with patch.object(
+            self.handler, "_chunk_file", return_value=(1, [10, 11], ["e"], [12])
+        ) as mock_chunk:
+            result = self.handler._update_file("test.md")
 
-            self.mock_index.remove.assert_called_once()
-            mock_db.delete_file_records.assert_called_once_with(1)
-            mock_process.assert_called_once_with("test.md")
+        mock_chunk.assert_called_once_with("test.md", "new content")
+        self.assertEqual(result, ((1, "new_hash", [10, 11]), [10, 11], ["e"], [12]))
+        self.assertEqual(self.handler._unsaved_files, [])
+        mock_db.finalize_files.assert_not_called()
 
     @patch("watcher.database")
     def test_delete_file(self, mock_db):
@@ -220,23 +195,166 @@ class TestMarkdownHandler(unittest.TestCase):
         mock_db.get_file_details.return_value = (1, "hash")
         mock_db.get_chunk_ids_for_file.return_value = [10, 11]
 
-        self.handler._delete_file("test.md")
+        stale_ids = self.handler._delete_file("test.md")
 
         mock_db.get_file_details.assert_called_once_with("test.md")
         mock_db.get_chunk_ids_for_file.assert_called_once_with(1)
-        self.mock_index.remove.assert_called_once()
         mock_db.delete_file_records.assert_called_once_with(1)
-        self.mock_index.save.assert_called_once()
+        self.assertEqual(stale_ids, [10, 11])
+        self.mock_index.save.assert_not_called()
 
     @patch("watcher.database")
     def test_delete_file_no_existing(self, mock_db):
         """Test _delete_file with no existing file."""
         mock_db.get_file_details.return_value = None
 
-        self.handler._delete_file("test.md")
+        self.assertEqual(self.handler._delete_file("test.md"), [])
 
         mock_db.get_chunk_ids_for_file.assert_not_called()
-        self.mock_index.remove.assert_not_called()
+
+
+class TestBatching(unittest.TestCase):
+    """Test event coalescing and deferred index saves."""
+
+    def setUp(self):
+        """Create a handler over real files with mocked components."""
+        self.temp_dir = tempfile.mkdtemp()
+        with (
+            patch("watcher.MarkdownChunker"),
+            patch("watcher.EmbeddingService") as mock_embed_class,
+            patch("watcher.FAISSIndexManager") as mock_index_class,
+        ):
+            self.handler = MarkdownHandler(
+                self.temp_dir, debounce_seconds=2, save_interval=30, dirty_threshold=100
+            )
+        self.mock_embed = mock_embed_class.return_value
+        self.mock_embed.encode.side_effect = lambda texts: np.ones((len(texts), 2), dtype=np.float32)
+        self.mock_index = mock_index_class.return_value
+
+        self.paths = []
+        for i in range(20):
+            path = os.path.join(self.temp_dir, f"guide{i}.md")
+            with open(path, "w") as f:
+                f.write(f"# Guide {i}")
+            self.paths.append(path)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def _chunk_file(self, path, content=None):
+        index = self.paths.index(path)
+        return index, [], [f"text{index}"], [100 + index]
+
+    def _queue_all(self):
+        with patch("builtins.print"):
+            for path in self.paths:
+                event = MagicMock(is_directory=False, src_path=path)
+                self.handler.on_created(event)
+                self.handler.on_modified(event)
+
+    @patch("watcher.database")
+    def test_burst_is_embedded_once_and_saved_later(self, mock_db):
+        """Test a burst of files costs one encode and no immediate save."""
+        mock_db.get_file_details.return_value = None
+        self._queue_all()
+        now = self.handler._last_event
+
+        with patch.object(self.handler, "_chunk_file", side_effect=self._chunk_file):
+            with patch("builtins.print"):
+                # Still inside the debounce window
+                self.handler.flush_if_due(now + 1)
+                self.mock_embed.encode.assert_not_called()
+
+                self.handler.flush_if_due(now + 3)
+
+        self.mock_embed.encode.assert_called_once()
+        self.assertEqual(len(self.mock_embed.encode.call_args.args[0]), 20)
+        self.mock_index.add.assert_called_once()
+        self.mock_index.save.assert_not_called()
+        mock_db.finalize_files.assert_not_called()
+
+        # The save interval elapses: one save, then hashes are recorded
+        self.handler.flush_if_due(self.handler._last_save + 31)
+        self.mock_index.save.assert_called_once()
+        finalized = list(mock_db.finalize_files.call_args.args[0])
+        self.assertEqual(len(finalized), 20)
+
+    @patch("watcher.database")
+    def test_dirty_threshold_forces_save(self, mock_db):
+        """Test enough changed vectors trigger a save before the interval."""
+        mock_db.get_file_details.return_value = None
+        self.handler.dirty_threshold = 10
+        self._queue_all()
+
+        with patch.object(self.handler, "_chunk_file", side_effect=self._chunk_file):
+            with patch("builtins.print"):
+                self.handler.flush_if_due(self.handler._last_event + 3)
+
+        self.mock_index.save.assert_called_once()
+
+    @patch("watcher.database")
+    def test_removals_are_batched(self, mock_db):
+        """Test deleted files' vectors are removed in one call."""
+        mock_db.get_file_details.side_effect = lambda path: (self.paths.index(path), "h")
+        mock_db.get_chunk_ids_for_file.side_effect = lambda file_id: [file_id]
+        with patch("builtins.print"):
+            for path in self.paths[:5]:
+                self.handler.on_deleted(MagicMock(is_directory=False, src_path=path))
+            self.handler.flush()
+
+        self.mock_index.remove.assert_called_once()
+        np.testing.assert_array_equal(self.mock_index.remove.call_args.args[0], [0, 1, 2, 3, 4])
+        self.mock_embed.encode.assert_not_called()
+        self.mock_index.save.assert_called_once()
+
+    @patch("watcher.database")
+    def test_file_vanishing_mid_batch_is_skipped(self, mock_db):
+        """Test a file removed after the exists() check doesn't drop the batch."""
+        mock_db.get_file_details.return_value = None
+        self._queue_all()
+        vanished = self.paths[3]
+
+        def chunk_file(path, content=None):
+            if path == vanished:
+                raise FileNotFoundError(path)
+            return self._chunk_file(path, content)
+
+        with patch.object(self.handler, "_chunk_file", side_effect=chunk_file):
+            with patch("builtins.print"):
+                self.handler.flush_if_due(self.handler._last_event + 3)
+
+        self.assertEqual(self.handler.pending_count, 0)
+        self.mock_index.add.assert_called_once()
+        embeddings, ids = self.mock_index.add.call_args.args
+        self.assertEqual(len(embeddings), 19)
+        self.assertNotIn(103, ids)
+        self.assertEqual(len(self.handler._unsaved_files), 19)
+
+    @patch("watcher.database")
+    def test_failed_embedding_keeps_files_pending(self, mock_db):
+        """Test files whose vectors weren't added are re-queued, not finalized."""
+        mock_db.get_file_details.return_value = None
+        self.mock_embed.encode.side_effect = RuntimeError("model failed")
+        self._queue_all()
+
+        with patch.object(self.handler, "_chunk_file", side_effect=self._chunk_file):
+            with patch("builtins.print"):
+                self.assertEqual(self.handler.process_pending(), 0)
+                self.handler.save()
+
+        self.mock_index.add.assert_not_called()
+        mock_db.finalize_files.assert_not_called()
+        self.assertEqual(set(self.handler._pending), set(self.paths))
+
+        # The next batch embeds them and only then records their hashes
+        self.mock_embed.encode.side_effect = lambda texts: np.ones((len(texts), 2), dtype=np.float32)
+        with patch.object(self.handler, "_chunk_file", side_effect=self._chunk_file):
+            with patch("builtins.print"):
+                self.handler.flush()
+
+        self.mock_index.add.assert_called_once()
+        self.assertEqual(len(list(mock_db.finalize_files.call_args.args[0])), 20)
 
 
 class TestMain(unittest.TestCase):
@@ -268,6 +386,21 @@ class TestMain(unittest.TestCase):
         mock_observer.stop.assert_called_once()
         mock_observer.join.assert_called_once()
 
+    @patch("watcher.os.path.exists", return_value=True)
+    @patch("watcher.database")
+    @patch("watcher.Observer")
+    def test_main_survives_flush_error(self, mock_observer_class, mock_db, mock_exists):
+        """Test an error while flushing doesn't stop the watcher loop."""
+        with patch("watcher.MarkdownHandler") as mock_handler_class:
+            handler = mock_handler_class.return_value
+            handler.flush_if_due.side_effect = OSError("gone")
+            with patch("builtins.print"):
+                with patch("time.sleep", side_effect=[None, None, KeyboardInterrupt]):
+                    main()
+
+        self.assertEqual(handler.flush_if_due.call_count, 2)
+        handler.flush.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
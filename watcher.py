@@ -1,11 +1,25 @@
 """
 File system watcher for automatic RAG index updates.
 Uses modular components from mamcrawler package.
+
+File events are only queued by the observer thread. The main loop processes
+the queue once a burst goes quiet (or grows large): stale vectors from all
+queued files are removed in one call, new chunks from all of them are
+embedded together, and the index is saved on a timer or once enough vectors
+changed, not after every file. A crawl writing hundreds of guides therefore
+costs a handful of index writes instead of one full rewrite per guide.
+
+Like ingest.py, a file's hash is recorded only after the index holding its
+vectors is saved, so a crash before a save leaves it pending for the next
+ingest run.
 """
 
 import os
 import time
 import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
 import numpy as np
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -14,124 +28,264 @@ import database
 from mamcrawler.rag import MarkdownChunker, EmbeddingService, FAISSIndexManager
 from mamcrawler.utils import safe_read_markdown
 
+# Seconds without new events before a burst is processed
+DEBOUNCE_SECONDS = 2.0
 
-class MarkdownHandler(FileSystemEventHandler):
-    """Handles markdown file changes and updates the RAG index."""
+# Process anyway once events have waited this long or this many files queued
+MAX_DELAY_SECONDS = 30.0
+MAX_PENDING_FILES = 500
+
+# Save the index this often while it has unsaved changes ...
+SAVE_INTERVAL_SECONDS = 30.0
+
+# ... or as soon as this many vectors were added/removed since the last save
+SAVE_DIRTY_THRESHOLD = 5000
 
-    def __init__(self, target_dir: str = "guides_output"):
+UPSERT = "upsert"
+DELETE = "delete"
+
+
+class MarkdownHandler(FileSystemEventHandler):
+    """Queues markdown file changes and applies them to the RAG index in batches."""
+
+    def __init__(
+        self,
+        target_dir: str = "guides_output",
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        save_interval: float = SAVE_INTERVAL_SECONDS,
+        dirty_threshold: int = SAVE_DIRTY_THRESHOLD,
+    ):
         """
         Initialize the handler.
 
         Args:
             target_dir: Directory to watch
+            debounce_seconds: Quiet period before a burst is processed
+            save_interval: Seconds between index saves while dirty
+            dirty_threshold: Changed vectors that force a save
         """
         self.target_dir = target_dir
+        self.debounce_seconds = debounce_seconds
+        self.save_interval = save_interval
+        self.dirty_threshold = dirty_threshold
 
         # Initialize modular components (singletons)
         self.chunker = MarkdownChunker()
         self.embedding_service = EmbeddingService()
         self.index_manager = FAISSIndexManager()
 
+        # path -> UPSERT/DELETE; a later event for a path replaces the earlier one
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._first_event: Optional[float] = None
+        self._last_event: Optional[float] = None
+
+        # Changes applied to the in-memory index but not yet saved
+        self._dirty = 0
+        self._last_save = time.monotonic()
+        self._unsaved_files: List[Tuple[int, str, List[int]]] = []
+
     def on_created(self, event):
         """Handle new file creation."""
         if event.is_directory or not event.src_path.endswith(".md"):
             return
         print(f"New file detected: {event.src_path}")
-        self._process_file(event.src_path)
+        self._queue(event.src_path, UPSERT)
 
     def on_modified(self, event):
         """Handle file modification."""
         if event.is_directory or not event.src_path.endswith(".md"):
             return
         print(f"Modified file detected: {event.src_path}")
-        self._update_file(event.src_path)
+        self._queue(event.src_path, UPSERT)
 
     def on_deleted(self, event):
         """Handle file deletion."""
         if event.is_directory or not event.src_path.endswith(".md"):
             return
         print(f"Deleted file detected: {event.src_path}")
-        self._delete_file(event.src_path)
-
-    def _process_file(self, path: str):
-        """Process new file and add to index."""
-        chunks, chunk_ids = self._chunk_file(path)
-        if chunks:
-            embeddings = self.embedding_service.encode(chunks)
-            self.index_manager.add(embeddings, np.array(chunk_ids))
-            self.index_manager.save()
-            print(f"Added {len(chunks)} chunks from {path}")
-
-    def _update_file(self, path: str):
-        """Update existing file in index."""
-        # Get existing file_id and chunk_ids
-        existing = database.get_file_details(path)
-        if not existing:
-            # New file, treat as created
-            self._process_file(path)
-            return
+        self._queue(event.src_path, DELETE)
+
+    def _queue(self, path: str, action: str):
+        """Record a file event for the next batch."""
+        now = time.monotonic()
+        with self._lock:
+            self._pending[path] = action
+            if self._first_event is None:
+                self._first_event = now
+            self._last_event = now
+
+    @property
+    def pending_count(self) -> int:
+        """Number of files waiting to be processed."""
+        return len(self._pending)
+
+    def flush_if_due(self, now: float = None):
+        """
+        Process the queue and save the index when their triggers are met.
 
-        file_id, old_hash = existing
+        Called periodically from the main loop.
 
-        # Check if actually changed
-        content = safe_read_markdown(path)
-        new_hash = hashlib.sha256(content.encode()).hexdigest()
+        Args:
+            now: time.monotonic() value (for testing)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = bool(self._pending) and (
+                now - self._last_event >= self.debounce_seconds
+                or now - self._first_event >= MAX_DELAY_SECONDS
+                or len(self._pending) >= MAX_PENDING_FILES
+            )
+        if due:
+            self.process_pending()
+
+        if self._dirty and (
+            now - self._last_save >= self.save_interval
+            or self._dirty >= self.dirty_threshold
+        ):
+            self.save()
+
+    def flush(self):
+        """Process everything queued and save (e.g. on shutdown)."""
+        self.process_pending()
+        if self._dirty or self._unsaved_files:
+            self.save()
+
+    def process_pending(self) -> int:
+        """
+        Apply all queued file events to the database and in-memory index.
 
-        if new_hash == old_hash:
-            return  # No change
+        Returns:
+            Number of files processed
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._first_event = self._last_event = None
+        if not pending:
+            return 0
+
+        stale_ids: List[int] = []
+        texts: List[str] = []
+        new_ids: List[int] = []
+        # (path, finalize_files() entry) of each re-chunked file
+        updated: List[Tuple[str, tuple]] = []
+
+        for path, action in pending.items():
+            try:
+                # Editors and crawlers often write a temp file and delete it again
+                if action == DELETE or not os.path.exists(path):
+                    stale_ids.extend(self._delete_file(path))
+                    continue
+
+                file_entry, file_stale_ids, file_texts, file_ids = self._update_file(path)
+            except Exception as e:
+                # The file may vanish or be renamed after the exists() check;
+                # skip it so the rest of the batch still reaches the index
+                print(f"Error processing {path}: {e}")
+                continue
+
+            if file_entry is None:
+                continue
+            updated.append((path, file_entry))
+            stale_ids.extend(file_stale_ids)
+            texts.extend(file_texts)
+            new_ids.extend(file_ids)
+
+        try:
+            if stale_ids:
+                self.index_manager.remove(np.array(stale_ids))
+            if texts:
+                embeddings = self.embedding_service.encode(texts)
+                self.index_manager.add(embeddings, np.array(new_ids))
+        except Exception as e:
+            # Without their vectors the files must stay pending: queue them
+            # again so a later batch re-chunks and embeds them
+            print(f"Error updating index, retrying {len(updated)} files later: {e}")
+            for path, _ in updated:
+                self._queue(path, UPSERT)
+            return 0
+
+        # Only now may save() record these files' hashes as indexed
+        self._unsaved_files.extend(file_entry for _, file_entry in updated)
+        self._dirty += len(stale_ids) + len(new_ids)
+        print(
+            f"Processed {len(pending)} files: +{len(new_ids)} / -{len(stale_ids)} chunks"
+        )
+        return len(pending)
+
+    def save(self):
+        """Persist the index, then record the files it now covers as indexed."""
+        self.index_manager.save()
+        if self._unsaved_files:
+            database.finalize_files(self._unsaved_files)
+            self._unsaved_files = []
+        self._dirty = 0
+        self._last_save = time.monotonic()
+
+    def _update_file(self, path: str) -> Tuple[Optional[tuple], List[int], List[str], List[int]]:
+        """
+        Re-chunk a new or changed file.
 
-        # Remove old chunks from index
-        chunk_ids = database.get_chunk_ids_for_file(file_id)
-        if chunk_ids:
-            self.index_manager.remove(np.array(chunk_ids))
+        Returns:
+            Tuple of (finalize_files() entry, stale chunk IDs to remove from
+            the index, texts to embed, their new chunk IDs); (None, [], [], [])
+            if unchanged
+        """
+        content = safe_read_markdown(path)
+        file_hash = hashlib.sha256(content.encode()).hexdigest()
 
-        # Delete old records
-        database.delete_file_records(file_id)
+        existing = database.get_file_details(path)
+        if existing and existing[1] == file_hash:
+            return None, [], [], []  # No change
+
+        file_id, stale_ids, texts, chunk_ids = self._chunk_file(path, content)
+        return (file_id, file_hash, stale_ids), stale_ids, texts, chunk_ids
 
-        # Process as new
-        self._process_file(path)
+    def _delete_file(self, path: str) -> List[int]:
+        """
+        Delete a file's records.
 
-    def _delete_file(self, path: str):
-        """Delete file from index."""
+        Returns:
+            Chunk IDs to remove from the index
+        """
         existing = database.get_file_details(path)
-        if existing:
-            file_id, _ = existing
-            chunk_ids = database.get_chunk_ids_for_file(file_id)
-            if chunk_ids:
-                self.index_manager.remove(np.array(chunk_ids))
-            database.delete_file_records(file_id)
-            self.index_manager.save()
-            print(f"Removed {len(chunk_ids)} chunks for {path}")
-
-    def _chunk_file(self, path: str) -> tuple:
+        if not existing:
+            return []
+
+        file_id, _ = existing
+        chunk_ids = database.get_chunk_ids_for_file(file_id)
+        database.delete_file_records(file_id)
+        return chunk_ids
+
+    def _chunk_file(self, path: str, content: str = None) -> tuple:
         """
-        Chunk file and return chunks with IDs.
+        Chunk file and store the chunks.
+
+        The file is registered as pending (empty hash); its old chunk rows
+        stay until save() finalizes it.
 
         Args:
             path: Path to markdown file
+            content: File content, if already read
 
         Returns:
-            Tuple of (chunks_to_embed, chunk_ids)
+            Tuple of (file_id, stale_chunk_ids, chunks_to_embed, chunk_ids)
         """
-        content = safe_read_markdown(path)
+        if content is None:
+            content = safe_read_markdown(path)
 
-        file_hash = hashlib.sha256(content.encode()).hexdigest()
-        file_id = database.insert_or_update_file(
-            path, os.path.getmtime(path), file_hash
-        )
+        file_id, stale_ids = database.begin_file(path, os.path.getmtime(path))
 
         # Use unified chunker
         chunk_data = self.chunker.chunk(content)
 
-        chunks = []
-        chunk_ids = []
-
-        for text_to_embed, raw_text, header_context in chunk_data:
-            chunk_id = database.insert_chunk(file_id, raw_text, header_context)
-            chunks.append(text_to_embed)
-            chunk_ids.append(chunk_id)
+        chunks = [text_to_embed for text_to_embed, _, _ in chunk_data]
+        chunk_ids = database.insert_chunks(
+            (file_id, raw_text, header_context)
+            for _, raw_text, header_context in chunk_data
+        )
 
-        return chunks, chunk_ids
+        return file_id, stale_ids, chunks, chunk_ids
 
 
 def main():
@@ -153,10 +307,15 @@ def main():
     try:
         while True:
             time.sleep(1)
+            try:
+                event_handler.flush_if_due()
+            except Exception as e:
+                print(f"Error updating index: {e}")
     except KeyboardInterrupt:
         observer.stop()
         print("\nStopping watcher...")
     observer.join()
+    event_handler.flush()
 
 
 if __name__ == "__main__":